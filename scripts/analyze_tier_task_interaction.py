@@ -14,7 +14,7 @@
 from pathlib import Path
 
 from scylla.analysis import build_runs_df, load_all_experiments
-from scylla.analysis.stats import scheirer_ray_hare
+from scylla.analysis.rank_tests import INTERACTION_SEPARATOR, scheirer_ray_hare_factorial
 
 
 def json_nan_handler(obj: object) -> object:
@@ -46,21 +46,22 @@ def main() -> None:
     experiments = load_all_experiments(args.data_dir)
     runs_df = build_runs_df(experiments)
 
-    results = {}
-    for metric in ["score", "cost_usd", "impl_rate"]:
-        if metric not in runs_df.columns:
-            continue
-        df = runs_df.dropna(subset=[metric])
-        if df.empty:
-            continue
+    factors = ["experiment", "tier"]
+    metrics = [
+        metric
+        for metric in ["score", "cost_usd", "impl_rate"]
+        if metric in runs_df.columns and runs_df[metric].notna().any()
+    ]
 
-        srh = scheirer_ray_hare(
-            df,
-            value_col=metric,
-            factor_a_col="experiment",
-            factor_b_col="tier",
-        )
-        results[metric] = srh
+    # All metrics in one pass; rows with a missing value are dropped per metric
+    srh_results = scheirer_ray_hare_factorial(runs_df, metrics, factors)
+    results = {
+        metric: {
+            ("interaction" if INTERACTION_SEPARATOR in effect else effect): effect_result
+            for effect, effect_result in srh_results[metric].items()
+        }
+        for metric in metrics
+    }
 
     args.output_dir.mkdir(parents=True, exist_ok=True)
     output_file = args.output_dir / "srh_tier_experiment.json"
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+r"""Benchmark agent transcript parsing: one parse per consumer vs a shared parse.
+
+Generates a synthetic ``--output-format stream-json`` transcript of ``--size-mb``
+megabytes (assistant text and tool-use events followed by a result event) and
+times extracting the run metrics the way ``ClaudeCodeAdapter.run()`` does:
+
+- ``per-metric``: rate-limit detection, token stats, API calls and cost each
+  parse stdout themselves (no ``transcript`` argument)
+- ``shared``: ``parse_transcript()`` once, then every consumer reuses it
+
+Usage:
+    python scripts/benchmark_transcript_parsing.py --size-mb 50 --repeat 3
+
+    # Benchmark a recorded transcript instead of a synthetic one
+    python scripts/benchmark_transcript_parsing.py --transcript results/.../agent/stdout.log
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from scylla.adapters.claude_code import ClaudeCodeAdapter
+from scylla.e2e.rate_limit import detect_rate_limit
+from scylla.e2e.transcript import parse_transcript
+
+
+@dataclass
+class ModeResult:
+    """Timings of one parsing mode.
+
+    Attributes:
+        mode: "per-metric" or "shared"
+        seconds: Wall time of each repetition
+        metrics: Extracted (input_tokens, output_tokens, api_calls, cost_usd)
+
+    """
+
+    mode: str
+    seconds: list[float] = field(default_factory=list)
+    metrics: tuple[int, int, int, float] = (0, 0, 0, 0.0)
+
+
+def generate_transcript(size_bytes: int) -> str:
+    """Build a stream-json transcript of roughly ``size_bytes`` bytes.
+
+    Args:
+        size_bytes: Approximate size of the transcript
+
+    Returns:
+        Newline-delimited JSON events ending with a result event
+
+    """
+    lines = [json.dumps({"type": "system", "subtype": "init", "model": "benchmark"})]
+    size = len(lines[0])
+    turn = 0
+    while size < size_bytes:
+        turn += 1
+        message = {
+            "id": f"msg_{turn:06d}",
+            "usage": {"input_tokens": 50, "output_tokens": 20, "cache_read_input_tokens": 900},
+        }
+        events = [
+            {
+                "type": "assistant",
+                "message": {**message, "content": [{"type": "text", "text": "x" * 400}]},
+            },
+            {
+                "type": "assistant",
+                "message": {
+                    **message,
+                    "content": [{"type": "tool_use", "name": "Bash", "input": {}}],
+                },
+            },
+            {
+                "type": "user",
+                "message": {"content": [{"type": "tool_result", "content": "y" * 600}]},
+            },
+        ]
+        for event in events:
+            line = json.dumps(event)
+            lines.append(line)
+            size += len(line) + 1
+    lines.append(
+        json.dumps(
+            {
+                "type": "result",
+                "is_error": False,
+                "result": "done",
+                "num_turns": turn,
+                "total_cost_usd": 0.01 * turn,
+                "usage": {"input_tokens": 50 * turn, "output_tokens": 20 * turn},
+            }
+        )
+    )
+    return "\n".join(lines) + "\n"
+
+
+def _per_metric(adapter: ClaudeCodeAdapter, stdout: str) -> tuple[int, int, int, float]:
+    detect_rate_limit(stdout, "")
+    stats = adapter._parse_token_stats(stdout, "")
+    api_calls = adapter._parse_api_calls(stdout, "")
+    cost = adapter._parse_cost(stdout)
+    return stats.input_tokens, stats.output_tokens, api_calls, cost
+
+
+def _shared(adapter: ClaudeCodeAdapter, stdout: str) -> tuple[int, int, int, float]:
+    transcript = parse_transcript(stdout)
+    detect_rate_limit(stdout, "", transcript=transcript)
+    stats = adapter._parse_token_stats(stdout, "", transcript)
+    api_calls = adapter._parse_api_calls(stdout, "", transcript)
+    cost = adapter._parse_cost(stdout, transcript)
+    return stats.input_tokens, stats.output_tokens, api_calls, cost
+
+
+MODES: dict[str, Callable[[ClaudeCodeAdapter, str], tuple[int, int, int, float]]] = {
+    "per-metric": _per_metric,
+    "shared": _shared,
+}
+
+
+def benchmark(stdout: str, repeat: int) -> list[ModeResult]:
+    """Time every parsing mode on the same transcript.
+
+    Args:
+        stdout: Transcript to parse
+        repeat: Repetitions per mode
+
+    Returns:
+        One ModeResult per mode
+
+    """
+    adapter = ClaudeCodeAdapter()
+    results = []
+    for mode, extract in MODES.items():
+        result = ModeResult(mode=mode)
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result.metrics = extract(adapter, stdout)
+            result.seconds.append(time.perf_counter() - start)
+        results.append(result)
+    return results
+
+
+def format_results(results: list[ModeResult], size_bytes: int) -> str:
+    """Format benchmark results as a plain-text table.
+
+    Args:
+        results: One result per mode
+        size_bytes: Transcript size, for throughput
+
+    Returns:
+        Table with median time and throughput per mode
+
+    """
+    lines = [f"{'mode':<12} {'median s':>9} {'MiB/s':>9} {'tokens in/out':>15} {'calls':>6}"]
+    for r in results:
+        median = statistics.median(r.seconds or [0.0])
+        throughput = size_bytes / 2**20 / median if median > 0 else 0.0
+        tokens = f"{r.metrics[0]}/{r.metrics[1]}"
+        lines.append(
+            f"{r.mode:<12} {median:>9.3f} {throughput:>9.1f} {tokens:>15} {r.metrics[2]:>6}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+
+    Returns:
+        Exit code
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--size-mb", type=float, default=20.0, help="Synthetic transcript size (default: 20)"
+    )
+    parser.add_argument("--transcript", type=Path, help="Parse this stdout log instead")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions per mode (default: 3)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    if args.transcript is not None:
+        stdout = args.transcript.read_text()
+    else:
+        stdout = generate_transcript(int(args.size_mb * 2**20))
+    size_bytes = len(stdout.encode())
+
+    results = benchmark(stdout, args.repeat)
+
+    if args.json:
+        print(json.dumps([asdict(r) for r in results], indent=2))
+    else:
+        print(f"{size_bytes / 2**20:.1f} MiB transcript, {args.repeat} repetitions per mode")
+        print(format_results(results, size_bytes))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+r"""Benchmark run-workspace materialization: git worktree add vs reflink copies.
+
+Clones a task repository once, then materializes ``--runs`` run workspaces
+with each backend of ``WorkspaceManager`` and reports per-workspace setup time
+and the disk space the workspaces actually consume (filesystem usage delta, so
+shared reflink extents are not double counted) next to their apparent size.
+
+On filesystems without reflink support (e.g. ext4) the reflink backend is
+reported as unsupported; use a btrfs or XFS (reflink=1) ``--work-dir``.
+
+Usage:
+    # Benchmark the repository of a fixture test
+    python scripts/benchmark_workspace_backends.py --test tests/fixtures/tests/test-001
+
+    # Benchmark an explicit repository/commit on a btrfs scratch directory
+    python scripts/benchmark_workspace_backends.py \
+        --repo https://github.com/modular/modular --commit <sha> \
+        --runs 10 --work-dir /mnt/btrfs/scratch
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import yaml
+
+from scylla.e2e.workspace_manager import WORKSPACE_BACKENDS, WorkspaceManager
+
+
+@dataclass
+class BackendResult:
+    """Timing and disk usage of one backend.
+
+    Attributes:
+        backend: Backend name ("worktree" or "reflink")
+        supported: False if the backend could not run on this filesystem
+        prepare_seconds: One-off setup time (reflink base checkout)
+        setup_seconds: Per-workspace materialization times
+        disk_bytes: Filesystem usage added by all workspaces
+        apparent_bytes: Sum of file sizes in all workspaces
+
+    """
+
+    backend: str
+    supported: bool = True
+    prepare_seconds: float = 0.0
+    setup_seconds: list[float] = field(default_factory=list)
+    disk_bytes: int = 0
+    apparent_bytes: int = 0
+
+
+def resolve_source(test_dir: Path | None, repo: str | None, commit: str | None) -> tuple[str, str]:
+    """Return the (repo, commit) to benchmark from a fixture test or explicit args.
+
+    Args:
+        test_dir: Fixture test directory containing test.yaml
+        repo: Explicit repository URL or path
+        commit: Explicit commit hash
+
+    Returns:
+        Tuple of (repo URL, commit hash)
+
+    Raises:
+        ValueError: If neither a test directory nor repo and commit are given
+
+    """
+    if test_dir is not None:
+        source = yaml.safe_load((test_dir / "test.yaml").read_text())["source"]
+        return source["repo"], source["hash"]
+    if repo and commit:
+        return repo, commit
+    raise ValueError("Pass --test or both --repo and --commit")
+
+
+def _apparent_size(path: Path) -> int:
+    """Sum the sizes of regular files under path, skipping .git metadata."""
+    total = 0
+    for item in path.rglob("*"):
+        if item.is_file() and not item.is_symlink() and ".git" not in item.parts:
+            total += item.stat().st_size
+    return total
+
+
+def benchmark_backend(
+    backend: str, repo: str, commit: str, runs: int, work_dir: Path
+) -> BackendResult:
+    """Materialize ``runs`` workspaces with one backend and measure them.
+
+    Args:
+        backend: One of WORKSPACE_BACKENDS
+        repo: Repository URL or path
+        commit: Commit to check out
+        runs: Number of workspaces to materialize
+        work_dir: Scratch directory; the clone is shared via work_dir/repos
+
+    Returns:
+        BackendResult for the backend
+
+    """
+    manager = WorkspaceManager(
+        experiment_dir=work_dir / f"experiment-{backend}",
+        repo_url=repo,
+        commit=commit,
+        repos_dir=work_dir / "repos",
+        workspace_backend=backend,
+    )
+    manager.setup_base_repo()
+    result = BackendResult(backend=backend)
+
+    if backend == "reflink":
+        start = time.perf_counter()
+        result.supported = manager.prepare_reflink_base()
+        result.prepare_seconds = time.perf_counter() - start
+        if not result.supported:
+            return result
+
+    runs_dir = manager.experiment_dir / "runs"
+    runs_dir.mkdir(parents=True, exist_ok=True)
+    workspaces = [runs_dir / f"run_{n:02d}" / "workspace" for n in range(1, runs + 1)]
+    # create_worktree() names branches <tier>_<subtest>_run_<NN>
+    branches = [f"bench_{backend}_00_run_{n:02d}" for n in range(1, runs + 1)]
+    disk_before = shutil.disk_usage(work_dir).used
+    try:
+        for run_number, (workspace, branch) in enumerate(
+            zip(workspaces, branches, strict=True), start=1
+        ):
+            workspace.parent.mkdir(parents=True, exist_ok=True)
+            start = time.perf_counter()
+            if backend == "reflink":
+                if manager.materialize_reflink_workspace(workspace, branch, commit) is None:
+                    raise RuntimeError(f"Reflink materialization failed for {workspace}")
+            else:
+                manager.create_worktree(workspace, f"bench_{backend}", "00", run_number)
+            result.setup_seconds.append(time.perf_counter() - start)
+
+        result.disk_bytes = max(0, shutil.disk_usage(work_dir).used - disk_before)
+        result.apparent_bytes = sum(_apparent_size(ws) for ws in workspaces)
+    finally:
+        for workspace, branch in zip(workspaces, branches, strict=True):
+            manager.cleanup_worktree(workspace, branch)
+        manager.remove_reflink_base()
+    return result
+
+
+def format_results(results: list[BackendResult]) -> str:
+    """Format benchmark results as a plain-text table.
+
+    Args:
+        results: One result per backend
+
+    Returns:
+        Table with mean/median setup time and disk usage per backend
+
+    """
+    lines = [
+        f"{'backend':<10} {'prepare s':>10} {'mean s':>9} {'median s':>9} "
+        f"{'disk MiB':>10} {'apparent MiB':>13}"
+    ]
+    for r in results:
+        if not r.supported:
+            lines.append(f"{r.backend:<10} unsupported on this filesystem")
+            continue
+        times = r.setup_seconds or [0.0]
+        lines.append(
+            f"{r.backend:<10} {r.prepare_seconds:>10.3f} {statistics.mean(times):>9.3f} "
+            f"{statistics.median(times):>9.3f} {r.disk_bytes / 2**20:>10.1f} "
+            f"{r.apparent_bytes / 2**20:>13.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+
+    Returns:
+        Exit code
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--test", type=Path, help="Fixture test directory (reads test.yaml)")
+    parser.add_argument("--repo", help="Repository URL or path (with --commit)")
+    parser.add_argument("--commit", help="Commit to check out (with --repo)")
+    parser.add_argument("--runs", type=int, default=5, help="Workspaces per backend (default: 5)")
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        choices=WORKSPACE_BACKENDS,
+        default=list(WORKSPACE_BACKENDS),
+        help="Backends to benchmark (default: all)",
+    )
+    parser.add_argument(
+        "--work-dir",
+        type=Path,
+        default=None,
+        help="Scratch directory; must be on the filesystem under test (default: a temp dir)",
+    )
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(message)s")
+
+    try:
+        repo, commit = resolve_source(args.test, args.repo, args.commit)
+    except ValueError as e:
+        parser.error(str(e))
+
+    work_dir = Path(tempfile.mkdtemp(prefix="workspace-bench-", dir=args.work_dir))
+    try:
+        results = [
+            benchmark_backend(backend, repo, commit, args.runs, work_dir)
+            for backend in args.backends
+        ]
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    if args.json:
+        print(json.dumps([asdict(r) for r in results], indent=2))
+    else:
+        print(f"{repo} @ {commit[:12]}, {args.runs} workspaces per backend")
+        print(format_results(results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 """Export experiment data to CSV files.
 
-Exports runs, judges, criteria, and subtests DataFrames to CSV for external use.
+Exports runs, judges, criteria, and subtests DataFrames to CSV for external use,
+plus a columnar Arrow dataset (``dataset/``) that ``generate_figures.py`` and
+``generate_tables.py`` can load via ``--dataset`` instead of re-parsing raw JSON.
 """
 
 from __future__ import annotations
@@ -20,9 +22,11 @@
     load_all_experiments,
 )
 from scylla.analysis.config import config
+from scylla.analysis.dataset import compute_source_hashes, write_dataset
 from scylla.analysis.figures import derive_tier_order
+from scylla.analysis.rank_tests import INTERACTION_SEPARATOR, scheirer_ray_hare_factorial
 from scylla.analysis.stats import (
-    cliffs_delta_ci,
+    cliffs_delta_ci_batch,
     compute_cop,
     compute_frontier_cop,
     holm_bonferroni_correction,
@@ -30,7 +34,6 @@
     kruskal_wallis_power,
     mann_whitney_power,
     mann_whitney_u,
-    scheirer_ray_hare,
     shapiro_wilk,
     spearman_correlation,
 )
@@ -324,7 +327,9 @@ def _compute_effect_sizes(
         List of effect size result dicts
 
     """
-    effect_sizes: list[dict[str, Any]] = []
+    # Collect (model, metric, tier transition) cells, then bootstrap them in one batch
+    cells: list[tuple[str, str, str, str]] = []
+    pairs: list[tuple[Any, Any]] = []
 
     for model in models:
         model_runs = runs_df[runs_df["agent_model"] == model]
@@ -338,21 +343,8 @@ def _compute_effect_sizes(
                 continue
 
             # pass_rate
-            delta, ci_low, ci_high = cliffs_delta_ci(
-                t2["passed"].astype(int), t1["passed"].astype(int)
-            )
-            effect_sizes.append(
-                {
-                    "model": model,
-                    "metric": "pass_rate",
-                    "tier1": tier1,
-                    "tier2": tier2,
-                    "cliffs_delta": float(delta),
-                    "ci_low": float(ci_low),
-                    "ci_high": float(ci_high),
-                    "is_significant": bool(not (ci_low <= 0 <= ci_high)),
-                }
-            )
+            cells.append((model, "pass_rate", tier1, tier2))
+            pairs.append((t2["passed"].astype(int), t1["passed"].astype(int)))
 
             # impl_rate, duration_seconds, and process metrics
             for metric in ("impl_rate", "duration_seconds", "r_prog", "cfp", "pr_revert_rate"):
@@ -361,28 +353,83 @@ def _compute_effect_sizes(
                 d1 = t1[metric].dropna()
                 d2 = t2[metric].dropna()
                 if len(d1) >= 2 and len(d2) >= 2:
-                    delta, ci_low, ci_high = cliffs_delta_ci(d2, d1)
-                    effect_sizes.append(
-                        {
-                            "model": model,
-                            "metric": metric,
-                            "tier1": tier1,
-                            "tier2": tier2,
-                            "cliffs_delta": float(delta),
-                            "ci_low": float(ci_low),
-                            "ci_high": float(ci_high),
-                            "is_significant": bool(not (ci_low <= 0 <= ci_high)),
-                        }
-                    )
+                    cells.append((model, metric, tier1, tier2))
+                    pairs.append((d2, d1))
+
+    effect_sizes: list[dict[str, Any]] = []
+    for (model, metric, tier1, tier2), (delta, ci_low, ci_high) in zip(
+        cells, cliffs_delta_ci_batch(pairs), strict=True
+    ):
+        effect_sizes.append(
+            {
+                "model": model,
+                "metric": metric,
+                "tier1": tier1,
+                "tier2": tier2,
+                "cliffs_delta": float(delta),
+                "ci_low": float(ci_low),
+                "ci_high": float(ci_high),
+                "is_significant": bool(not (ci_low <= 0 <= ci_high)),
+            }
+        )
 
     return effect_sizes
 
 
+PowerTask = tuple[str, tuple[Any, ...]]
+
+
+def _power_task(task: PowerTask) -> float:
+    """Run one power simulation.
+
+    Args:
+        task: ``("mw", (n1, n2, effect_size))`` for Mann-Whitney or
+            ``("kw", (group_sizes, effect_size))`` for Kruskal-Wallis
+
+    Returns:
+        Achieved power in [0, 1]
+
+    """
+    kind, params = task
+    if kind == "mw":
+        n1, n2, effect_size = params
+        return float(mann_whitney_power(n1, n2, effect_size))
+    group_sizes, effect_size = params
+    return float(kruskal_wallis_power(list(group_sizes), effect_size=effect_size))
+
+
+def _run_power_tasks(tasks: list[PowerTask], jobs: int = 1) -> dict[PowerTask, float]:
+    """Run power simulations once per distinct task, optionally in a process pool.
+
+    Simulations are seeded from config, so identical tasks (e.g. the medium-effect
+    power of every transition with the same sample sizes) give identical results
+    and are computed only once.
+
+    Args:
+        tasks: Power tasks (see :func:`_power_task`)
+        jobs: Worker processes; 1 runs the simulations in-process
+
+    Returns:
+        Mapping of task to achieved power
+
+    """
+    unique = list(dict.fromkeys(tasks))
+    if jobs > 1 and len(unique) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=min(jobs, len(unique))) as executor:
+            values = list(executor.map(_power_task, unique))
+    else:
+        values = [_power_task(task) for task in unique]
+    return dict(zip(unique, values, strict=True))
+
+
 def _compute_power_analysis(
     runs_df: Any,
     models: list[str],
     tier_order: list[str],
     effect_sizes: list[dict[str, Any]],
+    jobs: int = 1,
 ) -> list[dict[str, Any]]:
     """Compute post-hoc power estimates for pairwise Mann-Whitney transitions.
 
@@ -394,12 +441,14 @@ def _compute_power_analysis(
         models: Sorted list of model identifiers
         tier_order: List of tier IDs in order
         effect_sizes: Previously computed effect size results
+        jobs: Worker processes for the power simulations (default: 1, in-process)
 
     Returns:
         List of power analysis result dicts
 
     """
-    power_analysis: list[dict[str, Any]] = []
+    # Collect rows with their power tasks first, then run all simulations together
+    pending: list[tuple[dict[str, Any], dict[str, PowerTask]]] = []
 
     for model in models:
         model_runs = runs_df[runs_df["agent_model"] == model]
@@ -427,18 +476,24 @@ def _compute_power_analysis(
             if observed_delta is None:
                 continue
 
-            power_analysis.append(
-                {
-                    "model": model,
-                    "metric": "pass_rate",
-                    "tier1": tier1,
-                    "tier2": tier2,
-                    "n1": n1,
-                    "n2": n2,
-                    "observed_delta": float(observed_delta),
-                    "power_at_observed": float(mann_whitney_power(n1, n2, abs(observed_delta))),
-                    "power_at_medium_0_3": float(mann_whitney_power(n1, n2, 0.3)),
-                }
+            pending.append(
+                (
+                    {
+                        "model": model,
+                        "metric": "pass_rate",
+                        "tier1": tier1,
+                        "tier2": tier2,
+                        "n1": n1,
+                        "n2": n2,
+                        "observed_delta": float(observed_delta),
+                        "power_at_observed": None,
+                        "power_at_medium_0_3": None,
+                    },
+                    {
+                        "power_at_observed": ("mw", (n1, n2, abs(observed_delta))),
+                        "power_at_medium_0_3": ("mw", (n1, n2, 0.3)),
+                    },
+                )
             )
 
         # Overall KW power for pass_rate across all tiers
@@ -448,21 +503,31 @@ def _compute_power_analysis(
             if len(g) > 0
         ]
         if len(tier_groups) >= 2:
-            kw_power = kruskal_wallis_power([len(g) for g in tier_groups], effect_size=0.06)
-            power_analysis.append(
-                {
-                    "model": model,
-                    "metric": "pass_rate_omnibus",
-                    "tier1": tier_order[0],
-                    "tier2": tier_order[-1],
-                    "n1": sum(len(g) for g in tier_groups),
-                    "n2": None,
-                    "observed_delta": None,
-                    "power_at_observed": None,
-                    "power_at_medium_0_3": float(kw_power),
-                }
+            pending.append(
+                (
+                    {
+                        "model": model,
+                        "metric": "pass_rate_omnibus",
+                        "tier1": tier_order[0],
+                        "tier2": tier_order[-1],
+                        "n1": sum(len(g) for g in tier_groups),
+                        "n2": None,
+                        "observed_delta": None,
+                        "power_at_observed": None,
+                        "power_at_medium_0_3": None,
+                    },
+                    {"power_at_medium_0_3": ("kw", (tuple(len(g) for g in tier_groups), 0.06))},
+                )
             )
 
+    powers = _run_power_tasks([task for _, tasks in pending for task in tasks.values()], jobs)
+
+    power_analysis: list[dict[str, Any]] = []
+    for row, tasks in pending:
+        for key, task in tasks.items():
+            row[key] = powers[task]
+        power_analysis.append(row)
+
     return power_analysis
 
 
@@ -594,22 +659,25 @@ def _compute_interaction_tests(runs_df: Any) -> list[dict[str, Any]]:
     """
     interaction_tests: list[dict[str, Any]] = []
     interaction_metrics = ["score", "impl_rate", "cost_usd", "duration_seconds"]
+    factors = ["agent_model", "tier"]
 
-    for metric in interaction_metrics:
-        metric_data = runs_df[["agent_model", "tier", metric]].dropna()
-
-        if len(metric_data) < 10:
-            continue
+    metrics = [
+        metric
+        for metric in interaction_metrics
+        if runs_df[[*factors, metric]].notna().all(axis=1).sum() >= 10
+    ]
 
-        srh_results = scheirer_ray_hare(
-            metric_data, value_col=metric, factor_a_col="agent_model", factor_b_col="tier"
-        )
+    # All metrics in one pass; rows with a missing value are dropped per metric
+    srh_results = scheirer_ray_hare_factorial(runs_df, metrics, factors)
 
-        for effect_name, effect_result in srh_results.items():
+    for metric in metrics:
+        for effect_name, effect_result in srh_results[metric].items():
             interaction_tests.append(
                 {
                     "metric": metric,
-                    "effect": effect_name,
+                    "effect": "interaction"
+                    if INTERACTION_SEPARATOR in effect_name
+                    else effect_name,
                     "h_statistic": effect_result["h_statistic"],
                     "df": effect_result["df"],
                     "p_value": effect_result["p_value"],
@@ -620,7 +688,9 @@ def _compute_interaction_tests(runs_df: Any) -> list[dict[str, Any]]:
     return interaction_tests
 
 
-def compute_statistical_results(runs_df: Any, tier_order: list[str]) -> dict[str, Any]:
+def compute_statistical_results(
+    runs_df: Any, tier_order: list[str], power_jobs: int = 1
+) -> dict[str, Any]:
     """Compute all statistical test results for export.
 
     Pairwise comparisons use Holm-Bonferroni correction per model.
@@ -629,6 +699,7 @@ def compute_statistical_results(runs_df: Any, tier_order: list[str]) -> dict[str
     Args:
         runs_df: Runs DataFrame
         tier_order: List of tier IDs in order
+        power_jobs: Worker processes for the power simulations (default: 1)
 
     Returns:
         Dictionary of statistical test results with corrected p-values
@@ -645,60 +716,43 @@ def compute_statistical_results(runs_df: Any, tier_order: list[str]) -> dict[str
         "omnibus_tests": _compute_omnibus_tests(runs_df, models, tier_order),
         "pairwise_comparisons": _compute_pairwise_comparisons(runs_df, models, tier_order),
         "effect_sizes": effect_sizes,
-        "power_analysis": _compute_power_analysis(runs_df, models, tier_order, effect_sizes),
+        "power_analysis": _compute_power_analysis(
+            runs_df, models, tier_order, effect_sizes, jobs=power_jobs
+        ),
         "correlations": _compute_correlations(runs_df, models),
         "tier_descriptives": _compute_tier_descriptives(runs_df, models, tier_order),
         "interaction_tests": _compute_interaction_tests(runs_df),
     }
 
 
-def main() -> None:
-    """Run the data export script."""
-    parser = argparse.ArgumentParser(description="Export experiment data to CSV")
-    parser.add_argument(
-        "--data-dir",
-        type=Path,
-        default=Path.home() / "fullruns",
-        help="Root of fullruns/ (default: ~/fullruns)",
-    )
-    parser.add_argument(
-        "--output-dir",
-        type=Path,
-        default=Path("docs/data"),
-        help="Output directory (default: docs/data)",
-    )
-    parser.add_argument(
-        "--exclude",
-        type=str,
-        nargs="*",
-        default=[],
-        help="Experiment names to exclude (e.g., --exclude test001-dryrun)",
-    )
-
-    args = parser.parse_args()
-
-    # Load experiment data
-    print(f"Loading experiments from {args.data_dir}")
-    experiments = load_all_experiments(args.data_dir, exclude=args.exclude)
-
-    if not experiments:
-        print("ERROR: No experiments found")
-        return
-
-    # Build DataFrames
-    print("Building DataFrames...")
-    runs_df = build_runs_df(experiments)
-    judges_df = build_judges_df(experiments)
-    criteria_df = build_criteria_df(experiments)
-    subtests_df = build_subtests_df(runs_df)
+def export_frames(
+    runs_df: Any,
+    judges_df: Any,
+    criteria_df: Any,
+    subtests_df: Any,
+    output_dir: Path,
+    n_experiments: int,
+    source_hashes: dict[str, str] | None = None,
+    power_jobs: int = 1,
+) -> None:
+    """Write CSVs, the columnar dataset, summary.json and statistical_results.json.
 
-    print(f"  Runs: {len(runs_df)}")
-    print(f"  Judges: {len(judges_df)}")
-    print(f"  Criteria: {len(criteria_df)}")
-    print(f"  Subtests: {len(subtests_df)}")
+    Args:
+        runs_df: Runs DataFrame
+        judges_df: Judges DataFrame
+        criteria_df: Criteria DataFrame
+        subtests_df: Subtests DataFrame
+        output_dir: Output directory (created if missing)
+        n_experiments: Number of experiments the frames were built from
+        source_hashes: Per-experiment source digests for the dataset manifest.
+            If None, the columnar dataset is not written.
+        power_jobs: Worker processes for the power simulations (default: 1)
+
+    Raises:
+        ValueError: If the summary judge count disagrees with judges_df
 
+    """
     # Create output directory
-    output_dir = Path(args.output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Export CSVs
@@ -716,6 +770,15 @@ def main() -> None:
     subtests_df.to_csv(output_dir / "subtests.csv", index=False)
     print(f"  Exported subtests.csv ({len(subtests_df)} rows)")
 
+    # Export columnar dataset consumed by generate_figures.py / generate_tables.py
+    if source_hashes is not None:
+        dataset_dir = output_dir / "dataset"
+        try:
+            write_dataset(dataset_dir, runs_df, judges_df, criteria_df, subtests_df, source_hashes)
+            print(f"  Exported columnar dataset to {dataset_dir}")
+        except ImportError as e:
+            print(f"  Skipped columnar dataset: {e}")
+
     # Export summary statistics as JSON
     overall_r_prog = runs_df["r_prog"].dropna()
     overall_cfp = runs_df["cfp"].dropna()
@@ -724,7 +787,7 @@ def main() -> None:
     summary = {
         "pipeline_version": config.pipeline_version,
         "config_version": config.config_version,
-        "total_experiments": len(experiments),
+        "total_experiments": n_experiments,
         "total_runs": len(runs_df),
         "total_judge_evaluations": len(judges_df),
         "total_criteria_scores": len(criteria_df),
@@ -875,7 +938,7 @@ def main() -> None:
 
     # Export statistical test results
     print("  Computing statistical results...")
-    statistical_results = compute_statistical_results(runs_df, tier_order)
+    statistical_results = compute_statistical_results(runs_df, tier_order, power_jobs)
 
     stats_path = output_dir / "statistical_results.json"
     with stats_path.open("w") as f:
@@ -885,5 +948,90 @@ def main() -> None:
     print("\nExport complete!")
 
 
+def main() -> None:
+    """Run the data export script."""
+    parser = argparse.ArgumentParser(description="Export experiment data to CSV")
+    parser.add_argument(
+        "--data-dir",
+        type=Path,
+        default=Path.home() / "fullruns",
+        help="Root of fullruns/ (default: ~/fullruns)",
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=Path("docs/data"),
+        help="Output directory (default: docs/data)",
+    )
+    parser.add_argument(
+        "--exclude",
+        type=str,
+        nargs="*",
+        default=[],
+        help="Experiment names to exclude (e.g., --exclude test001-dryrun)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Directory for the parsed-run cache; unchanged runs are not re-parsed "
+        "(default: no cache)",
+    )
+    parser.add_argument(
+        "--load-jobs",
+        type=int,
+        default=1,
+        help="Worker processes for parsing uncached runs (default: 1)",
+    )
+    parser.add_argument(
+        "--no-dataset",
+        action="store_true",
+        help="Skip writing the columnar dataset (<output-dir>/dataset/)",
+    )
+    parser.add_argument(
+        "--power-jobs",
+        type=int,
+        default=1,
+        help="Worker processes for the post-hoc power simulations (default: 1)",
+    )
+
+    args = parser.parse_args()
+
+    # Load experiment data
+    print(f"Loading experiments from {args.data_dir}")
+    experiments = load_all_experiments(
+        args.data_dir, exclude=args.exclude, cache_dir=args.cache_dir, jobs=args.load_jobs
+    )
+
+    if not experiments:
+        print("ERROR: No experiments found")
+        return
+
+    # Build DataFrames
+    print("Building DataFrames...")
+    runs_df = build_runs_df(experiments)
+    judges_df = build_judges_df(experiments)
+    criteria_df = build_criteria_df(experiments)
+    subtests_df = build_subtests_df(runs_df)
+
+    print(f"  Runs: {len(runs_df)}")
+    print(f"  Judges: {len(judges_df)}")
+    print(f"  Criteria: {len(criteria_df)}")
+    print(f"  Subtests: {len(subtests_df)}")
+
+    export_frames(
+        runs_df,
+        judges_df,
+        criteria_df,
+        subtests_df,
+        Path(args.output_dir),
+        n_experiments=len(experiments),
+        source_hashes=None
+        if args.no_dataset
+        else compute_source_hashes(args.data_dir, args.exclude),
+        power_jobs=args.power_jobs,
+    )
+
+
 if __name__ == "__main__":
     main()
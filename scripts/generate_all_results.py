@@ -2,6 +2,11 @@
 """Master script to generate all analysis outputs.
 
 Runs data export, figure generation, and table generation in sequence.
+
+By default each step runs as a separate ``pixi run python`` subprocess.  With
+``--in-process`` all three steps run in this interpreter: experiments are
+loaded and the runs/judges/criteria/subtests DataFrames are built once and
+shared, and per-stage wall times are printed at the end.
 """
 
 from __future__ import annotations
@@ -9,6 +14,9 @@
 import argparse
 import subprocess
 import sys
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 from scylla.utils.terminal import terminal_guard
@@ -42,6 +50,163 @@ def run_script(script_name: str, args: list[str], description: str) -> bool:
         return False
 
 
+@contextmanager
+def _timed(stage: str, timings: list[tuple[str, float]]) -> Iterator[None]:
+    """Record the wall time of a stage in ``timings``, even if it raises."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.append((stage, time.perf_counter() - start))
+
+
+def _run_stage(
+    description: str, stage: str, timings: list[tuple[str, float]], func: Callable[[], None]
+) -> bool:
+    """Run one in-process stage with a banner, timing and error isolation.
+
+    Args:
+        description: Human-readable description
+        stage: Short stage name for the timing report
+        timings: Accumulator for ``(stage, seconds)`` pairs
+        func: Stage body
+
+    Returns:
+        True if the stage completed without raising, False otherwise
+
+    """
+    print(f"\n{'=' * 70}")
+    print(f"{description}")
+    print(f"{'=' * 70}\n")
+    with _timed(stage, timings):
+        try:
+            func()
+        except Exception as e:
+            print(f"\nERROR: {stage} failed with exception: {e}")
+            return False
+    return True
+
+
+def run_in_process(args: argparse.Namespace) -> bool:
+    """Run export, figures and tables in this process on shared DataFrames.
+
+    Experiments are loaded and the DataFrames built exactly once; each stage
+    receives the same frames.  Per-stage timings are printed at the end.
+
+    Args:
+        args: Parsed command-line arguments of :func:`main`
+
+    Returns:
+        True if every requested stage succeeded, False otherwise
+
+    """
+    timings: list[tuple[str, float]] = []
+
+    # Heavy imports (pandas, scipy, altair) are deferred to here so the
+    # default subprocess mode does not pay for them in the parent process.
+    with _timed("imports", timings):
+        import export_data
+        import generate_figures
+        import generate_tables
+
+        from scylla.analysis import (
+            build_criteria_df,
+            build_judges_df,
+            build_runs_df,
+            build_subtests_df,
+            load_all_experiments,
+            load_rubric_weights,
+        )
+        from scylla.analysis.dataset import compute_source_hashes
+        from scylla.analysis.figures.spec_builder import apply_publication_theme
+
+    print(f"Loading experiments from {args.data_dir}")
+    with _timed("load", timings):
+        experiments = load_all_experiments(
+            args.data_dir, exclude=args.exclude, cache_dir=args.cache_dir, jobs=args.load_jobs
+        )
+    if not experiments:
+        print("ERROR: No experiments found")
+        return False
+
+    print("Building DataFrames...")
+    with _timed("dataframes", timings):
+        runs_df = build_runs_df(experiments)
+        judges_df = build_judges_df(experiments)
+        criteria_df = build_criteria_df(experiments)
+        subtests_df = build_subtests_df(runs_df)
+    print(f"  Runs: {len(runs_df)}")
+    print(f"  Judges: {len(judges_df)}")
+    print(f"  Criteria: {len(criteria_df)}")
+    print(f"  Subtests: {len(subtests_df)}")
+
+    success = True
+
+    if not args.skip_data:
+
+        def _export() -> None:
+            export_data.export_frames(
+                runs_df,
+                judges_df,
+                criteria_df,
+                subtests_df,
+                args.output_dir / "data",
+                n_experiments=len(experiments),
+                source_hashes=compute_source_hashes(args.data_dir, args.exclude),
+                power_jobs=args.power_jobs,
+            )
+
+        success = _run_stage("Step 1/3: Exporting experiment data", "export", timings, _export)
+
+    if not args.skip_figures and success:
+
+        def _figures() -> None:
+            apply_publication_theme()
+            names = list(generate_figures.FIGURES)
+            ok, failed = generate_figures.run_figures(
+                runs_df,
+                judges_df,
+                criteria_df,
+                args.output_dir / "figures",
+                names,
+                render=not args.no_render,
+                jobs=args.figure_jobs,
+                use_cache=not args.no_output_cache,
+            )
+            print(f"\nFigures: {ok}/{len(names)} generated successfully")
+            for fig_name, error in failed:
+                print(f"  ✗ {fig_name}: {error}")
+
+        success = _run_stage("Step 2/3: Generating figures", "figures", timings, _figures)
+
+    if not args.skip_tables and success:
+
+        def _tables() -> None:
+            rubric_weights = load_rubric_weights(args.data_dir, exclude=args.exclude)
+            ok, failed, n_tables = generate_tables.run_tables(
+                runs_df,
+                judges_df,
+                criteria_df,
+                subtests_df,
+                rubric_weights,
+                args.output_dir / "tables",
+                use_cache=not args.no_output_cache,
+            )
+            print(f"\nTables: {ok}/{n_tables} generated successfully")
+            for table_name, error in failed:
+                print(f"  ✗ {table_name}: {error}")
+
+        success = _run_stage("Step 3/3: Generating tables", "tables", timings, _tables)
+
+    print(f"\n{'=' * 70}")
+    print("Stage timings:")
+    for stage, seconds in timings:
+        print(f"  {stage:<12} {seconds:8.2f}s")
+    print(f"  {'total':<12} {sum(seconds for _, seconds in timings):8.2f}s")
+
+    return success
+
+
 def main() -> None:
     """Run the complete analysis pipeline."""
     parser = argparse.ArgumentParser(
@@ -87,67 +252,122 @@ def main() -> None:
         default=[],
         help="Experiment names to exclude (e.g., --exclude test001-dryrun)",
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Directory for the parsed-run cache; unchanged runs are not re-parsed "
+        "(default: no cache)",
+    )
+    parser.add_argument(
+        "--load-jobs",
+        type=int,
+        default=1,
+        help="Worker processes for parsing uncached runs (default: 1)",
+    )
+    parser.add_argument(
+        "--power-jobs",
+        type=int,
+        default=1,
+        help="Worker processes for the post-hoc power simulations in export_data (default: 1)",
+    )
+    parser.add_argument(
+        "--figure-jobs",
+        type=int,
+        default=1,
+        help="Worker processes for rendering figures to PNG/PDF (default: 1)",
+    )
+    parser.add_argument(
+        "--no-output-cache",
+        action="store_true",
+        help="Regenerate every figure and table, even if its inputs are unchanged",
+    )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Run all steps in this process, loading data and building DataFrames once",
+    )
 
     args = parser.parse_args()
 
     with terminal_guard():
         success = True
 
-        # Build common exclude args
-        exclude_args = []
-        if args.exclude:
-            exclude_args.extend(["--exclude", *args.exclude])
-
-        # Step 1: Export data
-        if not args.skip_data:
-            export_args = [
-                "--data-dir",
-                str(args.data_dir),
-                "--output-dir",
-                str(args.output_dir / "data"),
-                *exclude_args,
-            ]
-            if not run_script(
-                "scripts/export_data.py",
-                export_args,
-                "Step 1/3: Exporting experiment data to CSV",
-            ):
-                success = False
-
-        # Step 2: Generate figures
-        if not args.skip_figures and success:
-            figure_args = [
-                "--data-dir",
-                str(args.data_dir),
-                "--output-dir",
-                str(args.output_dir / "figures"),
-                *exclude_args,
-            ]
-            if args.no_render:
-                figure_args.append("--no-render")
-
-            if not run_script(
-                "scripts/generate_figures.py",
-                figure_args,
-                "Step 2/3: Generating figures (Vega-Lite specs + CSV)",
-            ):
-                success = False
-
-        # Step 3: Generate tables
-        if not args.skip_tables and success:
-            table_args = [
-                "--data-dir",
-                str(args.data_dir),
-                "--output-dir",
-                str(args.output_dir / "tables"),
-                *exclude_args,
-            ]
-            if not run_script(
-                "scripts/generate_tables.py",
-                table_args,
-                "Step 3/3: Generating statistical tables (Markdown + LaTeX)",
-            ):
-                success = False
+        if args.in_process:
+            success = run_in_process(args)
+        else:
+            # Build common loader args
+            loader_args = []
+            if args.exclude:
+                loader_args.extend(["--exclude", *args.exclude])
+            if args.cache_dir is not None:
+                loader_args.extend(["--cache-dir", str(args.cache_dir)])
+            if args.load_jobs != 1:
+                loader_args.extend(["--load-jobs", str(args.load_jobs)])
+
+            # Step 1: Export data
+            if not args.skip_data:
+                export_args = [
+                    "--data-dir",
+                    str(args.data_dir),
+                    "--output-dir",
+                    str(args.output_dir / "data"),
+                    *loader_args,
+                ]
+                if args.power_jobs != 1:
+                    export_args.extend(["--power-jobs", str(args.power_jobs)])
+                if not run_script(
+                    "scripts/export_data.py",
+                    export_args,
+                    "Step 1/3: Exporting experiment data to CSV",
+                ):
+                    success = False
+
+            # Figures and tables reuse the columnar dataset written by the export step
+            dataset_args = ["--dataset", str(args.output_dir / "data" / "dataset")]
+
+            # Step 2: Generate figures
+            if not args.skip_figures and success:
+                figure_args = [
+                    "--data-dir",
+                    str(args.data_dir),
+                    "--output-dir",
+                    str(args.output_dir / "figures"),
+                    *loader_args,
+                    *dataset_args,
+                ]
+                if args.no_render:
+                    figure_args.append("--no-render")
+                if args.figure_jobs != 1:
+                    figure_args.extend(["--jobs", str(args.figure_jobs)])
+                if args.no_output_cache:
+                    figure_args.append("--no-output-cache")
+
+                if not run_script(
+                    "scripts/generate_figures.py",
+                    figure_args,
+                    "Step 2/3: Generating figures (Vega-Lite specs + CSV)",
+                ):
+                    success = False
+
+            # Step 3: Generate tables
+            if not args.skip_tables and success:
+                table_args = [
+                    "--data-dir",
+                    str(args.data_dir),
+                    "--output-dir",
+                    str(args.output_dir / "tables"),
+                    *loader_args,
+                    *dataset_args,
+                ]
+                if args.no_output_cache:
+                    table_args.append("--no-output-cache")
+                if not run_script(
+                    "scripts/generate_tables.py",
+                    table_args,
+                    "Step 3/3: Generating statistical tables (Markdown + LaTeX)",
+                ):
+                    success = False
 
         # Summary
         print(f"\n{'=' * 70}")
@@ -157,6 +377,7 @@ def main() -> None:
             print(f"  Data:    {args.output_dir / 'data'}/*.csv")
             print(f"           {args.output_dir / 'data'}/summary.json")
             print(f"           {args.output_dir / 'data'}/statistical_results.json")
+            print(f"           {args.output_dir / 'data'}/dataset/ (Arrow tables + manifest)")
             print(f"  Figures: {args.output_dir / 'figures'}/*.{{png,pdf,vl.json,csv}}")
             print(f"           {args.output_dir / 'figures'}/*_include.tex (LaTeX snippets)")
             print(f"  Tables:  {args.output_dir / 'tables'}/*.{{md,tex}}")
@@ -8,123 +8,340 @@
 from __future__ import annotations
 
 import argparse
+import importlib
+import multiprocessing
+import time
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
-from typing import Any
-
-from scylla.analysis import (
-    build_criteria_df,
-    build_judges_df,
-    build_runs_df,
-    load_all_experiments,
-)
-from scylla.analysis.figures.correlation import (
-    fig20_metric_correlation_heatmap,
-    fig21_cost_quality_regression,
-)
-from scylla.analysis.figures.cost_analysis import (
-    fig06_cop_by_tier,
-    fig08_cost_quality_pareto,
-    fig22_cumulative_cost,
-    fig34_per_experiment_cost_frontier,
-    fig39_cost_scaling_with_difficulty,
-)
-from scylla.analysis.figures.criteria_analysis import fig09_criteria_by_tier
-from scylla.analysis.figures.diagnostics import fig23_qq_plots, fig24_score_histograms
-from scylla.analysis.figures.effect_size import fig19_effect_size_forest
-from scylla.analysis.figures.impl_rate_analysis import (
-    fig25_impl_rate_by_tier,
-    fig26_impl_rate_vs_pass_rate,
-    fig27_impl_rate_distribution,
-)
-from scylla.analysis.figures.judge_analysis import (
-    fig02_judge_variance,
-    fig14_judge_agreement,
-    fig17_judge_variance_overall,
-)
-from scylla.analysis.figures.model_comparison import fig11_tier_uplift, fig12_consistency
-from scylla.analysis.figures.process_metrics import (
-    fig28_r_prog_by_tier,
-    fig29_cfp_by_tier,
-    fig30_pr_revert_by_tier,
-    fig_strategic_drift_by_tier,
-)
-from scylla.analysis.figures.spec_builder import apply_publication_theme
-from scylla.analysis.figures.subtest_detail import (
-    fig13_latency,
-    fig15a_subtest_run_heatmap,
-    fig15b_subtest_best_heatmap,
-    fig15c_tier_summary_heatmap,
-)
-from scylla.analysis.figures.task_analysis import (
-    fig35_task_difficulty_distribution,
-    fig36_tier_rank_stability,
-    fig37_complexity_vs_differentiation,
-    fig38_full_ablation_comparison,
-)
-from scylla.analysis.figures.tier_performance import (
-    fig04_pass_rate_by_tier,
-    fig05_grade_heatmap,
-    fig31_experiment_tier_heatmap,
-    fig32_tier_win_count,
-    fig33_convergence_analysis,
-)
-from scylla.analysis.figures.token_analysis import fig07_token_distribution
-from scylla.analysis.figures.variance import (
-    fig01_score_variance_by_tier,
-    fig03_failure_rate_by_tier,
-    fig16a_success_variance_per_subtest,
-    fig16b_success_variance_aggregate,
-    fig18a_failure_rate_per_subtest,
-    fig18b_failure_rate_aggregate,
-)
+from typing import TYPE_CHECKING
 
-# Figure registry mapping names to generator functions
-FIGURES: dict[str, tuple[str, Any]] = {
-    "fig01_score_variance_by_tier": ("variance", fig01_score_variance_by_tier),
-    "fig02_judge_variance": ("judge", fig02_judge_variance),
-    "fig03_failure_rate_by_tier": ("variance", fig03_failure_rate_by_tier),
-    "fig04_pass_rate_by_tier": ("tier", fig04_pass_rate_by_tier),
-    "fig05_grade_heatmap": ("tier", fig05_grade_heatmap),
-    "fig06_cop_by_tier": ("cost", fig06_cop_by_tier),
-    "fig07_token_distribution": ("token", fig07_token_distribution),
-    "fig08_cost_quality_pareto": ("cost", fig08_cost_quality_pareto),
-    "fig09_criteria_by_tier": ("criteria", fig09_criteria_by_tier),
-    "fig11_tier_uplift": ("model", fig11_tier_uplift),
-    "fig12_consistency": ("model", fig12_consistency),
-    "fig13_latency": ("cost", fig13_latency),
-    "fig14_judge_agreement": ("judge", fig14_judge_agreement),
-    "fig15a_subtest_run_heatmap": ("subtest", fig15a_subtest_run_heatmap),
-    "fig15b_subtest_best_heatmap": ("subtest", fig15b_subtest_best_heatmap),
-    "fig15c_tier_summary_heatmap": ("subtest", fig15c_tier_summary_heatmap),
-    "fig16a_success_variance_per_subtest": ("variance", fig16a_success_variance_per_subtest),
-    "fig16b_success_variance_aggregate": ("variance", fig16b_success_variance_aggregate),
-    "fig17_judge_variance_overall": ("judge", fig17_judge_variance_overall),
-    "fig18a_failure_rate_per_subtest": ("variance", fig18a_failure_rate_per_subtest),
-    "fig18b_failure_rate_aggregate": ("variance", fig18b_failure_rate_aggregate),
-    "fig19_effect_size_forest": ("effect_size", fig19_effect_size_forest),
-    "fig20_metric_correlation_heatmap": ("correlation", fig20_metric_correlation_heatmap),
-    "fig21_cost_quality_regression": ("correlation", fig21_cost_quality_regression),
-    "fig22_cumulative_cost": ("cost", fig22_cumulative_cost),
-    "fig23_qq_plots": ("diagnostics", fig23_qq_plots),
-    "fig24_score_histograms": ("diagnostics", fig24_score_histograms),
-    "fig25_impl_rate_by_tier": ("impl_rate", fig25_impl_rate_by_tier),
-    "fig26_impl_rate_vs_pass_rate": ("impl_rate", fig26_impl_rate_vs_pass_rate),
-    "fig27_impl_rate_distribution": ("impl_rate", fig27_impl_rate_distribution),
-    "fig28_r_prog_by_tier": ("tier", fig28_r_prog_by_tier),
-    "fig29_cfp_by_tier": ("tier", fig29_cfp_by_tier),
-    "fig30_pr_revert_by_tier": ("tier", fig30_pr_revert_by_tier),
-    "fig_strategic_drift_by_tier": ("tier", fig_strategic_drift_by_tier),
-    "fig31_experiment_tier_heatmap": ("tier", fig31_experiment_tier_heatmap),
-    "fig32_tier_win_count": ("tier", fig32_tier_win_count),
-    "fig33_convergence_analysis": ("tier", fig33_convergence_analysis),
-    "fig34_per_experiment_cost_frontier": ("cost", fig34_per_experiment_cost_frontier),
-    "fig35_task_difficulty_distribution": ("tier", fig35_task_difficulty_distribution),
-    "fig36_tier_rank_stability": ("tier", fig36_tier_rank_stability),
-    "fig37_complexity_vs_differentiation": ("tier", fig37_complexity_vs_differentiation),
-    "fig38_full_ablation_comparison": ("tier", fig38_full_ablation_comparison),
-    "fig39_cost_scaling_with_difficulty": ("cost", fig39_cost_scaling_with_difficulty),
+from scylla.analysis.startup import StartupProfiler
+
+_PROFILER = StartupProfiler()
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from scylla.analysis.figures.spec_builder import RenderResult
+
+# Figure name -> (category, module in scylla.analysis.figures defining a
+# generator function of the same name)
+FIGURE_MODULES: dict[str, tuple[str, str]] = {
+    "fig01_score_variance_by_tier": ("variance", "variance"),
+    "fig02_judge_variance": ("judge", "judge_analysis"),
+    "fig03_failure_rate_by_tier": ("variance", "variance"),
+    "fig04_pass_rate_by_tier": ("tier", "tier_performance"),
+    "fig05_grade_heatmap": ("tier", "tier_performance"),
+    "fig06_cop_by_tier": ("cost", "cost_analysis"),
+    "fig07_token_distribution": ("token", "token_analysis"),
+    "fig08_cost_quality_pareto": ("cost", "cost_analysis"),
+    "fig09_criteria_by_tier": ("criteria", "criteria_analysis"),
+    "fig11_tier_uplift": ("model", "model_comparison"),
+    "fig12_consistency": ("model", "model_comparison"),
+    "fig13_latency": ("cost", "subtest_detail"),
+    "fig14_judge_agreement": ("judge", "judge_analysis"),
+    "fig15a_subtest_run_heatmap": ("subtest", "subtest_detail"),
+    "fig15b_subtest_best_heatmap": ("subtest", "subtest_detail"),
+    "fig15c_tier_summary_heatmap": ("subtest", "subtest_detail"),
+    "fig16a_success_variance_per_subtest": ("variance", "variance"),
+    "fig16b_success_variance_aggregate": ("variance", "variance"),
+    "fig17_judge_variance_overall": ("judge", "judge_analysis"),
+    "fig18a_failure_rate_per_subtest": ("variance", "variance"),
+    "fig18b_failure_rate_aggregate": ("variance", "variance"),
+    "fig19_effect_size_forest": ("effect_size", "effect_size"),
+    "fig20_metric_correlation_heatmap": ("correlation", "correlation"),
+    "fig21_cost_quality_regression": ("correlation", "correlation"),
+    "fig22_cumulative_cost": ("cost", "cost_analysis"),
+    "fig23_qq_plots": ("diagnostics", "diagnostics"),
+    "fig24_score_histograms": ("diagnostics", "diagnostics"),
+    "fig25_impl_rate_by_tier": ("impl_rate", "impl_rate_analysis"),
+    "fig26_impl_rate_vs_pass_rate": ("impl_rate", "impl_rate_analysis"),
+    "fig27_impl_rate_distribution": ("impl_rate", "impl_rate_analysis"),
+    "fig28_r_prog_by_tier": ("tier", "process_metrics"),
+    "fig29_cfp_by_tier": ("tier", "process_metrics"),
+    "fig30_pr_revert_by_tier": ("tier", "process_metrics"),
+    "fig_strategic_drift_by_tier": ("tier", "process_metrics"),
+    "fig31_experiment_tier_heatmap": ("tier", "tier_performance"),
+    "fig32_tier_win_count": ("tier", "tier_performance"),
+    "fig33_convergence_analysis": ("tier", "tier_performance"),
+    "fig34_per_experiment_cost_frontier": ("cost", "cost_analysis"),
+    "fig35_task_difficulty_distribution": ("tier", "task_analysis"),
+    "fig36_tier_rank_stability": ("tier", "task_analysis"),
+    "fig37_complexity_vs_differentiation": ("tier", "task_analysis"),
+    "fig38_full_ablation_comparison": ("tier", "task_analysis"),
+    "fig39_cost_scaling_with_difficulty": ("cost", "cost_analysis"),
 }
 
+FigureGenerator = Callable[..., None]
+
+
+class FigureRegistry(Mapping[str, tuple[str, FigureGenerator]]):
+    """Read-only mapping of figure name to ``(category, generator)``.
+
+    Figure modules (and with them altair, scipy and the publication theme)
+    are imported the first time one of their figures is looked up, so
+    listing figures or generating a single one does not import them all.
+    """
+
+    def __init__(self, modules: dict[str, tuple[str, str]]) -> None:
+        """Initialize from a name -> (category, module) table."""
+        self._modules = modules
+        self._resolved: dict[str, tuple[str, FigureGenerator]] = {}
+
+    def category(self, name: str) -> str:
+        """Return a figure's category without importing its module."""
+        return self._modules[name][0]
+
+    def __getitem__(self, name: str) -> tuple[str, FigureGenerator]:
+        """Return ``(category, generator)``, importing the generator's module if needed."""
+        if name not in self._resolved:
+            category, module = self._modules[name]
+            generator = getattr(importlib.import_module(f"scylla.analysis.figures.{module}"), name)
+            self._resolved[name] = (category, generator)
+        return self._resolved[name]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over figure names in registry order."""
+        return iter(self._modules)
+
+    def __len__(self) -> int:
+        """Return the number of registered figures."""
+        return len(self._modules)
+
+
+# Figure registry mapping names to generator functions
+FIGURES = FigureRegistry(FIGURE_MODULES)
+
+_PROFILER.mark("script imports")
+
+
+def _load_frames(
+    args: argparse.Namespace,
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame] | None:
+    """Load runs/judges/criteria DataFrames from the dataset or raw experiment JSON.
+
+    Args:
+        args: Parsed command-line arguments
+
+    Returns:
+        ``(runs_df, judges_df, criteria_df)``, or None if no experiments were found
+
+    """
+    from scylla.analysis import (
+        build_criteria_df,
+        build_judges_df,
+        build_runs_df,
+        load_all_experiments,
+    )
+    from scylla.analysis.dataset import dataset_is_current, read_dataset
+
+    if args.dataset is not None:
+        if dataset_is_current(args.dataset, args.data_dir, args.exclude):
+            print(f"Loading dataset from {args.dataset}")
+            dataset = read_dataset(args.dataset)
+            return dataset.runs_df, dataset.judges_df, dataset.criteria_df
+        print(f"Dataset {args.dataset} is missing or stale, loading raw experiment data")
+
+    # Load experiment data
+    print(f"Loading experiments from {args.data_dir}")
+    experiments = load_all_experiments(
+        args.data_dir, exclude=args.exclude, cache_dir=args.cache_dir, jobs=args.load_jobs
+    )
+
+    if not experiments:
+        return None
+
+    # Build DataFrames
+    print("Building DataFrames...")
+    return (
+        build_runs_df(experiments),
+        build_judges_df(experiments),
+        build_criteria_df(experiments),
+    )
+
+
+def _report_renders(pending: list[tuple[str, Future[RenderResult]]], jobs: int) -> None:
+    """Wait for queued renders and print per-figure timing and warnings.
+
+    Render failures are warnings, as in synchronous rendering; they never
+    fail the figure whose spec was generated.
+
+    Args:
+        pending: ``(figure_name, future)`` in submission order
+        jobs: Number of render workers (for the progress message)
+
+    """
+    if not pending:
+        return
+    print(f"\nRendering {len(pending)} figure(s) with {jobs} worker(s)...")
+    for fig_name, future in pending:
+        try:
+            result = future.result()
+        except Exception as e:
+            print(f"  Warning: {fig_name}: render worker failed: {e}")
+            continue
+        for fmt, error in result.errors:
+            print(f"  Warning: {fig_name}: could not render {fmt}: {error}")
+        for path in result.rendered:
+            print(f"  Rendered: {path}")
+        print(f"  {fig_name} rendered in {result.seconds:.2f}s")
+
+
+def run_figures(
+    runs_df: pd.DataFrame,
+    judges_df: pd.DataFrame,
+    criteria_df: pd.DataFrame,
+    output_dir: Path,
+    figures_to_generate: list[str],
+    render: bool = True,
+    jobs: int = 1,
+    use_cache: bool = True,
+) -> tuple[int, list[tuple[str, str]]]:
+    """Generate the requested figures with per-figure error isolation.
+
+    With ``jobs > 1`` (and rendering enabled) specs are still built here, one
+    figure at a time, but each figure's PNG/PDF rendering is dispatched to a
+    process pool as soon as its spec is saved, so rendering overlaps with
+    building the remaining specs. Each worker process runs its own vl-convert
+    engine.
+
+    Figures whose input DataFrame, generator source and analysis config are
+    unchanged since the last run (see :class:`OutputCache`) are skipped.
+
+    Args:
+        runs_df: Runs DataFrame
+        judges_df: Judges DataFrame
+        criteria_df: Criteria DataFrame
+        output_dir: Output directory
+        figures_to_generate: Figure names from :data:`FIGURES`
+        render: Whether to render PNG/PDF in addition to specs and CSVs
+        jobs: Render worker processes (default: 1, render synchronously)
+        use_cache: Skip figures whose outputs are current (default: True)
+
+    Returns:
+        ``(success_count, failed)`` where ``failed`` lists ``(figure_name, error)``
+
+    """
+    from scylla.analysis.figures.spec_builder import defer_rendering, render_job
+    from scylla.analysis.output_cache import OutputCache
+
+    print(f"\nGenerating {len(figures_to_generate)} figures...")
+    success_count = 0
+    failed = []
+
+    # Detect single-model dataset for guarding multi-model figures
+    try:
+        n_models = int(runs_df["agent_model"].nunique())
+    except (KeyError, TypeError, ValueError):
+        n_models = 0
+    multi_model_figures = {"fig11_tier_uplift", "fig12_consistency"}
+
+    # Detect single-judge dataset for guarding multi-judge figures
+    try:
+        n_judges = int(judges_df["judge_model"].nunique())
+    except (KeyError, TypeError, ValueError):
+        n_judges = 0
+    single_judge_figures = {
+        "fig02_judge_variance",
+        "fig14_judge_agreement",
+        "fig17_judge_variance_overall",
+    }
+
+    # Spawn, not fork: a forked child inherits vl-convert's runtime threads in
+    # an unusable state once the parent has rendered anything
+    cache = OutputCache(output_dir, enabled=use_cache)
+    executor = (
+        ProcessPoolExecutor(max_workers=jobs, mp_context=multiprocessing.get_context("spawn"))
+        if render and jobs > 1
+        else None
+    )
+    pending: list[tuple[str, Future[RenderResult]]] = []
+
+    try:
+        for fig_name in figures_to_generate:
+            if fig_name not in FIGURES:
+                print(f"WARNING: Unknown figure '{fig_name}', skipping")
+                continue
+
+            # Skip multi-model figures on single-model data
+            if fig_name in multi_model_figures and n_models < 2:
+                print(f"\n{fig_name}: SKIPPED (requires >=2 models, found {n_models})")
+                success_count += 1  # Not a failure, just inapplicable
+                continue
+
+            # Skip multi-judge figures on single-judge data
+            if fig_name in single_judge_figures and n_judges < 2:
+                print(f"\n{fig_name}: SKIPPED (requires >=2 judges, found {n_judges})")
+                success_count += 1  # Not a failure, just inapplicable
+                continue
+
+            category, generator_func = FIGURES[fig_name]
+            print(f"\n{fig_name} ({category}):")
+
+            # Determine which DataFrame to pass
+            if category in (
+                "variance",
+                "tier",
+                "cost",
+                "token",
+                "model",
+                "subtest",
+                "effect_size",
+                "correlation",
+                "diagnostics",
+                "impl_rate",
+            ):
+                df = runs_df
+            elif category == "judge":
+                df = judges_df
+            elif category == "criteria":
+                df = criteria_df
+            else:
+                print(f"  ERROR: Unknown category '{category}'")
+                failed.append((fig_name, "Unknown category"))
+                continue
+
+            key = cache.key(generator_func, [df], render=render)
+            if cache.is_current(fig_name, key):
+                print(f"  ✓ {fig_name} unchanged, skipped (cached)")
+                success_count += 1
+                continue
+
+            start = time.perf_counter()
+            before = cache.snapshot()
+            try:
+                if executor is None:
+                    generator_func(df, output_dir, render=render)
+                    outputs = cache.written_since(before)
+                else:
+                    with defer_rendering() as queue:
+                        generator_func(df, output_dir, render=render)
+                    pending.extend((fig_name, executor.submit(render_job, job)) for job in queue)
+                    # Deferred renders count as outputs; if one fails its file is
+                    # missing and the figure is rebuilt next time
+                    outputs = cache.written_since(before) + [
+                        Path(path) for job in queue for _, path in job.outputs
+                    ]
+                cache.record(fig_name, key, outputs)
+
+                elapsed = time.perf_counter() - start
+                print(f"  ✓ {fig_name} generated successfully ({elapsed:.2f}s)")
+                success_count += 1
+
+            except Exception as e:
+                cache.invalidate(fig_name)
+                print(f"  ✗ {fig_name} failed: {e}")
+                failed.append((fig_name, str(e)))
+
+        _report_renders(pending, jobs)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+        cache.save()
+
+    return success_count, failed
+
 
 def main() -> None:  # figure generation with many conditional paths
     """Run the figure generation script."""
@@ -167,31 +384,66 @@ def main() -> None:  # figure generation with many conditional paths
         default=[],
         help="Experiment names to exclude (e.g., --exclude test001-dryrun)",
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Directory for the parsed-run cache; unchanged runs are not re-parsed "
+        "(default: no cache)",
+    )
+    parser.add_argument(
+        "--load-jobs",
+        type=int,
+        default=1,
+        help="Worker processes for parsing uncached runs (default: 1)",
+    )
+    parser.add_argument(
+        "--dataset",
+        type=Path,
+        default=None,
+        help="Columnar dataset written by export_data.py; used instead of raw JSON "
+        "when it is current (default: always load raw JSON)",
+    )
+    parser.add_argument(
+        "--no-output-cache",
+        action="store_true",
+        help="Regenerate every figure, even if its inputs are unchanged since the last run",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for rendering PNG/PDF; specs are always built in the "
+        "main process (default: 1, render synchronously)",
+    )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Report import and start-up time (before figure generation) against the "
+        "startup budget",
+    )
 
     args = parser.parse_args()
+    _PROFILER.mark("argument parsing")
 
     if args.list_figures:
         print("Available figures:")
-        for name, (category, _) in FIGURES.items():
-            print(f"  {name} ({category})")
+        for name in FIGURES:
+            print(f"  {name} ({FIGURES.category(name)})")
         return
 
     # Apply publication theme
-    apply_publication_theme()
+    from scylla.analysis.figures.spec_builder import apply_publication_theme
 
-    # Load experiment data
-    print(f"Loading experiments from {args.data_dir}")
-    experiments = load_all_experiments(args.data_dir, exclude=args.exclude)
+    apply_publication_theme()
+    _PROFILER.mark("publication theme")
 
-    if not experiments:
+    frames = _load_frames(args)
+    _PROFILER.mark("load data", startup=False)
+    if frames is None:
         print("ERROR: No experiments found")
         return
-
-    # Build DataFrames
-    print("Building DataFrames...")
-    runs_df = build_runs_df(experiments)
-    judges_df = build_judges_df(experiments)
-    criteria_df = build_criteria_df(experiments)
+    runs_df, judges_df, criteria_df = frames
 
     print(f"  Runs: {len(runs_df)}")
     print(f"  Judges: {len(judges_df)}")
@@ -203,82 +455,28 @@ def main() -> None:  # figure generation with many conditional paths
     else:
         figures_to_generate = [f.strip() for f in args.figures.split(",")]
 
+    if args.profile_startup:
+        # Resolve the requested generators up front so their imports are measured
+        for name in figures_to_generate:
+            if name in FIGURES:
+                FIGURES[name]
+        _PROFILER.mark("figure module imports")
+        print(_PROFILER.report())
+
     # Generate figures with error isolation
     render = not args.no_render
     output_dir = Path(args.output_dir)
 
-    print(f"\nGenerating {len(figures_to_generate)} figures...")
-    success_count = 0
-    failed = []
-
-    # Detect single-model dataset for guarding multi-model figures
-    try:
-        n_models = int(runs_df["agent_model"].nunique())
-    except (KeyError, TypeError, ValueError):
-        n_models = 0
-    multi_model_figures = {"fig11_tier_uplift", "fig12_consistency"}
-
-    # Detect single-judge dataset for guarding multi-judge figures
-    try:
-        n_judges = int(judges_df["judge_model"].nunique())
-    except (KeyError, TypeError, ValueError):
-        n_judges = 0
-    single_judge_figures = {
-        "fig02_judge_variance",
-        "fig14_judge_agreement",
-        "fig17_judge_variance_overall",
-    }
-
-    for fig_name in figures_to_generate:
-        if fig_name not in FIGURES:
-            print(f"WARNING: Unknown figure '{fig_name}', skipping")
-            continue
-
-        # Skip multi-model figures on single-model data
-        if fig_name in multi_model_figures and n_models < 2:
-            print(f"\n{fig_name}: SKIPPED (requires >=2 models, found {n_models})")
-            success_count += 1  # Not a failure, just inapplicable
-            continue
-
-        # Skip multi-judge figures on single-judge data
-        if fig_name in single_judge_figures and n_judges < 2:
-            print(f"\n{fig_name}: SKIPPED (requires >=2 judges, found {n_judges})")
-            success_count += 1  # Not a failure, just inapplicable
-            continue
-
-        category, generator_func = FIGURES[fig_name]
-        print(f"\n{fig_name} ({category}):")
-
-        try:
-            # Determine which DataFrame to pass
-            if category in (
-                "variance",
-                "tier",
-                "cost",
-                "token",
-                "model",
-                "subtest",
-                "effect_size",
-                "correlation",
-                "diagnostics",
-                "impl_rate",
-            ):
-                generator_func(runs_df, output_dir, render=render)
-            elif category == "judge":
-                generator_func(judges_df, output_dir, render=render)
-            elif category == "criteria":
-                generator_func(criteria_df, output_dir, render=render)
-            else:
-                print(f"  ERROR: Unknown category '{category}'")
-                failed.append((fig_name, "Unknown category"))
-                continue
-
-            print(f"  ✓ {fig_name} generated successfully")
-            success_count += 1
-
-        except Exception as e:
-            print(f"  ✗ {fig_name} failed: {e}")
-            failed.append((fig_name, str(e)))
+    success_count, failed = run_figures(
+        runs_df,
+        judges_df,
+        criteria_df,
+        output_dir,
+        figures_to_generate,
+        render=render,
+        jobs=args.jobs,
+        use_cache=not args.no_output_cache,
+    )
 
     # Summary
     print(f"\n{'=' * 70}")
@@ -7,7 +7,11 @@
 from __future__ import annotations
 
 import argparse
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
+
+import pandas as pd
 
 from scylla.analysis import (
     build_criteria_df,
@@ -17,6 +21,8 @@
     load_all_experiments,
     load_rubric_weights,
 )
+from scylla.analysis.dataset import dataset_is_current, read_dataset
+from scylla.analysis.output_cache import OutputCache
 from scylla.analysis.tables import (
     table01_tier_summary,
     table02_tier_comparison,
@@ -32,62 +38,77 @@
     table11_experiment_overview,
 )
 
+# (label, file prefix, generator, DataFrames it reads, extra positional arguments)
+TableSpec = tuple[str, str, Callable[..., tuple[str, str]], list[pd.DataFrame], tuple[Any, ...]]
 
-def main() -> None:
-    """Run the table generation script."""
-    parser = argparse.ArgumentParser(description="Generate tables for the paper")
-    parser.add_argument(
-        "--data-dir",
-        type=Path,
-        default=Path.home() / "fullruns",
-        help="Root of fullruns/ (default: ~/fullruns)",
-    )
-    parser.add_argument(
-        "--output-dir",
-        type=Path,
-        default=Path("docs/tables"),
-        help="Output directory (default: docs/tables)",
-    )
-    parser.add_argument(
-        "--exclude",
-        type=str,
-        nargs="*",
-        default=[],
-        help="Experiment names to exclude (e.g., --exclude test001-dryrun)",
-    )
 
-    args = parser.parse_args()
+def _load_frames(
+    args: argparse.Namespace,
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame] | None:
+    """Load the analysis DataFrames from the dataset or raw experiment JSON.
+
+    Args:
+        args: Parsed command-line arguments
+
+    Returns:
+        ``(runs_df, judges_df, criteria_df, subtests_df)``, or None if no
+        experiments were found
+
+    """
+    if args.dataset is not None:
+        if dataset_is_current(args.dataset, args.data_dir, args.exclude):
+            print(f"Loading dataset from {args.dataset}")
+            dataset = read_dataset(args.dataset)
+            return dataset.runs_df, dataset.judges_df, dataset.criteria_df, dataset.subtests_df
+        print(f"Dataset {args.dataset} is missing or stale, loading raw experiment data")
 
     # Load experiment data
     print(f"Loading experiments from {args.data_dir}")
-    experiments = load_all_experiments(args.data_dir, exclude=args.exclude)
+    experiments = load_all_experiments(
+        args.data_dir, exclude=args.exclude, cache_dir=args.cache_dir, jobs=args.load_jobs
+    )
 
     if not experiments:
-        print("ERROR: No experiments found")
-        return
-
-    # Load rubric weights
-    print("Loading rubric weights...")
-    rubric_weights = load_rubric_weights(args.data_dir, exclude=args.exclude)
-    if rubric_weights:
-        print(f"  Loaded weights: {rubric_weights}")
-    else:
-        print("  No rubric found, using defaults")
+        return None
 
     # Build DataFrames
     print("Building DataFrames...")
     runs_df = build_runs_df(experiments)
-    judges_df = build_judges_df(experiments)
-    criteria_df = build_criteria_df(experiments)
-    subtests_df = build_subtests_df(runs_df)
+    return (
+        runs_df,
+        build_judges_df(experiments),
+        build_criteria_df(experiments),
+        build_subtests_df(runs_df),
+    )
 
-    print(f"  Runs: {len(runs_df)}")
-    print(f"  Judges: {len(judges_df)}")
-    print(f"  Criteria: {len(criteria_df)}")
-    print(f"  Subtests: {len(subtests_df)}")
 
+def run_tables(
+    runs_df: pd.DataFrame,
+    judges_df: pd.DataFrame,
+    criteria_df: pd.DataFrame,
+    subtests_df: pd.DataFrame,
+    rubric_weights: dict[str, float],
+    output_dir: Path,
+    use_cache: bool = True,
+) -> tuple[int, list[tuple[str, str]], int]:
+    """Generate all tables with per-table error isolation.
+
+    Args:
+        runs_df: Runs DataFrame
+        judges_df: Judges DataFrame
+        criteria_df: Criteria DataFrame
+        subtests_df: Subtests DataFrame
+        rubric_weights: Category weights from ``load_rubric_weights``
+        output_dir: Output directory (created if missing)
+        use_cache: Skip tables whose inputs, generator source and analysis
+            config are unchanged since the last run (default: True)
+
+    Returns:
+        ``(success_count, failed, n_tables)`` where ``failed`` lists
+        ``(table_name, error)``
+
+    """
     # Create output directory
-    output_dir = Path(args.output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Generate tables with error isolation
@@ -99,36 +120,35 @@ def main() -> None:
     except (KeyError, TypeError, ValueError):
         n_models = 0
 
-    tables = [
-        ("Table 1", "tab01_tier_summary", lambda: table01_tier_summary(runs_df)),
-        ("Table 2", "tab02_tier_comparison", lambda: table02_tier_comparison(runs_df)),
-        ("Table 2b", "tab02b_impl_rate_comparison", lambda: table02b_impl_rate_comparison(runs_df)),
-        ("Table 3", "tab03_judge_agreement", lambda: table03_judge_agreement(judges_df)),
+    tables: list[TableSpec] = [
+        ("Table 1", "tab01_tier_summary", table01_tier_summary, [runs_df], ()),
+        ("Table 2", "tab02_tier_comparison", table02_tier_comparison, [runs_df], ()),
+        ("Table 2b", "tab02b_impl_rate_comparison", table02b_impl_rate_comparison, [runs_df], ()),
+        ("Table 3", "tab03_judge_agreement", table03_judge_agreement, [judges_df], ()),
         (
             "Table 4",
             "tab04_criteria_performance",
-            lambda: table04_criteria_performance(criteria_df, runs_df, rubric_weights),
+            table04_criteria_performance,
+            [criteria_df, runs_df],
+            (rubric_weights,),
         ),
-        ("Table 5", "tab05_cost_analysis", lambda: table05_cost_analysis(runs_df)),
-        ("Table 6", "tab06_model_comparison", lambda: table06_model_comparison(runs_df)),
-        (
-            "Table 7",
-            "tab07_subtest_detail",
-            lambda: table07_subtest_detail(runs_df, subtests_df),
-        ),
-        ("Table 8", "tab08_summary_statistics", lambda: table08_summary_statistics(runs_df)),
-        ("Table 9", "tab09_experiment_config", lambda: table09_experiment_config(runs_df)),
-        ("Table 10", "tab10_normality_tests", lambda: table10_normality_tests(runs_df)),
-        ("Table 11", "tab11_experiment_overview", lambda: table11_experiment_overview(runs_df)),
+        ("Table 5", "tab05_cost_analysis", table05_cost_analysis, [runs_df], ()),
+        ("Table 6", "tab06_model_comparison", table06_model_comparison, [runs_df], ()),
+        ("Table 7", "tab07_subtest_detail", table07_subtest_detail, [runs_df, subtests_df], ()),
+        ("Table 8", "tab08_summary_statistics", table08_summary_statistics, [runs_df], ()),
+        ("Table 9", "tab09_experiment_config", table09_experiment_config, [runs_df], ()),
+        ("Table 10", "tab10_normality_tests", table10_normality_tests, [runs_df], ()),
+        ("Table 11", "tab11_experiment_overview", table11_experiment_overview, [runs_df], ()),
     ]
 
     success_count = 0
     failed = []
+    cache = OutputCache(output_dir, enabled=use_cache)
 
     # Tables requiring multiple models
     multi_model_tables = {"tab06_model_comparison"}
 
-    for table_name, file_prefix, generator_func in tables:
+    for table_name, file_prefix, generator_func, frames, extra_args in tables:
         # Skip multi-model tables on single-model data
         if file_prefix in multi_model_tables and n_models < 2:
             print(f"\n{table_name}: SKIPPED (requires >=2 models, found {n_models})")
@@ -136,19 +156,113 @@ def main() -> None:
             continue
 
         print(f"\n{table_name}")
+        key = cache.key(generator_func, frames, extra_args=extra_args)
+        if cache.is_current(file_prefix, key):
+            print(f"  ✓ {file_prefix} unchanged, skipped (cached)")
+            success_count += 1
+            continue
+
         try:
-            md, tex = generator_func()
-            (output_dir / f"{file_prefix}.md").write_text(md)
-            (output_dir / f"{file_prefix}.tex").write_text(tex)
+            md, tex = generator_func(*frames, *extra_args)
+            md_path = output_dir / f"{file_prefix}.md"
+            tex_path = output_dir / f"{file_prefix}.tex"
+            md_path.write_text(md)
+            tex_path.write_text(tex)
+            cache.record(file_prefix, key, [md_path, tex_path])
             print(f"  ✓ Saved {file_prefix}.{{md,tex}}")
             success_count += 1
         except Exception as e:
+            cache.invalidate(file_prefix)
             print(f"  ✗ Failed: {e}")
             failed.append((table_name, str(e)))
 
+    cache.save()
+    return success_count, failed, len(tables)
+
+
+def main() -> None:
+    """Run the table generation script."""
+    parser = argparse.ArgumentParser(description="Generate tables for the paper")
+    parser.add_argument(
+        "--data-dir",
+        type=Path,
+        default=Path.home() / "fullruns",
+        help="Root of fullruns/ (default: ~/fullruns)",
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=Path("docs/tables"),
+        help="Output directory (default: docs/tables)",
+    )
+    parser.add_argument(
+        "--exclude",
+        type=str,
+        nargs="*",
+        default=[],
+        help="Experiment names to exclude (e.g., --exclude test001-dryrun)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Directory for the parsed-run cache; unchanged runs are not re-parsed "
+        "(default: no cache)",
+    )
+    parser.add_argument(
+        "--load-jobs",
+        type=int,
+        default=1,
+        help="Worker processes for parsing uncached runs (default: 1)",
+    )
+    parser.add_argument(
+        "--dataset",
+        type=Path,
+        default=None,
+        help="Columnar dataset written by export_data.py; used instead of raw JSON "
+        "when it is current (default: always load raw JSON)",
+    )
+    parser.add_argument(
+        "--no-output-cache",
+        action="store_true",
+        help="Regenerate every table, even if its inputs are unchanged since the last run",
+    )
+
+    args = parser.parse_args()
+
+    frames = _load_frames(args)
+    if frames is None:
+        print("ERROR: No experiments found")
+        return
+    runs_df, judges_df, criteria_df, subtests_df = frames
+
+    # Load rubric weights
+    print("Loading rubric weights...")
+    rubric_weights = load_rubric_weights(args.data_dir, exclude=args.exclude)
+    if rubric_weights:
+        print(f"  Loaded weights: {rubric_weights}")
+    else:
+        print("  No rubric found, using defaults")
+
+    print(f"  Runs: {len(runs_df)}")
+    print(f"  Judges: {len(judges_df)}")
+    print(f"  Criteria: {len(criteria_df)}")
+    print(f"  Subtests: {len(subtests_df)}")
+
+    output_dir = Path(args.output_dir)
+    success_count, failed, n_tables = run_tables(
+        runs_df,
+        judges_df,
+        criteria_df,
+        subtests_df,
+        rubric_weights,
+        output_dir,
+        use_cache=not args.no_output_cache,
+    )
+
     # Summary
     print(f"\n{'=' * 70}")
-    print(f"Summary: {success_count}/{len(tables)} tables generated successfully")
+    print(f"Summary: {success_count}/{n_tables} tables generated successfully")
     if failed:
         print(f"\nFailed tables ({len(failed)}):")
         for table_name, error in failed:
@@ -44,6 +44,9 @@
     # Repair corrupt checkpoint
     python scripts/manage_experiment.py repair /path/to/checkpoint.json
 
+    # Rebuild the run index after editing run directories by hand
+    python scripts/manage_experiment.py reindex /path/to/experiment
+
     # Stop all runs after agent_complete for incremental validation (inclusive)
     python scripts/manage_experiment.py run \\
         --config tests/fixtures/tests/test-001 \\
@@ -282,6 +285,95 @@ def _add_run_args(parser: argparse.ArgumentParser) -> None:
         metavar="N",
         help="Max concurrent claude CLI processes (default: min(threads, cpu_count))",
     )
+    parser.add_argument(
+        "--worktree-pool",
+        action="store_true",
+        default=False,
+        help="Pre-create one worktree per workspace slot and reset it between runs "
+        "instead of adding and removing a worktree for every run",
+    )
+    parser.add_argument(
+        "--workspace-backend",
+        choices=["worktree", "reflink"],
+        default="worktree",
+        help="How run workspaces are materialized: 'worktree' (git worktree add) or "
+        "'reflink' (copy-on-write copies of one base checkout; falls back to "
+        "worktree when the filesystem lacks reflink support) (default: worktree)",
+    )
+    parser.add_argument(
+        "--max-concurrent-judges",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Give judges their own queue of N slots so judging overlaps agent "
+        "execution. Up to --max-concurrent-agents + N claude CLI processes then run "
+        "at once (default: judges share the agent slots)",
+    )
+    parser.add_argument(
+        "--pipeline-budget",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Build pipeline budget units (about one CPU core each) shared by all "
+        "concurrent build/format/test/pre-commit steps; heavy steps such as a mojo "
+        "build take the whole budget (default: cpu_count)",
+    )
+    parser.add_argument(
+        "--no-pipeline-cache",
+        dest="pipeline_cache",
+        action="store_false",
+        default=True,
+        help="Always run the build pipeline instead of reusing the cached result of an "
+        "identical workspace tree (also set by SCYLLA_PIPELINE_CACHE=0)",
+    )
+    parser.add_argument(
+        "--max-concurrent-tiers",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Tiers of one dependency group run concurrently; each tier then builds on "
+        "its declared dependencies instead of the previous tier (default: 1, sequential)",
+    )
+    parser.add_argument(
+        "--max-concurrent-subtests",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Sub-tests run concurrently within a tier, bounded by the workspace and "
+        "agent limits (default: 1, sequential)",
+    )
+    parser.add_argument(
+        "--max-concurrent-runs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Runs of one sub-test executed concurrently, sharing the pipeline baseline "
+        "(default: 1, sequential)",
+    )
+    parser.add_argument(
+        "--max-concurrent-judges-per-run",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Judges of one run executed concurrently, each holding a judge slot "
+        "(default: all judge models at once)",
+    )
+    parser.add_argument(
+        "--judge-quorum",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Stop starting further judges of a run once N have produced valid results; "
+        "requires --max-concurrent-judges-per-run below the number of judge models "
+        "(default: run every judge)",
+    )
+    parser.add_argument(
+        "--stream-agent-output",
+        action="store_true",
+        default=False,
+        help="Write agent stdout/stderr to disk as they arrive and parse metrics line by "
+        "line instead of buffering the whole transcript in memory",
+    )
     parser.add_argument("-v", "--verbose", action="store_true", help="Enable verbose logging")
     parser.add_argument("-q", "--quiet", action="store_true", help="Suppress non-error output")
 
@@ -320,12 +412,11 @@ def _checkpoint_has_retryable_runs(checkpoint_path: Path) -> bool:
     Checks for infra failures or mid-pipeline crashes. Runs in worktree_cleaned
     state (even with bad grades) are NOT considered retryable.
     """
-    import json
+    from scylla.e2e.checkpoint import load_checkpoint
 
     try:
-        with open(checkpoint_path) as f:
-            data = json.load(f)
-        for subtests in data.get("run_states", {}).values():
+        checkpoint = load_checkpoint(checkpoint_path)
+        for subtests in checkpoint.run_states.values():
             for runs in subtests.values():
                 for state in runs.values():
                     if state != "worktree_cleaned":
@@ -743,6 +834,17 @@ def run_one_test(test_dir: Path) -> dict[str, Any]:
                 keep_failed_workspaces=args.keep_failed_workspaces,
                 max_concurrent_workspaces=args.max_concurrent_workspaces,
                 max_concurrent_agents=args.max_concurrent_agents,
+                worktree_pool=args.worktree_pool,
+                workspace_backend=args.workspace_backend,
+                max_concurrent_judges=args.max_concurrent_judges,
+                pipeline_budget=args.pipeline_budget,
+                pipeline_cache=args.pipeline_cache,
+                max_concurrent_tiers=args.max_concurrent_tiers,
+                max_concurrent_subtests=args.max_concurrent_subtests,
+                max_concurrent_runs=args.max_concurrent_runs,
+                max_concurrent_judges_per_run=args.max_concurrent_judges_per_run,
+                judge_quorum=args.judge_quorum,
+                stream_agent_output=args.stream_agent_output,
             )
 
             # If --from specified, load existing checkpoint and reset states
@@ -839,6 +941,8 @@ def run_one_test(test_dir: Path) -> dict[str, Any]:
     if not args.fresh:
         import json
 
+        from scylla.e2e.checkpoint import load_checkpoint
+
         summary_path = args.results_dir / "batch_summary.json"
         if summary_path.exists():
             try:
@@ -864,9 +968,7 @@ def run_one_test(test_dir: Path) -> dict[str, Any]:
                             continue  # Cannot verify subtest count; don't mark completed
                         cp_path = Path(result_dir) / "checkpoint.json"
                         try:
-                            with open(cp_path) as cp_f:
-                                cp = json.load(cp_f)
-                            subtest_states = cp.get("subtest_states", {})
+                            subtest_states = load_checkpoint(cp_path).subtest_states
                             needs_expansion = False
                             for tier_subtests in subtest_states.values():
                                 if len(tier_subtests) < args.max_subtests:
@@ -900,6 +1002,8 @@ def run_one_test(test_dir: Path) -> dict[str, Any]:
     batch_resource_manager = ResourceManager(
         max_workspaces=args.max_concurrent_workspaces,
         max_agents=args.max_concurrent_agents,
+        max_judges=args.max_concurrent_judges,
+        pipeline_budget=args.pipeline_budget,
         threads=args.threads,
     )
 
@@ -937,6 +1041,7 @@ def run_one_test(test_dir: Path) -> dict[str, Any]:
     total = len(to_run)
     passed = total - failed_count
     logger.info(f"Batch complete: {passed}/{total} tests succeeded")
+    logger.info(batch_resource_manager.format_stats())
 
     return 0 if failed_count == 0 else 1
 
@@ -1166,6 +1271,17 @@ def cmd_run(args: argparse.Namespace) -> int:  # CLI dispatch with many command
         keep_failed_workspaces=args.keep_failed_workspaces,
         max_concurrent_workspaces=args.max_concurrent_workspaces,
         max_concurrent_agents=args.max_concurrent_agents,
+        worktree_pool=args.worktree_pool,
+        workspace_backend=args.workspace_backend,
+        max_concurrent_judges=args.max_concurrent_judges,
+        pipeline_budget=args.pipeline_budget,
+        pipeline_cache=args.pipeline_cache,
+        max_concurrent_tiers=args.max_concurrent_tiers,
+        max_concurrent_subtests=args.max_concurrent_subtests,
+        max_concurrent_runs=args.max_concurrent_runs,
+        max_concurrent_judges_per_run=args.max_concurrent_judges_per_run,
+        judge_quorum=args.judge_quorum,
+        stream_agent_output=args.stream_agent_output,
     )
 
     # If --from specified, load existing checkpoint and reset states
@@ -1323,6 +1439,39 @@ def cmd_repair(args: argparse.Namespace) -> int:
     return 0
 
 
+# ---------------------------------------------------------------------------
+# Subcommand: reindex
+# ---------------------------------------------------------------------------
+
+
+def _add_reindex_args(parser: argparse.ArgumentParser) -> None:
+    """Add arguments for the 'reindex' subcommand."""
+    parser.add_argument("experiment_dir", type=Path, help="Path to experiment directory")
+
+
+def cmd_reindex(args: argparse.Namespace) -> int:
+    """Execute the 'reindex' subcommand."""
+    import sqlite3
+
+    from scylla.e2e.run_index import RunIndex
+
+    experiment_dir = args.experiment_dir
+    if not experiment_dir.is_dir():
+        logger.error(f"Experiment directory not found: {experiment_dir}")
+        return 1
+
+    index = RunIndex(experiment_dir)
+    try:
+        count = index.rebuild()
+    except (sqlite3.Error, OSError) as e:
+        logger.error(f"Could not rebuild run index {index.path}: {e}")
+        return 1
+
+    judge_slots = sum(len(slots) for slots in index.judges().values())
+    logger.info(f"Indexed {count} run(s) and {judge_slots} judge slot(s) into {index.path}")
+    return 0
+
+
 # ---------------------------------------------------------------------------
 # Subcommand: visualize
 # ---------------------------------------------------------------------------
@@ -1822,6 +1971,7 @@ def build_parser() -> argparse.ArgumentParser:
 Subcommands:
   run        Run single or batch experiments with optional --from re-execution
   repair     Repair corrupt checkpoint (rebuilds from run_result.json files)
+  reindex    Rebuild the experiment's run index (run_index.db) from disk
   visualize  Show experiment state from checkpoint
   subscribe  Subscribe to NATS JetStream events from ProjectHermes
 
@@ -1861,6 +2011,17 @@ def build_parser() -> argparse.ArgumentParser:
     )
     _add_repair_args(repair_parser)
 
+    # reindex subcommand
+    reindex_parser = subparsers.add_parser(
+        "reindex",
+        help="Rebuild the run index of an experiment from its run directories",
+        description=(
+            "Re-scan completed/, in_progress/ and legacy run directories and rebuild "
+            "run_index.db, which the rerun, regenerate and resume scanners query."
+        ),
+    )
+    _add_reindex_args(reindex_parser)
+
     # visualize subcommand
     visualize_parser = subparsers.add_parser(
         "visualize",
@@ -1895,6 +2056,7 @@ def main() -> int:
     subcommand_map = {
         "run": cmd_run,
         "repair": cmd_repair,
+        "reindex": cmd_reindex,
         "visualize": cmd_visualize,
         "subscribe": cmd_subscribe,
     }
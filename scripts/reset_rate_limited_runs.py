@@ -21,6 +21,8 @@
 import sys
 from pathlib import Path
 
+from scylla.e2e.checkpoint import compact_checkpoint
+
 
 def is_rate_limited_agent(result_path: Path) -> bool:
     """Check if an agent result.json indicates a 429 rate limit failure."""
@@ -186,6 +188,9 @@ def update_checkpoint(
     Returns a dict of changes made for reporting.
     """
     checkpoint_path = experiment_dir / "checkpoint.json"
+    if not dry_run:
+        # Fold any checkpoint.journal into the snapshot before editing it as JSON
+        compact_checkpoint(checkpoint_path)
     checkpoint = json.loads(checkpoint_path.read_text())
     changes: dict[str, list[str]] = {
         "run_states": [],
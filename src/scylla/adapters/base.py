@@ -19,6 +19,7 @@
 from scylla.e2e.models import TokenStats
 
 if TYPE_CHECKING:
+    from scylla.e2e.transcript import Usage
     from scylla.executor.tier_config import TierConfig
 
 
@@ -30,6 +31,16 @@ class AdapterTokenStats(BaseModel):
     cache_creation_tokens: int = Field(default=0, description="Tokens written to cache")
     cache_read_tokens: int = Field(default=0, description="Tokens read from cache")
 
+    @classmethod
+    def from_usage(cls, usage: Usage) -> AdapterTokenStats:
+        """Build from the usage of a parsed transcript."""
+        return cls(
+            input_tokens=usage.input_tokens,
+            output_tokens=usage.output_tokens,
+            cache_creation_tokens=usage.cache_creation_tokens,
+            cache_read_tokens=usage.cache_read_tokens,
+        )
+
     def to_token_stats(self) -> TokenStats:
         """Convert to E2E TokenStats dataclass."""
         return TokenStats(
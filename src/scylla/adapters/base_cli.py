@@ -19,6 +19,7 @@
     AdapterTokenStats,
     BaseAdapter,
 )
+from scylla.e2e.transcript import Transcript, parse_transcript
 
 if TYPE_CHECKING:
     from scylla.executor.tier_config import TierConfig
@@ -121,18 +122,15 @@ def run(
         end_time = datetime.now(timezone.utc)
         duration = (end_time - start_time).total_seconds()
 
-        # Parse output for metrics
-        tokens_input, tokens_output = self._parse_token_counts(result.stdout, result.stderr)
-        api_calls = self._parse_api_calls(result.stdout, result.stderr)
-
-        # Create token stats (CLI adapters typically don't provide cache info)
-        token_stats = AdapterTokenStats(
-            input_tokens=tokens_input,
-            output_tokens=tokens_output,
-        )
+        # Parse output for metrics (the transcript is parsed once and shared)
+        transcript = parse_transcript(result.stdout)
+        token_stats = self._parse_token_stats(result.stdout, result.stderr, transcript)
+        api_calls = self._parse_api_calls(result.stdout, result.stderr, transcript)
 
         # Calculate cost
-        cost = self.calculate_cost(tokens_input, tokens_output, config.model)
+        cost = self.calculate_cost(
+            token_stats.input_tokens, token_stats.output_tokens, config.model
+        )
 
         # Write logs
         self.write_logs(config.output_dir, result.stdout, result.stderr)
@@ -199,20 +197,55 @@ def _parse_token_counts(self, stdout: str, stderr: str) -> tuple[int, int]:
         """
         ...
 
-    def _parse_api_calls(self, stdout: str, stderr: str) -> int:
+    def _parse_token_stats(
+        self, stdout: str, stderr: str, transcript: Transcript | None = None
+    ) -> AdapterTokenStats:
+        """Parse token statistics from CLI output.
+
+        Structured usage in JSON output is preferred; otherwise the subclass's
+        _parse_token_counts() handles the tool's text format.
+
+        Args:
+            stdout: Standard output from CLI.
+            stderr: Standard error from CLI.
+            transcript: Already-parsed stdout, to avoid parsing it again.
+
+        Returns:
+            AdapterTokenStats (cache counts only when reported as JSON).
+
+        """
+        if transcript is None:
+            transcript = parse_transcript(stdout)
+        usage = transcript.usage
+        if usage is not None and (usage.input_tokens > 0 or usage.output_tokens > 0):
+            return AdapterTokenStats.from_usage(usage)
+
+        tokens_input, tokens_output = self._parse_token_counts(stdout, stderr)
+        return AdapterTokenStats(input_tokens=tokens_input, output_tokens=tokens_output)
+
+    def _parse_api_calls(
+        self, stdout: str, stderr: str, transcript: Transcript | None = None
+    ) -> int:
         """Parse API call count from output.
 
-        Uses common patterns across CLI tools, with optional fallback pattern
-        defined by subclasses via _api_call_fallback_pattern.
+        Uses the turn/message count of JSON output if present, then common
+        patterns across CLI tools, with optional fallback pattern defined by
+        subclasses via _api_call_fallback_pattern.
 
         Args:
             stdout: Standard output from CLI.
             stderr: Standard error from CLI.
+            transcript: Already-parsed stdout, to avoid parsing it again.
 
         Returns:
             Number of API calls detected.
 
         """
+        if transcript is None:
+            transcript = parse_transcript(stdout)
+        if transcript.api_calls > 0:
+            return transcript.api_calls
+
         combined = stdout + "\n" + stderr
 
         # Pattern: "API calls: N" or "N API calls"
@@ -10,7 +10,7 @@
 import re
 import subprocess
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING
 
 from hephaestus.resilience.circuit_breaker import get_circuit_breaker
 
@@ -22,6 +22,7 @@
     BaseAdapter,
 )
 from scylla.core.resilience import resilient_call
+from scylla.e2e.transcript import Transcript, parse_transcript
 
 if TYPE_CHECKING:
     from scylla.executor.tier_config import TierConfig
@@ -152,7 +153,11 @@ def run(
         # This ensures we detect and raise RateLimitError immediately
         from scylla.e2e.rate_limit import RateLimitError, detect_rate_limit
 
-        rate_limit_info = detect_rate_limit(result.stdout, result.stderr, source="agent")
+        # Parse the transcript once; rate-limit detection and every metric share it
+        transcript = parse_transcript(result.stdout)
+        rate_limit_info = detect_rate_limit(
+            result.stdout, result.stderr, source="agent", transcript=transcript
+        )
         if rate_limit_info:
             # Rate limits are not circuit breaker failures — they're expected
             self.write_logs(config.output_dir, result.stdout, result.stderr)
@@ -162,11 +167,11 @@ def run(
         cb._record_success()
 
         # Parse output for metrics
-        token_stats = self._parse_token_stats(result.stdout, result.stderr)
-        api_calls = self._parse_api_calls(result.stdout, result.stderr)
+        token_stats = self._parse_token_stats(result.stdout, result.stderr, transcript)
+        api_calls = self._parse_api_calls(result.stdout, result.stderr, transcript)
 
         # Parse cost directly from JSON if available, otherwise calculate
-        cost = self._parse_cost(result.stdout)
+        cost = self._parse_cost(result.stdout, transcript)
         if cost == 0.0 and (token_stats.input_tokens > 0 or token_stats.output_tokens > 0):
             # Use total input (including cache reads) for cost calculation
             total_input = token_stats.input_tokens + token_stats.cache_read_tokens
@@ -264,35 +269,28 @@ def _prepare_env(self, config: AdapterConfig) -> dict[str, str]:
         env.pop("CLAUDECODE", None)
         return env
 
-    def _parse_token_stats(self, stdout: str, stderr: str) -> AdapterTokenStats:
+    def _parse_token_stats(
+        self, stdout: str, stderr: str, transcript: Transcript | None = None
+    ) -> AdapterTokenStats:
         """Parse detailed token statistics from Claude Code output.
 
         Supports two formats:
-        1. JSON output (preferred): Parses full usage object with cache tokens
+        1. JSON/stream-json output (preferred): Full usage object with cache tokens
         2. Text output (fallback): Regex patterns for basic token counts
 
         Args:
             stdout: Standard output from CLI.
             stderr: Standard error from CLI.
+            transcript: Already-parsed stdout, to avoid parsing it again.
 
         Returns:
             AdapterTokenStats with all token types.
 
         """
-        import json
-
-        # Try JSON parsing first (from --output-format json)
-        try:
-            data = json.loads(stdout.strip())
-            usage = data.get("usage", {})
-            return AdapterTokenStats(
-                input_tokens=usage.get("input_tokens", 0),
-                output_tokens=usage.get("output_tokens", 0),
-                cache_creation_tokens=usage.get("cache_creation_input_tokens", 0),
-                cache_read_tokens=usage.get("cache_read_input_tokens", 0),
-            )
-        except (json.JSONDecodeError, AttributeError):
-            pass
+        if transcript is None:
+            transcript = parse_transcript(stdout)
+        if transcript.usage is not None:
+            return AdapterTokenStats.from_usage(transcript.usage)
 
         # Fallback to regex parsing for text output
         combined = stdout + "\n" + stderr
@@ -337,28 +335,25 @@ def _parse_token_stats(self, stdout: str, stderr: str) -> AdapterTokenStats:
             cache_read_tokens=0,
         )
 
-    def _parse_api_calls(self, stdout: str, stderr: str) -> int:
+    def _parse_api_calls(
+        self, stdout: str, stderr: str, transcript: Transcript | None = None
+    ) -> int:
         """Parse API call count from output.
 
         Args:
             stdout: Standard output from CLI.
             stderr: Standard error from CLI.
+            transcript: Already-parsed stdout, to avoid parsing it again.
 
         Returns:
             Number of API calls detected.
 
         """
-        import json
-
-        # Try JSON parsing first (from --output-format json)
-        try:
-            data = json.loads(stdout.strip())
-            # num_turns represents the number of API turn exchanges
-            num_turns = data.get("num_turns", 0)
-            if num_turns > 0:
-                return cast(int, num_turns)
-        except (json.JSONDecodeError, AttributeError):
-            pass
+        if transcript is None:
+            transcript = parse_transcript(stdout)
+        # num_turns (or the assistant message count) is the number of API exchanges
+        if transcript.api_calls > 0:
+            return transcript.api_calls
 
         # Fallback to regex parsing for text output
         combined = stdout + "\n" + stderr
@@ -382,20 +377,17 @@ def _parse_api_calls(self, stdout: str, stderr: str) -> int:
 
         return 0
 
-    def _parse_cost(self, stdout: str) -> float:
+    def _parse_cost(self, stdout: str, transcript: Transcript | None = None) -> float:
         """Parse cost from JSON output.
 
         Args:
             stdout: Standard output from CLI (JSON format).
+            transcript: Already-parsed stdout, to avoid parsing it again.
 
         Returns:
             Cost in USD, or 0.0 if not available.
 
         """
-        import json
-
-        try:
-            data = json.loads(stdout.strip())
-            return cast(float, data.get("total_cost_usd", 0.0))
-        except (json.JSONDecodeError, AttributeError):
-            return 0.0
+        if transcript is None:
+            transcript = parse_transcript(stdout)
+        return transcript.cost_usd
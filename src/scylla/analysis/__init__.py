@@ -3,15 +3,36 @@
 This module provides data loading, statistical analysis, figure generation,
 and table generation for evaluating agent performance across ablation study
 tiers.
+
+The re-exported names are resolved on first access so that importing the
+package (or any light submodule such as ``scylla.analysis.config``) does not
+pull in pandas, scipy and the schema/loader stack.
 """
 
-from scylla.analysis.dataframes import (
-    build_criteria_df,
-    build_judges_df,
-    build_runs_df,
-    build_subtests_df,
-)
-from scylla.analysis.loader import load_all_experiments, load_experiment, load_rubric_weights
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from scylla.analysis.dataframes import (
+        build_criteria_df,
+        build_judges_df,
+        build_runs_df,
+        build_subtests_df,
+    )
+    from scylla.analysis.loader import load_all_experiments, load_experiment, load_rubric_weights
+
+# Re-exported name -> defining module
+_LAZY_EXPORTS = {
+    "build_criteria_df": "scylla.analysis.dataframes",
+    "build_judges_df": "scylla.analysis.dataframes",
+    "build_runs_df": "scylla.analysis.dataframes",
+    "build_subtests_df": "scylla.analysis.dataframes",
+    "load_all_experiments": "scylla.analysis.loader",
+    "load_experiment": "scylla.analysis.loader",
+    "load_rubric_weights": "scylla.analysis.loader",
+}
 
 __all__ = [
     "build_criteria_df",
@@ -22,3 +43,18 @@
     "load_experiment",
     "load_rubric_weights",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the defining module of a re-exported name on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes including not-yet-imported re-exports."""
+    return sorted({*globals(), *_LAZY_EXPORTS})
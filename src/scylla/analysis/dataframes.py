@@ -6,6 +6,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Any
 
 import numpy as np
@@ -25,6 +26,7 @@
     "judge_summary",
     "model_comparison",
     "tier_summary",
+    "update_frames",
 ]
 
 
@@ -101,9 +103,17 @@ def compute_consensus_impl_rate(judges: list[JudgeEvaluation]) -> float:
     return float(np.median(judge_impl_rates))
 
 
+def _all_runs(experiments: dict[str, list[RunData]]) -> list[RunData]:
+    """Flatten experiments into one list of runs, in experiment order."""
+    return [run for runs in experiments.values() for run in runs]
+
+
 def build_runs_df(experiments: dict[str, list[RunData]]) -> pd.DataFrame:
     """Build runs DataFrame with one row per run.
 
+    Columns are filled directly (numeric ones into preallocated arrays)
+    instead of going through one dict per row.
+
     Args:
         experiments: Dictionary mapping experiment name to list of runs
 
@@ -111,47 +121,69 @@ def build_runs_df(experiments: dict[str, list[RunData]]) -> pd.DataFrame:
         DataFrame with ~2260 rows (113 subtests × 10 runs × 2 models)
 
     """
-    rows = []
-    for runs in experiments.values():
-        for run in runs:
+    runs = _all_runs(experiments)
+    if not runs:
+        return pd.DataFrame()
+    n = len(runs)
+
+    def floats(values: Iterable[float]) -> np.ndarray:
+        return np.fromiter(values, dtype=np.float64, count=n)
+
+    def ints(values: Iterable[int]) -> np.ndarray:
+        return np.fromiter(values, dtype=np.int64, count=n)
+
+    return pd.DataFrame(
+        {
+            "experiment": [run.experiment for run in runs],
+            "agent_model": [run.agent_model for run in runs],
+            "tier": [run.tier for run in runs],
+            "subtest": [run.subtest for run in runs],
+            "run_number": ints(run.run_number for run in runs),
+            "score": floats(run.score for run in runs),
             # Consensus impl_rate: median across judges (score uses mean, impl_rate uses median)
-            consensus_impl_rate = compute_consensus_impl_rate(run.judges)
-
-            rows.append(
-                {
-                    "experiment": run.experiment,
-                    "agent_model": run.agent_model,
-                    "tier": run.tier,
-                    "subtest": run.subtest,
-                    "run_number": run.run_number,
-                    "score": run.score,
-                    "impl_rate": consensus_impl_rate,
-                    "passed": run.passed,
-                    "grade": run.grade,
-                    "cost_usd": run.cost_usd,
-                    "duration_seconds": run.duration_seconds,
-                    "agent_duration_seconds": run.agent_duration_seconds,
-                    "judge_duration_seconds": run.judge_duration_seconds,
-                    "input_tokens": run.token_stats.input_tokens,
-                    "output_tokens": run.token_stats.output_tokens,
-                    "cache_creation_tokens": run.token_stats.cache_creation_tokens,
-                    "cache_read_tokens": run.token_stats.cache_read_tokens,
-                    "total_tokens": run.token_stats.total_tokens,
-                    "exit_code": run.exit_code,
-                    # Optional delegation metrics (T3-T6)
-                    "api_calls": run.api_calls,
-                    "num_turns": run.num_turns,
-                    "num_models": len(run.model_usage) if run.model_usage else None,
-                    "delegation_cost_ratio": _compute_delegation_cost_ratio(run),
-                    # Optional process metrics (R_Prog, CFP, PR revert rate, strategic drift)
-                    "r_prog": run.r_prog,
-                    "strategic_drift": run.strategic_drift,
-                    "cfp": run.cfp,
-                    "pr_revert_rate": run.pr_revert_rate,
-                }
-            )
-
-    return pd.DataFrame(rows)
+            "impl_rate": floats(compute_consensus_impl_rate(run.judges) for run in runs),
+            "passed": np.fromiter((run.passed for run in runs), dtype=bool, count=n),
+            "grade": [run.grade for run in runs],
+            "cost_usd": floats(run.cost_usd for run in runs),
+            "duration_seconds": floats(run.duration_seconds for run in runs),
+            "agent_duration_seconds": floats(run.agent_duration_seconds for run in runs),
+            "judge_duration_seconds": floats(run.judge_duration_seconds for run in runs),
+            "input_tokens": ints(run.token_stats.input_tokens for run in runs),
+            "output_tokens": ints(run.token_stats.output_tokens for run in runs),
+            "cache_creation_tokens": ints(run.token_stats.cache_creation_tokens for run in runs),
+            "cache_read_tokens": ints(run.token_stats.cache_read_tokens for run in runs),
+            "total_tokens": ints(run.token_stats.total_tokens for run in runs),
+            "exit_code": ints(run.exit_code for run in runs),
+            # Optional delegation metrics (T3-T6); None where missing, typed by pandas
+            "api_calls": [run.api_calls for run in runs],
+            "num_turns": [run.num_turns for run in runs],
+            "num_models": [len(run.model_usage) if run.model_usage else None for run in runs],
+            "delegation_cost_ratio": [_compute_delegation_cost_ratio(run) for run in runs],
+            # Optional process metrics (R_Prog, CFP, PR revert rate, strategic drift)
+            "r_prog": [run.r_prog for run in runs],
+            "strategic_drift": [run.strategic_drift for run in runs],
+            "cfp": [run.cfp for run in runs],
+            "pr_revert_rate": [run.pr_revert_rate for run in runs],
+        }
+    )
+
+
+def _run_key_columns(runs: list[RunData], repeats: list[int]) -> dict[str, list[Any]]:
+    """Build the run identifier columns, repeating each run's values ``repeats[i]`` times."""
+    columns: dict[str, list[Any]] = {
+        "experiment": [],
+        "agent_model": [],
+        "tier": [],
+        "subtest": [],
+        "run_number": [],
+    }
+    for run, count in zip(runs, repeats, strict=True):
+        columns["experiment"] += [run.experiment] * count
+        columns["agent_model"] += [run.agent_model] * count
+        columns["tier"] += [run.tier] * count
+        columns["subtest"] += [run.subtest] * count
+        columns["run_number"] += [run.run_number] * count
+    return columns
 
 
 def build_judges_df(experiments: dict[str, list[RunData]]) -> pd.DataFrame:
@@ -164,32 +196,29 @@ def build_judges_df(experiments: dict[str, list[RunData]]) -> pd.DataFrame:
         DataFrame with ~6780 rows (2260 runs × 3 judges)
 
     """
-    rows = []
-    for runs in experiments.values():
-        for run in runs:
-            for judge in run.judges:
-                # Calculate impl_rate for this judge
-                judge_impl_rate = compute_judge_impl_rate(judge)
-
-                rows.append(
-                    {
-                        "experiment": run.experiment,
-                        "agent_model": run.agent_model,
-                        "tier": run.tier,
-                        "subtest": run.subtest,
-                        "run_number": run.run_number,
-                        "judge_model": judge.judge_model,
-                        "judge_number": judge.judge_number,
-                        "judge_score": judge.score,
-                        "judge_impl_rate": judge_impl_rate,
-                        "judge_passed": judge.passed,
-                        "judge_grade": judge.grade,
-                        "judge_is_valid": judge.is_valid,
-                        "judge_reasoning": judge.reasoning,
-                    }
-                )
-
-    return pd.DataFrame(rows)
+    runs = _all_runs(experiments)
+    judges = [judge for run in runs for judge in run.judges]
+    if not judges:
+        return pd.DataFrame()
+
+    columns: dict[str, Any] = _run_key_columns(runs, [len(run.judges) for run in runs])
+    columns.update(
+        {
+            "judge_model": [judge.judge_model for judge in judges],
+            "judge_number": [judge.judge_number for judge in judges],
+            "judge_score": [judge.score for judge in judges],
+            "judge_impl_rate": np.fromiter(
+                (compute_judge_impl_rate(judge) for judge in judges),
+                dtype=np.float64,
+                count=len(judges),
+            ),
+            "judge_passed": [judge.passed for judge in judges],
+            "judge_grade": [judge.grade for judge in judges],
+            "judge_is_valid": [judge.is_valid for judge in judges],
+            "judge_reasoning": [judge.reasoning for judge in judges],
+        }
+    )
+    return pd.DataFrame(columns)
 
 
 def build_criteria_df(experiments: dict[str, list[RunData]]) -> pd.DataFrame:
@@ -202,28 +231,151 @@ def build_criteria_df(experiments: dict[str, list[RunData]]) -> pd.DataFrame:
         DataFrame with ~33,900 rows (6780 judge evaluations × 5 criteria)
 
     """
-    rows = []
-    for runs in experiments.values():
-        for run in runs:
-            for judge in run.judges:
-                for criterion_name, criterion in judge.criteria.items():
-                    rows.append(
-                        {
-                            "experiment": run.experiment,
-                            "agent_model": run.agent_model,
-                            "tier": run.tier,
-                            "subtest": run.subtest,
-                            "run_number": run.run_number,
-                            "judge_model": judge.judge_model,
-                            "judge_number": judge.judge_number,
-                            "criterion": criterion_name,
-                            "criterion_score": criterion.score,
-                            "criterion_achieved": criterion.achieved,
-                            "criterion_max": criterion.max_points,
-                        }
-                    )
-
-    return pd.DataFrame(rows)
+    runs = _all_runs(experiments)
+    judges = [judge for run in runs for judge in run.judges]
+    if not any(judge.criteria for judge in judges):
+        return pd.DataFrame()
+
+    columns: dict[str, Any] = _run_key_columns(
+        runs, [sum(len(judge.criteria) for judge in run.judges) for run in runs]
+    )
+    judge_models: list[str] = []
+    judge_numbers: list[int] = []
+    for judge in judges:
+        judge_models += [judge.judge_model] * len(judge.criteria)
+        judge_numbers += [judge.judge_number] * len(judge.criteria)
+    criteria = [item for judge in judges for item in judge.criteria.items()]
+
+    columns.update(
+        {
+            "judge_model": judge_models,
+            "judge_number": judge_numbers,
+            "criterion": [name for name, _ in criteria],
+            "criterion_score": [criterion.score for _, criterion in criteria],
+            # May hold "N/A" strings from the source JSON; kept as-is
+            "criterion_achieved": [criterion.achieved for _, criterion in criteria],
+            "criterion_max": [criterion.max_points for _, criterion in criteria],
+        }
+    )
+    return pd.DataFrame(columns)
+
+
+def update_frames(
+    runs_df: pd.DataFrame,
+    judges_df: pd.DataFrame,
+    criteria_df: pd.DataFrame,
+    subtests_df: pd.DataFrame,
+    delta: dict[str, list[RunData]],
+    removed: Iterable[str] = (),
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Apply a delta of (re)loaded experiments to previously built DataFrames.
+
+    Rows of every experiment in ``delta`` or ``removed`` are dropped and rows
+    for the ``delta`` runs are built and appended, so unchanged experiments
+    are never rebuilt.  Subtest summaries are grouped by experiment, so only
+    the groups of the delta experiments are recomputed; the result is
+    identical to rebuilding everything from scratch (up to row order).
+
+    Args:
+        runs_df: Runs DataFrame from :func:`build_runs_df`
+        judges_df: Judges DataFrame from :func:`build_judges_df`
+        criteria_df: Criteria DataFrame from :func:`build_criteria_df`
+        subtests_df: Subtests DataFrame from :func:`build_subtests_df`
+        delta: New or changed experiments (name -> runs)
+        removed: Experiments to drop without replacement
+
+    Returns:
+        Updated ``(runs_df, judges_df, criteria_df, subtests_df)``
+
+    """
+    stale = set(delta) | set(removed)
+
+    def replace(df: pd.DataFrame, new_rows: pd.DataFrame) -> pd.DataFrame:
+        if "experiment" in df.columns:
+            df = df[~df["experiment"].isin(stale)]
+        parts = [part for part in (df, new_rows) if not part.empty]
+        if not parts:
+            return df
+        return pd.concat(parts, ignore_index=True) if len(parts) > 1 else parts[0]
+
+    delta_runs = build_runs_df(delta)
+    runs_df = replace(runs_df, delta_runs)
+    judges_df = replace(judges_df, build_judges_df(delta))
+    criteria_df = replace(criteria_df, build_criteria_df(delta))
+    subtests_df = replace(
+        subtests_df, build_subtests_df(delta_runs) if not delta_runs.empty else pd.DataFrame()
+    )
+    return runs_df, judges_df, criteria_df, subtests_df
+
+
+# Nullable process metrics summarised as mean/median/std (NaN when not yet collected)
+_PROCESS_METRICS = ("r_prog", "cfp", "pr_revert_rate", "strategic_drift")
+_GRADES = ("S", "A", "B", "C", "D", "F")
+
+
+def _location_spread(column: str, name: str | None = None) -> dict[str, tuple[str, str]]:
+    """Named aggregations for mean/median/std of ``column`` (``mean_<name>`` etc.)."""
+    name = name or column
+    return {
+        f"mean_{name}": (column, "mean"),
+        f"median_{name}": (column, "median"),
+        f"std_{name}": (column, "std"),
+    }
+
+
+def _summarise(
+    runs_df: pd.DataFrame,
+    keys: list[str],
+    *,
+    num_runs: bool,
+    duration: bool,
+) -> pd.DataFrame:
+    """Summarise runs per group with one vectorized ``agg`` call.
+
+    Args:
+        runs_df: Runs DataFrame
+        keys: Grouping columns
+        num_runs: Include a ``num_runs`` count column
+        duration: Include ``mean_duration``
+
+    Returns:
+        DataFrame with the group keys as columns followed by the summary columns
+
+    """
+    spec: dict[str, tuple[str, str]] = {}
+    if num_runs:
+        spec["num_runs"] = ("passed", "size")
+    spec["pass_rate"] = ("passed", "mean")
+    spec.update(_location_spread("score"))
+    spec.update(_location_spread("impl_rate"))
+    spec["mean_cost"] = ("cost_usd", "mean")
+    spec["total_cost"] = ("cost_usd", "sum")
+    if duration:
+        spec["mean_duration"] = ("duration_seconds", "mean")
+    for metric in _PROCESS_METRICS:
+        spec.update(_location_spread(metric))
+
+    if runs_df.empty:
+        return pd.DataFrame(columns=[*keys, *spec, "consistency", "cop"])
+
+    # Process metrics that were never collected arrive as all-None object columns
+    untyped = {
+        metric: pd.to_numeric(runs_df[metric])
+        for metric in _PROCESS_METRICS
+        if runs_df[metric].dtype == object
+    }
+    summary = runs_df.assign(**untyped).groupby(keys).agg(**spec)
+
+    # Derived metrics reuse the scalar definitions from stats.py
+    summary["consistency"] = [
+        compute_consistency(mean, std)
+        for mean, std in zip(summary["mean_score"], summary["std_score"], strict=True)
+    ]
+    summary["cop"] = [
+        compute_cop(cost, rate)
+        for cost, rate in zip(summary["mean_cost"], summary["pass_rate"], strict=True)
+    ]
+    return summary.reset_index()
 
 
 def build_subtests_df(runs_df: pd.DataFrame) -> pd.DataFrame:
@@ -236,97 +388,58 @@ def build_subtests_df(runs_df: pd.DataFrame) -> pd.DataFrame:
         DataFrame with one row per (experiment, tier, subtest)
 
     """
-
-    def compute_subtest_stats(group: pd.DataFrame) -> pd.Series:
-        """Compute statistics for a single subtest."""
-        pass_rate = group["passed"].mean()
-        mean_score = group["score"].mean()
-        median_score = group["score"].median()
-        std_score = group["score"].std()
-
-        # Implementation Rate statistics
-        mean_impl_rate = group["impl_rate"].mean()
-        median_impl_rate = group["impl_rate"].median()
-        std_impl_rate = group["impl_rate"].std()
-
-        # Consistency: 1 - coefficient of variation (clamped to [0, 1])
-        consistency = compute_consistency(mean_score, std_score)
-
-        mean_cost = group["cost_usd"].mean()
-        total_cost = group["cost_usd"].sum()
-        mean_duration = group["duration_seconds"].mean()
-
-        # Cost-of-Pass: mean_cost / pass_rate (infinity if pass_rate == 0)
-        cop = compute_cop(mean_cost, pass_rate)
-
-        # Process metrics (nullable — NaN when data not yet collected)
-        mean_r_prog = group["r_prog"].mean()
-        median_r_prog = group["r_prog"].median()
-        std_r_prog = group["r_prog"].std()
-        mean_cfp = group["cfp"].mean()
-        median_cfp = group["cfp"].median()
-        std_cfp = group["cfp"].std()
-        mean_pr_revert_rate = group["pr_revert_rate"].mean()
-        median_pr_revert_rate = group["pr_revert_rate"].median()
-        std_pr_revert_rate = group["pr_revert_rate"].std()
-        mean_strategic_drift = group["strategic_drift"].mean()
-        median_strategic_drift = group["strategic_drift"].median()
-        std_strategic_drift = group["strategic_drift"].std()
-
-        # Grade distribution
-        grade_counts = group["grade"].value_counts().to_dict()
-        grade_s = grade_counts.get("S", 0)
-        grade_a = grade_counts.get("A", 0)
-        grade_b = grade_counts.get("B", 0)
-        grade_c = grade_counts.get("C", 0)
-        grade_d = grade_counts.get("D", 0)
-        grade_f = grade_counts.get("F", 0)
-
-        # Modal grade (handle case where mode() returns empty Series)
-        mode_result = group["grade"].mode()
-        modal_grade = mode_result[0] if len(mode_result) > 0 else "F"
-
-        return pd.Series(
-            {
-                "pass_rate": pass_rate,
-                "mean_score": mean_score,
-                "median_score": median_score,
-                "std_score": std_score,
-                "mean_impl_rate": mean_impl_rate,
-                "median_impl_rate": median_impl_rate,
-                "std_impl_rate": std_impl_rate,
-                "consistency": consistency,
-                "mean_cost": mean_cost,
-                "total_cost": total_cost,
-                "mean_duration": mean_duration,
-                "cop": cop,
-                "mean_r_prog": mean_r_prog,
-                "median_r_prog": median_r_prog,
-                "std_r_prog": std_r_prog,
-                "mean_cfp": mean_cfp,
-                "median_cfp": median_cfp,
-                "std_cfp": std_cfp,
-                "mean_pr_revert_rate": mean_pr_revert_rate,
-                "median_pr_revert_rate": median_pr_revert_rate,
-                "std_pr_revert_rate": std_pr_revert_rate,
-                "mean_strategic_drift": mean_strategic_drift,
-                "median_strategic_drift": median_strategic_drift,
-                "std_strategic_drift": std_strategic_drift,
-                "grade_S": grade_s,
-                "grade_A": grade_a,
-                "grade_B": grade_b,
-                "grade_C": grade_c,
-                "grade_D": grade_d,
-                "grade_F": grade_f,
-                "modal_grade": modal_grade,
-            }
+    keys = ["experiment", "agent_model", "tier", "subtest"]
+    summary = _summarise(runs_df, keys, num_runs=False, duration=True)
+
+    # Grade distribution: one count column per grade seen (sorted), NaN grades dropped
+    grade_counts = (
+        runs_df.groupby([*keys, "grade"]).size().unstack("grade", fill_value=0)
+        if not runs_df.empty
+        else pd.DataFrame()
+    )
+    grade_counts = grade_counts.reindex(
+        pd.MultiIndex.from_frame(summary[keys]), fill_value=0
+    ).reindex(columns=sorted(grade_counts.columns), fill_value=0)
+    for grade in _GRADES:
+        summary[f"grade_{grade}"] = (
+            grade_counts[grade].to_numpy(dtype=np.int64)
+            if grade in grade_counts.columns
+            else np.zeros(len(summary), dtype=np.int64)
         )
 
-    # Group by experiment, agent_model, tier, subtest
-    grouped = runs_df.groupby(["experiment", "agent_model", "tier", "subtest"])
-    stats = grouped.apply(compute_subtest_stats, include_groups=False).reset_index()
-
-    return stats
+    # Modal grade: most frequent, ties broken alphabetically (as Series.mode()[0]);
+    # "F" for groups without any grade
+    if grade_counts.shape[1]:
+        modal = grade_counts.idxmax(axis=1).to_numpy(dtype=object)
+        modal[grade_counts.to_numpy().max(axis=1) == 0] = "F"
+    else:
+        modal = np.full(len(summary), "F", dtype=object)
+    summary["modal_grade"] = modal
+
+    columns = [
+        *keys,
+        "pass_rate",
+        "mean_score",
+        "median_score",
+        "std_score",
+        "mean_impl_rate",
+        "median_impl_rate",
+        "std_impl_rate",
+        "consistency",
+        "mean_cost",
+        "total_cost",
+        "mean_duration",
+        "cop",
+        *_process_metric_columns(),
+        *(f"grade_{grade}" for grade in _GRADES),
+        "modal_grade",
+    ]
+    return summary[columns]
+
+
+def _process_metric_columns() -> list[str]:
+    """Return the mean/median/std column names of the process metrics, in order."""
+    return [f"{stat}_{metric}" for metric in _PROCESS_METRICS for stat in ("mean", "median", "std")]
 
 
 def tier_summary(runs_df: pd.DataFrame) -> pd.DataFrame:
@@ -339,65 +452,25 @@ def tier_summary(runs_df: pd.DataFrame) -> pd.DataFrame:
         DataFrame with one row per (agent_model, tier)
 
     """
-    grouped = runs_df.groupby(["agent_model", "tier"])
-
-    def compute_tier_stats(group: pd.DataFrame) -> pd.Series:
-        pass_rate = group["passed"].mean()
-        mean_score = group["score"].mean()
-        median_score = group["score"].median()
-        std_score = group["score"].std()
-        mean_impl_rate = group["impl_rate"].mean()
-        median_impl_rate = group["impl_rate"].median()
-        std_impl_rate = group["impl_rate"].std()
-        consistency = compute_consistency(mean_score, std_score)
-        mean_cost = group["cost_usd"].mean()
-        total_cost = group["cost_usd"].sum()
-        cop = compute_cop(mean_cost, pass_rate)
-
-        # Process metrics (nullable — NaN when data not yet collected)
-        mean_r_prog = group["r_prog"].mean()
-        median_r_prog = group["r_prog"].median()
-        std_r_prog = group["r_prog"].std()
-        mean_cfp = group["cfp"].mean()
-        median_cfp = group["cfp"].median()
-        std_cfp = group["cfp"].std()
-        mean_pr_revert_rate = group["pr_revert_rate"].mean()
-        median_pr_revert_rate = group["pr_revert_rate"].median()
-        std_pr_revert_rate = group["pr_revert_rate"].std()
-        mean_strategic_drift = group["strategic_drift"].mean()
-        median_strategic_drift = group["strategic_drift"].median()
-        std_strategic_drift = group["strategic_drift"].std()
-
-        return pd.Series(
-            {
-                "num_runs": len(group),
-                "pass_rate": pass_rate,
-                "mean_score": mean_score,
-                "median_score": median_score,
-                "std_score": std_score,
-                "mean_impl_rate": mean_impl_rate,
-                "median_impl_rate": median_impl_rate,
-                "std_impl_rate": std_impl_rate,
-                "consistency": consistency,
-                "mean_cost": mean_cost,
-                "total_cost": total_cost,
-                "cop": cop,
-                "mean_r_prog": mean_r_prog,
-                "median_r_prog": median_r_prog,
-                "std_r_prog": std_r_prog,
-                "mean_cfp": mean_cfp,
-                "median_cfp": median_cfp,
-                "std_cfp": std_cfp,
-                "mean_pr_revert_rate": mean_pr_revert_rate,
-                "median_pr_revert_rate": median_pr_revert_rate,
-                "std_pr_revert_rate": std_pr_revert_rate,
-                "mean_strategic_drift": mean_strategic_drift,
-                "median_strategic_drift": median_strategic_drift,
-                "std_strategic_drift": std_strategic_drift,
-            }
-        )
-
-    return grouped.apply(compute_tier_stats, include_groups=False).reset_index()
+    keys = ["agent_model", "tier"]
+    summary = _summarise(runs_df, keys, num_runs=True, duration=False)
+    columns = [
+        *keys,
+        "num_runs",
+        "pass_rate",
+        "mean_score",
+        "median_score",
+        "std_score",
+        "mean_impl_rate",
+        "median_impl_rate",
+        "std_impl_rate",
+        "consistency",
+        "mean_cost",
+        "total_cost",
+        "cop",
+        *_process_metric_columns(),
+    ]
+    return summary[columns]
 
 
 def judge_summary(judges_df: pd.DataFrame) -> pd.DataFrame:
@@ -0,0 +1,279 @@
+"""Columnar dataset hand-off between export, figure and table generation.
+
+``export_data.py`` parses the raw ``fullruns/`` JSON once and writes the runs,
+judges, criteria and subtests DataFrames as uncompressed Arrow IPC (Feather v2)
+files plus a ``manifest.json``.  ``generate_figures.py`` and
+``generate_tables.py`` memory-map those files instead of re-parsing every run.
+
+Identifier columns (experiment, model, tier, subtest, ...) are stored
+dictionary-encoded (pandas ``category``).  The manifest records a digest of the
+``(path, mtime, size)`` fingerprints of every source file per experiment, so a
+consumer can detect that the dataset is stale before trusting it.
+
+Requires ``pyarrow`` (part of the ``analysis`` extra).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from scylla.analysis.config import config
+from scylla.analysis.loader import discover_experiments, discover_runs
+from scylla.analysis.run_cache import run_fingerprint
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "CATEGORICAL_COLUMNS",
+    "DATASET_TABLES",
+    "DATASET_VERSION",
+    "MANIFEST_FILENAME",
+    "AnalysisDataset",
+    "compute_source_hashes",
+    "dataset_is_current",
+    "read_dataset",
+    "write_dataset",
+]
+
+DATASET_VERSION = 1
+MANIFEST_FILENAME = "manifest.json"
+DATASET_TABLES = ("runs", "judges", "criteria", "subtests")
+
+# Low-cardinality identifier columns stored dictionary-encoded
+CATEGORICAL_COLUMNS = (
+    "experiment",
+    "agent_model",
+    "tier",
+    "subtest",
+    "grade",
+    "judge_model",
+    "judge_grade",
+    "criterion",
+    "modal_grade",
+)
+
+# Columns that may hold "N/A" strings in the source JSON; coerced to float on write
+_NUMERIC_COLUMNS = ("criterion_achieved", "criterion_max")
+
+
+@dataclass
+class AnalysisDataset:
+    """DataFrames loaded from a columnar dataset.
+
+    Attributes:
+        runs_df: One row per run (see ``build_runs_df``)
+        judges_df: One row per (run, judge) (see ``build_judges_df``)
+        criteria_df: One row per (run, judge, criterion) (see ``build_criteria_df``)
+        subtests_df: One row per subtest (see ``build_subtests_df``)
+        manifest: Parsed ``manifest.json``
+
+    """
+
+    runs_df: pd.DataFrame
+    judges_df: pd.DataFrame
+    criteria_df: pd.DataFrame
+    subtests_df: pd.DataFrame
+    manifest: dict[str, Any]
+
+
+def _import_feather() -> Any:
+    """Import ``pyarrow.feather`` with an actionable error if pyarrow is missing."""
+    try:
+        from pyarrow import feather
+    except ImportError as e:
+        raise ImportError(
+            "pyarrow is required for the columnar dataset. "
+            "Install with: pip install 'scylla[analysis]'"
+        ) from e
+    return feather
+
+
+def compute_source_hashes(data_dir: Path, exclude: list[str] | None = None) -> dict[str, str]:
+    """Compute a digest of the source files of every experiment.
+
+    Only ``stat()`` calls are made; no JSON is parsed.  The digest changes
+    whenever any file read by the loader is added, removed or modified.
+
+    Args:
+        data_dir: Path to fullruns directory
+        exclude: List of experiment names to exclude
+
+    Returns:
+        Mapping of experiment name to SHA-256 hex digest
+
+    """
+    hashes: dict[str, str] = {}
+    for exp_name, exp_dir in discover_experiments(data_dir, exclude):
+        digest = hashlib.sha256()
+        config_path = exp_dir / "config" / "experiment.json"
+        if config_path.exists():
+            st = config_path.stat()
+            digest.update(f"config:{st.st_mtime_ns}:{st.st_size}\n".encode())
+        for run_dir, tier_id, subtest_id in discover_runs(exp_dir):
+            entries = run_fingerprint(run_dir, exp_name, tier_id, subtest_id, "")[4]
+            digest.update(f"{tier_id}/{subtest_id}/{run_dir.name}:{entries!r}\n".encode())
+        hashes[exp_name] = digest.hexdigest()
+    return hashes
+
+
+def _prepare_for_write(df: pd.DataFrame) -> pd.DataFrame:
+    """Apply the dataset column types to a copy of ``df``."""
+    df = df.copy()
+    for col in _NUMERIC_COLUMNS:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors="coerce")
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    return df.reset_index(drop=True)
+
+
+def write_dataset(
+    output_dir: Path,
+    runs_df: pd.DataFrame,
+    judges_df: pd.DataFrame,
+    criteria_df: pd.DataFrame,
+    subtests_df: pd.DataFrame,
+    source_hashes: dict[str, str],
+) -> Path:
+    """Write the analysis DataFrames as an Arrow IPC dataset.
+
+    Args:
+        output_dir: Dataset directory (created if missing)
+        runs_df: Runs DataFrame
+        judges_df: Judges DataFrame
+        criteria_df: Criteria DataFrame
+        subtests_df: Subtests DataFrame
+        source_hashes: Per-experiment source digests from :func:`compute_source_hashes`
+
+    Returns:
+        Path to the written manifest
+
+    Raises:
+        ImportError: If pyarrow is not installed
+
+    """
+    feather = _import_feather()
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    frames = {
+        "runs": runs_df,
+        "judges": judges_df,
+        "criteria": criteria_df,
+        "subtests": subtests_df,
+    }
+    tables: dict[str, Any] = {}
+    for name, df in frames.items():
+        prepared = _prepare_for_write(df)
+        feather.write_feather(prepared, output_dir / f"{name}.arrow", compression="uncompressed")
+        tables[name] = {
+            "file": f"{name}.arrow",
+            "rows": len(prepared),
+            "dtypes": {col: str(dtype) for col, dtype in prepared.dtypes.items()},
+        }
+
+    manifest = {
+        "dataset_version": DATASET_VERSION,
+        "pipeline_version": config.pipeline_version,
+        "config_version": config.config_version,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "tables": tables,
+        "sources": source_hashes,
+    }
+    manifest_path = output_dir / MANIFEST_FILENAME
+    with manifest_path.open("w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest_path
+
+
+def _read_manifest(dataset_dir: Path) -> dict[str, Any] | None:
+    """Read ``manifest.json``, returning None if missing or unreadable."""
+    manifest_path = dataset_dir / MANIFEST_FILENAME
+    if not manifest_path.exists():
+        return None
+    try:
+        with manifest_path.open() as f:
+            manifest: dict[str, Any] = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning("Failed to read dataset manifest %s: %s", manifest_path, e)
+        return None
+    return manifest
+
+
+def dataset_is_current(
+    dataset_dir: Path,
+    data_dir: Path,
+    exclude: list[str] | None = None,
+) -> bool:
+    """Check whether a dataset was built from the current sources, pipeline and config.
+
+    Args:
+        dataset_dir: Dataset directory written by :func:`write_dataset`
+        data_dir: Path to fullruns directory
+        exclude: List of experiment names to exclude
+
+    Returns:
+        True if the manifest matches the sources, pipeline, config and dataset version
+
+    """
+    manifest = _read_manifest(dataset_dir)
+    if manifest is None:
+        return False
+    if manifest.get("dataset_version") != DATASET_VERSION:
+        return False
+    if manifest.get("pipeline_version") != config.pipeline_version:
+        return False
+    if manifest.get("config_version") != config.config_version:
+        return False
+    if not all((dataset_dir / f"{name}.arrow").exists() for name in DATASET_TABLES):
+        return False
+    return bool(manifest.get("sources") == compute_source_hashes(data_dir, exclude))
+
+
+def read_dataset(dataset_dir: Path, categorical: bool = False) -> AnalysisDataset:
+    """Memory-map a dataset written by :func:`write_dataset`.
+
+    Args:
+        dataset_dir: Dataset directory
+        categorical: Keep identifier columns as pandas ``category``. By default
+            they are decoded to plain object columns so downstream groupbys and
+            comparisons behave exactly as with DataFrames built from raw JSON.
+
+    Returns:
+        Loaded dataset
+
+    Raises:
+        FileNotFoundError: If the manifest is missing
+        ImportError: If pyarrow is not installed
+
+    """
+    manifest = _read_manifest(dataset_dir)
+    if manifest is None:
+        raise FileNotFoundError(f"No dataset manifest in {dataset_dir}")
+
+    feather = _import_feather()
+    frames: dict[str, pd.DataFrame] = {}
+    for name in DATASET_TABLES:
+        table = feather.read_table(dataset_dir / f"{name}.arrow", memory_map=True)
+        df: pd.DataFrame = table.to_pandas()
+        if not categorical:
+            for col in CATEGORICAL_COLUMNS:
+                if col in df.columns and isinstance(df[col].dtype, pd.CategoricalDtype):
+                    df[col] = df[col].astype(object)
+        frames[name] = df
+
+    return AnalysisDataset(
+        runs_df=frames["runs"],
+        judges_df=frames["judges"],
+        criteria_df=frames["criteria"],
+        subtests_df=frames["subtests"],
+        manifest=manifest,
+    )
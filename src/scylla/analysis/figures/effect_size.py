@@ -12,7 +12,7 @@
 
 from scylla.analysis.figures import derive_tier_order
 from scylla.analysis.figures.spec_builder import save_figure
-from scylla.analysis.stats import cliffs_delta_ci
+from scylla.analysis.stats import cliffs_delta_ci_batch
 
 
 def fig19_effect_size_forest(runs_df: pd.DataFrame, output_dir: Path, render: bool = True) -> None:
@@ -31,8 +31,9 @@ def fig19_effect_size_forest(runs_df: pd.DataFrame, output_dir: Path, render: bo
     # Derive tier order from data
     tier_order = derive_tier_order(runs_df)
 
-    # Compute effect sizes for consecutive tier transitions
-    effect_sizes = []
+    # Collect consecutive tier transitions per model
+    transitions = []
+    pairs = []
 
     for model in sorted(runs_df["agent_model"].unique()):
         model_runs = runs_df[runs_df["agent_model"] == model]
@@ -45,29 +46,29 @@ def fig19_effect_size_forest(runs_df: pd.DataFrame, output_dir: Path, render: bo
             if len(tier1_data) == 0 or len(tier2_data) == 0:
                 continue
 
-            # Cliff's delta with 95% CI
-            delta, ci_low, ci_high = cliffs_delta_ci(
-                tier2_data["passed"].astype(int),
-                tier1_data["passed"].astype(int),
-                confidence=0.95,
-                n_resamples=10000,
-            )
-
-            # Determine significance (CI excludes zero)
-            is_significant = not (ci_low <= 0 <= ci_high)
-
-            effect_sizes.append(
-                {
-                    "agent_model": model,
-                    "transition": f"{tier1}→{tier2}",
-                    "tier1": tier1,
-                    "tier2": tier2,
-                    "delta": delta,
-                    "ci_low": ci_low,
-                    "ci_high": ci_high,
-                    "significant": "Yes" if is_significant else "No",
-                }
-            )
+            transitions.append((model, tier1, tier2))
+            pairs.append((tier2_data["passed"].astype(int), tier1_data["passed"].astype(int)))
+
+    # Cliff's delta with 95% CI for every transition in one batch
+    cis = cliffs_delta_ci_batch(pairs, confidence=0.95, n_resamples=10000)
+
+    effect_sizes = []
+    for (model, tier1, tier2), (delta, ci_low, ci_high) in zip(transitions, cis, strict=True):
+        # Determine significance (CI excludes zero)
+        is_significant = not (ci_low <= 0 <= ci_high)
+
+        effect_sizes.append(
+            {
+                "agent_model": model,
+                "transition": f"{tier1}→{tier2}",
+                "tier1": tier1,
+                "tier2": tier2,
+                "delta": delta,
+                "ci_low": ci_low,
+                "ci_high": ci_high,
+                "significant": "Yes" if is_significant else "No",
+            }
+        )
 
     effect_df = pd.DataFrame(effect_sizes)
 
@@ -19,7 +19,7 @@
     compute_dynamic_domain_with_ci,
     save_figure,
 )
-from scylla.analysis.stats import bootstrap_ci
+from scylla.analysis.stats import bootstrap_ci_batch
 
 
 def fig25_impl_rate_by_tier(
@@ -56,7 +56,7 @@ def fig25_impl_rate_by_tier(
             # Fallback if subtest column doesn't exist
             subtest_counts[tier] = 0
 
-    stats = []
+    cells = []
     for model in runs_df["agent_model"].unique():
         for tier in tier_order:
             subset = runs_df[(runs_df["agent_model"] == model) & (runs_df["tier"] == tier)]
@@ -67,22 +67,25 @@ def fig25_impl_rate_by_tier(
             if len(impl_rate) == 0:
                 continue
 
-            mean, ci_low, ci_high = bootstrap_ci(impl_rate)
-
-            # Add tier label with subtest count
-            tier_label = f"{tier} (n={subtest_counts[tier]})" if subtest_counts[tier] > 0 else tier
-
-            stats.append(
-                {
-                    "agent_model": model,
-                    "tier": tier,
-                    "tier_label": tier_label,
-                    "impl_rate": mean,
-                    "ci_low": ci_low,
-                    "ci_high": ci_high,
-                    "n": len(impl_rate),
-                }
-            )
+            cells.append((model, tier, impl_rate))
+
+    stats = []
+    cis = bootstrap_ci_batch([impl_rate for _, _, impl_rate in cells])
+    for (model, tier, impl_rate), (mean, ci_low, ci_high) in zip(cells, cis, strict=True):
+        # Add tier label with subtest count
+        tier_label = f"{tier} (n={subtest_counts[tier]})" if subtest_counts[tier] > 0 else tier
+
+        stats.append(
+            {
+                "agent_model": model,
+                "tier": tier,
+                "tier_label": tier_label,
+                "impl_rate": mean,
+                "ci_low": ci_low,
+                "ci_high": ci_high,
+                "n": len(impl_rate),
+            }
+        )
 
     df = pd.DataFrame(stats)
 
@@ -2,12 +2,22 @@
 
 Provides helpers for creating publication-quality Vega-Lite charts with
 consistent theming and color schemes.
+
+Rendering normally happens synchronously inside :func:`save_figure`. Inside a
+:func:`defer_rendering` block, ``save_figure`` still writes the spec (and LaTeX
+snippet) but queues a :class:`RenderJob` instead, so the caller can hand the
+self-contained specs to :func:`render_job` in worker processes.
 """
 
 from __future__ import annotations
 
 import json
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 import altair as alt
 import pandas as pd
@@ -157,6 +167,123 @@ def model_color_scale(models: list[str]) -> alt.Scale:
     return alt.Scale(domain=domain, range=range_)
 
 
+# PNG scale factor (300 DPI for publication)
+PNG_SCALE_FACTOR = 3.0
+
+
+@dataclass(frozen=True)
+class RenderJob:
+    """Deferred rendering of one figure.
+
+    Attributes:
+        name: Figure name (without extension)
+        spec: Vega-Lite spec with all data inlined, as ``chart.save()`` renders it
+        outputs: ``(format, path)`` pairs to render
+
+    """
+
+    name: str
+    spec: dict[str, Any]
+    outputs: tuple[tuple[str, str], ...]
+
+
+@dataclass(frozen=True)
+class RenderResult:
+    """Outcome of :func:`render_job`.
+
+    Attributes:
+        name: Figure name
+        rendered: Paths written successfully
+        errors: ``(format, error)`` for each format that failed
+        seconds: Wall time spent rendering
+
+    """
+
+    name: str
+    rendered: tuple[str, ...]
+    errors: tuple[tuple[str, str], ...]
+    seconds: float
+
+
+# Active render queue while inside defer_rendering(); None renders synchronously
+_render_queue: list[RenderJob] | None = None
+
+
+@contextmanager
+def defer_rendering() -> Iterator[list[RenderJob]]:
+    """Queue render jobs from :func:`save_figure` instead of rendering synchronously.
+
+    Yields:
+        The list that receives a :class:`RenderJob` per saved figure
+
+    """
+    global _render_queue
+    previous = _render_queue
+    queue: list[RenderJob] = []
+    _render_queue = queue
+    try:
+        yield queue
+    finally:
+        _render_queue = previous
+
+
+def _render_spec(chart: alt.TopLevelMixin) -> dict[str, Any]:
+    """Return the spec ``chart.save()`` would render (all data inlined)."""
+    with alt.data_transformers.enable("default"), alt.data_transformers.disable_max_rows():
+        spec: dict[str, Any] = chart.to_dict(context={"pre_transform": False})
+    return spec
+
+
+def render_job(job: RenderJob) -> RenderResult:
+    """Render a queued figure with vl-convert.
+
+    Safe to run in a worker process: the job carries the complete spec, and the
+    vl-convert engine is created once per process on first use. Each format is
+    isolated, so one failing format does not prevent the others.
+
+    Args:
+        job: Job queued by :func:`save_figure` inside :func:`defer_rendering`
+
+    Returns:
+        Rendered paths, per-format errors and elapsed time
+
+    """
+    from altair.utils.mimebundle import spec_to_mimebundle
+
+    start = time.perf_counter()
+    rendered: list[str] = []
+    errors: list[tuple[str, str]] = []
+    for fmt, path in job.outputs:
+        try:
+            # fmt is validated below; the overloads only accept literal formats
+            bundle: Any = spec_to_mimebundle(  # type: ignore[call-overload]
+                spec=job.spec,
+                format=fmt,
+                mode="vega-lite",
+                vega_version=alt.VEGA_VERSION,
+                vegalite_version=alt.VEGALITE_VERSION,
+                vegaembed_version=alt.VEGAEMBED_VERSION,
+                scale_factor=PNG_SCALE_FACTOR if fmt == "png" else 1.0,
+            )
+            if fmt == "png":
+                Path(path).write_bytes(bundle[0]["image/png"])
+            elif fmt == "pdf":
+                Path(path).write_bytes(bundle["application/pdf"])
+            elif fmt == "svg":
+                Path(path).write_text(bundle["image/svg+xml"])
+            else:
+                raise ValueError(f"Unsupported format: '{fmt}'")
+            rendered.append(path)
+        except Exception as e:
+            errors.append((fmt, str(e)))
+    return RenderResult(
+        name=job.name,
+        rendered=tuple(rendered),
+        errors=tuple(errors),
+        seconds=time.perf_counter() - start,
+    )
+
+
 def save_figure(
     chart: alt.TopLevelMixin,
     name: str,
@@ -188,13 +315,22 @@ def save_figure(
     spec_path.write_text(json.dumps(spec, indent=2) + "\n")
     print(f"  Saved spec: {spec_path}")
 
+    # Queue rendering for a worker pool when deferred
+    if render and _render_queue is not None:
+        outputs = tuple((fmt, str(output_dir / f"{name}.{fmt}")) for fmt in formats)
+        _render_queue.append(RenderJob(name=name, spec=_render_spec(chart), outputs=outputs))
+        print(f"  Queued render: {', '.join(formats)}")
+        if "pdf" in formats:
+            _generate_latex_snippet(name, output_dir, chart, latex_caption)
+        return
+
     # Optionally render to images
     if render:
         for fmt in formats:
             try:
                 img_path = output_dir / f"{name}.{fmt}"
                 if fmt == "png":
-                    chart.save(str(img_path), scale_factor=3.0)  # 300 DPI for publication
+                    chart.save(str(img_path), scale_factor=PNG_SCALE_FACTOR)
                 else:
                     chart.save(str(img_path))
                 print(f"  Rendered: {img_path}")
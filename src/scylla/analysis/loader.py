@@ -7,19 +7,24 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import re
 import warnings
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Literal, cast
+from typing import TYPE_CHECKING, Any, Literal, cast
 
-import jsonschema
 import numpy as np
 import yaml
 
-from scylla.e2e.models import TokenStats
+from scylla.analysis.run_cache import RunCache, RunFingerprint, run_fingerprint
+
+if TYPE_CHECKING:
+    from jsonschema.protocols import Validator
+
+    from scylla.e2e.models import TokenStats
 
 logger = logging.getLogger(__name__)
 
@@ -65,10 +70,25 @@ def __init__(
         )
 
 
-# Load JSON Schema for run_result.json validation
+# JSON Schema for run_result.json validation
 _SCHEMA_PATH = Path(__file__).parent / "schemas" / "run_result.schema.json"
-with _SCHEMA_PATH.open() as _schema_file:
-    _RUN_RESULT_SCHEMA = json.load(_schema_file)
+
+
+@functools.cache
+def _run_result_validator() -> Validator:
+    """Return the run_result.json validator, parsing the schema on first use.
+
+    The schema is checked once here rather than on every
+    ``jsonschema.validate()`` call.
+    """
+    import jsonschema
+
+    with _SCHEMA_PATH.open() as schema_file:
+        schema = json.load(schema_file)
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    validator: Validator = validator_cls(schema)
+    return validator
 
 
 def validate_numeric(value: Any, field_name: str, default: float = np.nan) -> float:
@@ -537,20 +557,25 @@ def load_run(run_dir: Path, experiment: str, tier: str, subtest: str, agent_mode
         Complete run data
 
     """
+    # Deferred: jsonschema and scylla.e2e are only needed once runs are parsed
+    from jsonschema.exceptions import best_match
+
+    from scylla.e2e.models import TokenStats
+
     # Load run_result.json for consensus data
     run_result_path = run_dir / "run_result.json"
     with run_result_path.open() as f:
         result = json.load(f)
 
-    # Validate against JSON Schema (graceful degradation - log warning only)
-    try:
-        jsonschema.validate(result, _RUN_RESULT_SCHEMA)
-    except jsonschema.ValidationError as e:
+    # Validate against JSON Schema (graceful degradation - log warning only).
+    # best_match() picks the same error jsonschema.validate() would raise.
+    error = best_match(_run_result_validator().iter_errors(result))
+    if error is not None:
         logger.warning(
             "Schema validation failed for %s: %s (path: %s)",
             run_result_path,
-            e.message,
-            " -> ".join(str(p) for p in e.path) if e.path else "root",
+            error.message,
+            " -> ".join(str(p) for p in error.path) if error.path else "root",
         )
 
     # Parse run number from directory name (e.g., "run_01" -> 1)
@@ -718,85 +743,149 @@ def _extract_process_float(key: str) -> float | None:
     )
 
 
-def load_experiment(
-    experiment_dir: Path,
-    agent_model: str,
-    experiment_name: str | None = None,
-) -> list[RunData]:
-    """Load all runs from an experiment.
+def discover_runs(experiment_dir: Path) -> list[tuple[Path, str, str]]:
+    """List the run directories of an experiment in deterministic order.
 
     Args:
         experiment_dir: Path to experiment directory (contains tier dirs)
-        agent_model: Agent model display name
-        experiment_name: Override for experiment name. If None, uses directory name.
 
     Returns:
-        List of all run data
-
-    Note:
-        Automatically skips non-tier directories (config, judges.txt, etc.)
+        List of ``(run_dir, tier_id, subtest_id)`` tuples, sorted by tier, subtest and run
 
     """
-    runs = []
-    experiment_name = experiment_name or experiment_dir.name
-
     # Iterate through tier directories (T0-T6) — results live under completed/
     from scylla.e2e.paths import COMPLETED_DIR
 
     completed_dir = experiment_dir / COMPLETED_DIR
     scan_base = completed_dir if completed_dir.exists() else experiment_dir
+    discovered: list[tuple[Path, str, str]] = []
     for tier_dir in sorted(scan_base.iterdir()):
         if not tier_dir.is_dir() or not tier_dir.name.startswith("T"):
             continue
 
-        tier_id = tier_dir.name
-
         # Iterate through subtest directories
         for subtest_dir in sorted(tier_dir.iterdir()):
             if not subtest_dir.is_dir() or not subtest_dir.name.isdigit():
                 continue
 
-            subtest_id = subtest_dir.name
-
             # Iterate through run directories
             for run_dir in sorted(subtest_dir.iterdir()):
                 if not run_dir.is_dir() or not run_dir.name.startswith("run_"):
                     continue
+                discovered.append((run_dir, tier_dir.name, subtest_dir.name))
 
-                try:
-                    run = load_run(run_dir, experiment_name, tier_id, subtest_id, agent_model)
-                    runs.append(run)
-                except Exception as e:
-                    logger.warning("Failed to load %s: %s", run_dir, e)
-                    continue
+    return discovered
 
-    return runs
 
+def _load_run_isolated(
+    task: tuple[Path, str, str, str, str],
+) -> tuple[RunData | None, str | None]:
+    """Load one run, returning the error message instead of raising.
 
-def load_all_experiments(
+    Module-level so it can be pickled for :class:`~concurrent.futures.ProcessPoolExecutor`.
+
+    Args:
+        task: ``(run_dir, experiment, tier, subtest, agent_model)``
+
+    Returns:
+        ``(run, None)`` on success or ``(None, error_message)`` on failure
+
+    """
+    run_dir, experiment, tier, subtest, agent_model = task
+    try:
+        return load_run(run_dir, experiment, tier, subtest, agent_model), None
+    except Exception as e:
+        return None, str(e)
+
+
+def load_experiment(
+    experiment_dir: Path,
+    agent_model: str,
+    experiment_name: str | None = None,
+    cache: RunCache | None = None,
+    jobs: int = 1,
+) -> list[RunData]:
+    """Load all runs from an experiment.
+
+    Args:
+        experiment_dir: Path to experiment directory (contains tier dirs)
+        agent_model: Agent model display name
+        experiment_name: Override for experiment name. If None, uses directory name.
+        cache: Optional run cache. Runs whose files are unchanged since they were
+            cached are returned without re-parsing; freshly parsed runs are stored.
+        jobs: Number of worker processes used to parse uncached runs. ``1``
+            (default) parses serially in-process.
+
+    Returns:
+        List of all run data, ordered by tier, subtest and run directory
+
+    Note:
+        Automatically skips non-tier directories (config, judges.txt, etc.)
+
+    """
+    experiment_name = experiment_name or experiment_dir.name
+
+    tasks = [
+        (run_dir, experiment_name, tier_id, subtest_id, agent_model)
+        for run_dir, tier_id, subtest_id in discover_runs(experiment_dir)
+    ]
+    results: list[RunData | None] = [None] * len(tasks)
+
+    # Serve unchanged runs from the cache; collect the rest for parsing
+    fingerprints: list[RunFingerprint | None] = [None] * len(tasks)
+    pending: list[int] = []
+    for i, task in enumerate(tasks):
+        if cache is not None:
+            fingerprint = run_fingerprint(*task)
+            fingerprints[i] = fingerprint
+            results[i] = cache.get(task[0], fingerprint)
+        if results[i] is None:
+            pending.append(i)
+
+    pending_tasks = [tasks[i] for i in pending]
+    if jobs > 1 and len(pending_tasks) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        workers = min(jobs, len(pending_tasks))
+        chunksize = max(1, len(pending_tasks) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parsed = list(pool.map(_load_run_isolated, pending_tasks, chunksize=chunksize))
+    else:
+        parsed = [_load_run_isolated(task) for task in pending_tasks]
+
+    for i, (run, error) in zip(pending, parsed, strict=True):
+        if run is None:
+            logger.warning("Failed to load %s: %s", tasks[i][0], error)
+            continue
+        results[i] = run
+        cached_fingerprint = fingerprints[i]
+        if cache is not None and cached_fingerprint is not None:
+            cache.put(tasks[i][0], cached_fingerprint, run)
+
+    return [run for run in results if run is not None]
+
+
+def discover_experiments(
     data_dir: Path,
     exclude: list[str] | None = None,
-) -> dict[str, list[RunData]]:
-    """Load all experiments from a data directory.
+) -> list[tuple[str, Path]]:
+    """List the experiments under a data directory.
+
+    Each experiment directory may contain several timestamped run directories;
+    the latest one (sorted alphabetically = chronologically) is used.
 
     Args:
         data_dir: Path to fullruns directory
         exclude: List of experiment names to exclude (default: [])
 
     Returns:
-        Dictionary mapping experiment name to list of runs
-
-    Note:
-        To load rubric weights with conflict resolution, call
-        :func:`load_rubric_weights` separately with the desired
-        ``rubric_conflict`` policy.
+        List of ``(experiment_name, timestamped_dir)`` tuples, sorted by name
 
     """
     if exclude is None:
         exclude = []
 
-    experiments = {}
-
+    discovered: list[tuple[str, Path]] = []
     for exp_dir in sorted(data_dir.iterdir()):
         if not exp_dir.is_dir():
             continue
@@ -806,14 +895,45 @@ def load_all_experiments(
         if not timestamped_dirs:
             continue
 
-        # Use the latest timestamped directory (sorted alphabetically = chronologically)
-        actual_exp_dir = timestamped_dirs[-1]
-        exp_name = exp_dir.name
-
-        if exp_name in exclude:
-            logger.info("Skipping excluded experiment: %s", exp_name)
+        if exp_dir.name in exclude:
+            logger.info("Skipping excluded experiment: %s", exp_dir.name)
             continue
 
+        discovered.append((exp_dir.name, timestamped_dirs[-1]))
+
+    return discovered
+
+
+def load_all_experiments(
+    data_dir: Path,
+    exclude: list[str] | None = None,
+    cache_dir: Path | None = None,
+    jobs: int = 1,
+) -> dict[str, list[RunData]]:
+    """Load all experiments from a data directory.
+
+    Args:
+        data_dir: Path to fullruns directory
+        exclude: List of experiment names to exclude (default: [])
+        cache_dir: Directory for the on-disk run cache (see
+            :class:`~scylla.analysis.run_cache.RunCache`). If None (default),
+            every run is parsed from JSON.
+        jobs: Number of worker processes used to parse uncached runs (default: 1)
+
+    Returns:
+        Dictionary mapping experiment name to list of runs
+
+    Note:
+        To load rubric weights with conflict resolution, call
+        :func:`load_rubric_weights` separately with the desired
+        ``rubric_conflict`` policy.
+
+    """
+    cache = RunCache(cache_dir) if cache_dir is not None else None
+
+    experiments = {}
+
+    for exp_name, actual_exp_dir in discover_experiments(data_dir, exclude):
         logger.info("Loading experiment: %s", exp_name)
 
         # Resolve agent model from experiment configuration
@@ -823,10 +943,19 @@ def load_all_experiments(
             logger.warning("%s, skipping experiment", e)
             continue
 
-        runs = load_experiment(actual_exp_dir, agent_model, experiment_name=exp_name)
+        runs = load_experiment(
+            actual_exp_dir, agent_model, experiment_name=exp_name, cache=cache, jobs=jobs
+        )
         experiments[exp_name] = runs
         logger.info("  Loaded %d runs (agent model: %s)", len(runs), agent_model)
 
+    if cache is not None:
+        logger.info("Run cache: %d hits, %d misses (%s)", cache.hits, cache.misses, cache.path)
+        try:
+            cache.save()
+        except OSError as e:
+            logger.warning("Failed to save run cache %s: %s", cache.path, e)
+
     return experiments
 
 
@@ -0,0 +1,238 @@
+"""Content-addressed cache of generated figure and table outputs.
+
+``generate_figures.py`` and ``generate_tables.py`` rebuild every artifact on
+each run.  :class:`OutputCache` keys each generator's outputs on a digest of
+
+- the DataFrame(s) passed to the generator,
+- the source of the generator's module plus the shared analysis modules it
+  builds on (``stats.py``, ``config.py``, the figure/table helpers), and
+- ``analysis/config.yaml``,
+
+and records which files the generator wrote.  When the key is unchanged and
+every recorded file still exists the generator is skipped.  The manifest is a
+JSON file inside the output directory, so deleting the directory (or any one
+output) forces a rebuild.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import inspect
+import json
+import logging
+from collections.abc import Callable, Iterable, Sequence
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "MANIFEST_FILENAME",
+    "OutputCache",
+    "frame_digest",
+    "source_digest",
+]
+
+# Bump whenever the key derivation or manifest layout changes.
+CACHE_VERSION = 1
+MANIFEST_FILENAME = ".output_cache.json"
+
+_ANALYSIS_DIR = Path(__file__).parent
+_CONFIG_PATH = _ANALYSIS_DIR / "config.yaml"
+
+# Modules every figure/table generator depends on besides its own module
+SHARED_SOURCES = (
+    _ANALYSIS_DIR / "config.py",
+    _ANALYSIS_DIR / "dataframes.py",
+    _ANALYSIS_DIR / "loader.py",
+    _ANALYSIS_DIR / "rank_tests.py",
+    _ANALYSIS_DIR / "stats.py",
+    _ANALYSIS_DIR / "figures" / "__init__.py",
+    _ANALYSIS_DIR / "figures" / "spec_builder.py",
+    _ANALYSIS_DIR / "tables" / "__init__.py",
+)
+
+
+def frame_digest(df: pd.DataFrame) -> str:
+    """Hash the contents, column names, dtypes and index of a DataFrame.
+
+    Columns holding unhashable objects (lists, dicts) are hashed via their
+    string representation.
+
+    Args:
+        df: DataFrame to hash
+
+    Returns:
+        Hex SHA-256 digest
+
+    """
+    h = hashlib.sha256()
+    h.update(repr((list(map(str, df.columns)), [str(t) for t in df.dtypes])).encode())
+    h.update(pd.util.hash_pandas_object(df.index).to_numpy().tobytes())
+    for col in df.columns:
+        series = df[col]
+        try:
+            hashed = pd.util.hash_pandas_object(series, index=False)
+        except TypeError:
+            hashed = pd.util.hash_pandas_object(series.astype(str), index=False)
+        h.update(hashed.to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def source_digest(paths: Iterable[Path]) -> str:
+    """Hash the contents of source files (missing files hash as empty).
+
+    Args:
+        paths: Files to hash, in a stable order
+
+    Returns:
+        Hex SHA-256 digest
+
+    """
+    h = hashlib.sha256()
+    for path in paths:
+        h.update(str(path.name).encode())
+        with contextlib.suppress(OSError):
+            h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+class OutputCache:
+    """Manifest of generated outputs keyed by content digest.
+
+    Example:
+        >>> cache = OutputCache(output_dir)
+        >>> key = cache.key(fig04_pass_rate_by_tier, [runs_df], render=True)
+        >>> if not cache.is_current("fig04_pass_rate_by_tier", key):
+        ...     before = cache.snapshot()
+        ...     fig04_pass_rate_by_tier(runs_df, output_dir)
+        ...     cache.record("fig04_pass_rate_by_tier", key, cache.written_since(before))
+        >>> cache.save()
+
+    """
+
+    def __init__(self, output_dir: Path, enabled: bool = True) -> None:
+        """Load the manifest from ``output_dir``.
+
+        Args:
+            output_dir: Directory the generators write into
+            enabled: If False, nothing is considered current; outputs are still
+                recorded so the manifest stays accurate for later runs
+
+        """
+        self.output_dir = output_dir
+        self.enabled = enabled
+        self._path = output_dir / MANIFEST_FILENAME
+        self._entries: dict[str, dict[str, Any]] = self._read()
+        self._frame_digests: dict[int, str] = {}
+        self._source_digests: dict[Path, str] = {}
+        self._shared_digest = source_digest((*SHARED_SOURCES, _CONFIG_PATH))
+
+    def _read(self) -> dict[str, dict[str, Any]]:
+        """Read the manifest, discarding it if unreadable or from another version."""
+        try:
+            manifest = json.loads(self._path.read_text())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable output cache {self._path}: {e}")
+            return {}
+        if not isinstance(manifest, dict) or manifest.get("version") != CACHE_VERSION:
+            return {}
+        entries: dict[str, dict[str, Any]] = manifest.get("entries", {})
+        return entries
+
+    def _frame_digest(self, df: pd.DataFrame) -> str:
+        """Return the (memoized) digest of a DataFrame shared by several generators."""
+        digest = self._frame_digests.get(id(df))
+        if digest is None:
+            digest = frame_digest(df)
+            self._frame_digests[id(df)] = digest
+        return digest
+
+    def key(
+        self,
+        generator: Callable[..., Any],
+        frames: Sequence[pd.DataFrame],
+        **params: Any,
+    ) -> str | None:
+        """Compute the cache key for one generator invocation.
+
+        Args:
+            generator: Figure or table function
+            frames: DataFrames passed to the generator
+            **params: Other arguments that affect the output (JSON-serialisable)
+
+        Returns:
+            Hex SHA-256 digest, or None if the generator or its inputs cannot
+            be hashed (the output is then always regenerated)
+
+        """
+        try:
+            source = Path(inspect.getfile(generator))
+            if source not in self._source_digests:
+                self._source_digests[source] = source_digest([source])
+
+            h = hashlib.sha256()
+            h.update(str(CACHE_VERSION).encode())
+            h.update(generator.__qualname__.encode())
+            h.update(self._source_digests[source].encode())
+            h.update(self._shared_digest.encode())
+            for df in frames:
+                h.update(self._frame_digest(df).encode())
+            h.update(json.dumps(params, sort_keys=True, default=str).encode())
+        except (AttributeError, TypeError, ValueError) as e:
+            logger.debug(f"Not caching {generator!r}: {e}")
+            return None
+        return h.hexdigest()
+
+    def is_current(self, name: str, key: str | None) -> bool:
+        """Return True if ``name`` was built with ``key`` and all its outputs exist."""
+        if not self.enabled or key is None:
+            return False
+        entry = self._entries.get(name)
+        if entry is None or entry.get("key") != key:
+            return False
+        return all((self.output_dir / rel).exists() for rel in entry.get("outputs", []))
+
+    def snapshot(self) -> dict[str, int]:
+        """Return ``{relative_path: mtime_ns}`` for the files in the output directory."""
+        if not self.output_dir.is_dir():
+            return {}
+        return {
+            str(path.relative_to(self.output_dir)): path.stat().st_mtime_ns
+            for path in self.output_dir.rglob("*")
+            if path.is_file() and path.name != MANIFEST_FILENAME
+        }
+
+    def written_since(self, before: dict[str, int]) -> list[Path]:
+        """Return files created or modified since :meth:`snapshot` returned ``before``."""
+        return [
+            self.output_dir / rel
+            for rel, mtime in self.snapshot().items()
+            if before.get(rel) != mtime
+        ]
+
+    def record(self, name: str, key: str | None, outputs: Iterable[Path | str]) -> None:
+        """Record that ``name`` was built with ``key`` and wrote ``outputs``."""
+        if key is None:
+            self.invalidate(name)
+            return
+        relative = sorted(
+            {str(Path(p).resolve().relative_to(self.output_dir.resolve())) for p in outputs}
+        )
+        self._entries[name] = {"key": key, "outputs": relative}
+
+    def invalidate(self, name: str) -> None:
+        """Forget ``name`` so it is rebuilt next time."""
+        self._entries.pop(name, None)
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self._path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"version": CACHE_VERSION, "entries": self._entries}, indent=2))
+        tmp.replace(self._path)
@@ -0,0 +1,160 @@
+"""Multi-factor rank tests over integer-coded factors.
+
+Generalises the Scheirer-Ray-Hare test (non-parametric two-way ANOVA on
+ranks) to any number of factors and several value columns in one call.
+Factors are integer-coded once with :func:`pandas.factorize`; per-cell rank
+sums and counts for the full factorial come from a single ``np.bincount``
+pass per value column, and every main-effect and interaction sum of squares
+is obtained by marginalising that cell table instead of rescanning the
+DataFrame with a boolean mask per level.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+__all__ = [
+    "INTERACTION_SEPARATOR",
+    "scheirer_ray_hare_factorial",
+]
+
+# Joins factor names into interaction effect names, e.g. "agent_model:tier"
+INTERACTION_SEPARATOR = ":"
+
+
+def _effect_result(ss: float, df: int, ms_total: float) -> dict[str, float]:
+    """Build the H-statistic, df and p-value entry for one effect."""
+    h = ss / ms_total
+    return {
+        "h_statistic": float(h),
+        "df": int(df),
+        "p_value": float(1 - stats.chi2.cdf(h, df)),
+    }
+
+
+def _factorial_effects(
+    ranks: np.ndarray,
+    codes: np.ndarray,
+    shape: tuple[int, ...],
+    factor_cols: Sequence[str],
+) -> dict[str, dict[str, float]]:
+    """Compute all effects for one value column.
+
+    Args:
+        ranks: Ranks of the valid rows, shape ``(n,)``
+        codes: Factor codes of the valid rows, shape ``(k, n)``
+        shape: Number of coded levels per factor
+        factor_cols: Factor names, in code order
+
+    Returns:
+        Mapping of effect name to ``{"h_statistic", "df", "p_value"}``
+
+    """
+    n = len(ranks)
+    cells = np.ravel_multi_index(tuple(codes), shape)
+    size = int(np.prod(shape))
+    cell_n = np.bincount(cells, minlength=size).reshape(shape)
+    cell_sum = np.bincount(cells, weights=ranks, minlength=size).reshape(shape)
+
+    mean_rank = ranks.mean()
+    ms_total = ((ranks - mean_rank) ** 2).sum() / (n - 1)
+
+    k = len(factor_cols)
+    ss: dict[tuple[int, ...], float] = {}
+    n_levels: dict[int, int] = {}
+    results: dict[str, dict[str, float]] = {}
+
+    for order in range(1, k + 1):
+        for subset in combinations(range(k), order):
+            other_axes = tuple(axis for axis in range(k) if axis not in subset)
+            n_s = cell_n.sum(axis=other_axes).ravel()
+            sum_s = cell_sum.sum(axis=other_axes).ravel()
+            present = n_s > 0
+            ss_cells = float(
+                (n_s[present] * (sum_s[present] / n_s[present] - mean_rank) ** 2).sum()
+            )
+
+            if order == 1:
+                n_levels[subset[0]] = int(present.sum())
+                ss[subset] = ss_cells
+            else:
+                # Interaction: what's left after removing every lower-order effect
+                ss[subset] = ss_cells - sum(
+                    ss[lower]
+                    for lower_order in range(1, order)
+                    for lower in combinations(subset, lower_order)
+                )
+
+            df = int(np.prod([n_levels[axis] - 1 for axis in subset]))
+            name = INTERACTION_SEPARATOR.join(factor_cols[axis] for axis in subset)
+            results[name] = _effect_result(ss[subset], df, ms_total)
+
+    return results
+
+
+def scheirer_ray_hare_factorial(
+    data: pd.DataFrame,
+    value_cols: str | Sequence[str],
+    factor_cols: Sequence[str],
+) -> dict[str, dict[str, dict[str, float]]]:
+    """Scheirer-Ray-Hare test generalised to any number of factors.
+
+    For each value column, observations are ranked across the whole dataset
+    and the rank sum of squares is partitioned into main effects and all
+    interactions of the factors. Each effect's H-statistic (SS / MS_total) is
+    tested against a chi-squared distribution. With two factors the results
+    are those of :func:`scylla.analysis.stats.scheirer_ray_hare`.
+
+    Rows with a missing value or factor are dropped per value column, so
+    columns with different missing-data patterns can be tested together.
+
+    Args:
+        data: DataFrame containing the data
+        value_cols: Dependent variable column(s)
+        factor_cols: Factor columns (at least one)
+
+    Returns:
+        Mapping of value column to a mapping of effect name to a dict with:
+            - h_statistic: H-statistic (similar to chi-squared)
+            - df: Degrees of freedom
+            - p_value: P-value from chi-squared distribution
+        Main effects are keyed by factor name, interactions by the factor
+        names joined with ``INTERACTION_SEPARATOR`` (e.g. ``"agent_model:tier"``).
+
+    Raises:
+        ValueError: If no factor columns are given
+
+    Example:
+        >>> results = scheirer_ray_hare_factorial(
+        ...     runs_df, ["score", "cost_usd"], ["agent_model", "tier", "experiment"]
+        ... )
+        >>> results["score"]["agent_model:tier"]["p_value"]
+
+    """
+    if not factor_cols:
+        raise ValueError("scheirer_ray_hare_factorial() requires at least one factor column")
+    if isinstance(value_cols, str):
+        value_cols = [value_cols]
+
+    # Integer-code every factor once (codes follow order of first appearance; NaN -> -1)
+    codes = np.empty((len(factor_cols), len(data)), dtype=np.intp)
+    shape = []
+    for i, col in enumerate(factor_cols):
+        factor_codes, uniques = pd.factorize(data[col])
+        codes[i] = factor_codes
+        shape.append(max(len(uniques), 1))
+    factors_present = (codes >= 0).all(axis=0)
+
+    results: dict[str, dict[str, dict[str, float]]] = {}
+    for value_col in value_cols:
+        values = data[value_col]
+        valid = factors_present & values.notna().to_numpy()
+        ranks = values[valid].rank().to_numpy(dtype=float)
+        results[value_col] = _factorial_effects(ranks, codes[:, valid], tuple(shape), factor_cols)
+
+    return results
@@ -0,0 +1,179 @@
+"""On-disk cache of parsed run data for the analysis loader.
+
+Parsing ``run_result.json`` plus every ``judge_*/judgment.json`` and validating
+each run against the JSON Schema dominates start-up time of the analysis
+scripts on large ``fullruns/`` trees.  :class:`RunCache` persists the parsed
+:class:`~scylla.analysis.loader.RunData` objects in a single pickle file keyed
+on the run directory, and invalidates an entry whenever the ``(path, mtime,
+size)`` fingerprint of any file that :func:`~scylla.analysis.loader.load_run`
+reads has changed.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from scylla.analysis.loader import RunData
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["CACHE_FILENAME", "RunCache", "RunFingerprint", "run_fingerprint"]
+
+# Bump whenever RunData or load_run() semantics change so stale pickles are discarded.
+CACHE_VERSION = 1
+CACHE_FILENAME = "runs.pkl"
+
+# (experiment, tier, subtest, agent_model, ((relative_path, mtime_ns, size), ...))
+RunFingerprint = tuple[str, str, str, str, tuple[tuple[str, int, int], ...]]
+
+
+def _stat_entry(path: Path, run_dir: Path) -> tuple[str, int, int] | None:
+    """Return the ``(relative_path, mtime_ns, size)`` triple for a file, or None if missing."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (str(path.relative_to(run_dir)), st.st_mtime_ns, st.st_size)
+
+
+def run_fingerprint(
+    run_dir: Path, experiment: str, tier: str, subtest: str, agent_model: str
+) -> RunFingerprint:
+    """Compute the cache fingerprint for a run directory.
+
+    Covers every file read by :func:`~scylla.analysis.loader.load_run`:
+    ``run_result.json``, ``agent/result.json`` and each judge's
+    ``judgment.json`` and ``MODEL.md``.  The loader arguments are part of the
+    fingerprint because they are stored on the resulting ``RunData``.
+
+    Args:
+        run_dir: Path to the run directory
+        experiment: Experiment name
+        tier: Tier ID (T0-T6)
+        subtest: Subtest ID
+        agent_model: Agent model display name
+
+    Returns:
+        Hashable fingerprint tuple
+
+    """
+    candidates = [run_dir / "run_result.json", run_dir / "agent" / "result.json"]
+    judge_dir = run_dir / "judge"
+    if judge_dir.is_dir():
+        for judgment_path in sorted(judge_dir.glob("judge_*/judgment.json")):
+            candidates.append(judgment_path)
+            candidates.append(judgment_path.parent / "MODEL.md")
+
+    entries = tuple(
+        entry for entry in (_stat_entry(p, run_dir) for p in candidates) if entry is not None
+    )
+    return (experiment, tier, subtest, agent_model, entries)
+
+
+class RunCache:
+    """Pickle-backed store of parsed runs, keyed by run directory.
+
+    The cache is loaded eagerly on construction and written back atomically by
+    :meth:`save`.  Entries whose run directory no longer exists are dropped on
+    save, so deleted runs do not accumulate.
+
+    Thread-safe: lookups and updates are guarded by an internal lock.
+
+    Attributes:
+        path: Location of the pickle file.
+        hits: Number of lookups served from the cache.
+        misses: Number of lookups that required re-parsing.
+
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        """Open (or create) the cache stored in ``cache_dir``.
+
+        Args:
+            cache_dir: Directory holding the cache file. Created on save.
+
+        """
+        self.path = cache_dir / CACHE_FILENAME
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[RunFingerprint, RunData]] = self._read()
+        self._dirty = False
+
+    def _read(self) -> dict[str, tuple[RunFingerprint, RunData]]:
+        """Read the cache file, returning an empty store if absent or incompatible."""
+        if not self.path.exists():
+            return {}
+        try:
+            with self.path.open("rb") as f:
+                payload: dict[str, Any] = pickle.load(f)  # nosec B301 - local, self-written cache
+        except Exception as e:
+            logger.warning("Ignoring unreadable run cache %s: %s", self.path, e)
+            return {}
+        if not isinstance(payload, dict) or payload.get("version") != CACHE_VERSION:
+            logger.info("Run cache %s has an old format, rebuilding", self.path)
+            return {}
+        entries: dict[str, tuple[RunFingerprint, RunData]] = payload.get("entries", {})
+        return entries
+
+    def get(self, run_dir: Path, fingerprint: RunFingerprint) -> RunData | None:
+        """Return the cached run if its fingerprint still matches.
+
+        Args:
+            run_dir: Run directory
+            fingerprint: Current fingerprint from :func:`run_fingerprint`
+
+        Returns:
+            Cached RunData, or None on a miss
+
+        """
+        key = str(run_dir.resolve())
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == fingerprint:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return None
+
+    def put(self, run_dir: Path, fingerprint: RunFingerprint, run: RunData) -> None:
+        """Store a freshly parsed run.
+
+        Args:
+            run_dir: Run directory
+            fingerprint: Fingerprint computed before parsing
+            run: Parsed run data
+
+        """
+        key = str(run_dir.resolve())
+        with self._lock:
+            self._entries[key] = (fingerprint, run)
+            self._dirty = True
+
+    def __len__(self) -> int:
+        """Return the number of cached runs."""
+        return len(self._entries)
+
+    def save(self) -> None:
+        """Persist the cache atomically, dropping entries for deleted run directories."""
+        with self._lock:
+            stale = [key for key in self._entries if not Path(key).is_dir()]
+            for key in stale:
+                del self._entries[key]
+            if stale:
+                self._dirty = True
+            if not self._dirty:
+                return
+            payload = {"version": CACHE_VERSION, "entries": self._entries}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.parent / f"{self.path.stem}.tmp.{os.getpid()}{self.path.suffix}"
+            with temp_path.open("wb") as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            temp_path.replace(self.path)
+            self._dirty = False
@@ -0,0 +1,92 @@
+"""Startup-time profiling for the analysis scripts.
+
+The analysis scripts defer pandas, scipy, altair and the loader stack until
+they are needed.  ``--profile-startup`` reports where the time before the
+first figure or table went, so regressions (a new top-level import of a heavy
+dependency) show up as a blown budget rather than as a vague slowdown.
+
+This module must stay cheap to import: standard library only.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+__all__ = ["HEAVY_MODULES", "STARTUP_BUDGET_SECONDS", "StartupProfiler"]
+
+# Target for interpreter start to "ready to generate", excluding data loading
+STARTUP_BUDGET_SECONDS = 1.0
+
+# Dependencies whose presence in sys.modules is worth reporting
+HEAVY_MODULES = (
+    "numpy",
+    "pandas",
+    "pyarrow",
+    "scipy.stats",
+    "statsmodels",
+    "altair",
+    "vl_convert",
+    "jsonschema",
+    "scylla.e2e",
+)
+
+
+class StartupProfiler:
+    """Collect labelled step timings from script start and format a report.
+
+    Steps that do real work (e.g. loading experiment data) are recorded with
+    ``startup=False``; they are reported but do not count against the budget.
+
+    Example:
+        >>> profiler = StartupProfiler()  # at the top of the script
+        >>> profiler.mark("script imports")
+        >>> profiler.mark("load data", startup=False)
+        >>> print(profiler.report())
+
+    """
+
+    def __init__(self) -> None:
+        """Start the clock; CPU time so far approximates interpreter start-up."""
+        self._boot_seconds = time.process_time()
+        self._last = time.perf_counter()
+        self._steps: list[tuple[str, float, bool]] = []
+
+    def mark(self, label: str, startup: bool = True) -> None:
+        """Record the time since the previous mark as step ``label``.
+
+        Args:
+            label: Step name
+            startup: Whether the step counts towards the startup budget
+
+        """
+        now = time.perf_counter()
+        self._steps.append((label, now - self._last, startup))
+        self._last = now
+
+    def startup_seconds(self) -> float:
+        """Return interpreter start-up plus all startup steps so far."""
+        return self._boot_seconds + sum(seconds for _, seconds, startup in self._steps if startup)
+
+    def report(self, budget: float = STARTUP_BUDGET_SECONDS) -> str:
+        """Format the per-step timings, loaded heavy modules and budget check.
+
+        Args:
+            budget: Startup budget in seconds
+
+        Returns:
+            Multi-line report
+
+        """
+        lines = ["Startup profile:", f"  {'interpreter (CPU)':<24} {self._boot_seconds:7.3f}s"]
+        for label, seconds, startup in self._steps:
+            note = "" if startup else "  (not startup)"
+            lines.append(f"  {label:<24} {seconds:7.3f}s{note}")
+
+        loaded = [name for name in HEAVY_MODULES if name in sys.modules]
+        lines.append(f"  heavy modules loaded: {', '.join(loaded) if loaded else 'none'}")
+
+        total = self.startup_seconds()
+        status = "within" if total <= budget else "OVER"
+        lines.append(f"  startup {total:.3f}s, {status} budget of {budget:.2f}s")
+        return "\n".join(lines)
@@ -7,15 +7,15 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 
-import krippendorff
 import numpy as np
 import pandas as pd
 from scipy import stats
-from statsmodels.regression.linear_model import OLS
-from statsmodels.tools import add_constant
+from scipy.special import ndtr, ndtri
 
 from scylla.analysis.config import config
+from scylla.analysis.rank_tests import INTERACTION_SEPARATOR, scheirer_ray_hare_factorial
 
 logger = logging.getLogger(__name__)
 
@@ -23,8 +23,10 @@
     "benjamini_hochberg_correction",
     "bonferroni_correction",
     "bootstrap_ci",
+    "bootstrap_ci_batch",
     "cliffs_delta",
     "cliffs_delta_ci",
+    "cliffs_delta_ci_batch",
     "compute_consistency",
     "compute_cop",
     "compute_delegation_overhead",
@@ -45,62 +47,208 @@
 ]
 
 
-def bootstrap_ci(
-    data: pd.Series | np.ndarray,
+# Upper bound on array elements materialised per bootstrap chunk (~32 MB of float64)
+_BOOTSTRAP_CHUNK_ELEMENTS = 4_000_000
+
+
+def _resample_indices(sizes: Sequence[int], n_resamples: int) -> list[np.ndarray]:
+    """Draw bootstrap resample indices for each sample of one bootstrap call.
+
+    Reproduces the random stream of ``scipy.stats.bootstrap``: a fresh
+    ``RandomState(config.bootstrap_random_state)`` per call and one
+    ``(n_resamples, n)`` index matrix per sample, drawn in sample order.
+    Because every call is seeded identically, all cells whose samples have
+    the same sizes share the same index matrices.
+
+    Args:
+        sizes: Size of each sample
+        n_resamples: Number of bootstrap resamples
+
+    Returns:
+        One integer index matrix of shape ``(n_resamples, n)`` per sample
+
+    """
+    rng = np.random.RandomState(config.bootstrap_random_state)
+    return [rng.randint(0, n, size=(n_resamples, n)) for n in sizes]
+
+
+def _jackknife_indices(n: int) -> np.ndarray:
+    """Return the ``(n, n - 1)`` leave-one-out index matrix (row k omits k)."""
+    keep = ~np.eye(n, dtype=bool)
+    return np.broadcast_to(np.arange(n), (n, n))[keep].reshape(n, n - 1)
+
+
+def _resample_counts(indices: np.ndarray, n: int) -> np.ndarray:
+    """Convert a ``(B, m)`` index matrix into ``(B, n)`` multiplicity counts."""
+    n_rows = indices.shape[0]
+    offsets = (np.arange(n_rows) * n)[:, None]
+    counts: np.ndarray = np.bincount((indices + offsets).ravel(), minlength=n_rows * n)
+    return counts.reshape(n_rows, n)
+
+
+def _row_means(values: np.ndarray) -> np.ndarray:
+    """Mean over the last axis, reduced as 2-D rows.
+
+    NumPy's pairwise summation can associate differently for >2-D inputs;
+    reducing ``(rows, n)`` keeps every mean bit-identical to the per-sample
+    ``np.mean`` computed by ``scipy.stats.bootstrap``.
+    """
+    means: np.ndarray = np.mean(values.reshape(-1, values.shape[-1]), axis=-1)
+    return means.reshape(values.shape[:-1])
+
+
+def _bca_quantiles(
+    theta_hat: np.ndarray,
+    theta_b: np.ndarray,
+    theta_jack: Sequence[np.ndarray],
+    confidence: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute BCa interval bounds for a batch of bootstrap distributions.
+
+    Follows ``scipy.stats._resampling._bca_interval`` operation for operation
+    (Efron & Tibshirani 1993, 14.3 and 15.4) so that results match
+    ``scipy.stats.bootstrap(method="BCa")`` exactly, vectorized over cells.
+
+    Args:
+        theta_hat: Statistic on the original data, shape ``(G,)``
+        theta_b: Bootstrap distributions, shape ``(G, B)``
+        theta_jack: Jackknife statistics per sample, each shape ``(G, n_j)``
+        confidence: Confidence level
+
+    Returns:
+        Tuple of (low, high) bounds, each shape ``(G,)``; NaN where the
+        interval is undefined (degenerate bootstrap distribution)
+
+    """
+    n_boot = theta_b.shape[-1]
+    score = theta_hat[:, None]
+    nonzeros = np.count_nonzero(theta_b < score, axis=-1) + np.count_nonzero(
+        theta_b <= score, axis=-1
+    )
+    z0_hat = ndtri(nonzeros.astype(theta_hat.dtype) / (2 * n_boot))
+
+    nums = []
+    dens = []
+    for theta_ji in theta_jack:
+        n_j = float(theta_ji.shape[-1])
+        u_ji = (n_j - 1) * (np.mean(theta_ji, axis=-1, keepdims=True) - theta_ji)
+        nums.append(np.sum(u_ji**3, axis=-1) / n_j**3)
+        dens.append(np.sum(u_ji**2, axis=-1) / n_j**2)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        a_hat = 1 / 6 * sum(nums) / sum(dens) ** (3 / 2)
+        alpha = (1 - confidence) / 2
+        z_alpha = float(ndtri(alpha))
+        num1 = z0_hat + z_alpha
+        alpha_1 = ndtr(z0_hat + num1 / (1 - a_hat * num1))
+        num2 = z0_hat - z_alpha
+        alpha_2 = ndtr(z0_hat + num2 / (1 - a_hat * num2))
+
+    levels = np.stack([alpha_1, alpha_2], axis=-1)
+    ci = np.full(levels.shape, np.nan)
+    valid = ~np.isnan(levels).any(axis=-1)
+    if valid.any():
+        ci[valid] = stats.quantile(theta_b[valid], levels[valid], axis=-1)
+    if not valid.all():
+        logger.warning(
+            f"BCa confidence interval undefined for {int((~valid).sum())} of "
+            f"{len(valid)} cells (degenerate bootstrap distribution). Returning NaN bounds."
+        )
+    return ci[:, 0], ci[:, 1]
+
+
+def bootstrap_ci_batch(
+    groups: Sequence[pd.Series | np.ndarray],
     confidence: float | None = None,
     n_resamples: int | None = None,
-) -> tuple[float, float, float]:
-    """Compute bootstrap confidence interval.
+) -> list[tuple[float, float, float]]:
+    """Compute bootstrap confidence intervals of the mean for many groups at once.
 
-    Uses BCa (bias-corrected and accelerated) method for better coverage
-    on small samples and binary data near boundaries.
+    Equivalent to calling :func:`bootstrap_ci` on each group, and returns the
+    same numbers, but groups of equal size share one resample index matrix and
+    their bootstrap means, jackknife values and BCa bounds are computed in
+    vectorized form instead of one ``scipy.stats.bootstrap`` call per group.
 
     Args:
-        data: Data to bootstrap
+        groups: Data for each cell (e.g. one per (model, tier))
         confidence: Confidence level (default from config: 0.95 for 95% CI)
         n_resamples: Number of bootstrap resamples (default from config: 10000)
 
     Returns:
-        Tuple of (mean, lower_bound, upper_bound)
+        List of (mean, lower_bound, upper_bound), one per group, in input order
 
     """
-    # Use config defaults if not specified
     if confidence is None:
         confidence = config.bootstrap_confidence
     if n_resamples is None:
         n_resamples = config.bootstrap_resamples
 
-    data_array = np.array(data)
-    mean = np.mean(data_array)
-
-    # Guard against single-element arrays (BCa requires n >= 2)
-    if len(data_array) < 2:
-        logger.warning(
-            f"Bootstrap CI called with sample size {len(data_array)} < 2. "
-            "Returning point estimate only."
+    arrays = [np.asarray(g, dtype=float) for g in groups]
+    results: list[tuple[float, float, float]] = [(np.nan, np.nan, np.nan)] * len(arrays)
+
+    by_size: dict[int, list[int]] = {}
+    for i, data_array in enumerate(arrays):
+        mean = float(np.mean(data_array)) if len(data_array) else np.nan
+        # Guard against single-element arrays (BCa requires n >= 2)
+        if len(data_array) < 2:
+            logger.warning(
+                f"Bootstrap CI called with sample size {len(data_array)} < 2. "
+                "Returning point estimate only."
+            )
+            results[i] = (mean, mean, mean)
+        # Guard against zero variance (BCa fails on degenerate distributions)
+        elif np.std(data_array) == 0:
+            logger.debug(
+                "Bootstrap CI called with zero variance data. "
+                "Returning point estimate as CI bounds."
+            )
+            results[i] = (mean, mean, mean)
+        else:
+            by_size.setdefault(len(data_array), []).append(i)
+
+    for n, members in by_size.items():
+        data = np.stack([arrays[i] for i in members])
+        (indices,) = _resample_indices([n], n_resamples)
+
+        chunk = max(1, _BOOTSTRAP_CHUNK_ELEMENTS // (len(members) * n))
+        theta_b = np.concatenate(
+            [
+                _row_means(data[:, indices[start : start + chunk]])
+                for start in range(0, n_resamples, chunk)
+            ],
+            axis=-1,
         )
-        val = float(mean)
-        return val, val, val
+        theta_hat = np.array([np.mean(arrays[i]) for i in members])
+        theta_jack = _row_means(data[:, _jackknife_indices(n)])
 
-    # Guard against zero variance (BCa fails on degenerate distributions)
-    if np.std(data_array) == 0:
-        logger.debug(
-            "Bootstrap CI called with zero variance data. Returning point estimate as CI bounds."
-        )
-        val = float(mean)
-        return val, val, val
-
-    # Use scipy's bootstrap with BCa method for better coverage
-    res = stats.bootstrap(
-        (data_array,),
-        np.mean,
-        n_resamples=n_resamples,
-        confidence_level=confidence,
-        method="BCa",
-        random_state=config.bootstrap_random_state,
-    )
+        lows, highs = _bca_quantiles(theta_hat, theta_b, [theta_jack], confidence)
+        for j, i in enumerate(members):
+            results[i] = (float(theta_hat[j]), float(lows[j]), float(highs[j]))
+
+    return results
+
+
+def bootstrap_ci(
+    data: pd.Series | np.ndarray,
+    confidence: float | None = None,
+    n_resamples: int | None = None,
+) -> tuple[float, float, float]:
+    """Compute bootstrap confidence interval.
+
+    Uses BCa (bias-corrected and accelerated) method for better coverage
+    on small samples and binary data near boundaries. To compute intervals
+    for many cells, prefer :func:`bootstrap_ci_batch`.
+
+    Args:
+        data: Data to bootstrap
+        confidence: Confidence level (default from config: 0.95 for 95% CI)
+        n_resamples: Number of bootstrap resamples (default from config: 10000)
 
-    return mean, res.confidence_interval.low, res.confidence_interval.high
+    Returns:
+        Tuple of (mean, lower_bound, upper_bound)
+
+    """
+    return bootstrap_ci_batch([data], confidence=confidence, n_resamples=n_resamples)[0]
 
 
 def mann_whitney_u(
@@ -139,6 +287,16 @@ def mann_whitney_u(
         return 0.0, 1.0
 
 
+# Upper bound on simulated values materialised per power-analysis chunk (~16 MB)
+_POWER_CHUNK_ELEMENTS = 2_000_000
+
+
+def _simulation_chunks(n_simulations: int, row_size: int) -> list[int]:
+    """Split ``n_simulations`` into chunk sizes bounded by ``_POWER_CHUNK_ELEMENTS``."""
+    chunk = max(1, _POWER_CHUNK_ELEMENTS // max(row_size, 1))
+    return [min(chunk, n_simulations - start) for start in range(0, n_simulations, chunk)]
+
+
 def mann_whitney_power(
     n1: int,
     n2: int,
@@ -150,7 +308,8 @@ def mann_whitney_power(
 
     Generates data under the alternative hypothesis using the observed
     Cliff's delta as effect size, then computes the proportion of
-    significant test results.
+    significant test results. Simulations are drawn as a 2-D array and
+    tested in vectorized form along the simulation axis.
 
     Args:
         n1: Sample size of group 1
@@ -180,20 +339,20 @@ def mann_whitney_power(
 
     shift = np.sqrt(2) * norm.ppf((effect_size + 1) / 2)
 
-    # Run simulations
+    # Run simulations, one row per simulation. Each row holds the n1 + n2 draws
+    # of one iteration in the order the per-iteration loop used to draw them,
+    # so the simulated samples (and the power estimate) are unchanged.
     rng = np.random.RandomState(config.power_random_state)
     significant_count = 0
 
-    for _ in range(n_simulations):
-        # Generate data under alternative hypothesis
-        group1_sim = rng.normal(0, 1, n1)
-        group2_sim = rng.normal(shift, 1, n2)
+    for size in _simulation_chunks(n_simulations, n1 + n2):
+        draws = rng.standard_normal((size, n1 + n2))
+        group1_sim = draws[:, :n1]
+        group2_sim = draws[:, n1:] + shift
 
-        # Run Mann-Whitney U test
-        _, p_value = mann_whitney_u(group1_sim, group2_sim)
-
-        if p_value < alpha:
-            significant_count += 1
+        # Run Mann-Whitney U test along the sample axis of every simulation
+        _, p_values = stats.mannwhitneyu(group1_sim, group2_sim, alternative="two-sided", axis=-1)
+        significant_count += int(np.count_nonzero(p_values < alpha))
 
     return significant_count / n_simulations
 
@@ -208,7 +367,8 @@ def kruskal_wallis_power(
 
     Generates data under the alternative hypothesis using the observed
     effect size (epsilon-squared), then computes the proportion of
-    significant test results.
+    significant test results. Simulations are drawn as a 2-D array and
+    tested in vectorized form along the simulation axis.
 
     Args:
         group_sizes: List of sample sizes for each group
@@ -236,19 +396,23 @@ def kruskal_wallis_power(
     k = len(group_sizes)
     shifts = np.linspace(-1, 1, k) * np.sqrt(effect_size) * 2
 
-    # Run simulations
+    # kruskal_wallis() reports NaN (never significant) below the configured minimum
+    if any(n < config.min_sample_kruskal_wallis for n in group_sizes):
+        return 0.0
+
+    # Run simulations, one row per simulation with the groups laid out in draw order
     rng = np.random.RandomState(config.power_random_state)
     significant_count = 0
+    bounds = np.cumsum([0, *group_sizes])
+    row_shifts = np.repeat(shifts, group_sizes)
 
-    for _ in range(n_simulations):
-        # Generate data for each group with different shifts
-        groups = [rng.normal(shift, 1, n) for shift, n in zip(shifts, group_sizes, strict=False)]
-
-        # Run Kruskal-Wallis test
-        _, p_value = kruskal_wallis(*groups)
+    for size in _simulation_chunks(n_simulations, int(bounds[-1])):
+        draws = rng.standard_normal((size, int(bounds[-1]))) + row_shifts
+        groups = [draws[:, bounds[i] : bounds[i + 1]] for i in range(k)]
 
-        if p_value < alpha:
-            significant_count += 1
+        # Run Kruskal-Wallis test along the sample axis of every simulation
+        _, p_values = stats.kruskal(*groups, axis=-1)
+        significant_count += int(np.count_nonzero(p_values < alpha))
 
     return significant_count / n_simulations
 
@@ -380,7 +544,9 @@ def krippendorff_alpha(ratings: np.ndarray, level: str = "ordinal") -> float:
     # No transpose needed
     reliability_data = ratings
 
-    # Call the krippendorff package
+    # Call the krippendorff package (imported here; only the judge tables need it)
+    import krippendorff
+
     return float(krippendorff.alpha(reliability_data=reliability_data, level_of_measurement=level))
 
 
@@ -663,6 +829,131 @@ def benjamini_hochberg_correction(p_values: list[float]) -> list[float]:
     return corrected
 
 
+def _cliffs_numerators(
+    x: np.ndarray,
+    y_sorted: np.ndarray,
+    x_counts: np.ndarray,
+    y_counts: np.ndarray,
+) -> np.ndarray:
+    """Compute ``#(x > y) - #(x < y)`` for count-weighted resamples of two groups.
+
+    Rank-based replacement for the ``sign(x[:, None] - y[None, :]).sum()``
+    pairwise matrix: the position of every ``x`` value in the sorted ``y``
+    values is found once with ``searchsorted`` and each resample only needs a
+    cumulative sum of its ``y`` multiplicities, i.e. O((n1 + n2) log n2) per
+    batch plus O(n1 + n2) per resample. All arithmetic is integer, so the
+    result is exact.
+
+    Args:
+        x: Original values of group 1, shape ``(P, n1)`` for P cells
+        y_sorted: Sorted original values of group 2, shape ``(P, n2)``
+        x_counts: Multiplicity of each x value per resample, shape ``(B, n1)``
+        y_counts: Multiplicity of each sorted y value per resample, shape
+            ``(P, B, n2)`` (y order differs per cell) or ``(B, n2)``
+
+    Returns:
+        Integer numerators, shape ``(P, B)``
+
+    """
+    n_cells = x.shape[0]
+    less = np.stack([np.searchsorted(y_sorted[p], x[p], side="left") for p in range(n_cells)])
+    less_equal = np.stack(
+        [np.searchsorted(y_sorted[p], x[p], side="right") for p in range(n_cells)]
+    )
+
+    if y_counts.ndim == 2:
+        y_counts = np.broadcast_to(y_counts, (n_cells, *y_counts.shape))
+    cum = np.zeros((*y_counts.shape[:2], y_counts.shape[2] + 1), dtype=np.int64)
+    np.cumsum(y_counts, axis=-1, out=cum[..., 1:])
+    total = cum[..., -1:]
+
+    rows = np.arange(n_cells)[:, None, None]
+    cols_b = np.arange(cum.shape[1])[None, :, None]
+    # Per original x value: #(resampled y < x) - #(resampled y > x)
+    signs = cum[rows, cols_b, less[:, None, :]] + cum[rows, cols_b, less_equal[:, None, :]] - total
+    numerators: np.ndarray = np.einsum("pbi,bi->pb", signs, x_counts)
+    return numerators
+
+
+def cliffs_delta_ci_batch(
+    pairs: Sequence[tuple[pd.Series | np.ndarray, pd.Series | np.ndarray]],
+    confidence: float | None = None,
+    n_resamples: int | None = None,
+) -> list[tuple[float, float, float]]:
+    """Compute Cliff's delta with bootstrap confidence intervals for many pairs.
+
+    Equivalent to calling :func:`cliffs_delta_ci` on each pair, and returns the
+    same numbers. Pairs with equal group sizes share resample index matrices,
+    and the bootstrap and jackknife deltas are computed from resample counts
+    with a rank-based O(n log n) statistic instead of an (n1 x n2) pairwise
+    matrix per resample.
+
+    Args:
+        pairs: ``(group1, group2)`` for each cell (e.g. one per tier transition)
+        confidence: Confidence level (default from config: 0.95)
+        n_resamples: Number of bootstrap resamples (default from config: 10000)
+
+    Returns:
+        List of (delta, ci_low, ci_high), one per pair, in input order
+
+    """
+    if confidence is None:
+        confidence = config.bootstrap_confidence
+    if n_resamples is None:
+        n_resamples = config.bootstrap_resamples
+
+    arrays = [(np.asarray(g1, dtype=float), np.asarray(g2, dtype=float)) for g1, g2 in pairs]
+    results: list[tuple[float, float, float]] = [(np.nan, np.nan, np.nan)] * len(arrays)
+
+    by_size: dict[tuple[int, int], list[int]] = {}
+    for i, (g1, g2) in enumerate(arrays):
+        delta = cliffs_delta(g1, g2)
+        # Guard against insufficient data
+        if len(g1) < 2 or len(g2) < 2:
+            logger.warning(
+                f"Cliff's delta CI called with sample sizes {len(g1)}, {len(g2)}. "
+                "Returning point estimate only."
+            )
+            results[i] = (delta, delta, delta)
+        else:
+            by_size.setdefault((len(g1), len(g2)), []).append(i)
+
+    for (n1, n2), members in by_size.items():
+        x = np.stack([arrays[i][0] for i in members])
+        y = np.stack([arrays[i][1] for i in members])
+        order = np.argsort(y, axis=-1, kind="stable")
+        y_sorted = np.take_along_axis(y, order, axis=-1)
+        delta_hat = np.array([cliffs_delta(x[p], y[p]) for p in range(len(members))])
+
+        idx1, idx2 = _resample_indices([n1, n2], n_resamples)
+        chunk = max(1, _BOOTSTRAP_CHUNK_ELEMENTS // (len(members) * (n1 + n2)))
+        theta_b_chunks = []
+        for start in range(0, n_resamples, chunk):
+            x_counts = _resample_counts(idx1[start : start + chunk], n1)
+            y_counts = _resample_counts(idx2[start : start + chunk], n2)
+            # Reorder y multiplicities to each cell's sorted y order
+            y_counts_sorted = y_counts[:, order].transpose(1, 0, 2)
+            numerators = _cliffs_numerators(x, y_sorted, x_counts, y_counts_sorted)
+            theta_b_chunks.append(numerators / (n1 * n2))
+        theta_b = np.concatenate(theta_b_chunks, axis=-1)
+
+        # Jackknife: leave one observation out of group 1, then of group 2
+        leave_one_out_1 = 1 - np.eye(n1, dtype=np.int64)
+        jack_1 = _cliffs_numerators(
+            x, y_sorted, leave_one_out_1, np.ones((n1, n2), dtype=np.int64)
+        ) / ((n1 - 1) * n2)
+        leave_one_out_2 = (1 - np.eye(n2, dtype=np.int64))[:, order].transpose(1, 0, 2)
+        jack_2 = _cliffs_numerators(
+            x, y_sorted, np.ones((n2, n1), dtype=np.int64), leave_one_out_2
+        ) / (n1 * (n2 - 1))
+
+        lows, highs = _bca_quantiles(delta_hat, theta_b, [jack_1, jack_2], confidence)
+        for j, i in enumerate(members):
+            results[i] = (float(delta_hat[j]), float(lows[j]), float(highs[j]))
+
+    return results
+
+
 def cliffs_delta_ci(
     group1: pd.Series | np.ndarray,
     group2: pd.Series | np.ndarray,
@@ -673,6 +964,7 @@ def cliffs_delta_ci(
 
     Provides effect size estimate with uncertainty quantification via
     BCa bootstrap. Complements the point estimate from cliffs_delta().
+    To compute intervals for many pairs, prefer :func:`cliffs_delta_ci_batch`.
 
     Args:
         group1: First group
@@ -684,44 +976,9 @@ def cliffs_delta_ci(
         Tuple of (delta, ci_low, ci_high)
 
     """
-    # Use config defaults if not specified
-    if confidence is None:
-        confidence = config.bootstrap_confidence
-    if n_resamples is None:
-        n_resamples = config.bootstrap_resamples
-
-    # Compute point estimate using existing function
-    delta = cliffs_delta(group1, group2)
-
-    g1 = np.array(group1)
-    g2 = np.array(group2)
-
-    # Guard against insufficient data
-    if len(g1) < 2 or len(g2) < 2:
-        logger.warning(
-            f"Cliff's delta CI called with sample sizes {len(g1)}, {len(g2)}. "
-            "Returning point estimate only."
-        )
-        return delta, delta, delta
-
-    # Bootstrap the delta calculation
-    def delta_statistic(g1_sample: np.ndarray, g2_sample: np.ndarray) -> float:
-        n1, n2 = len(g1_sample), len(g2_sample)
-        if n1 == 0 or n2 == 0:
-            return 0.0
-        return float(np.sign(g1_sample[:, None] - g2_sample[None, :]).sum() / (n1 * n2))
-
-    # Use scipy's bootstrap
-    res = stats.bootstrap(
-        (g1, g2),
-        delta_statistic,
-        n_resamples=n_resamples,
-        confidence_level=confidence,
-        method="BCa",
-        random_state=config.bootstrap_random_state,
-    )
-
-    return delta, res.confidence_interval.low, res.confidence_interval.high
+    return cliffs_delta_ci_batch(
+        [(group1, group2)], confidence=confidence, n_resamples=n_resamples
+    )[0]
 
 
 def ols_regression(x: pd.Series | np.ndarray, y: pd.Series | np.ndarray) -> dict[str, float]:
@@ -742,6 +999,10 @@ def ols_regression(x: pd.Series | np.ndarray, y: pd.Series | np.ndarray) -> dict
             - std_err: Standard error of slope estimate
 
     """
+    # statsmodels is slow to import and only needed for regressions
+    from statsmodels.regression.linear_model import OLS
+    from statsmodels.tools import add_constant
+
     x_array = np.array(x)
     y_array = np.array(y)
 
@@ -800,86 +1061,9 @@ def scheirer_ray_hare(
         >>> results['interaction']['p_value']  # Model x Tier interaction
 
     """
-    # Rank all observations across entire dataset
-    ranks = data[value_col].rank()
-
-    # Get factor levels
-    levels_a = data[factor_a_col].unique()
-    levels_b = data[factor_b_col].unique()
-
-    # Total number of observations
-    n = len(data)
-
-    # Degrees of freedom
-    a = len(levels_a)  # Number of levels in factor A
-    b = len(levels_b)  # Number of levels in factor B
-    df_a = a - 1
-    df_b = b - 1
-    df_ab = (a - 1) * (b - 1)
-
-    # Compute mean rank (for centering)
-    mean_rank = ranks.mean()
-
-    # Compute sum of squared deviations of ranks from mean (MS_total denominator)
-    ss_total = ((ranks - mean_rank) ** 2).sum()
-
-    # Compute SS for factor A (main effect)
-    ss_a = 0.0
-    for level in levels_a:
-        mask = data[factor_a_col] == level
-        n_i = mask.sum()
-        mean_rank_i = ranks[mask].mean()
-        ss_a += n_i * (mean_rank_i - mean_rank) ** 2
-
-    # Compute SS for factor B (main effect)
-    ss_b = 0.0
-    for level in levels_b:
-        mask = data[factor_b_col] == level
-        n_j = mask.sum()
-        mean_rank_j = ranks[mask].mean()
-        ss_b += n_j * (mean_rank_j - mean_rank) ** 2
-
-    # Compute SS for cells (A x B)
-    ss_cells = 0.0
-    for level_a in levels_a:
-        for level_b in levels_b:
-            mask = (data[factor_a_col] == level_a) & (data[factor_b_col] == level_b)
-            n_ij = mask.sum()
-            if n_ij > 0:
-                mean_rank_ij = ranks[mask].mean()
-                ss_cells += n_ij * (mean_rank_ij - mean_rank) ** 2
-
-    # Compute SS for interaction (what's left after removing main effects)
-    ss_ab = ss_cells - ss_a - ss_b
-
-    # Compute MS_total (variance of ranks)
-    ms_total = ss_total / (n - 1)
-
-    # Compute H-statistics (analogous to F-statistics in parametric ANOVA)
-    # H = SS / MS_total follows chi-squared distribution under null
-    h_a = ss_a / ms_total
-    h_b = ss_b / ms_total
-    h_ab = ss_ab / ms_total
-
-    # Compute p-values from chi-squared distribution
-    p_a = 1 - stats.chi2.cdf(h_a, df_a)
-    p_b = 1 - stats.chi2.cdf(h_b, df_b)
-    p_ab = 1 - stats.chi2.cdf(h_ab, df_ab)
-
+    effects = scheirer_ray_hare_factorial(data, value_col, [factor_a_col, factor_b_col])[value_col]
     return {
-        factor_a_col: {
-            "h_statistic": float(h_a),
-            "df": int(df_a),
-            "p_value": float(p_a),
-        },
-        factor_b_col: {
-            "h_statistic": float(h_b),
-            "df": int(df_b),
-            "p_value": float(p_b),
-        },
-        "interaction": {
-            "h_statistic": float(h_ab),
-            "df": int(df_ab),
-            "p_value": float(p_ab),
-        },
+        factor_a_col: effects[factor_a_col],
+        factor_b_col: effects[factor_b_col],
+        "interaction": effects[f"{factor_a_col}{INTERACTION_SEPARATOR}{factor_b_col}"],
     }
@@ -10,26 +10,47 @@
 
 from __future__ import annotations
 
-# Import all table functions from submodules
-from scylla.analysis.tables.comparison import (
-    table02_tier_comparison,
-    table02b_impl_rate_comparison,
-    table04_criteria_performance,
-    table06_model_comparison,
-    table_cfp_comparison,
-)
-from scylla.analysis.tables.detail import (
-    table03_judge_agreement,
-    table07_subtest_detail,
-    table08_summary_statistics,
-    table09_experiment_config,
-    table10_normality_tests,
-)
-from scylla.analysis.tables.summary import (
-    table01_tier_summary,
-    table05_cost_analysis,
-    table11_experiment_overview,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from scylla.analysis.tables.comparison import (
+        table02_tier_comparison,
+        table02b_impl_rate_comparison,
+        table04_criteria_performance,
+        table06_model_comparison,
+        table_cfp_comparison,
+    )
+    from scylla.analysis.tables.detail import (
+        table03_judge_agreement,
+        table07_subtest_detail,
+        table08_summary_statistics,
+        table09_experiment_config,
+        table10_normality_tests,
+    )
+    from scylla.analysis.tables.summary import (
+        table01_tier_summary,
+        table05_cost_analysis,
+        table11_experiment_overview,
+    )
+
+# Table functions are imported from their submodule on first access, so
+# importing one table does not load scipy/statsmodels for all of them
+_LAZY_EXPORTS = {
+    "table01_tier_summary": "summary",
+    "table02_tier_comparison": "comparison",
+    "table02b_impl_rate_comparison": "comparison",
+    "table03_judge_agreement": "detail",
+    "table04_criteria_performance": "comparison",
+    "table05_cost_analysis": "summary",
+    "table06_model_comparison": "comparison",
+    "table07_subtest_detail": "detail",
+    "table08_summary_statistics": "detail",
+    "table09_experiment_config": "detail",
+    "table10_normality_tests": "detail",
+    "table11_experiment_overview": "summary",
+    "table_cfp_comparison": "comparison",
+}
 
 # Export all table functions
 __all__ = [
@@ -47,3 +68,18 @@
     "table11_experiment_overview",
     "table_cfp_comparison",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining a table function on first access."""
+    submodule = _LAZY_EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{submodule}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes including not-yet-imported table functions."""
+    return sorted({*globals(), *_LAZY_EXPORTS})
@@ -10,7 +10,7 @@
 from scylla.analysis.config import config
 from scylla.analysis.figures import derive_tier_order
 from scylla.analysis.stats import (
-    bootstrap_ci,
+    bootstrap_ci_batch,
     compute_consistency,
     compute_cop,
 )
@@ -34,48 +34,50 @@ def table01_tier_summary(runs_df: pd.DataFrame) -> tuple[str, str]:
     # Derive tier order from data
     tier_order = derive_tier_order(runs_df)
 
-    # Compute statistics per (agent_model, tier)
-    rows = []
+    # Collect (agent_model, tier) cells
+    cells = []
     for model in sorted(runs_df["agent_model"].unique()):
         for tier in tier_order:
             subset = runs_df[(runs_df["agent_model"] == model) & (runs_df["tier"] == tier)]
-            if len(subset) == 0:
-                continue
+            if len(subset) > 0:
+                cells.append((model, tier, subset))
 
-            # Pass rate with 95% CI
-            passed = subset["passed"].astype(int)
-            pr_mean, pr_low, pr_high = bootstrap_ci(passed)
+    # Pass rate with 95% CI, bootstrapped for all cells in one batch
+    pass_rate_cis = bootstrap_ci_batch([subset["passed"].astype(int) for _, _, subset in cells])
 
-            # Score statistics
-            score_mean = subset["score"].mean()
-            score_std = subset["score"].std()
-            score_median = subset["score"].median()
+    # Compute statistics per (agent_model, tier)
+    rows = []
+    for (model, tier, subset), (pr_mean, pr_low, pr_high) in zip(cells, pass_rate_cis, strict=True):
+        # Score statistics
+        score_mean = subset["score"].mean()
+        score_std = subset["score"].std()
+        score_median = subset["score"].median()
 
-            # Consistency
-            consistency = compute_consistency(score_mean, score_std)
+        # Consistency
+        consistency = compute_consistency(score_mean, score_std)
 
-            # Cost-of-Pass
-            mean_cost = subset["cost_usd"].mean()
-            cop = compute_cop(mean_cost, pr_mean)
+        # Cost-of-Pass
+        mean_cost = subset["cost_usd"].mean()
+        cop = compute_cop(mean_cost, pr_mean)
 
-            # Count subtests
-            n_subtests = subset["subtest"].nunique()
+        # Count subtests
+        n_subtests = subset["subtest"].nunique()
 
-            rows.append(
-                {
-                    "Model": model,
-                    "Tier": tier,
-                    "Subtests": n_subtests,
-                    "Pass Rate": pr_mean,
-                    "PR 95% CI Low": pr_low,
-                    "PR 95% CI High": pr_high,
-                    "Mean Score": score_mean,
-                    "Score StdDev": score_std,
-                    "Median Score": score_median,
-                    "Consistency": consistency,
-                    "CoP": cop if cop != float("inf") else None,
-                }
-            )
+        rows.append(
+            {
+                "Model": model,
+                "Tier": tier,
+                "Subtests": n_subtests,
+                "Pass Rate": pr_mean,
+                "PR 95% CI Low": pr_low,
+                "PR 95% CI High": pr_high,
+                "Mean Score": score_mean,
+                "Score StdDev": score_std,
+                "Median Score": score_median,
+                "Consistency": consistency,
+                "CoP": cop if cop != float("inf") else None,
+            }
+        )
 
     df = pd.DataFrame(rows)
 
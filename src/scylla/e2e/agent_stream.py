@@ -0,0 +1,183 @@
+"""Streaming capture of agent stdout/stderr.
+
+``proc.communicate()`` buffers an agent's entire output in memory, and
+stream-json transcripts of hour-long runs can reach hundreds of MB.
+:class:`AgentOutputStream` instead receives the output line by line as it
+arrives. It tees each line to ``stdout.log``/``stderr.log`` and folds it into
+running totals: token usage, API calls, cost and the first rate-limit signal.
+The only parts of the output it keeps in memory are:
+
+- the final ``result`` event (which ``--output-format json`` emits as its
+  only line) and any event or stderr line carrying a rate-limit signal;
+- a bounded tail of each stream, used when the agent produced no result event
+  (text output, crash, timeout).
+
+These are returned by :meth:`AgentOutputStream.stdout_summary` /
+:meth:`AgentOutputStream.stderr_summary` and stored on the ``AdapterResult``
+in place of the full streams, so the downstream rate-limit checks and judge
+prompt see the same result object as before.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import deque
+from pathlib import Path
+from typing import IO
+
+from scylla.adapters.base import AdapterTokenStats
+from scylla.e2e.rate_limit import (
+    RateLimitInfo,
+    _detect_rate_limit_from_stderr,
+    _make_rate_limit_info,
+    parse_retry_after,
+)
+from scylla.e2e.transcript import Transcript, TranscriptParser
+
+logger = logging.getLogger(__name__)
+
+# Bytes of trailing output kept per stream when no result event is seen
+AGENT_OUTPUT_TAIL_BYTES = 64 * 1024
+
+
+class _Tail:
+    """The most recent lines of a stream, bounded by total size."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._lines: deque[str] = deque()
+        self._size = 0
+
+    def append(self, line: str) -> None:
+        self._lines.append(line)
+        self._size += len(line)
+        while self._size > self.max_bytes and len(self._lines) > 1:
+            self._size -= len(self._lines.popleft())
+
+    def text(self) -> str:
+        return "".join(self._lines)
+
+
+class AgentOutputStream:
+    """Tee agent output to log files and accumulate metrics line by line.
+
+    ``feed_stdout`` and ``feed_stderr`` may be called from two reader threads
+    concurrently; each stream must be fed from a single thread.
+    """
+
+    def __init__(
+        self,
+        stdout_path: Path,
+        stderr_path: Path,
+        tail_bytes: int = AGENT_OUTPUT_TAIL_BYTES,
+    ) -> None:
+        """Open the log files for writing.
+
+        Args:
+            stdout_path: File receiving the agent's stdout (e.g. agent/stdout.log)
+            stderr_path: File receiving the agent's stderr (e.g. agent/stderr.log)
+            tail_bytes: Trailing bytes of each stream kept in memory
+
+        """
+        stdout_path.parent.mkdir(parents=True, exist_ok=True)
+        self.stdout_path = stdout_path
+        self.stderr_path = stderr_path
+        # Line-buffered so the logs can be followed while the agent runs
+        self._stdout_file: IO[str] = open(stdout_path, "w", buffering=1)  # noqa: SIM115
+        self._stderr_file: IO[str] = open(stderr_path, "w", buffering=1)  # noqa: SIM115
+        self._stdout_tail = _Tail(tail_bytes)
+        self._stderr_tail = _Tail(tail_bytes)
+        self._lock = threading.Lock()
+
+        self.rate_limit_info: RateLimitInfo | None = None
+        self._parser = TranscriptParser()
+        self._stdout_signals: list[str] = []
+        self._stderr_signals: list[str] = []
+        self._result_line: str | None = None
+
+    def feed_stdout(self, line: str) -> None:
+        """Record one line of stdout.
+
+        Args:
+            line: Line as read from the pipe, including its newline
+
+        """
+        self._stdout_file.write(line)
+        self._stdout_tail.append(line)
+        event = self._parser.feed_line(line)
+        if event is None:
+            return
+        if event.rate_limited and event.error is not None:
+            self._stdout_signals.append(line.strip())
+            info = _make_rate_limit_info("agent", event.error, parse_retry_after(event.error))
+            self._record_rate_limit(info)
+        if event.is_result:
+            self._result_line = line.strip()
+
+    def feed_stderr(self, line: str) -> None:
+        """Record one line of stderr.
+
+        Args:
+            line: Line as read from the pipe, including its newline
+
+        """
+        self._stderr_file.write(line)
+        self._stderr_tail.append(line)
+        error_msg, retry_after = _detect_rate_limit_from_stderr(line)
+        if error_msg and not self._stderr_signals:
+            self._stderr_signals.append(line)
+            self._record_rate_limit(_make_rate_limit_info("agent", error_msg, retry_after))
+
+    def _record_rate_limit(self, info: RateLimitInfo) -> None:
+        with self._lock:
+            if self.rate_limit_info is not None:
+                return
+            self.rate_limit_info = info
+        logger.warning(f"[AGENT] Rate limit signal in agent output: {info.error_message}")
+
+    def close(self) -> None:
+        """Flush and close the log files."""
+        self._stdout_file.close()
+        self._stderr_file.close()
+
+    @property
+    def transcript(self) -> Transcript:
+        """Summary of the stdout events seen so far."""
+        return self._parser.result()
+
+    @property
+    def has_metrics(self) -> bool:
+        """Whether usage was seen in a result or assistant event."""
+        return self.transcript.has_usage
+
+    @property
+    def token_stats(self) -> AdapterTokenStats:
+        """Token usage from the result event, else summed over assistant messages."""
+        usage = self.transcript.usage
+        return AdapterTokenStats.from_usage(usage) if usage else AdapterTokenStats()
+
+    @property
+    def api_calls(self) -> int:
+        """Number of turns from the result event, else assistant messages seen."""
+        return self.transcript.api_calls
+
+    @property
+    def cost_usd(self) -> float:
+        """Total cost from the result event (0.0 if none was seen)."""
+        return self.transcript.cost_usd
+
+    def stdout_summary(self) -> str:
+        """Return the retained stdout: signal lines plus the result event or the tail."""
+        retained = [s for s in self._stdout_signals if s != self._result_line]
+        if self._result_line is not None:
+            retained.append(self._result_line)
+        else:
+            retained.append(self._stdout_tail.text())
+        return "\n".join(retained)
+
+    def stderr_summary(self) -> str:
+        """Return the retained stderr: the first rate-limit line plus the tail."""
+        tail = self._stderr_tail.text()
+        signals = "".join(s for s in self._stderr_signals if s not in tail)
+        return signals + tail
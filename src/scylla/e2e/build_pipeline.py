@@ -4,21 +4,99 @@
 pipelines against agent workspaces, producing structured BuildPipelineResult
 objects consumed by the LLM judge.
 
+Each step declares its cost in :data:`PIPELINE_STEP_COSTS` and, when given a
+``pipeline_slot`` (``ResourceManager.pipeline_slot``), holds that many units of
+the shared pipeline budget while it runs, so light steps of concurrent runs
+proceed in parallel while heavy builds are bounded.
+
 Extracted from llm_judge.py to isolate pipeline execution concerns.
 """
 
 from __future__ import annotations
 
+import contextlib
+import contextvars
+import functools
+import hashlib
 import logging
 import os
+import shutil
 import subprocess
 import tempfile
+import threading
+import weakref
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from scylla.e2e import pipeline_cache
 from scylla.e2e.llm_judge_models import BuildPipelineResult
 
 logger = logging.getLogger(__name__)
 
+# (passed, na, output) returned by every pipeline step
+StepResult = tuple[bool, bool, str]
+
+# Acquires N units of the pipeline budget (None = all of it), e.g.
+# ResourceManager.pipeline_slot
+PipelineSlot = Callable[[int | None], contextlib.AbstractContextManager[None]]
+
+# Cost of each step in pipeline budget units (about one CPU core each); None
+# takes the whole budget. Costs above the budget are capped to it.
+PIPELINE_STEP_COSTS: dict[str, int | None] = {
+    "python_build": 1,  # compileall + top-level scripts
+    "python_format": 1,  # ruff check
+    "python_test": 2,  # pytest
+    "precommit": 2,
+    "mojo_build": None,  # bazel/mojo build uses every core
+    "mojo_format": 1,
+    "mojo_test": None,
+}
+
+# Executables whose location and ``--version`` output are part of the cache key
+_PIPELINE_TOOLS: dict[str, tuple[str, ...]] = {
+    "python": ("python", "ruff", "pytest", "pre-commit"),
+    "mojo": ("pixi", "mojo", "pre-commit"),
+}
+
+# Set while a cacheable pipeline runs: steps append the output of timeouts and
+# missing tools, which depend on the host rather than the tree, so the result
+# is not cached.
+_transient_failures: contextvars.ContextVar[list[str] | None] = contextvars.ContextVar(
+    "_transient_failures", default=None
+)
+
+# One lock per workspace: concurrent judges of a run must not run the pipeline
+# on the same checkout at the same time (shared caches and output files).
+# Weak values: a lock is dropped once no pipeline run of its workspace holds it.
+_workspace_locks: weakref.WeakValueDictionary[Path, threading.Lock] = weakref.WeakValueDictionary()
+_workspace_locks_guard = threading.Lock()
+
+
+def _workspace_lock(workspace: Path) -> threading.Lock:
+    """Return the lock guarding pipeline runs in ``workspace``."""
+    key = workspace.resolve()
+    with _workspace_locks_guard:
+        return _workspace_locks.setdefault(key, threading.Lock())
+
+
+def _transient(output: str) -> str:
+    """Record a timeout or missing-tool ``output`` so the pipeline result is not cached."""
+    failures = _transient_failures.get()
+    if failures is not None:
+        failures.append(output)
+    return output
+
+
+def _run_step(
+    step: str, pipeline_slot: PipelineSlot | None, fn: Callable[[], StepResult]
+) -> StepResult:
+    """Run one pipeline step holding its cost in pipeline budget units."""
+    if pipeline_slot is None:
+        return fn()
+    with pipeline_slot(PIPELINE_STEP_COSTS[step]):
+        return fn()
+
 
 def _is_modular_repo(workspace: Path) -> bool:
     """Check if workspace is the modular/mojo monorepo.
@@ -74,10 +152,12 @@ def _run_mojo_build_step(workspace: Path, is_modular: bool) -> tuple[bool, bool,
         return (
             False,
             False,
-            f"Build timed out after {e.args[1] if len(e.args) > 1 else 'unknown'} seconds",
+            _transient(
+                f"Build timed out after {e.args[1] if len(e.args) > 1 else 'unknown'} seconds"
+            ),
         )
     except FileNotFoundError as e:
-        return False, False, f"Build tool not found: {e}"
+        return False, False, _transient(f"Build tool not found: {e}")
 
 
 def _run_mojo_format_step(workspace: Path, is_modular: bool) -> tuple[bool, bool, str]:
@@ -117,7 +197,7 @@ def _run_mojo_format_step(workspace: Path, is_modular: bool) -> tuple[bool, bool
             format_result.stdout + "\n" + format_result.stderr,
         )
     except (subprocess.TimeoutExpired, FileNotFoundError) as e:
-        return False, False, f"Error: {e}"
+        return False, False, _transient(f"Error: {e}")
 
 
 def _run_mojo_test_step(workspace: Path, is_modular: bool) -> tuple[bool, bool, str]:
@@ -154,9 +234,9 @@ def _run_mojo_test_step(workspace: Path, is_modular: bool) -> tuple[bool, bool,
             return True, True, output
         return test_result.returncode == 0, False, output
     except FileNotFoundError:
-        return True, True, "mojo test not available, skipping"
+        return True, True, _transient("mojo test not available, skipping")
     except subprocess.TimeoutExpired as e:
-        return False, False, f"Error: {e}"
+        return False, False, _transient(f"Error: {e}")
 
 
 def _run_precommit_step(
@@ -186,12 +266,14 @@ def _run_precommit_step(
             return True, True, output
         return precommit_result.returncode == 0, False, output
     except FileNotFoundError:
-        return True, True, "pre-commit not available, skipping"
+        return True, True, _transient("pre-commit not available, skipping")
     except subprocess.TimeoutExpired as e:
-        return False, False, f"Error: {e}"
+        return False, False, _transient(f"Error: {e}")
 
 
-def _run_mojo_pipeline(workspace: Path) -> BuildPipelineResult:
+def _run_mojo_pipeline(
+    workspace: Path, pipeline_slot: PipelineSlot | None = None
+) -> BuildPipelineResult:
     """Run Mojo build/lint pipeline and capture results.
 
     Detects if workspace is the modular/mojo monorepo and uses appropriate commands:
@@ -199,8 +281,11 @@ def _run_mojo_pipeline(workspace: Path) -> BuildPipelineResult:
       and pixi run tests from mojo/ subdirectory
     - Standalone repo: Uses pixi run mojo commands from workspace root
 
+    Steps run one after another (bazel/pixi serialize on their own locks).
+
     Args:
         workspace: Path to the workspace directory
+        pipeline_slot: Optional budget acquirer each step holds while it runs
 
     Returns:
         BuildPipelineResult with all tool outputs
@@ -208,10 +293,18 @@ def _run_mojo_pipeline(workspace: Path) -> BuildPipelineResult:
     """
     is_modular = _is_modular_repo(workspace)
 
-    build_passed, build_na, build_output = _run_mojo_build_step(workspace, is_modular)
-    format_passed, format_na, format_output = _run_mojo_format_step(workspace, is_modular)
-    test_passed, test_na, test_output = _run_mojo_test_step(workspace, is_modular)
-    precommit_passed, precommit_na, precommit_output = _run_precommit_step(workspace)
+    build_passed, build_na, build_output = _run_step(
+        "mojo_build", pipeline_slot, lambda: _run_mojo_build_step(workspace, is_modular)
+    )
+    format_passed, format_na, format_output = _run_step(
+        "mojo_format", pipeline_slot, lambda: _run_mojo_format_step(workspace, is_modular)
+    )
+    test_passed, test_na, test_output = _run_step(
+        "mojo_test", pipeline_slot, lambda: _run_mojo_test_step(workspace, is_modular)
+    )
+    precommit_passed, precommit_na, precommit_output = _run_step(
+        "precommit", pipeline_slot, lambda: _run_precommit_step(workspace)
+    )
 
     return BuildPipelineResult(
         language="mojo",
@@ -279,9 +372,9 @@ def _execute_python_scripts(workspace: Path, env: dict[str, str]) -> list[str]:
                     if exec_result.stderr:
                         output_lines.append(f"Stderr:\n{exec_result.stderr[:500]}")
                 except subprocess.TimeoutExpired:
-                    output_lines.append("Execution timed out (30s)")
+                    output_lines.append(_transient("Execution timed out (30s)"))
                 except (OSError, subprocess.SubprocessError) as e:
-                    output_lines.append(f"Execution error: {e}")
+                    output_lines.append(_transient(f"Execution error: {e}"))
     except OSError as e:
         logger.warning(f"Error finding Python scripts: {e}")
     return output_lines
@@ -321,7 +414,7 @@ def _run_python_build_step(workspace: Path, env: dict[str, str]) -> tuple[bool,
         )
         return build_passed, False, build_output
     except (subprocess.TimeoutExpired, FileNotFoundError) as e:
-        return False, False, f"Error: {e}"
+        return False, False, _transient(f"Error: {e}")
 
 
 def _run_python_format_step(workspace: Path, env: dict[str, str]) -> tuple[bool, bool, str]:
@@ -350,9 +443,9 @@ def _run_python_format_step(workspace: Path, env: dict[str, str]) -> tuple[bool,
             format_result.stdout + "\n" + format_result.stderr,
         )
     except FileNotFoundError:
-        return True, True, "ruff not available, skipping format check"
+        return True, True, _transient("ruff not available, skipping format check")
     except subprocess.TimeoutExpired as e:
-        return False, False, f"Error: {e}"
+        return False, False, _transient(f"Error: {e}")
 
 
 def _run_python_test_step(workspace: Path, env: dict[str, str]) -> tuple[bool, bool, str]:
@@ -381,16 +474,24 @@ def _run_python_test_step(workspace: Path, env: dict[str, str]) -> tuple[bool, b
             return True, True, output
         return test_result.returncode == 0, False, output
     except FileNotFoundError:
-        return True, True, "pytest not available, skipping"
+        return True, True, _transient("pytest not available, skipping")
     except subprocess.TimeoutExpired as e:
-        return False, False, f"Error: {e}"
+        return False, False, _transient(f"Error: {e}")
 
 
-def _run_python_pipeline(workspace: Path) -> BuildPipelineResult:
+def _run_python_pipeline(
+    workspace: Path, pipeline_slot: PipelineSlot | None = None
+) -> BuildPipelineResult:
     """Run Python build/lint pipeline and capture results.
 
+    The build step runs first (it executes the workspace's scripts, whose side
+    effects the tests see, as before). The read-only ``ruff check`` then runs
+    concurrently with pytest, and pre-commit runs last because its hooks may
+    rewrite files the other steps read.
+
     Args:
         workspace: Path to the workspace directory
+        pipeline_slot: Optional budget acquirer each step holds while it runs
 
     Returns:
         BuildPipelineResult with all tool outputs
@@ -398,11 +499,24 @@ def _run_python_pipeline(workspace: Path) -> BuildPipelineResult:
     """
     pipeline_env = _get_pipeline_env()
 
-    build_passed, build_na, build_output = _run_python_build_step(workspace, pipeline_env)
-    format_passed, format_na, format_output = _run_python_format_step(workspace, pipeline_env)
-    test_passed, test_na, test_output = _run_python_test_step(workspace, pipeline_env)
-    precommit_passed, precommit_na, precommit_output = _run_precommit_step(
-        workspace, env=pipeline_env
+    build_passed, build_na, build_output = _run_step(
+        "python_build", pipeline_slot, lambda: _run_python_build_step(workspace, pipeline_env)
+    )
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="pipeline") as pool:
+        # copy_context() shares _transient_failures with the worker thread
+        format_future = pool.submit(
+            contextvars.copy_context().run,
+            _run_step,
+            "python_format",
+            pipeline_slot,
+            lambda: _run_python_format_step(workspace, pipeline_env),
+        )
+        test_passed, test_na, test_output = _run_step(
+            "python_test", pipeline_slot, lambda: _run_python_test_step(workspace, pipeline_env)
+        )
+        format_passed, format_na, format_output = format_future.result()
+    precommit_passed, precommit_na, precommit_output = _run_step(
+        "precommit", pipeline_slot, lambda: _run_precommit_step(workspace, env=pipeline_env)
     )
 
     return BuildPipelineResult(
@@ -423,23 +537,107 @@ def _run_python_pipeline(workspace: Path) -> BuildPipelineResult:
     )
 
 
-def _run_build_pipeline(workspace: Path, language: str = "python") -> BuildPipelineResult:
+@functools.cache
+def _pipeline_version() -> str:
+    """Fingerprint the pipeline implementation (this module's source) for cache keys."""
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+
+
+@functools.cache
+def _toolchain_version(language: str, search_path: str | None) -> str:
+    """Fingerprint the pipeline tools (location and ``--version`` output) for cache keys.
+
+    Args:
+        language: Pipeline language selecting the tools in _PIPELINE_TOOLS
+        search_path: PATH the tools are resolved on
+
+    Returns:
+        Short hex digest; changes when a tool or interpreter is upgraded or moved
+
+    """
+    digest = hashlib.sha256()
+    for tool in _PIPELINE_TOOLS.get(language, ()):
+        executable = shutil.which(tool, path=search_path)
+        version = ""
+        if executable:
+            try:
+                result = subprocess.run(
+                    [executable, "--version"], capture_output=True, text=True, timeout=60
+                )
+                version = (result.stdout + result.stderr).strip()
+            except (OSError, subprocess.SubprocessError) as e:
+                version = f"unavailable: {e}"
+        digest.update(f"{tool}\0{executable}\0{version}\n".encode())
+    return digest.hexdigest()[:16]
+
+
+def _run_uncached_pipeline(
+    workspace: Path, language: str, pipeline_slot: PipelineSlot | None
+) -> BuildPipelineResult:
+    """Route to the language-specific pipeline."""
+    run = _run_python_pipeline if language == "python" else _run_mojo_pipeline
+    if pipeline_slot is None:
+        return run(workspace)
+    return run(workspace, pipeline_slot=pipeline_slot)
+
+
+def _run_build_pipeline(
+    workspace: Path,
+    language: str = "python",
+    *,
+    use_cache: bool = True,
+    pipeline_slot: PipelineSlot | None = None,
+) -> BuildPipelineResult:
     """Run build/lint pipeline and capture results.
 
-    Routes to language-specific pipeline based on language parameter.
+    Routes to language-specific pipeline based on language parameter. Results
+    are cached by workspace tree hash, language, pipeline version and tool
+    versions (see ``scylla.e2e.pipeline_cache``), so an identical tree never
+    reruns the pipeline. Workspaces that are not git worktrees, and results
+    with a timed-out step or a missing tool, are never cached.
 
     Args:
         workspace: Path to the workspace directory
         language: Programming language ("python" or "mojo")
+        use_cache: Whether to reuse and store cached results (also disabled by
+            ``SCYLLA_PIPELINE_CACHE=0``)
+        pipeline_slot: Optional budget acquirer (``ResourceManager.pipeline_slot``)
+            each step holds for its PIPELINE_STEP_COSTS units while it runs
 
     Returns:
         BuildPipelineResult with all tool outputs
 
     """
-    if language == "python":
-        return _run_python_pipeline(workspace)
-    else:
-        return _run_mojo_pipeline(workspace)
+    if not use_cache or not pipeline_cache.cache_enabled():
+        return _run_uncached_pipeline(workspace, language, pipeline_slot)
+
+    cache_dir = pipeline_cache.get_pipeline_cache_dir(workspace)
+    tree_hash = pipeline_cache.workspace_tree_hash(workspace) if cache_dir else None
+    if cache_dir is None or tree_hash is None:
+        return _run_uncached_pipeline(workspace, language, pipeline_slot)
+
+    key = pipeline_cache.pipeline_cache_key(
+        tree_hash,
+        language,
+        _pipeline_version(),
+        _toolchain_version(language, os.environ.get("PATH")),
+    )
+    with pipeline_cache.cache_key_lock(key):
+        cached = pipeline_cache.load_cached_result(cache_dir, key)
+        if cached is not None:
+            logger.info(f"Reusing cached {language} pipeline result for tree {tree_hash[:12]}")
+            return cached
+        failures: list[str] = []
+        token = _transient_failures.set(failures)
+        try:
+            result = _run_uncached_pipeline(workspace, language, pipeline_slot)
+        finally:
+            _transient_failures.reset(token)
+        if failures:
+            logger.info(f"Not caching {language} pipeline result: {failures[0]}")
+        else:
+            pipeline_cache.save_cached_result(cache_dir, key, result)
+        return result
 
 
 def _run_and_log_pipeline(
@@ -449,7 +647,8 @@ def _run_and_log_pipeline(
     from scylla.e2e.pipeline_scripts import _save_pipeline_outputs
 
     logger.info(f"Running {language} build/lint/test pipeline")
-    result = _run_build_pipeline(workspace, language=language)
+    with _workspace_lock(workspace):
+        result = _run_build_pipeline(workspace, language=language)
 
     status_summary = result.get_status_summary()
     failed_steps = result.get_failure_summary()
@@ -463,7 +662,8 @@ def _run_and_log_pipeline(
 
     if judge_dir:
         run_dir = judge_dir.parent if judge_dir.parent.name.startswith("run_") else judge_dir
-        _save_pipeline_outputs(run_dir, result, language=language)
+        with _workspace_lock(workspace):
+            _save_pipeline_outputs(run_dir, result, language=language)
 
     return result
 
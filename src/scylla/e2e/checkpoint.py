@@ -8,6 +8,12 @@
     - v3.0: fine-grained state machine (RunState/SubtestState/TierState/ExperimentState)
             Adds: experiment_state, tier_states, subtest_states, run_states, last_heartbeat
             Backward compat: completed_runs preserved as derived view
+
+Journal:
+    State transitions are appended to ``checkpoint.journal`` next to the
+    snapshot (``save_checkpoint(..., incremental=True)``) instead of rewriting
+    ``checkpoint.json`` each time. ``load_checkpoint()`` replays the journal on
+    top of the snapshot, and every full ``save_checkpoint()`` compacts it.
 """
 
 from __future__ import annotations
@@ -17,11 +23,13 @@
 import logging
 import os
 import threading
+import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 if TYPE_CHECKING:
     from scylla.e2e.models import ExperimentConfig
@@ -29,6 +37,48 @@
 logger = logging.getLogger(__name__)
 
 
+# Lock protecting checkpoint serialization. With ThreadPoolExecutor, multiple
+# threads may call save_checkpoint() concurrently. Without this lock, thread A
+# could serialize stale state (before thread B's mutation) and overwrite B's
+# checkpoint on the atomic rename. The lock ensures serialize + rename is atomic
+# with respect to other threads. The E2ECheckpoint state setters take it too, so
+# a concurrent sub-test cannot add a key while another thread is serializing.
+# Reentrant because set_run_state() calls mark_run_completed().
+_checkpoint_write_lock = threading.RLock()
+
+# An incremental save rewrites the full snapshot (compaction) once the journal
+# holds this many records.
+CHECKPOINT_JOURNAL_MAX_RECORDS = 1000
+
+# Journal appends are flushed on every save but fsync'ed at most this often.
+CHECKPOINT_JOURNAL_FSYNC_INTERVAL_SECONDS = 1.0
+
+# Container fields covered by journal records. Every other field is a scalar
+# and is journaled as a changed value in a "set" record.
+_JOURNAL_CONTAINER_FIELDS = frozenset(
+    {"tier_states", "subtest_states", "run_states", "completed_runs"}
+)
+
+
+@dataclass
+class _JournalState:
+    """Per-path journal bookkeeping, guarded by _checkpoint_write_lock.
+
+    Attributes:
+        snapshot_digest: SHA256 of the checkpoint.json bytes the journal extends
+        records: Number of records currently in the journal
+        last_fsync: time.monotonic() of the last fsync of the journal
+
+    """
+
+    snapshot_digest: str
+    records: int = 0
+    last_fsync: float = 0.0
+
+
+_journal_states: dict[Path, _JournalState] = {}
+
+
 class CheckpointError(Exception):
     """Base exception for checkpoint-related errors."""
 
@@ -123,6 +173,12 @@ class E2ECheckpoint(BaseModel):
     # Process info for monitoring
     pid: int | None = Field(default=None, description="Process ID of running experiment")
 
+    # Journal records produced by the state setters since the last save, and
+    # the snapshot path/scalar values this object was last synced with.
+    _journal_pending: list[dict[str, Any]] = PrivateAttr(default_factory=list)
+    _journal_path: Path | None = PrivateAttr(default=None)
+    _journal_scalars: dict[str, Any] = PrivateAttr(default_factory=dict)
+
     # -------------------------------------------------------------------------
     # v3.0 State machine helpers
     # -------------------------------------------------------------------------
@@ -157,32 +213,36 @@ def set_run_state(self, tier_id: str, subtest_id: str, run_num: int, state: str)
             state: RunState value string
 
         """
-        key = str(run_num)
-        if tier_id not in self.run_states:
-            self.run_states[tier_id] = {}
-        if subtest_id not in self.run_states[tier_id]:
-            self.run_states[tier_id][subtest_id] = {}
-        self.run_states[tier_id][subtest_id][key] = state
-        self.last_updated_at = datetime.now(timezone.utc).isoformat()
-
-        # Sync to completed_runs for v2.0 backward compat consumers
-        # Includes both v3.0 (run_complete) and v3.1 (run_finalized, report_written) names
-        terminal_complete = {
-            "run_complete",  # v3.0 name (kept for migration compat)
-            "run_finalized",  # v3.1 name
-            "report_written",  # v3.1 name
-            "checkpointed",
-            "worktree_cleaned",
-        }
-        if state in terminal_complete:
-            # Preserve existing status (passed/failed), default to "passed"
-            existing = self.get_run_status(tier_id, subtest_id, run_num)
-            compat_status = existing if existing in ("passed", "failed") else "passed"
-            self.mark_run_completed(tier_id, subtest_id, run_num, status=compat_status)
-        elif state == "agent_complete":
-            self.mark_run_completed(tier_id, subtest_id, run_num, status="agent_complete")
-        elif state == "failed":
-            self.mark_run_completed(tier_id, subtest_id, run_num, status="failed")
+        with _checkpoint_write_lock:
+            key = str(run_num)
+            if tier_id not in self.run_states:
+                self.run_states[tier_id] = {}
+            if subtest_id not in self.run_states[tier_id]:
+                self.run_states[tier_id][subtest_id] = {}
+            self.run_states[tier_id][subtest_id][key] = state
+            self._journal_pending.append(
+                {"op": "run", "t": tier_id, "s": subtest_id, "r": key, "v": state}
+            )
+            self.last_updated_at = datetime.now(timezone.utc).isoformat()
+
+            # Sync to completed_runs for v2.0 backward compat consumers
+            # Includes both v3.0 (run_complete) and v3.1 (run_finalized, report_written) names
+            terminal_complete = {
+                "run_complete",  # v3.0 name (kept for migration compat)
+                "run_finalized",  # v3.1 name
+                "report_written",  # v3.1 name
+                "checkpointed",
+                "worktree_cleaned",
+            }
+            if state in terminal_complete:
+                # Preserve existing status (passed/failed), default to "passed"
+                existing = self.get_run_status(tier_id, subtest_id, run_num)
+                compat_status = existing if existing in ("passed", "failed") else "passed"
+                self.mark_run_completed(tier_id, subtest_id, run_num, status=compat_status)
+            elif state == "agent_complete":
+                self.mark_run_completed(tier_id, subtest_id, run_num, status="agent_complete")
+            elif state == "failed":
+                self.mark_run_completed(tier_id, subtest_id, run_num, status="failed")
 
     def get_tier_state(self, tier_id: str) -> str:
         """Get the TierState for a tier.
@@ -204,8 +264,10 @@ def set_tier_state(self, tier_id: str, state: str) -> None:
             state: TierState value string
 
         """
-        self.tier_states[tier_id] = state
-        self.last_updated_at = datetime.now(timezone.utc).isoformat()
+        with _checkpoint_write_lock:
+            self.tier_states[tier_id] = state
+            self._journal_pending.append({"op": "tier", "t": tier_id, "v": state})
+            self.last_updated_at = datetime.now(timezone.utc).isoformat()
 
     def get_subtest_state(self, tier_id: str, subtest_id: str) -> str:
         """Get the SubtestState for a subtest.
@@ -229,15 +291,57 @@ def set_subtest_state(self, tier_id: str, subtest_id: str, state: str) -> None:
             state: SubtestState value string
 
         """
-        if tier_id not in self.subtest_states:
-            self.subtest_states[tier_id] = {}
-        self.subtest_states[tier_id][subtest_id] = state
-        self.last_updated_at = datetime.now(timezone.utc).isoformat()
+        with _checkpoint_write_lock:
+            if tier_id not in self.subtest_states:
+                self.subtest_states[tier_id] = {}
+            self.subtest_states[tier_id][subtest_id] = state
+            self._journal_pending.append(
+                {"op": "subtest", "t": tier_id, "s": subtest_id, "v": state}
+            )
+            self.last_updated_at = datetime.now(timezone.utc).isoformat()
 
     def update_heartbeat(self) -> None:
         """Update the heartbeat timestamp to now."""
         self.last_heartbeat = datetime.now(timezone.utc).isoformat()
 
+    def _journal_scalar_values(self) -> dict[str, Any]:
+        """Return the current values of all non-container fields."""
+        return {
+            name: getattr(self, name)
+            for name in type(self).model_fields
+            if name not in _JOURNAL_CONTAINER_FIELDS
+        }
+
+    def _apply_journal_record(self, record: dict[str, Any]) -> None:
+        """Apply one journal record without producing a new pending record.
+
+        Args:
+            record: Decoded journal line (see save_checkpoint)
+
+        Raises:
+            ValueError: If the record has an unknown op
+
+        """
+        op = record["op"]
+        if op == "run":
+            tier = self.run_states.setdefault(record["t"], {})
+            tier.setdefault(record["s"], {})[record["r"]] = record["v"]
+        elif op == "tier":
+            self.tier_states[record["t"]] = record["v"]
+        elif op == "subtest":
+            self.subtest_states.setdefault(record["t"], {})[record["s"]] = record["v"]
+        elif op == "done":
+            tier_runs = self.completed_runs.setdefault(record["t"], {})
+            tier_runs.setdefault(record["s"], {})[int(record["r"])] = record["v"]
+        elif op == "undone":
+            subtest_runs = self.completed_runs.get(record["t"], {}).get(record["s"], {})
+            subtest_runs.pop(int(record["r"]), None)
+        elif op == "set":
+            for name, value in record["v"].items():
+                setattr(self, name, value)
+        else:
+            raise ValueError(f"Unknown checkpoint journal op: {op!r}")
+
     # -------------------------------------------------------------------------
     # v2.0 backward compat helpers
     # -------------------------------------------------------------------------
@@ -259,13 +363,17 @@ def mark_run_completed(
                 f"Invalid status: {status}. Must be 'passed', 'failed', or 'agent_complete'."
             )
 
-        if tier_id not in self.completed_runs:
-            self.completed_runs[tier_id] = {}
-        if subtest_id not in self.completed_runs[tier_id]:
-            self.completed_runs[tier_id][subtest_id] = {}
+        with _checkpoint_write_lock:
+            if tier_id not in self.completed_runs:
+                self.completed_runs[tier_id] = {}
+            if subtest_id not in self.completed_runs[tier_id]:
+                self.completed_runs[tier_id][subtest_id] = {}
 
-        self.completed_runs[tier_id][subtest_id][run_number] = status
-        self.last_updated_at = datetime.now(timezone.utc).isoformat()
+            self.completed_runs[tier_id][subtest_id][run_number] = status
+            self._journal_pending.append(
+                {"op": "done", "t": tier_id, "s": subtest_id, "r": run_number, "v": status}
+            )
+            self.last_updated_at = datetime.now(timezone.utc).isoformat()
 
     def unmark_run_completed(self, tier_id: str, subtest_id: str, run_number: int) -> None:
         """Remove a run from completed runs (for re-running invalid runs).
@@ -276,13 +384,17 @@ def unmark_run_completed(self, tier_id: str, subtest_id: str, run_number: int) -
             run_number: Run number (1-based)
 
         """
-        if (
-            tier_id in self.completed_runs
-            and subtest_id in self.completed_runs[tier_id]
-            and run_number in self.completed_runs[tier_id][subtest_id]
-        ):
-            del self.completed_runs[tier_id][subtest_id][run_number]
-            self.last_updated_at = datetime.now(timezone.utc).isoformat()
+        with _checkpoint_write_lock:
+            if (
+                tier_id in self.completed_runs
+                and subtest_id in self.completed_runs[tier_id]
+                and run_number in self.completed_runs[tier_id][subtest_id]
+            ):
+                del self.completed_runs[tier_id][subtest_id][run_number]
+                self._journal_pending.append(
+                    {"op": "undone", "t": tier_id, "s": subtest_id, "r": run_number}
+                )
+                self.last_updated_at = datetime.now(timezone.utc).isoformat()
 
     def get_run_status(self, tier_id: str, subtest_id: str, run_number: int) -> str | None:
         """Get the status of a run.
@@ -499,24 +611,103 @@ def _migrate_v3_to_v3_1(cls, data: dict[str, Any]) -> dict[str, Any]:
         return data
 
 
-# Lock protecting checkpoint serialization. With ThreadPoolExecutor, multiple
-# threads may call save_checkpoint() concurrently. Without this lock, thread A
-# could serialize stale state (before thread B's mutation) and overwrite B's
-# checkpoint on the atomic rename. The lock ensures serialize + rename is atomic
-# with respect to other threads.
-_checkpoint_write_lock = threading.Lock()
+def get_journal_path(path: Path) -> Path:
+    """Return the journal file that accompanies a checkpoint snapshot.
+
+    Args:
+        path: Path to checkpoint.json
+
+    Returns:
+        Path to checkpoint.journal in the same directory
+
+    """
+    return path.with_suffix(".journal")
+
+
+def _write_snapshot(checkpoint: E2ECheckpoint, path: Path) -> None:
+    """Write a full snapshot atomically and start a fresh journal for it.
+
+    Must be called with _checkpoint_write_lock held.
+
+    Args:
+        checkpoint: Checkpoint to write
+        path: Path to checkpoint file
 
+    """
+    # Atomic write: write to temp file, then rename.
+    # Include both PID and thread ID in the temp filename so concurrent threads
+    # in the same process each get a unique file, preventing ENOENT when one
+    # thread renames the file before another can.
+    tid = threading.get_ident()
+    temp_path = path.parent / f"{path.stem}.tmp.{os.getpid()}.{tid}{path.suffix}"
+    payload = json.dumps(checkpoint.model_dump(), indent=2)
+
+    with open(temp_path, "w") as f:
+        f.write(payload)
+
+    # Atomic rename — each writer has a unique temp file (PID+TID)
+    temp_path.replace(path)
+
+    # The old journal is folded into the snapshot. Removing it after the rename
+    # is safe: a crash in between leaves a journal whose header no longer
+    # matches the snapshot, which load_checkpoint() ignores.
+    get_journal_path(path).unlink(missing_ok=True)
+    _journal_states[path] = _JournalState(
+        snapshot_digest=hashlib.sha256(payload.encode()).hexdigest()
+    )
+    checkpoint._journal_pending.clear()
+    checkpoint._journal_path = path
+    checkpoint._journal_scalars = checkpoint._journal_scalar_values()
+
+
+def _append_journal(path: Path, records: list[dict[str, Any]]) -> None:
+    """Append records to the journal of a snapshot, fsync-batched.
+
+    Must be called with _checkpoint_write_lock held and _journal_states[path]
+    present. The first append after a snapshot writes the header line.
+
+    Args:
+        path: Path to checkpoint file
+        records: Journal records to append
 
-def save_checkpoint(checkpoint: E2ECheckpoint, path: Path) -> None:
+    """
+    state = _journal_states[path]
+    lines = [json.dumps(record, separators=(",", ":")) for record in records]
+    if state.records == 0:
+        lines.insert(0, json.dumps({"snapshot": state.snapshot_digest}, separators=(",", ":")))
+        mode = "w"
+    else:
+        mode = "a"
+
+    with open(get_journal_path(path), mode) as f:
+        f.write("\n".join(lines) + "\n")
+        f.flush()
+        now = time.monotonic()
+        if now - state.last_fsync >= CHECKPOINT_JOURNAL_FSYNC_INTERVAL_SECONDS:
+            os.fsync(f.fileno())
+            state.last_fsync = now
+    state.records += len(records)
+
+
+def save_checkpoint(checkpoint: E2ECheckpoint, path: Path, *, incremental: bool = False) -> None:
     """Save checkpoint to file with atomic write, serialized across threads.
 
     All worker threads share the same in-memory checkpoint object. This function
     serializes access so that mutations from one thread are not lost when another
     thread writes concurrently.
 
+    A full save rewrites checkpoint.json and discards the journal (compaction).
+    With ``incremental=True`` only the records produced by the state setters
+    since the last save, plus any changed scalar fields, are appended to
+    checkpoint.journal. The save falls back to a full snapshot when this object
+    was not loaded from or saved to ``path`` in this process, or when the
+    journal has reached CHECKPOINT_JOURNAL_MAX_RECORDS. Direct mutations of the
+    state dicts bypass the journal and need a full save.
+
     Args:
         checkpoint: Checkpoint to save
         path: Path to checkpoint file
+        incremental: Append to the journal instead of rewriting the snapshot
 
     Raises:
         CheckpointError: If save fails
@@ -527,26 +718,111 @@ def save_checkpoint(checkpoint: E2ECheckpoint, path: Path) -> None:
             # Update timestamp
             checkpoint.last_updated_at = datetime.now(timezone.utc).isoformat()
 
-            # Atomic write: write to temp file, then rename.
-            # Include both PID and thread ID in the temp filename so concurrent threads
-            # in the same process each get a unique file, preventing ENOENT when one
-            # thread renames the file before another can.
-            tid = threading.get_ident()
-            temp_path = path.parent / f"{path.stem}.tmp.{os.getpid()}.{tid}{path.suffix}"
-            data = checkpoint.model_dump()
+            state = _journal_states.get(path)
+            if (
+                not incremental
+                or state is None
+                or checkpoint._journal_path != path
+                or state.records >= CHECKPOINT_JOURNAL_MAX_RECORDS
+            ):
+                _write_snapshot(checkpoint, path)
+                return
+
+            records = list(checkpoint._journal_pending)
+            scalars = checkpoint._journal_scalar_values()
+            changed = {
+                name: value
+                for name, value in scalars.items()
+                if checkpoint._journal_scalars.get(name) != value
+            }
+            if changed:
+                records.append({"op": "set", "v": changed})
+            if records:
+                _append_journal(path, records)
+            checkpoint._journal_pending.clear()
+            checkpoint._journal_scalars = scalars
 
-            with open(temp_path, "w") as f:
-                json.dump(data, f, indent=2)
+        except OSError as e:
+            raise CheckpointError(f"Failed to save checkpoint to {path}: {e}") from e
 
-            # Atomic rename — each writer has a unique temp file (PID+TID)
-            temp_path.replace(path)
 
+def append_checkpoint_fields(path: Path, **fields: Any) -> bool:
+    """Journal scalar field updates for a checkpoint without loading it.
+
+    Used by writers that do not own the in-memory checkpoint (e.g. the
+    heartbeat thread), so a concurrent incremental save is never overwritten
+    by a stale full snapshot.
+
+    Args:
+        path: Path to checkpoint file
+        **fields: Scalar E2ECheckpoint fields and their new values
+
+    Returns:
+        True if the update was journaled, False if no journal is active for
+        ``path`` in this process (the caller should do a full save instead)
+
+    Raises:
+        CheckpointError: If the append fails
+
+    """
+    with _checkpoint_write_lock:
+        if path not in _journal_states:
+            return False
+        try:
+            _append_journal(path, [{"op": "set", "v": fields}])
         except OSError as e:
-            raise CheckpointError(f"Failed to save checkpoint to {path}: {e}") from e
+            raise CheckpointError(f"Failed to append to checkpoint journal {path}: {e}") from e
+        return True
+
+
+def _replay_journal(checkpoint: E2ECheckpoint, path: Path, snapshot_digest: str) -> int:
+    """Apply the journal of ``path`` to a freshly loaded snapshot.
+
+    A journal whose header names a different snapshot is stale (the snapshot
+    was rewritten after a crash or by another tool) and is ignored. A torn last
+    line from an interrupted append is dropped.
+
+    Args:
+        checkpoint: Checkpoint decoded from the snapshot (mutated in place)
+        path: Path to checkpoint file
+        snapshot_digest: SHA256 of the snapshot bytes
+
+    Returns:
+        Number of records applied
+
+    """
+    journal_path = get_journal_path(path)
+    if not journal_path.exists():
+        return 0
+    with open(journal_path) as f:
+        lines = f.read().splitlines()
+    if not lines:
+        return 0
+
+    try:
+        header = json.loads(lines[0])
+    except json.JSONDecodeError:
+        header = {}
+    if header.get("snapshot") != snapshot_digest:
+        logger.warning(f"Ignoring stale checkpoint journal {journal_path}")
+        return 0
+
+    applied = 0
+    for index, line in enumerate(lines[1:], start=1):
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            if index == len(lines) - 1:
+                logger.warning(f"Dropping torn last record of checkpoint journal {journal_path}")
+                break
+            raise
+        checkpoint._apply_journal_record(record)
+        applied += 1
+    return applied
 
 
 def load_checkpoint(path: Path) -> E2ECheckpoint:
-    """Load checkpoint from file.
+    """Load checkpoint from file, replaying its journal if present.
 
     Args:
         path: Path to checkpoint file
@@ -562,11 +838,46 @@ def load_checkpoint(path: Path) -> E2ECheckpoint:
         raise CheckpointError(f"Checkpoint file not found: {path}")
 
     try:
-        with open(path) as f:
-            data = json.load(f)
-        return E2ECheckpoint.from_dict(data)
+        with open(path, "rb") as f:
+            payload = f.read()
+        data = json.loads(payload)
     except (OSError, json.JSONDecodeError) as e:
         raise CheckpointError(f"Failed to load checkpoint from {path}: {e}") from e
+    checkpoint = E2ECheckpoint.from_dict(data)
+
+    digest = hashlib.sha256(payload).hexdigest()
+    with _checkpoint_write_lock:
+        try:
+            records = _replay_journal(checkpoint, path, digest)
+        except (OSError, ValueError, KeyError) as e:
+            raise CheckpointError(f"Failed to replay checkpoint journal for {path}: {e}") from e
+        state = _journal_states.get(path)
+        if state is None or state.snapshot_digest != digest:
+            _journal_states[path] = _JournalState(snapshot_digest=digest, records=records)
+        checkpoint._journal_path = path
+        checkpoint._journal_scalars = checkpoint._journal_scalar_values()
+    return checkpoint
+
+
+def compact_checkpoint(path: Path) -> E2ECheckpoint:
+    """Fold the journal of a checkpoint into a fresh checkpoint.json snapshot.
+
+    Tools that read or edit checkpoint.json as plain JSON call this first.
+
+    Args:
+        path: Path to checkpoint file
+
+    Returns:
+        The compacted E2ECheckpoint
+
+    Raises:
+        CheckpointError: If the checkpoint cannot be loaded or saved
+
+    """
+    checkpoint = load_checkpoint(path)
+    if get_journal_path(path).exists():
+        save_checkpoint(checkpoint, path)
+    return checkpoint
 
 
 def compute_config_hash(config: ExperimentConfig) -> str:
@@ -609,6 +920,17 @@ def compute_config_hash(config: ExperimentConfig) -> str:
     config_dict.pop("keep_failed_workspaces", None)
     config_dict.pop("max_concurrent_workspaces", None)
     config_dict.pop("max_concurrent_agents", None)
+    config_dict.pop("max_concurrent_judges", None)
+    config_dict.pop("pipeline_budget", None)
+    config_dict.pop("pipeline_cache", None)
+    config_dict.pop("worktree_pool", None)
+    config_dict.pop("workspace_backend", None)
+    config_dict.pop("max_concurrent_tiers", None)
+    config_dict.pop("max_concurrent_subtests", None)
+    config_dict.pop("max_concurrent_runs", None)
+    config_dict.pop("max_concurrent_judges_per_run", None)
+    config_dict.pop("judge_quorum", None)
+    config_dict.pop("stream_agent_output", None)
 
     # Stable JSON serialization (sorted keys)
     config_json = json.dumps(config_dict, sort_keys=True)
@@ -10,6 +10,7 @@
 import json
 import os
 import shlex
+import shutil
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -153,6 +154,8 @@ def update_last_command(
         stderr: str,
         exit_code: int,
         duration: float,
+        stdout_path: Path | None = None,
+        stderr_path: Path | None = None,
     ) -> None:
         """Update the most recently logged command with execution results.
 
@@ -164,6 +167,9 @@ def update_last_command(
             stderr: Standard error from the command
             exit_code: Process exit code
             duration: Execution duration in seconds
+            stdout_path: File holding the full stdout (e.g. a streamed log); if
+                given, the log file is copied from it instead of written from stdout
+            stderr_path: Same as stdout_path, for stderr
 
         """
         if not self.commands:
@@ -172,8 +178,14 @@ def update_last_command(
         last_cmd = self.commands[-1]
 
         # Update log files
-        (self.log_dir / last_cmd.stdout_file).write_text(stdout)
-        (self.log_dir / last_cmd.stderr_file).write_text(stderr)
+        for text, source, log_file in (
+            (stdout, stdout_path, last_cmd.stdout_file),
+            (stderr, stderr_path, last_cmd.stderr_file),
+        ):
+            if source is not None:
+                shutil.copyfile(source, self.log_dir / log_file)
+            else:
+                (self.log_dir / log_file).write_text(text)
 
         # Update command metadata
         last_cmd.exit_code = exit_code
@@ -178,6 +178,7 @@ def capture_baseline(self, experiment_dir: Path, workspace_manager: WorkspaceMan
             result = _run_build_pipeline(
                 workspace=worktree_path,
                 language=self.config.language,
+                use_cache=self.config.pipeline_cache,
             )
             _save_pipeline_baseline(experiment_dir, result)
             baseline_status = "ALL PASSED ✓" if result.all_passed else "SOME FAILED ✗"
@@ -217,18 +217,27 @@ def stop(self) -> None:
     def _write_heartbeat(self) -> None:
         """Update only the heartbeat timestamp on disk, preserving all other state.
 
-        Reads the current checkpoint from disk, updates only last_heartbeat,
-        and writes it back atomically. This prevents overwriting run_states and
-        other fields written by worker processes.
+        When this process is journaling the checkpoint, the timestamp is appended
+        to the journal so concurrent state transitions are never overwritten.
+        Otherwise reads the current checkpoint from disk, updates only
+        last_heartbeat, and writes it back atomically. This prevents overwriting
+        run_states and other fields written by worker processes.
         """
-        from scylla.e2e.checkpoint import CheckpointError, load_checkpoint, save_checkpoint
+        from scylla.e2e.checkpoint import (
+            CheckpointError,
+            append_checkpoint_fields,
+            load_checkpoint,
+            save_checkpoint,
+        )
 
         try:
-            # Read from disk to get the latest state written by worker processes
-            current = load_checkpoint(self._checkpoint_path)
-            current.update_heartbeat()
-            save_checkpoint(current, self._checkpoint_path)
-            logger.debug(f"Heartbeat updated: {current.last_heartbeat}")
+            heartbeat = datetime.now(timezone.utc).isoformat()
+            if not append_checkpoint_fields(self._checkpoint_path, last_heartbeat=heartbeat):
+                # Read from disk to get the latest state written by worker processes
+                current = load_checkpoint(self._checkpoint_path)
+                current.last_heartbeat = heartbeat
+                save_checkpoint(current, self._checkpoint_path)
+            logger.debug(f"Heartbeat updated: {heartbeat}")
         except CheckpointError as e:
             logger.warning(f"Failed to write heartbeat: {e}")
         except Exception as e:
@@ -12,13 +12,16 @@
 import json
 import logging
 import subprocess
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
 from scylla.e2e.llm_judge import run_llm_judge
 from scylla.e2e.models import JudgeResultSummary
-from scylla.e2e.paths import RESULT_FILE, get_judge_result_file
+from scylla.e2e.paths import JUDGE_SKIPPED_FILE, RESULT_FILE, get_judge_result_file
 from scylla.e2e.rate_limit import RateLimitError, RateLimitInfo, _detect_rate_limit_from_stderr
 
 if TYPE_CHECKING:
@@ -49,6 +52,43 @@ def _save_judge_result(judge_dir: Path, result: JudgeResult) -> None:
         json.dump(result_data, f, indent=2)
 
 
+def _save_skipped_judges(
+    judge_dir: Path,
+    judge_models: list[str],
+    judges: list[JudgeResultSummary],
+    quorum: int | None,
+) -> None:
+    """Mark judge slots that were not started because the judge quorum was reached.
+
+    Writes ``judge_NN/skipped.json`` so rerun_judges does not classify the
+    slots as missing and rerun them.
+
+    Args:
+        judge_dir: Path to the run's judge directory
+        judge_models: Judge models, numbered from 1 in list order
+        judges: Summaries of the judges that ran
+        quorum: Judge quorum that was reached
+
+    """
+    ran = {j.judge_number for j in judges}
+    for judge_num, model in enumerate(judge_models, start=1):
+        if judge_num in ran:
+            continue
+        slot_dir = judge_dir / f"judge_{judge_num:02d}"
+        slot_dir.mkdir(parents=True, exist_ok=True)
+        with open(slot_dir / JUDGE_SKIPPED_FILE, "w") as f:
+            json.dump(
+                {
+                    "skipped": True,
+                    "model": model,
+                    "reason": f"Judge quorum of {quorum} reached",
+                    "measured_at": datetime.now(timezone.utc).isoformat(),
+                },
+                f,
+                indent=2,
+            )
+
+
 def _load_judge_result(judge_dir: Path) -> dict[str, Any]:
     """Load judge evaluation result from judge/result.json.
 
@@ -130,6 +170,76 @@ def _compute_judge_consensus(
     return (consensus_score, passed, grade)
 
 
+def _run_judges_concurrently(
+    judge_models: list[str],
+    run_one: Callable[[int, str], JudgeResultSummary],
+    max_concurrent: int | None = None,
+    quorum: int | None = None,
+    judge_dir: Path | None = None,
+) -> list[JudgeResultSummary]:
+    """Execute the judges of one run on a pool of worker threads.
+
+    Each judge writes only to its own ``judge_NN/`` directory, so artifacts are
+    the same as for sequential execution. Once ``quorum`` judges have produced
+    valid results no further judges are started; judges already in flight
+    finish. The quorum can only skip judges when ``max_concurrent`` is below
+    the number of judges, since otherwise every judge starts at once. After a
+    RateLimitError no further judges are started either, and
+    the error is re-raised once in-flight judges finish.
+
+    Args:
+        judge_models: Judge models, numbered from 1 in list order
+        run_one: Executes one judge given (judge_number, model)
+        max_concurrent: Max judges running at once (None = all)
+        quorum: Valid results after which no new judges start (None = run all)
+        judge_dir: Judge directory of the run; when given, judges skipped by the
+            quorum get a ``judge_NN/skipped.json`` marker
+
+    Returns:
+        Summaries of the judges that ran, ordered by judge number
+
+    """
+    if not judge_models:
+        return []
+    stop = threading.Event()
+    lock = threading.Lock()
+    judges: list[JudgeResultSummary] = []
+    errors: list[BaseException] = []
+
+    def work(judge_num: int, model: str) -> None:
+        if stop.is_set():
+            return
+        try:
+            summary = run_one(judge_num, model)
+        except BaseException as e:
+            stop.set()
+            with lock:
+                errors.append(e)
+            return
+        with lock:
+            judges.append(summary)
+            if quorum is not None and sum(j.is_valid for j in judges) >= quorum:
+                stop.set()
+
+    workers = min(max_concurrent or len(judge_models), len(judge_models))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="judge") as pool:
+        futures = [
+            pool.submit(work, judge_num, model)
+            for judge_num, model in enumerate(judge_models, start=1)
+        ]
+        for future in futures:
+            future.result()
+    if errors:
+        raise errors[0]
+    if len(judges) < len(judge_models):
+        logger.info(
+            f"Judge quorum of {quorum} reached after {len(judges)}/{len(judge_models)} judges"
+        )
+        if judge_dir is not None:
+            _save_skipped_judges(judge_dir, judge_models, judges, quorum)
+    return sorted(judges, key=lambda j: j.judge_number)
+
+
 def _run_judge(
     workspace: Path,
     task_prompt: str,
@@ -139,10 +249,13 @@ def _run_judge(
     rubric_path: Path | None = None,
     judge_models: list[str] | None = None,
     pipeline_baseline: BuildPipelineResult | None = None,
+    max_concurrent_judges: int | None = None,
+    judge_quorum: int | None = None,
 ) -> tuple[dict[str, Any], list[JudgeResultSummary]]:
     """Run LLM judge evaluation(s) on the result.
 
-    Runs multiple judges if configured, computes consensus.
+    Runs multiple judges concurrently if configured, computes consensus once
+    all of them finish (or ``judge_quorum`` valid results are in).
 
     Args:
         workspace: Workspace with agent's output
@@ -154,6 +267,8 @@ def _run_judge(
         rubric_path: Optional path to rubric YAML file
         judge_models: List of judge models to use (required)
         pipeline_baseline: Optional baseline pipeline result from before agent execution
+        max_concurrent_judges: Max judges running at once (None = all)
+        judge_quorum: Valid results after which no new judges start (None = run all)
 
     Returns:
         Tuple of (consensus_dict, judges_list)
@@ -163,16 +278,12 @@ def _run_judge(
     """
     if not judge_models:
         raise ValueError("judge_models is required")
+    num_judges = len(judge_models)
 
-    judges = []
-
-    # Run each configured judge
-    for judge_num, model in enumerate(judge_models, start=1):
-        from datetime import datetime, timezone
-
+    def _judge_one(judge_num: int, model: str) -> JudgeResultSummary:
         _phase_log(
             "JUDGE",
-            f"Running judge {judge_num}/{len(judge_models)} with model[{model}]",
+            f"Running judge {judge_num}/{num_judges} with model[{model}]",
         )
 
         # Use the LLM judge for proper evaluation
@@ -190,7 +301,7 @@ def _run_judge(
             )
 
             # Store individual judge result
-            judge_summary = JudgeResultSummary(
+            return JudgeResultSummary(
                 model=model,
                 score=judge_result.score,
                 passed=judge_result.passed,
@@ -200,7 +311,6 @@ def _run_judge(
                 is_valid=judge_result.is_valid,
                 criteria_scores=judge_result.criteria_scores,
             )
-            judges.append(judge_summary)
 
         except RateLimitError:
             # Rate limit errors must propagate immediately to trigger backoff
@@ -252,10 +362,10 @@ def _run_judge(
             if raw_stderr is not None:
                 (judge_specific_dir / "stderr.log").write_text(raw_stderr)
 
-            # Record a zero-score failed result and continue to the next judge
-            # rather than aborting the entire run. This handles cases like Haiku
-            # returning conversational text instead of structured JSON.
-            failed_summary = JudgeResultSummary(
+            # Record a zero-score failed result rather than aborting the entire
+            # run. This handles cases like Haiku returning conversational text
+            # instead of structured JSON.
+            return JudgeResultSummary(
                 model=model,
                 score=0.0,
                 passed=False,
@@ -265,7 +375,15 @@ def _run_judge(
                 is_valid=False,
                 criteria_scores={},
             )
-            judges.append(failed_summary)
+
+    # Run the configured judges concurrently (judge_01/, judge_02/, ... as before)
+    judges = _run_judges_concurrently(
+        judge_models,
+        _judge_one,
+        max_concurrent=max_concurrent_judges,
+        quorum=judge_quorum,
+        judge_dir=judge_dir,
+    )
 
     # Compute consensus from all judges (only valid ones contribute)
     consensus_score, consensus_passed, consensus_grade = _compute_judge_consensus(judges)
@@ -278,8 +396,6 @@ def _run_judge(
         rate_limit_errors = [e for e in all_errors if _detect_rate_limit_from_stderr(e)[0]]
         if rate_limit_errors and len(rate_limit_errors) == len(judges):
             # Every judge hit a rate limit — propagate so the run is retried
-            from datetime import datetime, timezone
-
             logger.warning(
                 "All %d judges failed with rate-limit errors; propagating RateLimitError",
                 len(judges),
@@ -10,11 +10,14 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
 import subprocess
+import threading
 import time
+import weakref
 from pathlib import Path
 from typing import Any
 
@@ -23,8 +26,15 @@
 from scylla.config.constants import DEFAULT_JUDGE_MODEL
 from scylla.e2e.build_pipeline import _format_pipeline_result, _run_and_log_pipeline
 from scylla.e2e.filters import is_test_config_file
-from scylla.e2e.llm_judge_models import BuildPipelineResult, JudgeResult, _score_to_grade
+from scylla.e2e.llm_judge_models import (
+    BuildPipelineResult,
+    JudgeContext,
+    JudgeResult,
+    _score_to_grade,
+)
+from scylla.e2e.paths import get_judge_context_file
 from scylla.e2e.pipeline_scripts import _save_judge_logs
+from scylla.e2e.transcript import Transcript, parse_transcript
 from scylla.judge import extract_json_from_llm_response
 from scylla.judge.prompts import JUDGE_SYSTEM_PROMPT_FILE, build_task_prompt
 
@@ -289,7 +299,7 @@ def _gather_judge_context(
     language: str,
     pipeline_baseline: BuildPipelineResult | None,
     judge_dir: Path | None,
-) -> tuple[str, BuildPipelineResult | None]:
+) -> JudgeContext:
     """Gather all context needed for the judge prompt.
 
     Collects workspace state, patchfile, reference patch, rubric, and pipeline
@@ -308,7 +318,7 @@ def _gather_judge_context(
         judge_dir: Directory for pipeline output saving
 
     Returns:
-        Tuple of (judge_prompt, pipeline_result)
+        JudgeContext holding the gathered inputs and the assembled prompt
 
     """
     workspace_state = _get_workspace_state(workspace)
@@ -350,7 +360,165 @@ def _gather_judge_context(
         baseline_pipeline_str=baseline_pipeline_str,
     )
 
-    return judge_prompt, pipeline_result
+    return JudgeContext(
+        workspace_state=workspace_state,
+        patchfile=patchfile,
+        deleted_files=deleted_files,
+        reference_patch=reference_patch,
+        rubric_content=rubric_content,
+        pipeline_result=pipeline_result,
+        judge_prompt=judge_prompt,
+    )
+
+
+def save_judge_context(run_dir: Path, context: JudgeContext) -> None:
+    """Persist a run's judge context to judge_context.json (atomic write).
+
+    Args:
+        run_dir: Path to the run directory
+        context: Context to save
+
+    """
+    path = get_judge_context_file(run_dir)
+    temp_path = path.with_name(f"{path.stem}.tmp.{os.getpid()}.{threading.get_ident()}.json")
+    temp_path.write_text(context.model_dump_json(indent=2))
+    temp_path.replace(path)
+
+
+def load_judge_context(run_dir: Path) -> JudgeContext | None:
+    """Load a run's judge context from judge_context.json.
+
+    Args:
+        run_dir: Path to the run directory
+
+    Returns:
+        The saved JudgeContext, or None if missing or unreadable
+
+    """
+    path = get_judge_context_file(run_dir)
+    if not path.exists():
+        return None
+    try:
+        return JudgeContext.model_validate_json(path.read_text())
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable judge context {path}: {e}")
+        return None
+
+
+def load_saved_judge_prompt(run_dir: Path) -> str | None:
+    """Return the judge prompt saved for a run, if any.
+
+    Prefers judge_prompt.md and falls back to the prompt in judge_context.json.
+
+    Args:
+        run_dir: Path to the run directory
+
+    Returns:
+        The saved prompt, or None if the run has neither file
+
+    """
+    prompt_path = run_dir / "judge_prompt.md"
+    if prompt_path.exists():
+        return prompt_path.read_text()
+    context = load_judge_context(run_dir)
+    return context.judge_prompt if context is not None else None
+
+
+# One lock per run directory, so concurrent judges of a run gather once. Weak
+# values: a lock is dropped once no judge of its run holds it.
+_context_locks: weakref.WeakValueDictionary[Path, threading.Lock] = weakref.WeakValueDictionary()
+_context_locks_guard = threading.Lock()
+
+
+def _context_lock(run_dir: Path) -> threading.Lock:
+    """Return the lock guarding judge-context gathering for ``run_dir``."""
+    key = run_dir.resolve()
+    with _context_locks_guard:
+        return _context_locks.setdefault(key, threading.Lock())
+
+
+def _judge_context_key(**inputs: Any) -> str:
+    """Hash the non-workspace inputs of _gather_judge_context()."""
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _get_judge_context(
+    workspace: Path,
+    task_prompt: str,
+    agent_output: str,
+    include_patchfile: bool,
+    reference_patch_path: Path | None,
+    rubric_path: Path | None,
+    run_build_pipeline: bool,
+    language: str,
+    pipeline_baseline: BuildPipelineResult | None,
+    judge_dir: Path | None,
+) -> JudgeContext:
+    """Return the run's judge context, gathering it only once per run.
+
+    With a ``judge_dir``, the context is cached in the run's judge_context.json
+    and reused by every later judge of the run whose inputs match; concurrent
+    judges wait for the first one to finish gathering. Without a ``judge_dir``
+    the context is gathered on every call.
+
+    Args:
+        workspace: Path to the workspace with agent's output
+        task_prompt: The original task prompt
+        agent_output: The agent's stdout output
+        include_patchfile: Whether to include git diff in evaluation context
+        reference_patch_path: Optional path to reference solution patch
+        rubric_path: Optional path to rubric YAML file
+        run_build_pipeline: Whether to run build/lint/test pipeline
+        language: Programming language for pipeline selection
+        pipeline_baseline: Optional baseline pipeline result
+        judge_dir: Run's judge directory (run_dir/judge), or None
+
+    Returns:
+        JudgeContext for the run
+
+    """
+
+    def gather() -> JudgeContext:
+        return _gather_judge_context(
+            workspace=workspace,
+            task_prompt=task_prompt,
+            agent_output=agent_output,
+            include_patchfile=include_patchfile,
+            reference_patch_path=reference_patch_path,
+            rubric_path=rubric_path,
+            run_build_pipeline=run_build_pipeline,
+            language=language,
+            pipeline_baseline=pipeline_baseline,
+            judge_dir=judge_dir,
+        )
+
+    if judge_dir is None:
+        return gather()
+
+    run_dir = judge_dir.parent
+    inputs_key = _judge_context_key(
+        workspace=str(workspace.resolve()),
+        task_prompt=task_prompt,
+        agent_output=agent_output,
+        include_patchfile=include_patchfile,
+        reference_patch_path=str(reference_patch_path) if reference_patch_path else None,
+        rubric_path=str(rubric_path) if rubric_path else None,
+        run_build_pipeline=run_build_pipeline,
+        language=language,
+        pipeline_baseline=(
+            pipeline_baseline.model_dump(mode="json") if pipeline_baseline else None
+        ),
+    )
+    with _context_lock(run_dir):
+        cached = load_judge_context(run_dir)
+        if cached is not None and cached.inputs_key == inputs_key:
+            logger.debug(f"Reusing judge context from {get_judge_context_file(run_dir)}")
+            return cached
+        context = gather()
+        context.inputs_key = inputs_key
+        run_dir.mkdir(parents=True, exist_ok=True)
+        save_judge_context(run_dir, context)
+        return context
 
 
 def _execute_judge_with_retry(
@@ -480,7 +648,7 @@ def run_llm_judge(
     """
     judge_start = time.time()
 
-    judge_prompt, _pipeline_result = _gather_judge_context(
+    context = _get_judge_context(
         workspace=workspace,
         task_prompt=task_prompt,
         agent_output=agent_output,
@@ -504,10 +672,10 @@ def run_llm_judge(
         run_dir = actual_judge_dir.parent.parent
         judge_prompt_path = run_dir / "judge_prompt.md"
         if not judge_prompt_path.exists():
-            judge_prompt_path.write_text(judge_prompt)
+            judge_prompt_path.write_text(context.judge_prompt)
 
     return _execute_judge_with_retry(
-        judge_prompt=judge_prompt,
+        judge_prompt=context.judge_prompt,
         model=model,
         workspace=workspace,
         actual_judge_dir=actual_judge_dir,
@@ -530,34 +698,10 @@ def _extract_response_from_stream(stream_output: str) -> str:
         Extracted response text
 
     """
-    text_parts: list[str] = []
-    result_text = ""
-
-    for line in stream_output.strip().splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            event = json.loads(line)
-        except json.JSONDecodeError:
-            continue
+    return parse_transcript(stream_output, collect_text=True).response_text
 
-        if event.get("type") == "assistant":
-            message = event.get("message", {})
-            for block in message.get("content", []):
-                if block.get("type") == "text":
-                    text_parts.append(block["text"])
-        elif event.get("type") == "result":
-            result_text = event.get("result", "")
 
-    # Prefer result field if populated (CLI bug is fixed)
-    if result_text.strip():
-        return result_text
-
-    return "".join(text_parts)
-
-
-def _raise_if_rate_limit(stdout: str, stderr: str) -> None:
+def _raise_if_rate_limit(stdout: str, stderr: str, transcript: Transcript | None = None) -> None:
     """Raise RateLimitError if stdout/stderr contain rate limit indicators.
 
     Handles both single-object JSON (``--output-format json``) and
@@ -565,7 +709,7 @@ def _raise_if_rate_limit(stdout: str, stderr: str) -> None:
     """
     from scylla.e2e.rate_limit import RateLimitError, detect_rate_limit
 
-    rate_limit_info = detect_rate_limit(stdout, stderr, source="judge")
+    rate_limit_info = detect_rate_limit(stdout, stderr, source="judge", transcript=transcript)
     if rate_limit_info:
         raise RateLimitError(rate_limit_info)
 
@@ -675,8 +819,11 @@ def _call_claude_judge(
 
     from scylla.e2e.rate_limit import RateLimitError, _detect_rate_limit_from_stdout
 
+    # Parse the stream-json output once for rate-limit detection and the response
+    transcript = parse_transcript(result.stdout, collect_text=True)
+
     if result.returncode != 0:
-        _raise_if_rate_limit(result.stdout, result.stderr)
+        _raise_if_rate_limit(result.stdout, result.stderr, transcript)
         error_msg = _extract_cli_error(result.stdout, result.stderr)
         _raise_if_rate_limit_in_error(error_msg)
         cb._record_failure()
@@ -689,7 +836,9 @@ def _call_claude_judge(
     # On success (exit 0), only check stdout for structured JSON rate-limit signals.
     # Stderr on a successful call is warnings/progress — scanning it risks false
     # positives when the model mentions "resets" or "rate limit" in valid output.
-    rate_limit_info = _detect_rate_limit_from_stdout(result.stdout, source="judge")
+    rate_limit_info = _detect_rate_limit_from_stdout(
+        result.stdout, source="judge", transcript=transcript
+    )
     if rate_limit_info:
         raise RateLimitError(rate_limit_info)
 
@@ -697,7 +846,7 @@ def _call_claude_judge(
     cb._record_success()
 
     # Extract response text from stream-json events
-    response_text = _extract_response_from_stream(result.stdout)
+    response_text = transcript.response_text
     return result.stdout, result.stderr, response_text
 
 
@@ -150,3 +150,33 @@ def to_context_string(self) -> str:
         )
 
         return "\n\n".join(sections)
+
+
+class JudgeContext(BaseModel):
+    """Judge inputs gathered once per run and shared by all of its judges.
+
+    Persisted as ``judge_context.json`` next to ``judge_prompt.md`` so that
+    every judge of the run, and later reruns, reuse it instead of re-running
+    git and the build pipeline.
+
+    Attributes:
+        inputs_key: Hash of the non-workspace inputs the context was gathered
+            for, or None when assembled by the stage pipeline
+        workspace_state: Description of files changed in the workspace
+        patchfile: Git diff of the agent's changes
+        deleted_files: Files deleted by the agent
+        reference_patch: Reference solution patch, if provided
+        rubric_content: Raw rubric YAML, if provided
+        pipeline_result: Build pipeline result on the agent's workspace
+        judge_prompt: Fully assembled judge prompt
+
+    """
+
+    inputs_key: str | None = None
+    workspace_state: str = ""
+    patchfile: str | None = None
+    deleted_files: list[str] | None = None
+    reference_patch: str | None = None
+    rubric_content: str | None = None
+    pipeline_result: BuildPipelineResult | None = None
+    judge_prompt: str
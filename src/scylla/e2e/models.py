@@ -10,10 +10,10 @@
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 import yaml
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from scylla.config.constants import (
     DEFAULT_AGENT_MODEL,
@@ -794,7 +794,32 @@ class ExperimentConfig(BaseModel):
     keep_failed_workspaces: bool = False  # Preserve workspaces for failed runs
     max_concurrent_workspaces: int | None = None  # Limit live workspaces (None = auto)
     max_concurrent_agents: int | None = None  # Limit concurrent claude CLI processes (None = auto)
+    max_concurrent_judges: int | None = None  # Separate judge slots (None = share agent slots)
+    # Build pipeline budget units shared by weighted pipeline steps (None = cpu_count)
+    pipeline_budget: int | None = Field(default=None, ge=1)
+    # Reuse build pipeline results of identical workspace trees (pipeline_cache.py)
+    pipeline_cache: bool = True
+    # Reuse pre-created worktrees (one per workspace slot) instead of add/remove per run
+    worktree_pool: bool = False
+    # How run workspaces are materialized: "worktree" (git worktree add) or
+    # "reflink" (copy-on-write copies of one base checkout, where supported)
+    workspace_backend: Literal["worktree", "reflink"] = "worktree"
+    # Tiers of one dependency group run concurrently (1 = sequential, each tier
+    # extending the previous tier's best sub-test)
+    max_concurrent_tiers: int = Field(default=1, ge=1)
+    # Sub-tests run concurrently within a tier (1 = sequential)
+    max_concurrent_subtests: int = Field(default=1, ge=1)
+    # Runs of one sub-test executed concurrently (1 = sequential)
+    max_concurrent_runs: int = Field(default=1, ge=1)
+    # Judges of one run executed concurrently (None = all judge_models at once)
+    max_concurrent_judges_per_run: int | None = Field(default=None, ge=1)
+    # Stop starting further judges of a run once this many are valid (None = run all).
+    # Requires max_concurrent_judges_per_run below len(judge_models); otherwise
+    # every judge has already started by the time the quorum is reached.
+    judge_quorum: int | None = Field(default=None, ge=1)
     off_peak: bool = False  # Wait for off-peak hours before each subtest run
+    # Tee agent output to disk line by line instead of buffering it in memory
+    stream_agent_output: bool = False
 
     @field_validator("models", mode="before")
     @classmethod
@@ -806,6 +831,18 @@ def _normalize_models(cls, v: list[str]) -> list[str]:
     def _normalize_judge_models(cls, v: list[str]) -> list[str]:
         return [normalize_model_id(m) for m in v]
 
+    @model_validator(mode="after")
+    def _check_judge_quorum(self) -> ExperimentConfig:
+        """Reject a judge quorum that could never skip a judge."""
+        cap = self.max_concurrent_judges_per_run
+        if self.judge_quorum is not None and (cap is None or cap >= len(self.judge_models)):
+            raise ValueError(
+                "judge_quorum requires max_concurrent_judges_per_run to be set below the "
+                f"number of judge models ({len(self.judge_models)}); otherwise every judge "
+                "starts at once and none can be skipped"
+            )
+        return self
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization.
 
@@ -832,7 +869,18 @@ def to_dict(self) -> dict[str, Any]:
             "keep_failed_workspaces",
             "max_concurrent_workspaces",
             "max_concurrent_agents",
+            "max_concurrent_judges",
+            "pipeline_budget",
+            "pipeline_cache",
+            "worktree_pool",
+            "workspace_backend",
+            "max_concurrent_tiers",
+            "max_concurrent_subtests",
+            "max_concurrent_runs",
+            "max_concurrent_judges_per_run",
+            "judge_quorum",
             "off_peak",
+            "stream_agent_output",
         }
         return self.model_dump(mode="json", exclude=_ephemeral)
 
@@ -1,8 +1,8 @@
-"""Sequential execution and rate limit coordination for E2E testing.
+"""Subtest execution and rate limit coordination for E2E testing.
 
 This module handles:
-- Sequential execution of subtests
-- Rate limit detection and coordination
+- Sequential or concurrent (worker pool) execution of a tier's subtests
+- Rate limit detection and coordination across worker threads
 - Retry logic for rate-limited subtests
 """
 
@@ -12,6 +12,7 @@
 import logging
 import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -40,6 +41,9 @@
 
 logger = logging.getLogger(__name__)
 
+# How often the worker-pool loop checks for a shutdown request
+_SHUTDOWN_POLL_SECONDS = 5.0
+
 
 class RateLimitCoordinator:
     """Coordinates rate limit pause across parallel worker threads.
@@ -84,6 +88,8 @@ def signal_rate_limit(self, info: RateLimitInfo) -> None:
                 "detected_at": info.detected_at,
             }
         )
+        # Re-arm the resume event so a second pause blocks workers again
+        self._resume_event.clear()
         self._pause_event.set()
         logger.info(f"Rate limit coordinator: pause signal from {info.source}")
 
@@ -168,8 +174,16 @@ def run_tier_subtests_parallel(
     checkpoint_path: Path | None = None,
     experiment_dir: Path | None = None,
     resource_manager: ResourceManager | None = None,
+    coordinator: RateLimitCoordinator | None = None,
 ) -> dict[str, SubTestResult]:
-    """Run all sub-tests for a tier sequentially with rate limit handling.
+    """Run all sub-tests for a tier with rate limit handling.
+
+    Sub-tests run one at a time unless ``config.max_concurrent_subtests`` is
+    greater than 1, in which case they run on a worker pool (see
+    :func:`_run_subtests_concurrently`).
+
+    When tiers run concurrently, ``coordinator`` is shared by all of them: a
+    rate limit in any tier pauses every tier's runs until the limit is waited out.
 
     Args:
         config: Experiment configuration
@@ -183,11 +197,30 @@ def run_tier_subtests_parallel(
         checkpoint_path: Path to checkpoint file for saving
         experiment_dir: Path to experiment directory (needed for T5 inheritance)
         resource_manager: Optional resource limiter for concurrency control
+        coordinator: Optional rate limit coordinator shared with other tiers
 
     Returns:
         Dict mapping sub-test ID to results.
 
     """
+    workers = min(config.max_concurrent_subtests, len(tier_config.subtests))
+    if workers > 1:
+        return _run_subtests_concurrently(
+            config=config,
+            tier_id=tier_id,
+            tier_config=tier_config,
+            tier_manager=tier_manager,
+            workspace_manager=workspace_manager,
+            baseline=baseline,
+            results_dir=results_dir,
+            checkpoint=checkpoint,
+            checkpoint_path=checkpoint_path,
+            experiment_dir=experiment_dir,
+            resource_manager=resource_manager,
+            workers=workers,
+            coordinator=coordinator,
+        )
+
     # Import here to avoid circular dependency
     from scylla.e2e.subtest_executor import SubTestExecutor
 
@@ -230,7 +263,7 @@ def run_tier_subtests_parallel(
                 results_dir=subtest_dir,
                 checkpoint=checkpoint,
                 checkpoint_path=checkpoint_path,
-                coordinator=None,
+                coordinator=coordinator,
                 experiment_dir=experiment_dir,
             )
             completed_count += 1
@@ -263,11 +296,192 @@ def run_tier_subtests_parallel(
                 checkpoint_path=checkpoint_path,
                 experiment_dir=experiment_dir,
                 completed_count=completed_count,
+                coordinator=coordinator,
             )
 
     return results
 
 
+def _run_subtests_concurrently(  # noqa: C901  # worker pool with retry/skip/shutdown paths
+    config: ExperimentConfig,
+    tier_id: TierID,
+    tier_config: TierConfig,
+    tier_manager: TierManager,
+    workspace_manager: WorkspaceManager,
+    baseline: TierBaseline | None,
+    results_dir: Path,
+    checkpoint: E2ECheckpoint | None,
+    checkpoint_path: Path | None,
+    experiment_dir: Path | None,
+    resource_manager: ResourceManager | None,
+    workers: int,
+    coordinator: RateLimitCoordinator | None = None,
+) -> dict[str, SubTestResult]:
+    """Run a tier's sub-tests on a pool of worker threads.
+
+    Each worker runs one sub-test at a time. The ``agent_slot()`` and
+    ``workspace_slot()`` limits of ``resource_manager`` still bound how many
+    agents and worktrees are live across all workers.
+
+    A worker that hits a rate limit signals the shared
+    :class:`RateLimitCoordinator`, which holds every worker before its next run.
+    The main thread waits out the limit once (recording the pause in the
+    checkpoint), resumes the workers and resubmits the rate-limited sub-tests.
+    Checkpoint mutations and writes are serialized by the checkpoint module.
+
+    Args:
+        config: Experiment configuration
+        tier_id: The tier being executed
+        tier_config: Tier configuration with sub-tests
+        tier_manager: Tier configuration manager
+        workspace_manager: Workspace manager for git worktrees
+        baseline: Previous tier's winning baseline
+        results_dir: Base directory for tier results
+        checkpoint: Optional checkpoint for resume capability
+        checkpoint_path: Path to checkpoint file for saving
+        experiment_dir: Path to experiment directory (needed for T5 inheritance)
+        resource_manager: Optional resource limiter for concurrency control
+        workers: Number of worker threads
+        coordinator: Coordinator shared with other tiers (default: a new one)
+
+    Returns:
+        Dict mapping sub-test ID to results, in ``tier_config.subtests`` order.
+
+    Raises:
+        RateLimitError: If a rate limit is hit and no checkpoint is available.
+
+    """
+    from scylla.e2e.shutdown import is_shutdown_requested
+
+    if coordinator is None:
+        coordinator = RateLimitCoordinator()
+    subtests = {subtest.id: subtest for subtest in tier_config.subtests}
+    results: dict[str, SubTestResult] = {}
+    total_subtests = len(subtests)
+    start_time = time.time()
+    completed_count = 0
+
+    def work(subtest: SubTestConfig) -> SubTestResult | None:
+        if is_shutdown_requested() or coordinator.is_shutdown_requested():
+            return None
+        if config.off_peak:
+            from scylla.e2e.scheduling import wait_for_off_peak
+
+            wait_for_off_peak()
+        return _run_subtest(
+            config,
+            tier_id,
+            tier_config,
+            subtest,
+            baseline,
+            results_dir / subtest.id,
+            tier_manager,
+            workspace_manager,
+            checkpoint=checkpoint,
+            checkpoint_path=checkpoint_path,
+            coordinator=coordinator,
+            experiment_dir=experiment_dir,
+            resource_manager=resource_manager,
+        )
+
+    logger.info(f"Tier {tier_id.value}: running {total_subtests} sub-tests on {workers} workers")
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix=f"subtest-{tier_id.value}"
+    ) as pool:
+        pending: dict[Future[SubTestResult | None], str] = {
+            pool.submit(work, subtest): subtest.id for subtest in subtests.values()
+        }
+        try:
+            while pending:
+                done, _ = wait(pending, timeout=_SHUTDOWN_POLL_SECONDS, return_when=FIRST_COMPLETED)
+                if is_shutdown_requested() and not coordinator.is_shutdown_requested():
+                    logger.warning("Shutdown requested, stopping subtest execution...")
+                    coordinator.signal_shutdown()
+
+                rate_limited: list[tuple[str, RateLimitError]] = []
+                for future in done:
+                    subtest_id = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except InfrastructureFailureError as e:
+                        # Agent crashed before making API calls; the run is already
+                        # archived to .failed/, so skip this subtest and continue.
+                        logger.warning(
+                            f"[SKIP] Subtest {subtest_id} skipped due to infrastructure "
+                            f"failure: {e}"
+                        )
+                        completed_count += 1
+                        continue
+                    except RateLimitError as e:
+                        rate_limited.append((subtest_id, e))
+                        continue
+                    if result is None:
+                        continue
+
+                    results[subtest_id] = result
+                    completed_count += 1
+                    elapsed = time.time() - start_time
+                    logger.info(
+                        f"[PROGRESS] Tier {tier_id.value}: "
+                        f"{completed_count}/{total_subtests} complete, "
+                        f"{total_subtests - completed_count} remaining, elapsed: {elapsed:.0f}s"
+                    )
+
+                if rate_limited:
+                    _wait_out_rate_limit(
+                        [error for _, error in rate_limited], checkpoint, checkpoint_path
+                    )
+                    coordinator.resume_all_workers()
+                    if not coordinator.is_shutdown_requested():
+                        for subtest_id, _ in rate_limited:
+                            future = pool.submit(work, subtests[subtest_id])
+                            pending[future] = subtest_id
+        except BaseException:
+            # Stop idle and paused workers; running sub-tests stop before their next run
+            coordinator.signal_shutdown()
+            for future in pending:
+                future.cancel()
+            raise
+
+    return {subtest_id: results[subtest_id] for subtest_id in subtests if subtest_id in results}
+
+
+def _wait_out_rate_limit(
+    errors: list[RateLimitError],
+    checkpoint: E2ECheckpoint | None,
+    checkpoint_path: Path | None,
+) -> None:
+    """Wait for the longest of several concurrent rate limits to expire.
+
+    Args:
+        errors: Rate limit errors raised by workers since the last wait.
+        checkpoint: Optional checkpoint for resume.
+        checkpoint_path: Path to checkpoint file.
+
+    Raises:
+        RateLimitError: If no checkpoint is available to record the pause.
+
+    """
+    error = max(errors, key=lambda e: e.info.retry_after_seconds or 0.0)
+    if not (checkpoint and checkpoint_path):
+        raise error
+
+    if is_weekly_limit(error.info):
+        logger.warning(
+            "Weekly usage limit detected from %s — waiting until reset. Resume after: %s",
+            error.info.source,
+            error.info.error_message,
+        )
+    else:
+        logger.info(
+            "Rate limit detected from %s, pausing %d worker(s)...",
+            error.info.source,
+            len(errors),
+        )
+
+    wait_for_rate_limit(error.info.retry_after_seconds, checkpoint, checkpoint_path)
+
+
 def _handle_rate_limit(
     error: RateLimitError,
     *,
@@ -282,6 +496,7 @@ def _handle_rate_limit(
     checkpoint_path: Path | None,
     experiment_dir: Path | None,
     completed_count: int,
+    coordinator: RateLimitCoordinator | None = None,
 ) -> int:
     """Handle a rate limit error by waiting and retrying.
 
@@ -298,6 +513,8 @@ def _handle_rate_limit(
         checkpoint_path: Path to checkpoint file.
         experiment_dir: Experiment directory (for T5 inheritance).
         completed_count: Current count of completed subtests.
+        coordinator: Optional coordinator shared with other tiers; resumed
+            after the wait and passed to the retry.
 
     Returns:
         Updated completed_count.
@@ -319,6 +536,8 @@ def _handle_rate_limit(
         logger.info("Rate limit detected from %s, waiting...", error.info.source)
 
     wait_for_rate_limit(error.info.retry_after_seconds, checkpoint, checkpoint_path)
+    if coordinator is not None:
+        coordinator.resume_all_workers()
 
     results[subtest.id] = executor.run_subtest(
         tier_id=tier_id,
@@ -328,7 +547,7 @@ def _handle_rate_limit(
         results_dir=results_dir,
         checkpoint=checkpoint,
         checkpoint_path=checkpoint_path,
-        coordinator=None,
+        coordinator=coordinator,
         experiment_dir=experiment_dir,
     )
     return completed_count + 1
@@ -428,6 +647,7 @@ def _run_subtest(
     checkpoint_path: Path | None = None,
     coordinator: RateLimitCoordinator | None = None,
     experiment_dir: Path | None = None,
+    resource_manager: ResourceManager | None = None,
 ) -> SubTestResult:
     """Run a sub-test.
 
@@ -444,6 +664,7 @@ def _run_subtest(
         checkpoint_path: Path to checkpoint file
         coordinator: Optional rate limit coordinator
         experiment_dir: Path to experiment directory (needed for T5 inheritance)
+        resource_manager: Optional resource limiter for concurrency control
 
     Returns:
         SubTestResult
@@ -454,7 +675,9 @@ def _run_subtest(
     from scylla.e2e.subtest_executor import SubTestExecutor
 
     set_log_context(tier_id=tier_id.value, subtest_id=subtest.id)
-    executor = SubTestExecutor(config, tier_manager, workspace_manager)
+    executor = SubTestExecutor(
+        config, tier_manager, workspace_manager, resource_manager=resource_manager
+    )
     return executor.run_subtest(
         tier_id=tier_id,
         tier_config=tier_config,
@@ -1,17 +1,25 @@
-"""Sequential tier execution orchestrator.
+"""Tier execution orchestrator.
 
 Encapsulates execute_tier_groups, _execute_single_tier, and
 _create_baseline_from_tier_result from E2ERunner.
+
+By default tiers run one at a time, each inheriting the previous tier's
+winning baseline. With ``config.max_concurrent_tiers > 1`` the tiers of each
+dependency group run concurrently, sharing one ``RateLimitCoordinator`` (and
+the runner's ``ResourceManager``), and each tier inherits only from its
+declared ``TIER_DEPENDENCIES``.
 """
 
 from __future__ import annotations
 
 import logging
 from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from scylla.e2e.models import (
+    TIER_DEPENDENCIES,
     ExperimentConfig,
     TierBaseline,
     TierID,
@@ -19,16 +27,22 @@
 )
 
 if TYPE_CHECKING:
+    from scylla.e2e.parallel_executor import RateLimitCoordinator
     from scylla.e2e.tier_manager import TierManager
 
+# run_tier_fn(tier_id, baseline) or, for concurrent tiers,
+# run_tier_fn(tier_id, baseline, coordinator)
+RunTierFn = Callable[..., TierResult]
+
 logger = logging.getLogger(__name__)
 
 
 class ParallelTierRunner:
-    """Orchestrates sequential tier execution.
+    """Orchestrates tier execution.
 
-    Encapsulates the logic for executing tiers sequentially, handling
-    baseline selection and creation between tiers.
+    Encapsulates the logic for executing tiers sequentially or, per
+    dependency group, concurrently, handling baseline selection and creation
+    between tiers.
 
     Receives runner state as explicit constructor arguments (no runner reference)
     to avoid circular coupling.
@@ -39,7 +53,7 @@ def __init__(
         config: ExperimentConfig,
         tier_manager: TierManager,
         experiment_dir: Path | None,
-        run_tier_fn: Callable[[TierID, TierBaseline | None], TierResult],
+        run_tier_fn: RunTierFn,
         save_tier_result_fn: Callable[[TierID, TierResult], None],
     ) -> None:
         """Initialize ParallelTierRunner with all required collaborators.
@@ -49,6 +63,8 @@ def __init__(
             tier_manager: Provides baseline retrieval for subtest results.
             experiment_dir: Root directory for this experiment's outputs (may be None).
             run_tier_fn: Callable injected from the runner to execute a single tier.
+                Called as ``(tier_id, baseline)``, plus the shared
+                ``RateLimitCoordinator`` when tiers run concurrently.
             save_tier_result_fn: Callable injected from the runner to save tier results.
 
         """
@@ -63,16 +79,22 @@ def execute_tier_groups(
         tier_groups: list[list[TierID]],
         previous_baseline: TierBaseline | None = None,
     ) -> dict[TierID, TierResult]:
-        """Execute all tier groups sequentially.
+        """Execute all tier groups in order.
+
+        With ``config.max_concurrent_tiers == 1`` the groups are flattened into
+        sequential execution; otherwise see :meth:`_execute_tier_groups_concurrently`.
 
         Args:
-            tier_groups: List of tier groups (flattened into sequential execution).
+            tier_groups: List of tier groups, each depending only on earlier groups.
             previous_baseline: Optional baseline from previous tier.
 
         Returns:
             Dictionary mapping tier IDs to their results.
 
         """
+        if self.config.max_concurrent_tiers > 1:
+            return self._execute_tier_groups_concurrently(tier_groups, previous_baseline)
+
         tier_results: dict[TierID, TierResult] = {}
 
         for group in tier_groups:
@@ -102,6 +124,122 @@ def execute_tier_groups(
 
         return tier_results
 
+    def _execute_tier_groups_concurrently(
+        self,
+        tier_groups: list[list[TierID]],
+        previous_baseline: TierBaseline | None,
+    ) -> dict[TierID, TierResult]:
+        """Run the tiers of each group concurrently, one group after another.
+
+        A group starts once every tier of the previous groups has finished,
+        i.e. once its declared dependencies are complete. All tiers share one
+        :class:`RateLimitCoordinator`, so a rate limit seen by any tier pauses
+        the workers of every tier; agent/workspace/judge/pipeline limits come
+        from the runner's shared ``ResourceManager``.
+
+        Args:
+            tier_groups: List of tier groups, each depending only on earlier groups.
+            previous_baseline: Baseline for tiers without completed dependencies.
+
+        Returns:
+            Dictionary mapping tier IDs to their results.
+
+        """
+        from scylla.e2e.parallel_executor import RateLimitCoordinator
+        from scylla.e2e.shutdown import is_shutdown_requested
+
+        coordinator = RateLimitCoordinator()
+        tier_results: dict[TierID, TierResult] = {}
+        for group in tier_groups:
+            if is_shutdown_requested():
+                logger.warning("Shutdown requested before tier group, stopping...")
+                break
+            baselines = {
+                tier_id: self._dependency_baseline(tier_id, tier_results, previous_baseline)
+                for tier_id in group
+            }
+            tier_results.update(self._execute_group(group, baselines, coordinator))
+        return tier_results
+
+    def _execute_group(
+        self,
+        group: list[TierID],
+        baselines: dict[TierID, TierBaseline | None],
+        coordinator: RateLimitCoordinator,
+    ) -> dict[TierID, TierResult]:
+        """Run one dependency group's tiers on a thread pool.
+
+        Args:
+            group: Independent tiers to run.
+            baselines: Baseline for each tier of the group.
+            coordinator: Rate limit coordinator shared by all tiers.
+
+        Returns:
+            Results of the group's tiers, in group order.
+
+        Raises:
+            BaseException: The first error raised by a tier, after the others
+                have been told to stop and have returned.
+
+        """
+        from scylla.e2e.log_context import set_log_context
+
+        def run(tier_id: TierID) -> TierResult:
+            set_log_context(tier_id=tier_id.value)
+            logger.info(f"Starting tier {tier_id.value}")
+            tier_result = self.run_tier_fn(tier_id, baselines[tier_id], coordinator)
+            self.save_tier_result_fn(tier_id, tier_result)
+            return tier_result
+
+        workers = min(self.config.max_concurrent_tiers, len(group))
+        logger.info(f"Running tiers {[t.value for t in group]} on {workers} workers")
+        results: dict[TierID, TierResult] = {}
+        first_error: BaseException | None = None
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tier") as pool:
+            futures: dict[Future[TierResult], TierID] = {
+                pool.submit(run, tier_id): tier_id for tier_id in group
+            }
+            for future in as_completed(futures):
+                try:
+                    results[futures[future]] = future.result()
+                except BaseException as e:  # re-raised once the other tiers stop
+                    if first_error is None:
+                        first_error = e
+                        coordinator.signal_shutdown()
+                        for pending in futures:
+                            pending.cancel()
+        if first_error is not None:
+            raise first_error
+        return {tier_id: results[tier_id] for tier_id in group if tier_id in results}
+
+    def _dependency_baseline(
+        self,
+        tier_id: TierID,
+        tier_results: dict[TierID, TierResult],
+        previous_baseline: TierBaseline | None,
+    ) -> TierBaseline | None:
+        """Return the baseline a tier inherits from its completed dependencies.
+
+        Single-dependency tiers (T6) inherit from that tier; otherwise (T5) the
+        dependency with the lowest finite cost-of-pass wins.
+
+        Args:
+            tier_id: The tier about to run.
+            tier_results: Results of the tiers completed so far.
+            previous_baseline: Fallback when no dependency yields a baseline.
+
+        Returns:
+            TierBaseline to pass to the tier, or ``previous_baseline``.
+
+        """
+        deps = [dep for dep in TIER_DEPENDENCIES[tier_id] if dep in tier_results]
+        if len(deps) > 1:
+            deps = [dep for dep in deps if tier_results[dep].cost_of_pass < float("inf")]
+        if not deps:
+            return previous_baseline
+        best = min(deps, key=lambda dep: tier_results[dep].cost_of_pass)
+        return self.create_baseline_from_tier_result(best, tier_results[best]) or previous_baseline
+
     def select_best_baseline_from_group(
         self,
         group: list[TierID],
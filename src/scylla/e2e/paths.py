@@ -22,6 +22,8 @@
 AGENT_DIR = "agent"
 JUDGE_DIR = "judge"
 RESULT_FILE = "result.json"
+JUDGE_CONTEXT_FILE = "judge_context.json"
+JUDGE_SKIPPED_FILE = "skipped.json"
 
 # Phase subdirectory names
 IN_PROGRESS_DIR = "in_progress"
@@ -67,6 +69,19 @@ def get_agent_result_file(run_dir: Path) -> Path:
     return get_agent_dir(run_dir) / RESULT_FILE
 
 
+def get_judge_context_file(run_dir: Path) -> Path:
+    """Get the shared judge context file path.
+
+    Args:
+        run_dir: Path to the run directory
+
+    Returns:
+        Path to judge_context.json (next to judge_prompt.md)
+
+    """
+    return run_dir / JUDGE_CONTEXT_FILE
+
+
 def get_judge_result_file(run_dir: Path) -> Path:
     """Get the judge result.json file path.
 
@@ -0,0 +1,185 @@
+"""On-disk cache of build pipeline results keyed by workspace content.
+
+The build/format/test/pre-commit pipeline can take up to 30 minutes, and it
+runs for the baseline, for every run's judge stage and again on rejudge.  Many
+agent outputs leave byte-identical trees (or no changes at all), so results
+are cached under the key ``(git tree hash of the workspace, language,
+pipeline version, tool versions)``. Results with a timed-out step or a missing
+tool are not stored, since those depend on the host rather than the tree.
+
+The tree hash is computed with a throw-away index (``git add -A`` +
+``git write-tree``), so it covers tracked, modified and untracked files and
+honours ``.gitignore`` without touching the workspace's own index.  Entries
+live in ``<git common dir>/scylla/pipeline_cache/<key>.json``, i.e. next to the
+objects of the repository the worktree belongs to, so every worktree of the
+same base repo - across experiments and reruns - shares them.  Delete that
+directory to invalidate the cache, or set ``SCYLLA_PIPELINE_CACHE=0`` (or pass
+``manage_experiment.py run --no-pipeline-cache``) to bypass it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import weakref
+from pathlib import Path
+
+from scylla.e2e.llm_judge_models import BuildPipelineResult
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever BuildPipelineResult semantics change so stale entries are ignored.
+PIPELINE_CACHE_VERSION = 1
+PIPELINE_CACHE_DIRNAME = "scylla/pipeline_cache"
+# Set to 0/false/no/off to bypass the cache in every entry point (run, rejudge, rerun)
+PIPELINE_CACHE_ENV = "SCYLLA_PIPELINE_CACHE"
+
+# One lock per cache key: concurrent runs with identical trees wait for the
+# first one to finish the pipeline and then reuse its result. Weak values: a
+# lock is dropped once no run of its key holds it.
+_key_locks: weakref.WeakValueDictionary[str, threading.Lock] = weakref.WeakValueDictionary()
+_key_locks_guard = threading.Lock()
+
+
+def cache_key_lock(key: str) -> threading.Lock:
+    """Return the lock serializing pipeline runs for ``key``."""
+    with _key_locks_guard:
+        return _key_locks.setdefault(key, threading.Lock())
+
+
+def cache_enabled() -> bool:
+    """Whether the cache is enabled by the environment (see PIPELINE_CACHE_ENV)."""
+    return os.environ.get(PIPELINE_CACHE_ENV, "1").strip().lower() not in (
+        "0",
+        "false",
+        "no",
+        "off",
+    )
+
+
+def _git(workspace: Path, *args: str, env: dict[str, str] | None = None) -> str | None:
+    """Run a git command in ``workspace`` and return its stripped stdout, or None on failure."""
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(workspace), *args],
+            capture_output=True,
+            text=True,
+            timeout=120,
+            env=env,
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.debug(f"git {args[0]} failed in {workspace}: {e}")
+        return None
+    if result.returncode != 0:
+        logger.debug(f"git {args[0]} failed in {workspace}: {result.stderr.strip()}")
+        return None
+    return result.stdout.strip()
+
+
+def workspace_tree_hash(workspace: Path) -> str | None:
+    """Return the git tree hash of the workspace's current contents.
+
+    Stages every non-ignored file into a temporary copy of the index, so the
+    stat cache of the real index is reused and the workspace is left untouched.
+
+    Args:
+        workspace: Git worktree to hash
+
+    Returns:
+        Tree object id, or None if the workspace is not a git worktree
+
+    """
+    index_path = _git(workspace, "rev-parse", "--path-format=absolute", "--git-path", "index")
+    if index_path is None:
+        return None
+    with tempfile.TemporaryDirectory(prefix="scylla-index-") as tmp:
+        temp_index = Path(tmp) / "index"
+        if Path(index_path).exists():
+            shutil.copyfile(index_path, temp_index)
+        env = {**os.environ, "GIT_INDEX_FILE": str(temp_index)}
+        if _git(workspace, "add", "-A", env=env) is None:
+            return None
+        return _git(workspace, "write-tree", env=env)
+
+
+def get_pipeline_cache_dir(workspace: Path) -> Path | None:
+    """Return the cache directory shared by all worktrees of the workspace's repo.
+
+    Args:
+        workspace: Git worktree
+
+    Returns:
+        ``<git common dir>/scylla/pipeline_cache``, or None if not a git worktree
+
+    """
+    common_dir = _git(workspace, "rev-parse", "--path-format=absolute", "--git-common-dir")
+    if common_dir is None:
+        return None
+    return Path(common_dir) / PIPELINE_CACHE_DIRNAME
+
+
+def pipeline_cache_key(
+    tree_hash: str, language: str, pipeline_version: str, toolchain_version: str
+) -> str:
+    """Return the cache key for a tree, language, pipeline and toolchain version.
+
+    Args:
+        tree_hash: Git tree hash of the workspace
+        language: Pipeline language ("python" or "mojo")
+        pipeline_version: Fingerprint of the pipeline implementation
+        toolchain_version: Fingerprint of the interpreter and tools the pipeline runs
+
+    Returns:
+        Hex digest used as the cache file name
+
+    """
+    payload = "\0".join(
+        (str(PIPELINE_CACHE_VERSION), tree_hash, language, pipeline_version, toolchain_version)
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def load_cached_result(cache_dir: Path, key: str) -> BuildPipelineResult | None:
+    """Load a cached pipeline result.
+
+    Args:
+        cache_dir: Cache directory
+        key: Cache key from pipeline_cache_key()
+
+    Returns:
+        Cached BuildPipelineResult, or None if missing or unreadable
+
+    """
+    path = cache_dir / f"{key}.json"
+    try:
+        return BuildPipelineResult.model_validate_json(path.read_text())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable pipeline cache entry {path}: {e}")
+        return None
+
+
+def save_cached_result(cache_dir: Path, key: str, result: BuildPipelineResult) -> None:
+    """Store a pipeline result atomically.
+
+    Args:
+        cache_dir: Cache directory (created if missing)
+        key: Cache key from pipeline_cache_key()
+        result: Result to store
+
+    """
+    path = cache_dir / f"{key}.json"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".tmp.{os.getpid()}.{threading.get_ident()}")
+        tmp_path.write_text(json.dumps(result.model_dump(mode="json"), indent=2))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Failed to write pipeline cache entry {path}: {e}")
@@ -6,7 +6,6 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import re
 import subprocess
@@ -19,6 +18,7 @@
 from pydantic import BaseModel, model_validator
 
 from scylla.e2e.paths import get_agent_dir
+from scylla.e2e.transcript import Transcript, parse_transcript
 
 if TYPE_CHECKING:
     from scylla.e2e.checkpoint import E2ECheckpoint
@@ -178,20 +178,6 @@ def parse_retry_after(stderr: str) -> float | None:
     ("resets ", True, "Usage limit with scheduled reset"),
 ]
 
-# Rate-limit keywords for JSON is_error result fields (used in JSON + stream-json detection)
-_JSON_RATE_LIMIT_KEYWORDS: tuple[str, ...] = (
-    "rate limit",
-    "rate_limit",
-    "ratelimit",
-    "overloaded",
-    "429",
-    "hit your limit",
-    "resets",
-    "weekly usage limit",
-    "upgrade to continue",
-    "failed to configure provider",
-)
-
 
 def _detect_rate_limit_from_stderr(stderr: str) -> tuple[str, float | None]:
     """Scan stderr for rate-limit indicator patterns.
@@ -247,34 +233,9 @@ def _make_rate_limit_info(
     )
 
 
-def _detect_rate_limit_from_json_line(data: dict[str, object], source: str) -> RateLimitInfo | None:
-    """Check a single parsed JSON object for rate-limit indicators.
-
-    Handles both ``--output-format json`` (single object) and individual
-    lines from ``--output-format stream-json``.
-
-    Args:
-        data: Parsed JSON object
-        source: "agent" or "judge"
-
-    Returns:
-        RateLimitInfo if rate limit detected, None otherwise
-
-    """
-    if not data.get("is_error"):
-        return None
-
-    result = data.get("result", data.get("error", ""))
-    error_str = str(result).lower()
-
-    if any(keyword in error_str for keyword in _JSON_RATE_LIMIT_KEYWORDS):
-        retry_after = parse_retry_after(str(result))
-        return _make_rate_limit_info(source, str(result), retry_after)
-
-    return None
-
-
-def _detect_rate_limit_from_stdout(stdout: str, source: str) -> RateLimitInfo | None:
+def _detect_rate_limit_from_stdout(
+    stdout: str, source: str, transcript: Transcript | None = None
+) -> RateLimitInfo | None:
     """Detect rate limit from stdout in JSON or stream-json format.
 
     Only checks structured JSON fields (``is_error: true``) — never scans
@@ -284,58 +245,46 @@ def _detect_rate_limit_from_stdout(stdout: str, source: str) -> RateLimitInfo |
     Args:
         stdout: Standard output from subprocess
         source: "agent" or "judge"
+        transcript: ``stdout`` already parsed by the caller, to avoid parsing it again
 
     Returns:
         RateLimitInfo if rate limit detected, None otherwise
 
     """
-    if not stdout.strip():
+    if transcript is None:
+        if not stdout.strip():
+            return None
+        transcript = parse_transcript(stdout)
+    if not transcript.rate_limit_errors:
         return None
-
-    # 1. Try single-object JSON (--output-format json)
-    try:
-        data = json.loads(stdout.strip())
-        info = _detect_rate_limit_from_json_line(data, source)
-        if info:
-            return info
-    except (json.JSONDecodeError, ValueError, TypeError):
-        pass
-
-    # 2. Try stream-json: one JSON object per line (--output-format stream-json)
-    for line in stdout.splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            data = json.loads(line)
-            info = _detect_rate_limit_from_json_line(data, source)
-            if info:
-                return info
-        except (json.JSONDecodeError, ValueError, TypeError):
-            continue
-
-    return None
+    error = transcript.rate_limit_errors[0]
+    return _make_rate_limit_info(source, error, parse_retry_after(error))
 
 
-def detect_rate_limit(stdout: str, stderr: str, source: str = "agent") -> RateLimitInfo | None:
+def detect_rate_limit(
+    stdout: str,
+    stderr: str,
+    source: str = "agent",
+    transcript: Transcript | None = None,
+) -> RateLimitInfo | None:
     """Detect rate limit from JSON or stream-json output, or stderr patterns.
 
     Detection order:
-    1. Parse stdout as single JSON object (``--output-format json``)
-    2. Parse stdout line-by-line as stream-json (``--output-format stream-json``)
-    3. Scan stdout as plain text for rate-limit patterns
-    4. Scan stderr for rate-limit patterns
+    1. ``is_error`` events of stdout, parsed once as json or stream-json
+       (see :mod:`scylla.e2e.transcript`)
+    2. Scan stderr for rate-limit patterns
 
     Args:
         stdout: Standard output from subprocess
         stderr: Standard error from subprocess
         source: Source of output ("agent" or "judge")
+        transcript: ``stdout`` already parsed by the caller, to avoid parsing it again
 
     Returns:
         RateLimitInfo if rate limit detected, None otherwise
 
     """
-    info = _detect_rate_limit_from_stdout(stdout, source)
+    info = _detect_rate_limit_from_stdout(stdout, source, transcript)
     if info:
         return info
 
@@ -10,7 +10,9 @@
 import json
 import logging
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
 from pydantic import BaseModel
 
@@ -18,7 +20,7 @@
 from scylla.e2e.agent_runner import _has_valid_agent_result
 from scylla.e2e.judge_runner import _has_valid_judge_result
 from scylla.e2e.judge_selection import select_best_subtest
-from scylla.e2e.llm_judge import run_llm_judge
+from scylla.e2e.llm_judge import load_saved_judge_prompt, run_llm_judge
 from scylla.e2e.models import (
     E2ERunResult,
     ExperimentConfig,
@@ -28,6 +30,7 @@
     TierResult,
     TokenStats,
 )
+from scylla.e2e.run_index import RunIndex, index_runs, open_run_index
 from scylla.e2e.run_report import (
     generate_experiment_summary_table,
     generate_tier_summary_table,
@@ -57,15 +60,21 @@ def regenerate_experiment(
     judge_model: str | None = None,
     dry_run: bool = False,
     verbose: bool = False,
+    parallel: int = 1,
 ) -> RegenerateStats:
     """Regenerate experiment results from existing run_result.json files.
 
+    With ``rejudge``, runs missing a judge result are re-judged by up to
+    ``parallel`` workers; tier and experiment results are then rebuilt once
+    from all run results.
+
     Args:
         experiment_dir: Path to experiment directory
         rejudge: Whether to re-run judges for missing judge results
         judge_model: Override judge model (default: from config)
         dry_run: Show what would be done without modifying files
         verbose: Enable verbose logging
+        parallel: Number of runs to re-judge concurrently (default: 1, sequential)
 
     Returns:
         Statistics about the regeneration process.
@@ -97,7 +106,7 @@ def regenerate_experiment(
 
     # Scan for run results
     stats = RegenerateStats()
-    run_results = scan_run_results(experiment_dir, stats)
+    run_results = scan_run_results(experiment_dir, stats, open_run_index(experiment_dir))
 
     if not run_results:
         logger.warning("⚠️  No run results found in experiment directory")
@@ -110,9 +119,9 @@ def regenerate_experiment(
 
     # Re-judge if requested
     if rejudge:
-        logger.info("⚖️  Re-judging runs with missing judge results...")
+        logger.info(f"⚖️  Re-judging runs with missing judge results (parallel={parallel})...")
         rejudge_missing_runs(
-            experiment_dir, config, run_results, effective_judge_model, dry_run, stats
+            experiment_dir, config, run_results, effective_judge_model, dry_run, stats, parallel
         )
         logger.info(f"✅ Re-judged {stats.runs_rejudged} runs")
 
@@ -145,20 +154,102 @@ def regenerate_experiment(
     return stats
 
 
+def _run_result_from_dict(data: dict[str, Any]) -> E2ERunResult:
+    """Reconstruct an E2ERunResult from run_result.json data.
+
+    Same logic as subtest_executor.py:659-681.
+
+    Args:
+        data: Parsed run_result.json
+
+    Returns:
+        E2ERunResult
+
+    Raises:
+        KeyError: If a required field is missing
+
+    """
+    return E2ERunResult(
+        run_number=data["run_number"],
+        exit_code=data["exit_code"],
+        token_stats=TokenStats.from_dict(data["token_stats"]),
+        cost_usd=data["cost_usd"],
+        duration_seconds=data["duration_seconds"],
+        agent_duration_seconds=data.get("agent_duration_seconds", 0.0),
+        judge_duration_seconds=data.get("judge_duration_seconds", 0.0),
+        judge_score=data["judge_score"],
+        judge_passed=data["judge_passed"],
+        judge_grade=data["judge_grade"],
+        judge_reasoning=data["judge_reasoning"],
+        workspace_path=Path(data["workspace_path"]),
+        logs_path=Path(data["logs_path"]),
+        command_log_path=(Path(data["command_log_path"]) if data.get("command_log_path") else None),
+        criteria_scores=data.get("criteria_scores") or {},
+    )
+
+
+def _scan_run_index(
+    index: RunIndex,
+    stats: RegenerateStats,
+) -> dict[str, dict[str, list[E2ERunResult]]]:
+    """Collect completed run results from the experiment's run index."""
+    from scylla.e2e.paths import COMPLETED_DIR
+
+    results: dict[str, dict[str, list[E2ERunResult]]] = {}
+    for run in index.runs(prefix=f"{COMPLETED_DIR}/"):
+        if not run.has_run_result:
+            continue
+        stats.runs_found += 1
+        if run.run_result is None or not (index.experiment_dir / run.run_key).is_dir():
+            logger.warning(f"⚠️  Invalid or removed run_result.json: {run.run_key}")
+            stats.runs_skipped += 1
+            continue
+        try:
+            run_result = _run_result_from_dict(run.run_result)
+        except KeyError as e:
+            logger.warning(f"⚠️  Invalid run_result.json: {run.run_key}: {e}")
+            stats.runs_skipped += 1
+            continue
+        results.setdefault(run.tier_id, {}).setdefault(run.subtest_id, []).append(run_result)
+        stats.runs_valid += 1
+    return results
+
+
 def scan_run_results(
     experiment_dir: Path,
     stats: RegenerateStats,
+    index: RunIndex | None = None,
 ) -> dict[str, dict[str, list[E2ERunResult]]]:
     """Scan for run_result.json files and reconstruct E2ERunResult objects.
 
     Args:
         experiment_dir: Path to experiment directory
         stats: Statistics object to update
+        index: Run index of the experiment; when given, run results are read
+            from it instead of walking completed/
 
     Returns:
         Dict mapping tier_id -> subtest_id -> list[E2ERunResult].
 
     """
+    if index is not None:
+        results = _scan_run_index(index, stats)
+    else:
+        results = _scan_run_files(experiment_dir, stats)
+
+    # rglob() order depends on the filesystem; keep run order deterministic
+    for subtests in results.values():
+        for runs in subtests.values():
+            runs.sort(key=lambda r: r.run_number)
+
+    return results
+
+
+def _scan_run_files(
+    experiment_dir: Path,
+    stats: RegenerateStats,
+) -> dict[str, dict[str, list[E2ERunResult]]]:
+    """Collect completed run results by parsing every completed/**/run_result.json."""
     results: dict[str, dict[str, list[E2ERunResult]]] = {}
 
     # Find all run_result.json files — only scan completed/ to exclude in-progress runs
@@ -194,26 +285,7 @@ def scan_run_results(
                 with open(run_result_file) as f:
                     data = json.load(f)
 
-                # Reconstruct E2ERunResult (same logic as subtest_executor.py:659-681)
-                run_result = E2ERunResult(
-                    run_number=data["run_number"],
-                    exit_code=data["exit_code"],
-                    token_stats=TokenStats.from_dict(data["token_stats"]),
-                    cost_usd=data["cost_usd"],
-                    duration_seconds=data["duration_seconds"],
-                    agent_duration_seconds=data.get("agent_duration_seconds", 0.0),
-                    judge_duration_seconds=data.get("judge_duration_seconds", 0.0),
-                    judge_score=data["judge_score"],
-                    judge_passed=data["judge_passed"],
-                    judge_grade=data["judge_grade"],
-                    judge_reasoning=data["judge_reasoning"],
-                    workspace_path=Path(data["workspace_path"]),
-                    logs_path=Path(data["logs_path"]),
-                    command_log_path=(
-                        Path(data["command_log_path"]) if data.get("command_log_path") else None
-                    ),
-                    criteria_scores=data.get("criteria_scores") or {},
-                )
+                run_result = _run_result_from_dict(data)
 
                 # Add to results
                 if tier_id not in results:
@@ -237,16 +309,252 @@ def scan_run_results(
     return results
 
 
-def rejudge_missing_runs(  # noqa: C901  # workspace state detection with many file patterns
+def _rejudge_run(  # noqa: C901  # workspace state detection with many file patterns
+    experiment_dir: Path,
+    config: ExperimentConfig,
+    tier_id: str,
+    subtest_id: str,
+    run: E2ERunResult,
+    judge_model: str,
+    dry_run: bool,
+) -> Path | None:
+    """Re-run the judge of one run if its judge result is missing.
+
+    Updates ``run`` and its run_result.json in place. Judge failures are
+    logged rather than raised, so one failing run does not stop the others.
+
+    Args:
+        experiment_dir: Path to experiment directory
+        config: Experiment configuration
+        tier_id: Tier of the run
+        subtest_id: Subtest of the run
+        run: Run result to update
+        judge_model: Judge model to use
+        dry_run: If True, only show what would be done
+
+    Returns:
+        Run directory if the run was (or, in a dry run, would be) re-judged,
+        None otherwise.
+
+    """
+    from scylla.e2e.paths import get_run_dir
+
+    run_dir = get_run_dir(experiment_dir, tier_id, subtest_id, run.run_number, completed=True)
+
+    # Check if judge result exists and is valid
+    if _has_valid_judge_result(run_dir):
+        logger.debug(f"Judge result exists for {run_dir}")
+        return None
+
+    # Check if agent result exists
+    if not _has_valid_agent_result(run_dir):
+        logger.warning(f"⚠️  No valid agent result for {run_dir}, cannot re-judge")
+        return None
+
+    # Check if workspace exists
+    workspace = run_dir / "workspace"
+    if not workspace.exists():
+        logger.warning(f"⚠️  Workspace not found for {run_dir}, cannot re-judge")
+        return None
+
+    logger.info(f"⚖️  Re-judging: {run_dir}")
+
+    if dry_run:
+        return run_dir
+
+    try:
+        # Load agent output
+        agent_output_file = run_dir / "agent" / "output.txt"
+        if not agent_output_file.exists():
+            logger.warning(f"⚠️  Agent output not found: {agent_output_file}")
+            return None
+        agent_output = agent_output_file.read_text()
+
+        # Load task prompt
+        task_prompt_file = experiment_dir / "prompt.md"
+        if not task_prompt_file.exists():
+            task_prompt_file = run_dir / "task_prompt.md"
+        if not task_prompt_file.exists():
+            logger.warning(f"⚠️  Task prompt not found for {run_dir}")
+            return None
+        task_prompt = task_prompt_file.read_text()
+
+        # Backup old run_result.json
+        run_result_file = run_dir / "run_result.json"
+        if run_result_file.exists():
+            backup_file = run_dir / "run_result.json.pre-rejudge"
+            shutil.copy2(run_result_file, backup_file)
+
+        # Run judge
+        judge_dir = run_dir / "judge"
+        judge_dir.mkdir(exist_ok=True)
+
+        # Reuse the prompt saved by the original run
+        # (judge_prompt.md or judge_context.json)
+        saved_judge_prompt_path = run_dir / "judge_prompt.md"
+        saved_judge_prompt = load_saved_judge_prompt(run_dir)
+
+        try:
+            if saved_judge_prompt is not None:
+                # Reuse the original judge prompt to avoid rebuilding
+                # from potentially corrupted workspace
+                logger.info(f"Re-judging {run_dir} with model {judge_model} (using saved prompt)")
+
+                judge_prompt = saved_judge_prompt
+
+                # Run judge using the saved prompt directly
+                # (bypass run_llm_judge which would rebuild prompt)
+                import time
+                from datetime import datetime, timezone
+
+                from scylla.e2e.llm_judge import (
+                    _call_claude_judge,
+                    _parse_judge_response,
+                )
+                from scylla.e2e.pipeline_scripts import _save_judge_logs
+
+                judge_start = time.time()
+
+                # Call Claude with saved prompt
+                stdout, stderr, result = _call_claude_judge(judge_prompt, judge_model, workspace)
+                judge_result = _parse_judge_response(result)
+
+                # Save logs
+                _save_judge_logs(
+                    judge_dir,
+                    judge_prompt,
+                    result,
+                    judge_result,
+                    judge_model,
+                    workspace,
+                    raw_stdout=stdout,
+                    raw_stderr=stderr,
+                    language=config.language,
+                )
+
+                # Save timing
+                judge_duration = time.time() - judge_start
+                timing_file = judge_dir / "timing.json"
+                with open(timing_file, "w") as f:
+                    json.dump(
+                        {
+                            "judge_duration_seconds": judge_duration,
+                            "measured_at": datetime.now(timezone.utc).isoformat(),
+                            "rejudge": True,
+                            "used_saved_prompt": True,
+                        },
+                        f,
+                        indent=2,
+                    )
+
+            else:
+                # Fallback: rebuild from workspace (old behavior, but log warning)
+                logger.warning(
+                    f"Saved judge_prompt.md not found at {saved_judge_prompt_path}, "
+                    f"rebuilding from workspace (may be inaccurate)"
+                )
+
+                judge_result = run_llm_judge(
+                    workspace=workspace,
+                    task_prompt=task_prompt,
+                    agent_output=agent_output,
+                    model=judge_model,
+                    judge_dir=judge_dir,
+                    reference_patch_path=(
+                        experiment_dir / "reference.patch"
+                        if (experiment_dir / "reference.patch").exists()
+                        else None
+                    ),
+                    rubric_path=(
+                        experiment_dir / "rubric.yaml"
+                        if (experiment_dir / "rubric.yaml").exists()
+                        else None
+                    ),
+                )
+
+            # Update run result with new judge scores
+            run.judge_score = judge_result.score
+            run.judge_passed = judge_result.passed
+            run.judge_grade = judge_result.grade
+            run.judge_reasoning = judge_result.reasoning
+            run.criteria_scores = judge_result.criteria_scores or {}
+
+            # Save updated run_result.json
+            with open(run_result_file, "w") as f:
+                json.dump(
+                    {
+                        "run_number": run.run_number,
+                        "exit_code": run.exit_code,
+                        "token_stats": run.token_stats.to_dict(),
+                        "cost_usd": run.cost_usd,
+                        "duration_seconds": run.duration_seconds,
+                        "agent_duration_seconds": run.agent_duration_seconds,
+                        "judge_duration_seconds": run.judge_duration_seconds,
+                        "judge_score": run.judge_score,
+                        "judge_passed": run.judge_passed,
+                        "judge_grade": run.judge_grade,
+                        "judge_reasoning": run.judge_reasoning,
+                        "workspace_path": str(run.workspace_path),
+                        "logs_path": str(run.logs_path),
+                        "command_log_path": (
+                            str(run.command_log_path) if run.command_log_path else None
+                        ),
+                        "criteria_scores": run.criteria_scores,
+                    },
+                    f,
+                    indent=2,
+                )
+
+            logger.info(f"✅ Re-judged {run_dir}: score={judge_result.score:.2f}")
+            return run_dir
+
+        except Exception as judge_error:
+            from datetime import datetime, timezone
+
+            # Log error with context
+            logger.error(
+                f"❌ Judge failed for {run_dir} with model {judge_model}: {judge_error}",
+                exc_info=True,
+            )
+
+            # Save error artifacts
+            timing_file = judge_dir / "timing.json"
+            with open(timing_file, "w") as f:
+                json.dump(
+                    {
+                        "judge_duration_seconds": 0.0,
+                        "measured_at": datetime.now(timezone.utc).isoformat(),
+                        "failed": True,
+                        "error": str(judge_error),
+                    },
+                    f,
+                    indent=2,
+                )
+
+            error_file = judge_dir / "error.log"
+            error_file.write_text(f"Judge failed: {judge_error}\n")
+
+            return None
+
+    except Exception as e:
+        logger.error(f"❌ Failed to re-judge {run_dir}: {e}")
+        return None
+
+
+def rejudge_missing_runs(
     experiment_dir: Path,
     config: ExperimentConfig,
     run_results: dict[str, dict[str, list[E2ERunResult]]],
     judge_model: str,
     dry_run: bool,
     stats: RegenerateStats,
+    parallel: int = 1,
 ) -> None:
     """Re-run judges for runs with missing judge results.
 
+    Runs are judged by up to ``parallel`` worker threads; statistics are
+    updated in tier/subtest/run order once all workers finished.
+
     Args:
         experiment_dir: Path to experiment directory
         config: Experiment configuration
@@ -254,221 +562,32 @@ def rejudge_missing_runs(  # noqa: C901  # workspace state detection with many f
         judge_model: Judge model to use
         dry_run: If True, only show what would be done
         stats: Statistics object to update
+        parallel: Number of runs to judge concurrently (default: 1, sequential)
 
     """
-    for tier_id, subtests in run_results.items():
-        for subtest_id, runs in subtests.items():
-            for run in runs:
-                from scylla.e2e.paths import get_run_dir
+    tasks = [
+        (tier_id, subtest_id, run)
+        for tier_id, subtests in sorted(run_results.items())
+        for subtest_id, runs in sorted(subtests.items())
+        for run in runs
+    ]
+
+    def rejudge(task: tuple[str, str, E2ERunResult]) -> Path | None:
+        tier_id, subtest_id, run = task
+        return _rejudge_run(experiment_dir, config, tier_id, subtest_id, run, judge_model, dry_run)
+
+    if parallel <= 1 or len(tasks) <= 1:
+        outcomes = [rejudge(task) for task in tasks]
+    else:
+        # pool.map() yields in submission order, keeping the results deterministic
+        with ThreadPoolExecutor(max_workers=parallel) as pool:
+            outcomes = list(pool.map(rejudge, tasks))
 
-                run_dir = get_run_dir(
-                    experiment_dir, tier_id, subtest_id, run.run_number, completed=True
-                )
+    rejudged_dirs = [run_dir for run_dir in outcomes if run_dir is not None]
+    stats.runs_rejudged += len(rejudged_dirs)
 
-                # Check if judge result exists and is valid
-                if _has_valid_judge_result(run_dir):
-                    logger.debug(f"Judge result exists for {run_dir}")
-                    continue
-
-                # Check if agent result exists
-                if not _has_valid_agent_result(run_dir):
-                    logger.warning(f"⚠️  No valid agent result for {run_dir}, cannot re-judge")
-                    continue
-
-                # Check if workspace exists
-                workspace = run_dir / "workspace"
-                if not workspace.exists():
-                    logger.warning(f"⚠️  Workspace not found for {run_dir}, cannot re-judge")
-                    continue
-
-                logger.info(f"⚖️  Re-judging: {run_dir}")
-
-                if dry_run:
-                    stats.runs_rejudged += 1
-                    continue
-
-                try:
-                    # Load agent output
-                    agent_output_file = run_dir / "agent" / "output.txt"
-                    if not agent_output_file.exists():
-                        logger.warning(f"⚠️  Agent output not found: {agent_output_file}")
-                        continue
-                    agent_output = agent_output_file.read_text()
-
-                    # Load task prompt
-                    task_prompt_file = experiment_dir / "prompt.md"
-                    if not task_prompt_file.exists():
-                        task_prompt_file = run_dir / "task_prompt.md"
-                    if not task_prompt_file.exists():
-                        logger.warning(f"⚠️  Task prompt not found for {run_dir}")
-                        continue
-                    task_prompt = task_prompt_file.read_text()
-
-                    # Backup old run_result.json
-                    run_result_file = run_dir / "run_result.json"
-                    if run_result_file.exists():
-                        backup_file = run_dir / "run_result.json.pre-rejudge"
-                        shutil.copy2(run_result_file, backup_file)
-
-                    # Run judge
-                    judge_dir = run_dir / "judge"
-                    judge_dir.mkdir(exist_ok=True)
-
-                    # Check if saved judge_prompt.md exists (from original run)
-                    saved_judge_prompt_path = run_dir / "judge_prompt.md"
-
-                    try:
-                        if saved_judge_prompt_path.exists():
-                            # Reuse the original judge prompt to avoid rebuilding
-                            # from potentially corrupted workspace
-                            logger.info(
-                                f"Re-judging {run_dir} with model {judge_model} "
-                                f"(using saved prompt)"
-                            )
-
-                            judge_prompt = saved_judge_prompt_path.read_text()
-
-                            # Run judge using the saved prompt directly
-                            # (bypass run_llm_judge which would rebuild prompt)
-                            import time
-                            from datetime import datetime, timezone
-
-                            from scylla.e2e.llm_judge import (
-                                _call_claude_judge,
-                                _parse_judge_response,
-                            )
-                            from scylla.e2e.pipeline_scripts import _save_judge_logs
-
-                            judge_start = time.time()
-
-                            # Call Claude with saved prompt
-                            stdout, stderr, result = _call_claude_judge(
-                                judge_prompt, judge_model, workspace
-                            )
-                            judge_result = _parse_judge_response(result)
-
-                            # Save logs
-                            _save_judge_logs(
-                                judge_dir,
-                                judge_prompt,
-                                result,
-                                judge_result,
-                                judge_model,
-                                workspace,
-                                raw_stdout=stdout,
-                                raw_stderr=stderr,
-                                language=config.language,
-                            )
-
-                            # Save timing
-                            judge_duration = time.time() - judge_start
-                            timing_file = judge_dir / "timing.json"
-                            with open(timing_file, "w") as f:
-                                json.dump(
-                                    {
-                                        "judge_duration_seconds": judge_duration,
-                                        "measured_at": datetime.now(timezone.utc).isoformat(),
-                                        "rejudge": True,
-                                        "used_saved_prompt": True,
-                                    },
-                                    f,
-                                    indent=2,
-                                )
-
-                        else:
-                            # Fallback: rebuild from workspace (old behavior, but log warning)
-                            logger.warning(
-                                f"Saved judge_prompt.md not found at {saved_judge_prompt_path}, "
-                                f"rebuilding from workspace (may be inaccurate)"
-                            )
-
-                            judge_result = run_llm_judge(
-                                workspace=workspace,
-                                task_prompt=task_prompt,
-                                agent_output=agent_output,
-                                model=judge_model,
-                                judge_dir=judge_dir,
-                                reference_patch_path=(
-                                    experiment_dir / "reference.patch"
-                                    if (experiment_dir / "reference.patch").exists()
-                                    else None
-                                ),
-                                rubric_path=(
-                                    experiment_dir / "rubric.yaml"
-                                    if (experiment_dir / "rubric.yaml").exists()
-                                    else None
-                                ),
-                            )
-
-                        # Update run result with new judge scores
-                        run.judge_score = judge_result.score
-                        run.judge_passed = judge_result.passed
-                        run.judge_grade = judge_result.grade
-                        run.judge_reasoning = judge_result.reasoning
-                        run.criteria_scores = judge_result.criteria_scores or {}
-
-                        # Save updated run_result.json
-                        with open(run_result_file, "w") as f:
-                            json.dump(
-                                {
-                                    "run_number": run.run_number,
-                                    "exit_code": run.exit_code,
-                                    "token_stats": run.token_stats.to_dict(),
-                                    "cost_usd": run.cost_usd,
-                                    "duration_seconds": run.duration_seconds,
-                                    "agent_duration_seconds": run.agent_duration_seconds,
-                                    "judge_duration_seconds": run.judge_duration_seconds,
-                                    "judge_score": run.judge_score,
-                                    "judge_passed": run.judge_passed,
-                                    "judge_grade": run.judge_grade,
-                                    "judge_reasoning": run.judge_reasoning,
-                                    "workspace_path": str(run.workspace_path),
-                                    "logs_path": str(run.logs_path),
-                                    "command_log_path": (
-                                        str(run.command_log_path) if run.command_log_path else None
-                                    ),
-                                    "criteria_scores": run.criteria_scores,
-                                },
-                                f,
-                                indent=2,
-                            )
-
-                        stats.runs_rejudged += 1
-                        logger.info(f"✅ Re-judged {run_dir}: score={judge_result.score:.2f}")
-
-                    except Exception as judge_error:
-                        from datetime import datetime, timezone
-
-                        # Log error with context
-                        logger.error(
-                            f"❌ Judge failed for {run_dir} with model {judge_model}: "
-                            f"{judge_error}",
-                            exc_info=True,
-                        )
-
-                        # Save error artifacts
-                        timing_file = judge_dir / "timing.json"
-                        with open(timing_file, "w") as f:
-                            json.dump(
-                                {
-                                    "judge_duration_seconds": 0.0,
-                                    "measured_at": datetime.now(timezone.utc).isoformat(),
-                                    "failed": True,
-                                    "error": str(judge_error),
-                                },
-                                f,
-                                indent=2,
-                            )
-
-                        error_file = judge_dir / "error.log"
-                        error_file.write_text(f"Judge failed: {judge_error}\n")
-
-                        # Continue to next run instead of crashing
-                        continue
-
-                except Exception as e:
-                    logger.error(f"❌ Failed to re-judge {run_dir}: {e}")
-                    continue
+    if rejudged_dirs and not dry_run:
+        index_runs(experiment_dir, rejudged_dirs)
 
 
 def rebuild_tier_results(
@@ -21,15 +21,44 @@
         TierID,
         TierResult,
     )
+    from scylla.e2e.run_index import RunIndex
 
 logger = logging.getLogger(__name__)
 
 
+def _load_indexed_run_results(index: RunIndex, directory: Path) -> dict[str, list[E2ERunResult]]:
+    """Load the run results below a tier or subtest directory from the run index.
+
+    Args:
+        index: Run index of the experiment containing ``directory``
+        directory: Tier or subtest results directory
+
+    Returns:
+        Dict mapping subtest_id -> run results sorted by run_number.
+
+    """
+    from scylla.e2e.models import E2ERunResult
+
+    prefix = f"{index.key(directory)}/"
+    run_results: dict[str, list[E2ERunResult]] = {}
+    for run in index.runs(prefix=prefix):
+        if run.run_result is None or not (index.experiment_dir / run.run_key).is_dir():
+            continue
+        try:
+            run_result = E2ERunResult.model_validate(run.run_result)
+        except Exception as e:
+            logger.warning(f"Skipping invalid indexed run_result.json of {run.run_key}: {e}")
+            continue
+        run_results.setdefault(run.subtest_id, []).append(run_result)
+    return run_results
+
+
 def load_subtest_run_results(results_dir: Path) -> list[E2ERunResult]:
     """Load E2ERunResult objects from results_dir/run_*/run_result.json.
 
     Scans one level deep for run_NN subdirectories, skips .failed directories,
-    and returns a list sorted by run_number.
+    and returns a list sorted by run_number. When the experiment has a run
+    index, the results are read from it instead.
 
     Args:
         results_dir: Subtest results directory (e.g., experiment/T0/00/).
@@ -39,11 +68,16 @@ def load_subtest_run_results(results_dir: Path) -> list[E2ERunResult]:
         or contains no valid run_result.json files.
 
     """
+    from scylla.e2e.run_index import find_run_index
     from scylla.e2e.subtest_executor import _load_run_result
 
     if not results_dir.exists():
         return []
 
+    index = find_run_index(results_dir)
+    if index is not None:
+        return _load_indexed_run_results(index, results_dir).get(results_dir.name, [])
+
     run_results: list[E2ERunResult] = []
     for run_result_path in results_dir.glob("run_*/run_result.json"):
         # Skip .failed directories
@@ -62,8 +96,9 @@ def load_subtest_run_results(results_dir: Path) -> list[E2ERunResult]:
 def load_tier_subtest_results(tier_dir: Path, tier_id: TierID) -> dict[str, SubTestResult]:
     """Load SubTestResult objects for a tier by scanning its subdirectories.
 
-    Walks tier_dir/<subtest_id>/ subdirectories, calls load_subtest_run_results()
-    for each, and aggregates via aggregate_run_results().
+    Walks tier_dir/<subtest_id>/ subdirectories (or queries the experiment's
+    run index), calls load_subtest_run_results() for each, and aggregates via
+    aggregate_run_results().
 
     Args:
         tier_dir: Tier results directory (e.g., experiment/T0/).
@@ -74,21 +109,30 @@ def load_tier_subtest_results(tier_dir: Path, tier_id: TierID) -> dict[str, SubT
         not exist or contains no valid run data.
 
     """
+    from scylla.e2e.run_index import find_run_index
     from scylla.e2e.subtest_executor import aggregate_run_results
 
     if not tier_dir.exists():
         return {}
 
-    subtest_results: dict[str, SubTestResult] = {}
-    for subtest_dir in sorted(tier_dir.iterdir()):
-        if not subtest_dir.is_dir():
-            continue
-        # Skip hidden/special directories
-        if subtest_dir.name.startswith("."):
-            continue
+    index = find_run_index(tier_dir)
+    if index is not None:
+        indexed = _load_indexed_run_results(index, tier_dir)
+        subtest_ids = sorted(indexed)
+    else:
+        subtest_ids = [
+            d.name
+            for d in sorted(tier_dir.iterdir())
+            # Skip hidden/special directories
+            if d.is_dir() and not d.name.startswith(".")
+        ]
 
-        subtest_id = subtest_dir.name
-        runs = load_subtest_run_results(subtest_dir)
+    subtest_results: dict[str, SubTestResult] = {}
+    for subtest_id in subtest_ids:
+        if index is not None:
+            runs = indexed[subtest_id]
+        else:
+            runs = load_subtest_run_results(tier_dir / subtest_id)
         if not runs:
             continue
 
@@ -13,16 +13,20 @@
 
 import logging
 import os
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from enum import Enum
+from itertools import groupby
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, ConfigDict
 
 from scylla.e2e.checkpoint import load_checkpoint, save_checkpoint
 from scylla.e2e.models import E2ERunResult, ExperimentConfig, TierBaseline, TierID
 from scylla.e2e.rerun_base import load_rerun_context, print_dry_run_summary
+from scylla.e2e.run_index import RunIndex, index_runs, open_run_index
 from scylla.e2e.subtest_executor import SubTestExecutor, _commit_test_config
 from scylla.e2e.tier_manager import TierManager
 from scylla.e2e.workspace_manager import WorkspaceManager
@@ -158,6 +162,7 @@ def scan_runs_needing_rerun(  # noqa: C901  # experiment rerun with many retry/s
     run_filter: list[int] | None = None,
     status_filter: list[RunStatus] | None = None,
     stats: RerunStats | None = None,
+    index: RunIndex | None = None,
 ) -> dict[RunStatus, list[RunToRerun]]:
     """Scan experiment directory and classify runs by status.
 
@@ -170,6 +175,8 @@ def scan_runs_needing_rerun(  # noqa: C901  # experiment rerun with many retry/s
         run_filter: Only process these run numbers (e.g., [1, 3, 5])
         status_filter: Only include runs with these statuses
         stats: RerunStats instance to update (optional)
+        index: Run index of the experiment; when given, statuses of indexed
+            run directories are read from it instead of classifying files
 
     Returns:
         Dictionary mapping RunStatus to list of RunToRerun instances
@@ -179,6 +186,9 @@ def scan_runs_needing_rerun(  # noqa: C901  # experiment rerun with many retry/s
         stats = RerunStats()
 
     runs_by_status: dict[RunStatus, list[RunToRerun]] = {status: [] for status in RunStatus}
+    indexed_status = (
+        {run.run_key: RunStatus(run.status) for run in index.runs()} if index is not None else {}
+    )
 
     # Iterate over all tiers to run
     for tier_id in config.tiers_to_run:
@@ -216,8 +226,10 @@ def scan_runs_needing_rerun(  # noqa: C901  # experiment rerun with many retry/s
                 stats.total_expected_runs += 1
                 run_dir = subtest_dir / f"run_{run_number:02d}"
 
-                # Classify run status
-                status = _classify_run_status(run_dir)
+                # Classify run status (from the index when it knows the run)
+                status = indexed_status.get(index.key(run_dir)) if index is not None else None
+                if status is None or not run_dir.is_dir():
+                    status = _classify_run_status(run_dir)
 
                 # Update stats
                 if status == RunStatus.COMPLETED:
@@ -432,6 +444,219 @@ def rerun_single_run(
         return None
 
 
+def _map_runs(
+    fn: Callable[[RunToRerun], Any], runs: list[RunToRerun], parallel: int
+) -> Iterator[Any]:
+    """Apply ``fn`` to ``runs`` on up to ``parallel`` threads, yielding in input order.
+
+    Args:
+        fn: Work for one run
+        runs: Runs to process
+        parallel: Number of worker threads (1 runs inline, without a pool)
+
+    Yields:
+        ``fn(run)`` for each run, in the order of ``runs``
+
+    """
+    if parallel <= 1 or len(runs) <= 1:
+        yield from map(fn, runs)
+        return
+    with ThreadPoolExecutor(max_workers=parallel) as pool:
+        yield from pool.map(fn, runs)
+
+
+def _rebuild_experiment_results(experiment_dir: Path, config: ExperimentConfig) -> None:
+    """Rebuild and save tier/experiment results from all completed run results.
+
+    Args:
+        experiment_dir: Path to experiment directory
+        config: Experiment configuration
+
+    """
+    from scylla.e2e.regenerate import (
+        RegenerateStats,
+        rebuild_experiment_result,
+        rebuild_tier_results,
+        save_all_results,
+        scan_run_results,
+    )
+
+    regenerate_stats = RegenerateStats()
+    run_results = scan_run_results(experiment_dir, regenerate_stats, open_run_index(experiment_dir))
+    if not run_results:
+        return
+
+    tier_results = rebuild_tier_results(run_results, config, regenerate_stats)
+    save_all_results(experiment_dir, rebuild_experiment_result(tier_results, config), config)
+    logger.info(
+        f"Rebuilt results of {regenerate_stats.tiers_processed} tiers from "
+        f"{regenerate_stats.runs_valid} runs"
+    )
+
+
+def _regenerate_run_files(run_info: RunToRerun) -> bool:  # noqa: C901  # two file kinds, many inputs
+    """Regenerate agent/result.json or run_result.json of an agent-complete run.
+
+    Args:
+        run_info: Run with RESULTS status
+
+    Returns:
+        True if a result file was regenerated
+
+    """
+    agent_dir = run_info.run_dir / "agent"
+
+    # Check if agent/result.json is missing
+    if not (agent_dir / "result.json").exists():
+        # Import regenerate function from regenerate_agent_results
+        import json
+
+        try:
+            # Read existing files
+            stdout = (agent_dir / "stdout.log").read_text()
+            stderr = (agent_dir / "stderr.log").read_text()
+
+            with open(agent_dir / "command_log.json") as f:
+                cmd_log = json.load(f)
+
+            # Parse Claude Code JSON output
+            stdout_json = json.loads(stdout.strip())
+            usage = stdout_json.get("usage", {})
+
+            # Build token_stats structure
+            token_stats = {
+                "input_tokens": usage.get("input_tokens", 0),
+                "output_tokens": usage.get("output_tokens", 0),
+                "cache_creation_input_tokens": usage.get("cache_creation_input_tokens", 0),
+                "cache_read_input_tokens": usage.get("cache_read_input_tokens", 0),
+            }
+
+            # Extract cost and exit code
+            cost_usd = stdout_json.get("total_cost_usd", 0.0)
+            exit_code = cmd_log["commands"][0]["exit_code"]
+
+            # Build and save result.json
+            result_data = {
+                "exit_code": exit_code,
+                "stdout": stdout,
+                "stderr": stderr,
+                "token_stats": token_stats,
+                "cost_usd": cost_usd,
+                "api_calls": 1,
+            }
+
+            with open(agent_dir / "result.json", "w") as f:
+                json.dump(result_data, f, indent=2)
+
+            logger.debug(f"Regenerated {agent_dir / 'result.json'}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to regenerate {agent_dir / 'result.json'}: {e}")
+            return False
+
+    # Handle missing run_result.json when agent/result.json exists
+    elif not (run_info.run_dir / "run_result.json").exists():
+        import json
+
+        try:
+            # Read agent result
+            with open(agent_dir / "result.json") as f:
+                agent_result = json.load(f)
+
+            # Read judge result
+            judge_dir = run_info.run_dir / "judge"
+            with open(judge_dir / "result.json") as f:
+                judge_result = json.load(f)
+
+            # Read agent timing
+            with open(agent_dir / "timing.json") as f:
+                agent_timing = json.load(f)
+
+            # Sum judge timings from all judge_NN directories
+            judge_duration_total = 0.0
+            for judge_subdir in sorted(judge_dir.glob("judge_*")):
+                timing_file = judge_subdir / "timing.json"
+                if timing_file.exists():
+                    with open(timing_file) as f:
+                        judge_timing = json.load(f)
+                        judge_duration_total += judge_timing.get("judge_duration_seconds", 0.0)
+
+            # Build judges array from judge_NN directories
+            judges = []
+            for judge_subdir in sorted(judge_dir.glob("judge_*")):
+                judgment_file = judge_subdir / "judgment.json"
+                model_file = judge_subdir / "MODEL.md"
+
+                if judgment_file.exists() and model_file.exists():
+                    # Extract judge number from directory name (judge_01 -> 1)
+                    judge_num = int(judge_subdir.name.split("_")[1])
+
+                    # Read judgment
+                    with open(judgment_file) as f:
+                        judgment = json.load(f)
+
+                    # Extract model from MODEL.md
+                    model_md = model_file.read_text()
+                    model = "unknown"
+                    for line in model_md.split("\n"):
+                        if line.startswith("**Model**:"):
+                            model = line.split(":", 1)[1].strip()
+                            break
+
+                    # Build judge entry
+                    judge_entry = {
+                        "model": model,
+                        "score": judgment.get("score", 0.0),
+                        "passed": judgment.get("passed", False),
+                        "grade": judgment.get("grade", "F"),
+                        "reasoning": judgment.get("reasoning", ""),
+                        "judge_number": judge_num,
+                    }
+                    judges.append(judge_entry)
+
+            # Calculate total duration
+            total_duration = agent_timing.get("agent_duration_seconds", 0.0) + judge_duration_total
+
+            # Build run_result.json
+            token_stats = agent_result.get("token_stats", {})
+            run_result_data = {
+                "run_number": run_info.run_number,
+                "exit_code": agent_result.get("exit_code", 1),
+                "token_stats": token_stats,
+                "tokens_input": (
+                    token_stats.get("input_tokens", 0) + token_stats.get("cache_read_tokens", 0)
+                ),
+                "tokens_output": token_stats.get("output_tokens", 0),
+                "cost_usd": agent_result.get("cost_usd", 0.0),
+                "duration_seconds": total_duration,
+                "agent_duration_seconds": agent_timing.get("agent_duration_seconds", 0.0),
+                "judge_duration_seconds": judge_duration_total,
+                "judge_score": judge_result.get("score", 0.0),
+                "judge_passed": judge_result.get("passed", False),
+                "judge_grade": judge_result.get("grade", "F"),
+                "judge_reasoning": judge_result.get("reasoning", ""),
+                "judges": judges,
+                "workspace_path": str(run_info.run_dir / "workspace"),
+                "logs_path": str(run_info.run_dir / "agent"),
+                "command_log_path": str(run_info.run_dir / "agent" / "command_log.json"),
+                "criteria_scores": judge_result.get("criteria_scores") or {},
+            }
+
+            # Save run_result.json
+            with open(run_info.run_dir / "run_result.json", "w") as f:
+                json.dump(run_result_data, f, indent=2)
+
+            logger.debug(f"Regenerated {run_info.run_dir / 'run_result.json'}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to regenerate {run_info.run_dir / 'run_result.json'}: {e}")
+            return False
+
+    return False
+
+
 def rerun_experiment(  # noqa: C901  # orchestration with many retry/outcome paths
     experiment_dir: Path,
     dry_run: bool = False,
@@ -441,9 +666,13 @@ def rerun_experiment(  # noqa: C901  # orchestration with many retry/outcome pat
     run_filter: list[int] | None = None,
     status_filter: list[RunStatus] | None = None,
     skip_regenerate: bool = False,
+    parallel: int = 1,
 ) -> RerunStats:
     """Re-run agents for failed/missing runs in an experiment.
 
+    Runs of the same tier are re-run by up to ``parallel`` worker threads;
+    tier and experiment results are rebuilt once at the end.
+
     Args:
         experiment_dir: Path to experiment directory
         dry_run: Show what would be done without executing
@@ -453,6 +682,7 @@ def rerun_experiment(  # noqa: C901  # orchestration with many retry/outcome pat
         run_filter: Only process these run numbers (e.g., [1, 3, 5])
         status_filter: Only rerun runs with these statuses
         skip_regenerate: Skip the regenerate step for agent-complete runs
+        parallel: Number of runs to re-execute concurrently (default: 1, sequential)
 
     Returns:
         RerunStats with summary of what was done
@@ -512,6 +742,7 @@ def rerun_experiment(  # noqa: C901  # orchestration with many retry/outcome pat
         run_filter=run_filter,
         status_filter=status_filter,
         stats=stats,
+        index=open_run_index(experiment_dir),
     )
 
     # Print classification summary
@@ -569,203 +800,63 @@ def rerun_experiment(  # noqa: C901  # orchestration with many retry/outcome pat
     logger.info(f"Runs needing agent re-execution: {len(needs_agent_rerun)}")
     logger.info(f"Runs needing regenerate only: {len(needs_regenerate)}")
 
-    # Re-run agents sequentially
-    for run_info in needs_agent_rerun:
+    def rerun(run_info: RunToRerun) -> E2ERunResult | None:
         # Note: Baseline resolution deferred - reruns currently execute without baseline context.
         # This is acceptable for failed runs as they will be re-evaluated independently.
-        baseline = None
-
-        # Execute the rerun
-        run_result = rerun_single_run(
+        return rerun_single_run(
             run_info=run_info,
             experiment_dir=experiment_dir,
             config=config,
             tier_manager=tier_manager,
             workspace_manager=workspace_manager,
-            baseline=baseline,
+            baseline=None,
         )
 
-        if run_result:
-            stats.runs_rerun_success += 1
-
-            # Update checkpoint with pass/fail status based on judge result
-            run_status = "passed" if run_result.judge_passed else "failed"
-            checkpoint.mark_run_completed(
-                tier_id=run_info.tier_id,
-                subtest_id=run_info.subtest_id,
-                run_number=run_info.run_number,
-                status=run_status,
-            )
-            checkpoint.last_updated_at = datetime.now(timezone.utc).isoformat()
-            save_checkpoint(checkpoint, checkpoint_path)
-        else:
-            stats.runs_rerun_failed += 1
-            logger.error(
-                f"Failed to rerun {run_info.tier_id}/{run_info.subtest_id}/"
-                f"run_{run_info.run_number:02d}"
-            )
+    # Re-run agents tier by tier (T5 subtests inherit from earlier tiers), running
+    # up to `parallel` runs of a tier at once. Checkpoint updates stay on this thread.
+    needs_agent_rerun.sort(key=lambda r: (r.tier_id, r.subtest_id, r.run_number))
+    for _, tier_runs in groupby(needs_agent_rerun, key=lambda r: r.tier_id):
+        tier_batch = list(tier_runs)
+        for run_info, run_result in zip(
+            tier_batch, _map_runs(rerun, tier_batch, parallel), strict=True
+        ):
+            if run_result:
+                stats.runs_rerun_success += 1
+
+                # Update checkpoint with pass/fail status based on judge result
+                run_status = "passed" if run_result.judge_passed else "failed"
+                checkpoint.mark_run_completed(
+                    tier_id=run_info.tier_id,
+                    subtest_id=run_info.subtest_id,
+                    run_number=run_info.run_number,
+                    status=run_status,
+                )
+                checkpoint.last_updated_at = datetime.now(timezone.utc).isoformat()
+                save_checkpoint(checkpoint, checkpoint_path)
+            else:
+                stats.runs_rerun_failed += 1
+                logger.error(
+                    f"Failed to rerun {run_info.tier_id}/{run_info.subtest_id}/"
+                    f"run_{run_info.run_number:02d}"
+                )
 
     # Regenerate result files for runs with 'results' status
     if needs_regenerate:
         logger.info(f"Regenerating result files for {len(needs_regenerate)} runs...")
 
-        for run_info in needs_regenerate:
-            agent_dir = run_info.run_dir / "agent"
-
-            # Check if agent/result.json is missing
-            if not (agent_dir / "result.json").exists():
-                # Import regenerate function from regenerate_agent_results
-                import json
+        for regenerated in _map_runs(_regenerate_run_files, needs_regenerate, parallel):
+            if regenerated:
+                stats.runs_regenerated += 1
 
-                try:
-                    # Read existing files
-                    stdout = (agent_dir / "stdout.log").read_text()
-                    stderr = (agent_dir / "stderr.log").read_text()
-
-                    with open(agent_dir / "command_log.json") as f:
-                        cmd_log = json.load(f)
-
-                    # Parse Claude Code JSON output
-                    stdout_json = json.loads(stdout.strip())
-                    usage = stdout_json.get("usage", {})
-
-                    # Build token_stats structure
-                    token_stats = {
-                        "input_tokens": usage.get("input_tokens", 0),
-                        "output_tokens": usage.get("output_tokens", 0),
-                        "cache_creation_input_tokens": usage.get("cache_creation_input_tokens", 0),
-                        "cache_read_input_tokens": usage.get("cache_read_input_tokens", 0),
-                    }
-
-                    # Extract cost and exit code
-                    cost_usd = stdout_json.get("total_cost_usd", 0.0)
-                    exit_code = cmd_log["commands"][0]["exit_code"]
-
-                    # Build and save result.json
-                    result_data = {
-                        "exit_code": exit_code,
-                        "stdout": stdout,
-                        "stderr": stderr,
-                        "token_stats": token_stats,
-                        "cost_usd": cost_usd,
-                        "api_calls": 1,
-                    }
-
-                    with open(agent_dir / "result.json", "w") as f:
-                        json.dump(result_data, f, indent=2)
-
-                    stats.runs_regenerated += 1
-                    logger.debug(f"Regenerated {agent_dir / 'result.json'}")
-
-                except Exception as e:
-                    logger.error(f"Failed to regenerate {agent_dir / 'result.json'}: {e}")
-
-            # Handle missing run_result.json when agent/result.json exists
-            elif not (run_info.run_dir / "run_result.json").exists():
-                import json
-
-                try:
-                    # Read agent result
-                    with open(agent_dir / "result.json") as f:
-                        agent_result = json.load(f)
-
-                    # Read judge result
-                    judge_dir = run_info.run_dir / "judge"
-                    with open(judge_dir / "result.json") as f:
-                        judge_result = json.load(f)
-
-                    # Read agent timing
-                    with open(agent_dir / "timing.json") as f:
-                        agent_timing = json.load(f)
-
-                    # Sum judge timings from all judge_NN directories
-                    judge_duration_total = 0.0
-                    for judge_subdir in sorted(judge_dir.glob("judge_*")):
-                        timing_file = judge_subdir / "timing.json"
-                        if timing_file.exists():
-                            with open(timing_file) as f:
-                                judge_timing = json.load(f)
-                                judge_duration_total += judge_timing.get(
-                                    "judge_duration_seconds", 0.0
-                                )
-
-                    # Build judges array from judge_NN directories
-                    judges = []
-                    for judge_subdir in sorted(judge_dir.glob("judge_*")):
-                        judgment_file = judge_subdir / "judgment.json"
-                        model_file = judge_subdir / "MODEL.md"
-
-                        if judgment_file.exists() and model_file.exists():
-                            # Extract judge number from directory name (judge_01 -> 1)
-                            judge_num = int(judge_subdir.name.split("_")[1])
-
-                            # Read judgment
-                            with open(judgment_file) as f:
-                                judgment = json.load(f)
-
-                            # Extract model from MODEL.md
-                            model_md = model_file.read_text()
-                            model = "unknown"
-                            for line in model_md.split("\n"):
-                                if line.startswith("**Model**:"):
-                                    model = line.split(":", 1)[1].strip()
-                                    break
-
-                            # Build judge entry
-                            judge_entry = {
-                                "model": model,
-                                "score": judgment.get("score", 0.0),
-                                "passed": judgment.get("passed", False),
-                                "grade": judgment.get("grade", "F"),
-                                "reasoning": judgment.get("reasoning", ""),
-                                "judge_number": judge_num,
-                            }
-                            judges.append(judge_entry)
-
-                    # Calculate total duration
-                    total_duration = (
-                        agent_timing.get("agent_duration_seconds", 0.0) + judge_duration_total
-                    )
-
-                    # Build run_result.json
-                    token_stats = agent_result.get("token_stats", {})
-                    run_result_data = {
-                        "run_number": run_info.run_number,
-                        "exit_code": agent_result.get("exit_code", 1),
-                        "token_stats": token_stats,
-                        "tokens_input": (
-                            token_stats.get("input_tokens", 0)
-                            + token_stats.get("cache_read_tokens", 0)
-                        ),
-                        "tokens_output": token_stats.get("output_tokens", 0),
-                        "cost_usd": agent_result.get("cost_usd", 0.0),
-                        "duration_seconds": total_duration,
-                        "agent_duration_seconds": agent_timing.get("agent_duration_seconds", 0.0),
-                        "judge_duration_seconds": judge_duration_total,
-                        "judge_score": judge_result.get("score", 0.0),
-                        "judge_passed": judge_result.get("passed", False),
-                        "judge_grade": judge_result.get("grade", "F"),
-                        "judge_reasoning": judge_result.get("reasoning", ""),
-                        "judges": judges,
-                        "workspace_path": str(run_info.run_dir / "workspace"),
-                        "logs_path": str(run_info.run_dir / "agent"),
-                        "command_log_path": str(run_info.run_dir / "agent" / "command_log.json"),
-                        "criteria_scores": judge_result.get("criteria_scores") or {},
-                    }
-
-                    # Save run_result.json
-                    with open(run_info.run_dir / "run_result.json", "w") as f:
-                        json.dump(run_result_data, f, indent=2)
-
-                    stats.runs_regenerated += 1
-                    logger.debug(f"Regenerated {run_info.run_dir / 'run_result.json'}")
+        logger.info(f"✓ Regenerated {stats.runs_regenerated} result files")
 
-                except Exception as e:
-                    logger.error(
-                        f"Failed to regenerate {run_info.run_dir / 'run_result.json'}: {e}"
-                    )
+    changed_runs = needs_agent_rerun + needs_regenerate
+    if changed_runs:
+        index_runs(experiment_dir, [run_info.run_dir for run_info in changed_runs])
 
-        logger.info(f"✓ Regenerated {stats.runs_regenerated} result files")
+    # Rebuild tier and experiment results once, after every run has finished
+    if stats.runs_rerun_success or stats.runs_regenerated:
+        _rebuild_experiment_results(experiment_dir, config)
 
     stats.print_summary()
     return stats
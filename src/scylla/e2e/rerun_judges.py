@@ -25,7 +25,9 @@
 
 from scylla.e2e.agent_runner import _has_valid_agent_result
 from scylla.e2e.models import ExperimentConfig
+from scylla.e2e.paths import JUDGE_SKIPPED_FILE
 from scylla.e2e.rerun_base import load_rerun_context, print_dry_run_summary
+from scylla.e2e.run_index import IndexedJudge, IndexedRun, RunIndex, index_runs, open_run_index
 from scylla.e2e.tier_manager import TierManager
 from scylla.metrics.grading import assign_letter_grade
 
@@ -41,6 +43,7 @@ class JudgeSlotStatus(Enum):
     COMPLETE = "complete"  # judgment.json exists and is valid
     MISSING = "missing"  # judge_NN/ dir doesn't exist
     FAILED = "failed"  # judge_NN/ exists but judgment.json is invalid/missing
+    SKIPPED = "skipped"  # judge_NN/skipped.json: not started, judge quorum was reached
     AGENT_FAILED = "agent_failed"  # Agent failed, cannot judge
 
 
@@ -56,6 +59,7 @@ class RerunJudgeStats(BaseModel):
     complete: int = 0
     missing: int = 0
     failed: int = 0
+    skipped: int = 0
     agent_failed: int = 0
     slots_rerun_success: int = 0
     slots_rerun_failed: int = 0
@@ -78,7 +82,8 @@ def print_summary(self, judge_models: list[str]) -> None:
             print(
                 f"      ✓ complete: {stats.get('complete', 0):4d}    "
                 f"○ missing: {stats.get('missing', 0):4d}     "
-                f"✗ failed: {stats.get('failed', 0):4d}"
+                f"✗ failed: {stats.get('failed', 0):4d}    "
+                f"- skipped: {stats.get('skipped', 0):4d}"
             )
 
         print()
@@ -156,7 +161,10 @@ def _classify_judge_slots(
         if not judge_slot_dir.exists():
             results.append((judge_num, model, JudgeSlotStatus.MISSING))
         elif not judgment_file.exists():
-            results.append((judge_num, model, JudgeSlotStatus.FAILED))
+            skipped = (judge_slot_dir / JUDGE_SKIPPED_FILE).exists()
+            results.append(
+                (judge_num, model, JudgeSlotStatus.SKIPPED if skipped else JudgeSlotStatus.FAILED)
+            )
         elif _is_valid_judgment(judgment_file):
             results.append((judge_num, model, JudgeSlotStatus.COMPLETE))
         else:
@@ -165,6 +173,41 @@ def _classify_judge_slots(
     return results
 
 
+def _classify_indexed_judge_slots(
+    run: IndexedRun,
+    judges: list[IndexedJudge],
+    judge_models: list[str],
+) -> list[tuple[int, str, JudgeSlotStatus]]:
+    """Classify judge slots from the run index, with the rules of _classify_judge_slots().
+
+    Args:
+        run: Indexed run
+        judges: Indexed judge slots of the run
+        judge_models: List of judge models (used to map judge_num -> model)
+
+    Returns:
+        List of (judge_number, judge_model, status) tuples
+
+    """
+    if not run.agent_valid:
+        return [(i + 1, m, JudgeSlotStatus.AGENT_FAILED) for i, m in enumerate(judge_models)]
+
+    slots = {judge.judge_number: judge for judge in judges}
+    results = []
+    for judge_num, model in enumerate(judge_models, start=1):
+        slot = slots.get(judge_num)
+        if slot is None:
+            results.append((judge_num, model, JudgeSlotStatus.MISSING))
+        elif slot.has_judgment and slot.is_valid:
+            results.append((judge_num, model, JudgeSlotStatus.COMPLETE))
+        elif slot.skipped and not slot.has_judgment:
+            results.append((judge_num, model, JudgeSlotStatus.SKIPPED))
+        else:
+            results.append((judge_num, model, JudgeSlotStatus.FAILED))
+
+    return results
+
+
 def scan_judges_needing_rerun(  # noqa: C901  # judge scan with many filter conditions
     experiment_dir: Path,
     config: ExperimentConfig,
@@ -175,6 +218,7 @@ def scan_judges_needing_rerun(  # noqa: C901  # judge scan with many filter cond
     judge_slot_filter: list[int] | None = None,
     status_filter: list[JudgeSlotStatus] | None = None,
     stats: RerunJudgeStats | None = None,
+    index: RunIndex | None = None,
 ) -> dict[JudgeSlotStatus, list[JudgeSlotToRerun]]:
     """Scan experiment directory and classify judge slots by status.
 
@@ -188,6 +232,8 @@ def scan_judges_needing_rerun(  # noqa: C901  # judge scan with many filter cond
         judge_slot_filter: Only process these judge slots (e.g., [1, 3])
         status_filter: Only include judge slots with these statuses
         stats: RerunJudgeStats instance to update (optional)
+        index: Run index of the experiment; when given, judge slots of indexed
+            run directories are classified from it instead of reading files
 
     Returns:
         Dictionary mapping JudgeSlotStatus to list of JudgeSlotToRerun instances
@@ -199,6 +245,8 @@ def scan_judges_needing_rerun(  # noqa: C901  # judge scan with many filter cond
     slots_by_status: dict[JudgeSlotStatus, list[JudgeSlotToRerun]] = {
         status: [] for status in JudgeSlotStatus
     }
+    indexed_runs = {run.run_key: run for run in index.runs()} if index is not None else {}
+    indexed_judges = index.judges() if index is not None else {}
 
     # Iterate over all tiers to run
     for tier_id in config.tiers_to_run:
@@ -235,8 +283,14 @@ def scan_judges_needing_rerun(  # noqa: C901  # judge scan with many filter cond
 
                 run_dir = subtest_dir / f"run_{run_number:02d}"
 
-                # Classify each judge slot
-                slot_statuses = _classify_judge_slots(run_dir, config.judge_models)
+                # Classify each judge slot (from the index when it knows the run)
+                run = indexed_runs.get(index.key(run_dir)) if index is not None else None
+                if run is not None and run_dir.is_dir():
+                    slot_statuses = _classify_indexed_judge_slots(
+                        run, indexed_judges.get(run.run_key, []), config.judge_models
+                    )
+                else:
+                    slot_statuses = _classify_judge_slots(run_dir, config.judge_models)
 
                 for judge_num, judge_model, status in slot_statuses:
                     # Apply judge slot filter
@@ -252,6 +306,7 @@ def scan_judges_needing_rerun(  # noqa: C901  # judge scan with many filter cond
                             "complete": 0,
                             "missing": 0,
                             "failed": 0,
+                            "skipped": 0,
                             "agent_failed": 0,
                         }
 
@@ -264,6 +319,9 @@ def scan_judges_needing_rerun(  # noqa: C901  # judge scan with many filter cond
                     elif status == JudgeSlotStatus.FAILED:
                         stats.failed += 1
                         stats.per_slot_stats[judge_num]["failed"] += 1
+                    elif status == JudgeSlotStatus.SKIPPED:
+                        stats.skipped += 1
+                        stats.per_slot_stats[judge_num]["skipped"] += 1
                     elif status == JudgeSlotStatus.AGENT_FAILED:
                         stats.agent_failed += 1
                         stats.per_slot_stats[judge_num]["agent_failed"] += 1
@@ -283,6 +341,9 @@ def scan_judges_needing_rerun(  # noqa: C901  # judge scan with many filter cond
                         JudgeSlotStatus.FAILED: (
                             f"Judge {judge_num} ran but failed (no valid judgment.json)"
                         ),
+                        JudgeSlotStatus.SKIPPED: (
+                            f"Judge {judge_num} skipped (judge quorum reached, no action needed)"
+                        ),
                         JudgeSlotStatus.AGENT_FAILED: "Agent failed, cannot judge",
                     }
 
@@ -316,16 +377,17 @@ def _rerun_single_judge_slot(
         True if judge slot was successfully re-run
 
     """
-    from scylla.e2e.llm_judge import run_llm_judge
+    from scylla.e2e.llm_judge import load_saved_judge_prompt, run_llm_judge
 
     run_dir = slot.run_dir
     judge_dir = run_dir / "judge"
     judge_dir.mkdir(exist_ok=True)
 
-    # Check if saved judge_prompt.md exists (from original run)
+    # Reuse the prompt saved by the original run (judge_prompt.md or judge_context.json)
     saved_judge_prompt_path = run_dir / "judge_prompt.md"
+    judge_prompt = load_saved_judge_prompt(run_dir)
 
-    if saved_judge_prompt_path.exists():
+    if judge_prompt is not None:
         # Reuse the original judge prompt to avoid rebuilding from potentially corrupted workspace
         logger.info(
             f"Re-running judge slot {slot.judge_number} for "
@@ -333,7 +395,6 @@ def _rerun_single_judge_slot(
             f"with model {slot.judge_model} (using saved prompt)"
         )
 
-        judge_prompt = saved_judge_prompt_path.read_text()
         workspace = run_dir / "workspace"
 
         # Run judge using the saved prompt directly
@@ -394,7 +455,9 @@ def _rerun_single_judge_slot(
             return False
 
     else:
-        # Fallback: rebuild from workspace (old behavior, but log warning)
+        # Fallback: rebuild from workspace (old behavior, but log warning). The
+        # rebuilt context is cached in judge_context.json, so the other slots of
+        # this run reuse it instead of rebuilding.
         logger.warning(
             f"Saved judge_prompt.md not found at {saved_judge_prompt_path}, "
             f"rebuilding from workspace (may be inaccurate if workspace was recreated)"
@@ -652,6 +715,7 @@ def rerun_judges_experiment(  # noqa: C901  # judge rerun with many retry/skip p
         judge_slot_filter=judge_slot_filter,
         status_filter=status_filter,
         stats=stats,
+        index=open_run_index(experiment_dir),
     )
 
     # Print classification summary
@@ -687,6 +751,8 @@ def rerun_judges_experiment(  # noqa: C901  # judge rerun with many retry/skip p
         for run_dir in sorted(runs_to_regenerate):
             if _regenerate_consensus(run_dir, config.judge_models):
                 stats.consensus_regenerated += 1
+        if runs_to_regenerate:
+            index_runs(experiment_dir, sorted(runs_to_regenerate))
 
         stats.print_summary(config.judge_models)
         return stats
@@ -702,7 +768,7 @@ def rerun_judges_experiment(  # noqa: C901  # judge rerun with many retry/skip p
         stats.print_summary(config.judge_models)
         return stats
 
-    # Determine which judge slots to rerun (exclude complete and agent_failed)
+    # Determine which judge slots to rerun (exclude complete, skipped and agent_failed)
     needs_judge_rerun = []
     for status in [JudgeSlotStatus.MISSING, JudgeSlotStatus.FAILED]:
         needs_judge_rerun.extend(slots_by_status[status])
@@ -768,5 +834,8 @@ def rerun_judges_experiment(  # noqa: C901  # judge rerun with many retry/skip p
             if _regenerate_consensus(run_dir, config.judge_models):
                 stats.consensus_regenerated += 1
 
+        # Failed slots changed on disk too (new judge_NN dirs, error logs)
+        index_runs(experiment_dir, sorted({slot.run_dir for slot in needs_judge_rerun}))
+
     stats.print_summary(config.judge_models)
     return stats
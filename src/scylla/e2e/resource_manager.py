@@ -1,9 +1,25 @@
 """Thread-safe resource management for concurrent E2E experiment runs.
 
-Provides context managers for three resource types:
+Provides context managers for five resource classes, each a bounded queue:
 - workspace_slot: Limits concurrent git worktrees (disk I/O protection)
-- agent_slot: Limits concurrent claude CLI processes (RAM protection)
-- pipeline_slot: Serializes heavy build pipeline executions (CPU protection)
+- agent_slot: Limits concurrent agent claude CLI processes (RAM protection)
+- judge_slot: Limits concurrent judge claude CLI processes (RAM protection);
+  shares the agent queue unless given its own limit
+- pipeline_slot: Weighted CPU budget shared by build pipeline steps
+- git_slot: Limits concurrent git-heavy run stages (worktree, commit, diff)
+
+By default judges draw from the agent queue, so the agent limit bounds every
+claude CLI process. With ``max_judges`` they get a queue of their own and
+concurrent runs pipeline: run N's judge executes while run N+1's agent holds an
+agent slot, at the cost of up to ``max_agents + max_judges`` CLI processes.
+Each queue records its depth (threads waiting) and utilization (time-averaged
+fraction of slots in use); see :meth:`ResourceManager.stats`.
+
+The pipeline queue is weighted: its limit is a budget of units (one per CPU by
+default) and each build pipeline step declares its cost, so light steps such as
+``ruff check`` run side by side while a heavy ``bazel build`` holds the whole
+budget. Waiters are granted strictly in arrival order, so a heavy step is never
+starved by a stream of light ones.
 
 Usage:
     rm = ResourceManager(max_workspaces=16, max_agents=6)
@@ -12,8 +28,10 @@
         # create and use worktree
         with rm.agent_slot():
             # run claude CLI
-        with rm.pipeline_slot():
-            # run mojo build / pytest / ruff
+        with rm.pipeline_slot(weight=1):
+            # run ruff check
+
+    logger.info(rm.format_stats())
 
 All context managers guarantee release on any exception (including
 ShutdownInterruptedError), preventing semaphore leaks that cause hangs.
@@ -25,10 +43,143 @@
 import logging
 import os
 import threading
+import time
+from collections import deque
 from collections.abc import Generator
+from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# Resource class names, in reporting order
+WORKSPACE = "workspace"
+AGENT = "agent"
+JUDGE = "judge"
+PIPELINE = "pipeline"
+GIT = "git"
+
+
+@dataclass(frozen=True)
+class ResourceUsage:
+    """Snapshot of one resource queue.
+
+    Attributes:
+        name: Resource class name
+        limit: Maximum concurrent holders (budget units for weighted queues)
+        in_use: Slots (budget units) currently held
+        waiting: Threads currently queued for a slot
+        peak_waiting: Largest queue depth observed
+        acquisitions: Number of slots granted so far
+        mean_wait_seconds: Average time spent queued per acquisition
+        utilization: Time-averaged fraction of slots in use since creation
+
+    """
+
+    name: str
+    limit: int
+    in_use: int
+    waiting: int
+    peak_waiting: int
+    acquisitions: int
+    mean_wait_seconds: float
+    utilization: float
+
+
+class _ResourceQueue:
+    """Bounded FIFO budget that tracks queue depth, wait time and utilization.
+
+    Each holder takes ``weight`` units of the ``limit`` (1 for plain slots).
+    """
+
+    def __init__(self, name: str, limit: int) -> None:
+        self.name = name
+        self.limit = limit
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._queue: deque[object] = deque()  # Waiter tickets in arrival order
+        self._created = time.monotonic()
+        self._last_change = self._created
+        self._slot_seconds = 0.0  # Integral of in_use over time
+        self._in_use = 0  # Budget units held
+        self._waiting = 0
+        self._peak_waiting = 0
+        self._acquisitions = 0
+        self._wait_seconds = 0.0
+
+    def _advance(self, now: float) -> None:
+        """Accumulate slot-seconds up to ``now`` (caller holds ``_lock``)."""
+        self._slot_seconds += self._in_use * (now - self._last_change)
+        self._last_change = now
+
+    @contextlib.contextmanager
+    def slot(
+        self, timeout: float | None, hint: str = "", weight: int = 1
+    ) -> Generator[None, None, None]:
+        """Hold ``weight`` units of the budget for the duration of the ``with`` block.
+
+        Args:
+            timeout: Max seconds to wait for a slot, or None to wait indefinitely.
+            hint: Extra text appended to the timeout error message.
+            weight: Budget units to hold; clamped to ``[1, limit]``.
+
+        Raises:
+            TimeoutError: If no slot becomes available within timeout.
+
+        """
+        weight = max(1, min(weight, self.limit))
+        ticket = object()
+        queued_at = time.monotonic()
+        with self._cond:
+            self._queue.append(ticket)
+            self._waiting += 1
+            self._peak_waiting = max(self._peak_waiting, self._waiting)
+            try:
+                acquired = self._cond.wait_for(
+                    lambda: self._queue[0] is ticket and self._in_use + weight <= self.limit,
+                    timeout=timeout,
+                )
+            finally:
+                self._queue.remove(ticket)
+                self._waiting -= 1
+                # The head changed: let the next waiter re-check its turn
+                self._cond.notify_all()
+            if acquired:
+                now = time.monotonic()
+                self._advance(now)
+                self._in_use += weight
+                self._acquisitions += 1
+                self._wait_seconds += now - queued_at
+        if not acquired:
+            raise TimeoutError(
+                f"No {self.name} slot available after {timeout}s (limit: {self.limit}).{hint}"
+            )
+
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._advance(time.monotonic())
+                self._in_use -= weight
+                self._cond.notify_all()
+
+    def usage(self) -> ResourceUsage:
+        """Return a snapshot of this queue."""
+        with self._lock:
+            now = time.monotonic()
+            self._advance(now)
+            elapsed = now - self._created
+            return ResourceUsage(
+                name=self.name,
+                limit=self.limit,
+                in_use=self._in_use,
+                waiting=self._waiting,
+                peak_waiting=self._peak_waiting,
+                acquisitions=self._acquisitions,
+                mean_wait_seconds=(
+                    self._wait_seconds / self._acquisitions if self._acquisitions else 0.0
+                ),
+                utilization=self._slot_seconds / (self.limit * elapsed) if elapsed > 0 else 0.0,
+            )
+
 
 class ResourceManager:
     """Thread-safe resource limiter for concurrent experiment runs.
@@ -41,6 +192,11 @@ class ResourceManager:
         max_agents: Max concurrent claude CLI processes.
             Default: min(threads, cpu_count).
         threads: Number of batch threads (used for default agent limit).
+        max_judges: Max concurrent judge claude CLI processes, in a queue separate
+            from the agents. Default: judges share the agent slots.
+        max_git_ops: Max concurrent git-heavy run stages. Default: cpu_count.
+        pipeline_budget: Build pipeline budget units shared by all pipeline
+            steps. Default: cpu_count.
 
     """
 
@@ -49,6 +205,9 @@ def __init__(
         max_workspaces: int | None = None,
         max_agents: int | None = None,
         threads: int = 4,
+        max_judges: int | None = None,
+        max_git_ops: int | None = None,
+        pipeline_budget: int | None = None,
     ) -> None:
         """Initialize resource limits.
 
@@ -57,25 +216,46 @@ def __init__(
             max_agents: Max concurrent claude CLI processes.
                 Default: min(threads, cpu_count).
             threads: Number of batch threads (used for default agent limit).
+            max_judges: Max concurrent judge claude CLI processes, in a queue
+                separate from the agents. Default: judges share the agent slots.
+            max_git_ops: Max concurrent git-heavy run stages. Default: cpu_count.
+            pipeline_budget: Build pipeline budget units shared by all pipeline
+                steps. Default: cpu_count.
 
         """
         cpu_count = os.cpu_count() or 4
 
         self._ws_limit = max_workspaces if max_workspaces else cpu_count * 2
         self._agent_limit = max_agents if max_agents else min(threads, cpu_count)
+        self._git_limit = max_git_ops if max_git_ops else cpu_count
+        self._pipeline_budget = pipeline_budget if pipeline_budget else cpu_count
 
-        self._workspace_sem = threading.Semaphore(self._ws_limit)
-        self._agent_sem = threading.Semaphore(self._agent_limit)
-        self._pipeline_lock = threading.Lock()
+        agent_queue = _ResourceQueue(AGENT, self._agent_limit)
+        self._queues = {
+            WORKSPACE: _ResourceQueue(WORKSPACE, self._ws_limit),
+            AGENT: agent_queue,
+            # Without a judge limit, judges take agent slots so the agent limit
+            # bounds all claude CLI processes
+            JUDGE: _ResourceQueue(JUDGE, max_judges) if max_judges else agent_queue,
+            PIPELINE: _ResourceQueue(PIPELINE, self._pipeline_budget),
+            GIT: _ResourceQueue(GIT, self._git_limit),
+        }
 
         logger.info(
             f"ResourceManager initialized: "
             f"max_workspaces={self._ws_limit}, "
-            f"max_agents={self._agent_limit}"
+            f"max_agents={self._agent_limit}, "
+            f"max_judges={max_judges if max_judges else 'shared with agents'}, "
+            f"max_git_ops={self._git_limit}, "
+            f"pipeline_budget={self._pipeline_budget}"
         )
 
-    @contextlib.contextmanager
-    def workspace_slot(self, timeout: float = 300) -> Generator[None, None, None]:
+    @property
+    def workspace_limit(self) -> int:
+        """Maximum number of concurrent live workspaces."""
+        return self._ws_limit
+
+    def workspace_slot(self, timeout: float = 300) -> contextlib.AbstractContextManager[None]:
         """Acquire a workspace slot, guaranteeing release on any exception.
 
         Args:
@@ -85,19 +265,9 @@ def workspace_slot(self, timeout: float = 300) -> Generator[None, None, None]:
             TimeoutError: If no slot becomes available within timeout.
 
         """
-        acquired = self._workspace_sem.acquire(timeout=timeout)
-        if not acquired:
-            raise TimeoutError(
-                f"No workspace slot available after {timeout}s "
-                f"(limit: {self._ws_limit}). Check for leaked slots from crashed runs."
-            )
-        try:
-            yield
-        finally:
-            self._workspace_sem.release()
+        return self._queues[WORKSPACE].slot(timeout, " Check for leaked slots from crashed runs.")
 
-    @contextlib.contextmanager
-    def agent_slot(self, timeout: float = 600) -> Generator[None, None, None]:
+    def agent_slot(self, timeout: float = 600) -> contextlib.AbstractContextManager[None]:
         """Acquire an agent slot, guaranteeing release on any exception.
 
         Args:
@@ -107,23 +277,86 @@ def agent_slot(self, timeout: float = 600) -> Generator[None, None, None]:
             TimeoutError: If no slot becomes available within timeout.
 
         """
-        acquired = self._agent_sem.acquire(timeout=timeout)
-        if not acquired:
-            raise TimeoutError(
-                f"No agent slot available after {timeout}s "
-                f"(limit: {self._agent_limit}). Check for leaked slots from crashed runs."
-            )
-        try:
-            yield
-        finally:
-            self._agent_sem.release()
+        return self._queues[AGENT].slot(timeout, " Check for leaked slots from crashed runs.")
 
-    @contextlib.contextmanager
-    def pipeline_slot(self) -> Generator[None, None, None]:
-        """Acquire exclusive access to the build pipeline.
+    def judge_slot(self, timeout: float = 600) -> contextlib.AbstractContextManager[None]:
+        """Acquire a judge slot, guaranteeing release on any exception.
+
+        Args:
+            timeout: Max seconds to wait for a slot. Default: 600 (10 min).
+
+        Raises:
+            TimeoutError: If no slot becomes available within timeout.
 
-        Serializes heavy executions (mojo build, pytest, ruff, pre-commit)
-        across all concurrent threads.
         """
-        with self._pipeline_lock:
-            yield
+        return self._queues[JUDGE].slot(timeout, " Check for leaked slots from crashed runs.")
+
+    @property
+    def pipeline_budget(self) -> int:
+        """Total build pipeline budget units."""
+        return self._pipeline_budget
+
+    def pipeline_slot(self, weight: int | None = 1) -> contextlib.AbstractContextManager[None]:
+        """Acquire ``weight`` units of the build pipeline budget.
+
+        Pipeline steps declare their cost (see
+        ``build_pipeline.PIPELINE_STEP_COSTS``); light steps share the budget
+        while heavy ones are bounded by it. Waits indefinitely.
+
+        Args:
+            weight: Budget units to hold (default 1), or None for the whole
+                budget, i.e. exclusive access to the build pipeline.
+
+        """
+        queue = self._queues[PIPELINE]
+        return queue.slot(None, weight=queue.limit if weight is None else weight)
+
+    def git_slot(self, timeout: float = 300) -> contextlib.AbstractContextManager[None]:
+        """Acquire a slot for a git-heavy run stage (worktree, commit, diff).
+
+        Args:
+            timeout: Max seconds to wait for a slot. Default: 300 (5 min).
+
+        Raises:
+            TimeoutError: If no slot becomes available within timeout.
+
+        """
+        return self._queues[GIT].slot(timeout)
+
+    def slot(self, resource: str) -> contextlib.AbstractContextManager[None]:
+        """Acquire a slot of the named resource class with its default timeout.
+
+        Args:
+            resource: One of ``"workspace"``, ``"agent"``, ``"judge"``,
+                ``"pipeline"`` or ``"git"``.
+
+        Raises:
+            KeyError: If ``resource`` is not a known resource class.
+
+        """
+        acquire = {
+            WORKSPACE: self.workspace_slot,
+            AGENT: self.agent_slot,
+            JUDGE: self.judge_slot,
+            PIPELINE: self.pipeline_slot,
+            GIT: self.git_slot,
+        }[resource]
+        return acquire()
+
+    def stats(self) -> dict[str, ResourceUsage]:
+        """Return current depth and utilization of every resource queue.
+
+        The judge queue is only listed when it is separate from the agent queue.
+        """
+        return {name: queue.usage() for name, queue in self._queues.items() if queue.name == name}
+
+    def format_stats(self) -> str:
+        """Format :meth:`stats` as a table for logging."""
+        lines = ["Resource queues (limit, in use, waiting, peak wait, mean wait, utilization):"]
+        for usage in self.stats().values():
+            lines.append(
+                f"  {usage.name:<10} {usage.limit:>3} {usage.in_use:>4} {usage.waiting:>4} "
+                f"{usage.peak_waiting:>4} {usage.mean_wait_seconds:>8.1f}s "
+                f"{usage.utilization:>6.1%}"
+            )
+        return "\n".join(lines)
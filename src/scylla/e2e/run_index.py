@@ -0,0 +1,541 @@
+"""Experiment-level SQLite index of runs and judge slots.
+
+Rehydration, regeneration and the rerun scanners need to answer questions such
+as "which runs lack a valid judgment" or "give me every finalized run of this
+subtest".  Walking the experiment tree and re-parsing every ``run_result.json``
+and ``judgment.json`` for each question is slow on large experiments, so
+:class:`RunIndex` keeps one row per run directory (status, agent validity,
+scores, cost, artifact paths and the ``E2ERunResult`` fields of
+``run_result.json``) plus one row per ``judge/judge_NN`` slot in
+``<experiment_dir>/run_index.db``.
+
+The index is built from disk the first time it is opened and is then
+maintained incrementally: ``stage_finalize_run()``, promotion to
+``completed/`` and the rerun/rejudge/regenerate flows call :func:`index_runs`
+for the run directories they change.  Edits made outside of Scylla (deleting
+or copying run directories by hand) are not seen until the index is rebuilt
+with ``manage_experiment.py reindex <experiment_dir>``.
+
+Run directories are keyed by their path relative to the experiment directory,
+e.g. ``completed/T0/00/run_01``; runs of the legacy flat layout
+(``T0/00/run_01``) are indexed with an empty phase.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from scylla.e2e.paths import COMPLETED_DIR, IN_PROGRESS_DIR, JUDGE_SKIPPED_FILE
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "run_index.db"
+
+# Bump whenever the schema or the meaning of a column changes; older indexes
+# are rebuilt from disk on first use.
+INDEX_VERSION = 2
+
+_RUN_DIR_PATTERN = re.compile(r"run_\d+")
+_JUDGE_DIR_PATTERN = re.compile(r"judge_(\d+)")
+
+# Seconds to wait for another process holding the index write lock
+_BUSY_TIMEOUT = 300.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS runs (
+    run_key TEXT PRIMARY KEY,
+    phase TEXT NOT NULL,
+    tier_id TEXT NOT NULL,
+    subtest_id TEXT NOT NULL,
+    run_number INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    agent_valid INTEGER NOT NULL,
+    has_run_result INTEGER NOT NULL,
+    run_result TEXT,
+    exit_code INTEGER,
+    judge_score REAL,
+    judge_passed INTEGER,
+    judge_grade TEXT,
+    cost_usd REAL,
+    duration_seconds REAL,
+    workspace_path TEXT,
+    logs_path TEXT,
+    command_log_path TEXT,
+    indexed_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_by_subtest ON runs (phase, tier_id, subtest_id, run_number);
+CREATE TABLE IF NOT EXISTS judges (
+    run_key TEXT NOT NULL,
+    judge_number INTEGER NOT NULL,
+    has_judgment INTEGER NOT NULL,
+    is_valid INTEGER NOT NULL,
+    skipped INTEGER NOT NULL,
+    score REAL,
+    PRIMARY KEY (run_key, judge_number)
+);
+"""
+
+_RUN_COLUMNS = (
+    "run_key, phase, tier_id, subtest_id, run_number, status, agent_valid, has_run_result, "
+    "run_result, exit_code, judge_score, judge_passed, judge_grade, cost_usd, "
+    "duration_seconds, workspace_path, logs_path, command_log_path, indexed_at"
+)
+
+# Serializes rebuilds within a process; other processes wait on the SQLite lock.
+_build_locks: dict[Path, threading.Lock] = {}
+_build_locks_guard = threading.Lock()
+
+
+def _build_lock(path: Path) -> threading.Lock:
+    with _build_locks_guard:
+        return _build_locks.setdefault(path, threading.Lock())
+
+
+@dataclass(frozen=True)
+class IndexedRun:
+    """One indexed run directory.
+
+    Attributes:
+        run_key: Run directory relative to the experiment directory
+        phase: "completed", "in_progress", or "" for the legacy flat layout
+        tier_id: Tier identifier (e.g. "T0")
+        subtest_id: Subtest identifier (e.g. "00")
+        run_number: 1-based run number
+        status: ``RunStatus`` value from ``rerun._classify_run_status()``
+        agent_valid: Whether agent/result.json holds a valid agent result
+        has_run_result: Whether run_result.json exists
+        run_result: E2ERunResult fields of run_result.json, or None if it is
+            missing or not valid JSON
+        judge_score: Consensus score from run_result.json
+        judge_passed: Consensus pass/fail from run_result.json
+        cost_usd: Run cost from run_result.json
+
+    """
+
+    run_key: str
+    phase: str
+    tier_id: str
+    subtest_id: str
+    run_number: int
+    status: str
+    agent_valid: bool
+    has_run_result: bool
+    run_result: dict[str, Any] | None
+    judge_score: float | None
+    judge_passed: bool | None
+    cost_usd: float | None
+
+
+@dataclass(frozen=True)
+class IndexedJudge:
+    """One ``judge/judge_NN`` slot of an indexed run.
+
+    Attributes:
+        judge_number: 1-based judge slot number
+        has_judgment: Whether judgment.json exists
+        is_valid: Whether judgment.json has a score and is not marked invalid
+        skipped: Whether the slot has a skipped.json marker (judge quorum reached)
+        score: Score from judgment.json, if any
+
+    """
+
+    judge_number: int
+    has_judgment: bool
+    is_valid: bool
+    skipped: bool
+    score: float | None
+
+
+def _read_judgment(judgment_file: Path) -> tuple[bool, float | None]:
+    """Return (is_valid, score) with the same rules as rerun_judges._is_valid_judgment()."""
+    try:
+        data = json.loads(judgment_file.read_text())
+    except (OSError, ValueError):
+        return False, None
+    if not isinstance(data, dict):
+        return False, None
+    score = data.get("score")
+    is_valid = "score" in data and data.get("is_valid", True) is not False
+    return is_valid, float(score) if isinstance(score, int | float) else None
+
+
+def _read_run_result(run_result_file: Path) -> dict[str, Any] | None:
+    """Return the E2ERunResult fields of run_result.json, or None if unreadable."""
+    from scylla.e2e.models import E2ERunResult
+
+    try:
+        data = json.loads(run_result_file.read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    known_fields = E2ERunResult.model_fields.keys()
+    return {k: v for k, v in data.items() if k in known_fields}
+
+
+def _run_row(run_key: str, run_dir: Path) -> tuple[Any, ...]:
+    """Classify one run directory into a ``runs`` row."""
+    from scylla.e2e.agent_runner import _has_valid_agent_result
+    from scylla.e2e.rerun import _classify_run_status
+
+    *phase_parts, tier_id, subtest_id, run_name = run_key.split("/")
+    run_result_file = run_dir / "run_result.json"
+    has_run_result = run_result_file.exists()
+    data = _read_run_result(run_result_file) if has_run_result else None
+    fields = data or {}
+
+    def number(key: str) -> float | None:
+        value = fields.get(key)
+        return float(value) if isinstance(value, int | float) else None
+
+    passed = fields.get("judge_passed")
+    return (
+        run_key,
+        phase_parts[0] if phase_parts else "",
+        tier_id,
+        subtest_id,
+        int(run_name.split("_")[1]),
+        _classify_run_status(run_dir).value,
+        int(_has_valid_agent_result(run_dir)),
+        int(has_run_result),
+        json.dumps(data) if data is not None else None,
+        fields.get("exit_code") if isinstance(fields.get("exit_code"), int) else None,
+        number("judge_score"),
+        int(passed) if isinstance(passed, bool) else None,
+        fields.get("judge_grade"),
+        number("cost_usd"),
+        number("duration_seconds"),
+        fields.get("workspace_path"),
+        fields.get("logs_path"),
+        fields.get("command_log_path"),
+        datetime.now(timezone.utc).isoformat(),
+    )
+
+
+def _judge_rows(run_key: str, run_dir: Path) -> list[tuple[Any, ...]]:
+    """Return one ``judges`` row per judge/judge_NN directory of a run."""
+    judge_dir = run_dir / "judge"
+    if not judge_dir.is_dir():
+        return []
+    rows = []
+    for slot_dir in sorted(judge_dir.iterdir()):
+        match = _JUDGE_DIR_PATTERN.fullmatch(slot_dir.name)
+        if match is None or not slot_dir.is_dir():
+            continue
+        judgment_file = slot_dir / "judgment.json"
+        has_judgment = judgment_file.exists()
+        is_valid, score = _read_judgment(judgment_file) if has_judgment else (False, None)
+        skipped = (slot_dir / JUDGE_SKIPPED_FILE).exists()
+        rows.append(
+            (run_key, int(match.group(1)), int(has_judgment), int(is_valid), int(skipped), score)
+        )
+    return rows
+
+
+def iter_run_dirs(experiment_dir: Path) -> Iterator[Path]:
+    """Yield every run directory of an experiment.
+
+    Covers ``completed/``, ``in_progress/`` and the legacy flat layout;
+    ``.failed/`` archives and other hidden directories are skipped.
+
+    Args:
+        experiment_dir: Experiment directory
+
+    Yields:
+        Run directories (``<tier>/<subtest>/run_NN``)
+
+    """
+    roots = [experiment_dir / COMPLETED_DIR, experiment_dir / IN_PROGRESS_DIR, experiment_dir]
+    for root in roots:
+        if not root.is_dir():
+            continue
+        for tier_dir in sorted(root.iterdir()):
+            if not tier_dir.name.startswith("T") or not tier_dir.is_dir():
+                continue
+            for subtest_dir in sorted(tier_dir.iterdir()):
+                if subtest_dir.name.startswith(".") or not subtest_dir.is_dir():
+                    continue
+                for run_dir in sorted(subtest_dir.iterdir()):
+                    if _RUN_DIR_PATTERN.fullmatch(run_dir.name) and run_dir.is_dir():
+                        yield run_dir
+
+
+class RunIndex:
+    """SQLite index of an experiment's run directories.
+
+    Each method opens its own connection, so an instance may be shared across
+    threads; concurrent writers (threads or processes) are serialized by
+    SQLite's database lock.
+
+    Attributes:
+        experiment_dir: Experiment directory the index describes
+        path: Location of the SQLite database
+
+    """
+
+    def __init__(self, experiment_dir: Path) -> None:
+        """Bind the index of ``experiment_dir`` (nothing is read or created yet).
+
+        Args:
+            experiment_dir: Experiment directory
+
+        """
+        self.experiment_dir = experiment_dir
+        self.path = experiment_dir / INDEX_FILENAME
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=_BUSY_TIMEOUT, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection holding the database write lock until commit."""
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def is_built(self) -> bool:
+        """Whether the database exists and was fully built by this index version."""
+        if not self.path.exists():
+            return False
+        try:
+            with self._connect() as conn:
+                row = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        except sqlite3.Error:
+            return False
+        return row is not None and row[0] == str(INDEX_VERSION)
+
+    def ensure_built(self) -> None:
+        """Build the index from disk unless an up-to-date one exists."""
+        if self.is_built():
+            return
+        with _build_lock(self.path):
+            if not self.is_built():
+                self.rebuild()
+
+    def rebuild(self) -> int:
+        """Re-index every run directory of the experiment from disk.
+
+        Returns:
+            Number of run directories indexed
+
+        """
+        if self.path.exists():
+            try:
+                self._drop_stale_schema()
+            except sqlite3.DatabaseError:
+                logger.warning(f"Replacing unreadable run index {self.path}")
+                self.path.unlink()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+        with self._write() as conn:
+            conn.execute("DELETE FROM meta WHERE key = 'version'")
+            conn.execute("DELETE FROM runs")
+            conn.execute("DELETE FROM judges")
+            count = 0
+            for run_dir in iter_run_dirs(self.experiment_dir):
+                self._upsert(conn, run_dir)
+                count += 1
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?), ('built_at', ?)",
+                (str(INDEX_VERSION), datetime.now(timezone.utc).isoformat()),
+            )
+        logger.debug(f"Indexed {count} run directories of {self.experiment_dir}")
+        return count
+
+    def _drop_stale_schema(self) -> None:
+        """Drop tables written by an older index version."""
+        with self._connect() as conn:
+            tables = {
+                name
+                for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+            }
+            version = None
+            if "meta" in tables:
+                row = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+                version = row[0] if row else None
+            if version not in (None, str(INDEX_VERSION)):
+                conn.executescript(
+                    "DROP TABLE IF EXISTS runs; DROP TABLE IF EXISTS judges; "
+                    "DROP TABLE IF EXISTS meta;"
+                )
+
+    def key(self, path: Path) -> str:
+        """Return the index key (experiment-relative POSIX path) of a directory."""
+        return path.relative_to(self.experiment_dir).as_posix()
+
+    def _upsert(self, conn: sqlite3.Connection, run_dir: Path) -> None:
+        run_key = self.key(run_dir)
+        conn.execute("DELETE FROM judges WHERE run_key = ?", (run_key,))
+        if not run_dir.is_dir():
+            conn.execute("DELETE FROM runs WHERE run_key = ?", (run_key,))
+            return
+        placeholders = ", ".join("?" * len(_RUN_COLUMNS.split(",")))
+        conn.execute(
+            f"INSERT OR REPLACE INTO runs ({_RUN_COLUMNS}) VALUES ({placeholders})",
+            _run_row(run_key, run_dir),
+        )
+        conn.executemany(
+            "INSERT INTO judges (run_key, judge_number, has_judgment, is_valid, skipped, score) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            _judge_rows(run_key, run_dir),
+        )
+
+    def record_runs(self, run_dirs: Iterable[Path]) -> None:
+        """Re-index run directories after they changed on disk.
+
+        Directories that no longer exist (moved to ``.failed/``, deleted) are
+        removed from the index.
+
+        Args:
+            run_dirs: Run directories inside the experiment directory
+
+        """
+        self.ensure_built()
+        with self._write() as conn:
+            for run_dir in run_dirs:
+                self._upsert(conn, run_dir)
+
+    def runs(self, prefix: str | None = None) -> list[IndexedRun]:
+        """Return indexed runs, ordered by phase, tier, subtest and run number.
+
+        Args:
+            prefix: Only runs whose key starts with this path prefix
+                (e.g. "completed/" or "completed/T0/00/")
+
+        Returns:
+            Matching runs
+
+        """
+        query = (
+            "SELECT run_key, phase, tier_id, subtest_id, run_number, status, agent_valid, "
+            "has_run_result, run_result, judge_score, judge_passed, cost_usd FROM runs"
+        )
+        params: tuple[str, ...] = ()
+        if prefix:
+            query += " WHERE substr(run_key, 1, length(?)) = ?"
+            params = (prefix, prefix)
+        query += " ORDER BY phase, tier_id, subtest_id, run_number"
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [
+            IndexedRun(
+                run_key=row[0],
+                phase=row[1],
+                tier_id=row[2],
+                subtest_id=row[3],
+                run_number=row[4],
+                status=row[5],
+                agent_valid=bool(row[6]),
+                has_run_result=bool(row[7]),
+                run_result=json.loads(row[8]) if row[8] is not None else None,
+                judge_score=row[9],
+                judge_passed=bool(row[10]) if row[10] is not None else None,
+                cost_usd=row[11],
+            )
+            for row in rows
+        ]
+
+    def judges(self, prefix: str | None = None) -> dict[str, list[IndexedJudge]]:
+        """Return the judge slots of indexed runs, keyed by run key.
+
+        Args:
+            prefix: Only runs whose key starts with this path prefix
+
+        Returns:
+            Mapping of run key to its judge slots, ordered by judge number
+
+        """
+        query = "SELECT run_key, judge_number, has_judgment, is_valid, skipped, score FROM judges"
+        params: tuple[str, ...] = ()
+        if prefix:
+            query += " WHERE substr(run_key, 1, length(?)) = ?"
+            params = (prefix, prefix)
+        query += " ORDER BY run_key, judge_number"
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+        slots: dict[str, list[IndexedJudge]] = {}
+        for run_key, judge_number, has_judgment, is_valid, skipped, score in rows:
+            slots.setdefault(run_key, []).append(
+                IndexedJudge(judge_number, bool(has_judgment), bool(is_valid), bool(skipped), score)
+            )
+        return slots
+
+
+def open_run_index(experiment_dir: Path) -> RunIndex | None:
+    """Open the index of an experiment, building it from disk if needed.
+
+    Args:
+        experiment_dir: Experiment directory
+
+    Returns:
+        Ready-to-query index, or None if it cannot be created (callers then
+        scan the filesystem as before)
+
+    """
+    index = RunIndex(experiment_dir)
+    try:
+        index.ensure_built()
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"Run index unavailable for {experiment_dir}, scanning files: {e}")
+        return None
+    return index
+
+
+def find_run_index(path: Path) -> RunIndex | None:
+    """Return the built index of the experiment containing ``path``, if any.
+
+    Looks for an index in ``path`` and up to four parent directories (a run
+    directory is at most ``<phase>/<tier>/<subtest>/run_NN`` below the
+    experiment).  Unlike :func:`open_run_index`, never creates one.
+
+    Args:
+        path: A tier, subtest or run directory
+
+    Returns:
+        RunIndex, or None if no built index exists
+
+    """
+    for candidate in [path, *list(path.parents)[:4]]:
+        index = RunIndex(candidate)
+        if index.path.exists():
+            return index if index.is_built() else None
+    return None
+
+
+def index_runs(experiment_dir: Path, run_dirs: Iterable[Path]) -> None:
+    """Best-effort update of the index after run directories changed.
+
+    Failures are logged and otherwise ignored: the index is an accelerator and
+    ``manage_experiment.py reindex`` can always rebuild it.
+
+    Args:
+        experiment_dir: Experiment directory
+        run_dirs: Changed run directories
+
+    """
+    try:
+        RunIndex(experiment_dir).record_runs(list(run_dirs))
+    except (sqlite3.Error, OSError, ValueError) as e:
+        logger.warning(f"Could not update run index of {experiment_dir}: {e}")
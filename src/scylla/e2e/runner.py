@@ -18,6 +18,7 @@
 if TYPE_CHECKING:
     from scylla.e2e.judge_selection import JudgeSelection
     from scylla.e2e.models import SubTestResult, TierConfig
+    from scylla.e2e.parallel_executor import RateLimitCoordinator
     from scylla.e2e.resource_manager import ResourceManager
 
 import contextlib
@@ -371,9 +372,14 @@ def _setup_workspace(self) -> None:
                 repo_url=self.config.task_repo,
                 commit=self.config.task_commit,
                 repos_dir=repos_dir,
+                workspace_backend=self.config.workspace_backend,
             )
             # Setup base repo (idempotent - checks for existing clone internally)
             self.workspace_manager.setup_base_repo()
+            self.workspace_manager.prepare_reflink_base()
+            # One pooled worktree per workspace slot
+            if self.config.worktree_pool and self._resource_manager is not None:
+                self.workspace_manager.start_worktree_pool(self._resource_manager.workspace_limit)
 
     def _capture_experiment_baseline(self) -> None:
         """Capture pipeline baseline once at experiment level from a clean repo state."""
@@ -400,7 +406,7 @@ def _execute_tier_groups(
         tier_groups: list[list[TierID]],
         previous_baseline: TierBaseline | None = None,
     ) -> dict[TierID, TierResult]:
-        """Execute all tier groups sequentially.
+        """Execute all tier groups (concurrently within a group if configured).
 
         Args:
             tier_groups: List of tier groups for execution
@@ -618,6 +624,8 @@ def run(self) -> ExperimentResult:  # noqa: C901  # orchestration with many retr
             self._resource_manager = ResourceManager(
                 max_workspaces=self.config.max_concurrent_workspaces,
                 max_agents=self.config.max_concurrent_agents,
+                max_judges=self.config.max_concurrent_judges,
+                pipeline_budget=self.config.pipeline_budget,
             )
 
         # Start heartbeat thread to prevent zombie detection on long runs
@@ -677,6 +685,11 @@ def run(self) -> ExperimentResult:  # noqa: C901  # orchestration with many retr
             raise
         finally:
             heartbeat.stop()
+            if self._resource_manager is not None:
+                logger.info(self._resource_manager.format_stats())
+            if self.workspace_manager is not None:
+                self.workspace_manager.drain_worktree_pool()
+                self.workspace_manager.remove_reflink_base()
             heartbeat.join(timeout=5)
 
             if is_shutdown_requested():
@@ -722,6 +735,7 @@ def _build_tier_actions(
         tier_id: TierID,
         baseline: TierBaseline | None,
         tier_ctx: TierContext,
+        coordinator: RateLimitCoordinator | None = None,
     ) -> dict[TierState, Callable[[], None]]:
         """Build the TierState -> Callable action map for TierStateMachine.
 
@@ -732,6 +746,7 @@ def _build_tier_actions(
             tier_id: The tier to run
             baseline: Previous tier's winning baseline
             tier_ctx: Mutable TierContext for inter-action state
+            coordinator: Rate limit coordinator shared with concurrently running tiers
 
         Returns:
             Dict mapping TierState to callable
@@ -748,18 +763,21 @@ def _build_tier_actions(
             experiment_dir=self.experiment_dir,
             save_tier_result_fn=self._save_tier_result,
             resource_manager=self._resource_manager,
+            coordinator=coordinator,
         ).build()
 
     def _run_tier(
         self,
         tier_id: TierID,
         baseline: TierBaseline | None,
+        coordinator: RateLimitCoordinator | None = None,
     ) -> TierResult:
         """Run a single tier's evaluation.
 
         Args:
             tier_id: The tier to run
             baseline: Previous tier's winning baseline
+            coordinator: Rate limit coordinator shared with concurrently running tiers
 
         Returns:
             TierResult with all sub-test results.
@@ -824,6 +842,7 @@ def _run_tier(
             tier_id=tier_id,
             baseline=baseline,
             tier_ctx=tier_ctx,
+            coordinator=coordinator,
         )
 
         # Filesystem cross-validation on resume
@@ -9,6 +9,7 @@
 
 from __future__ import annotations
 
+import contextlib
 import dataclasses
 import json
 import logging
@@ -17,6 +18,7 @@
 
 from scylla.e2e.models import E2ERunResult
 from scylla.e2e.paths import get_agent_dir, get_judge_dir
+from scylla.e2e.run_index import index_runs
 from scylla.e2e.stage_process_metrics import (
     _finalize_change_results,
     _finalize_progress_steps,
@@ -119,8 +121,9 @@ def stage_execute_judge(ctx: RunContext) -> None:
     """JUDGE_PROMPT_BUILT -> JUDGE_COMPLETE: Execute judge(s) and save results.
 
     If ctx.judgment is already set (resume), this is a no-op.
-    Otherwise, calls Claude CLI judge(s) with pre-built prompt and
-    computes consensus.
+    Otherwise, calls Claude CLI judge(s) concurrently with the pre-built
+    prompt (bounded by ``config.max_concurrent_judges_per_run``) and computes
+    consensus once they finish or ``config.judge_quorum`` valid results are in.
 
     Args:
         ctx: Run context (mutates ctx.judgment, ctx.judges, ctx.judge_duration)
@@ -131,7 +134,11 @@ def stage_execute_judge(ctx: RunContext) -> None:
         logger.debug(f"Skipping judge execution for run {ctx.run_number} (resumed)")
         return
 
-    from scylla.e2e.judge_runner import _compute_judge_consensus, _save_judge_result
+    from scylla.e2e.judge_runner import (
+        _compute_judge_consensus,
+        _run_judges_concurrently,
+        _save_judge_result,
+    )
     from scylla.e2e.llm_judge_models import JudgeResult
     from scylla.e2e.models import JudgeResultSummary
     from scylla.e2e.pipeline_scripts import _save_judge_logs
@@ -152,25 +159,34 @@ def stage_execute_judge(ctx: RunContext) -> None:
                 f"Cannot execute judge without a prompt."
             )
 
-    judges = []
+    judge_prompt = ctx.judge_prompt
+    num_judges = len(ctx.config.judge_models)
     judge_start = datetime.now(timezone.utc)
 
-    for judge_num, model in enumerate(ctx.config.judge_models, start=1):
-        logger.info(
-            f"[JUDGE] Running judge {judge_num}/{len(ctx.config.judge_models)} with model[{model}]"
-        )
+    def _judge_one(judge_num: int, model: str) -> JudgeResultSummary:
+        logger.info(f"[JUDGE] Running judge {judge_num}/{num_judges} with model[{model}]")
 
         try:
-            actual_judge_dir = judge_dir / f"judge_{judge_num:02d}"
-            actual_judge_dir.mkdir(parents=True, exist_ok=True)
-
-            stdout, stderr, result, judge_result = _call_judge_with_retry(
-                ctx.judge_prompt, model, ctx.workspace, judge_num
+            # Each judge CLI process holds its own judge slot (an agent slot
+            # unless --max-concurrent-judges is set), so the judges of one run
+            # count individually against that limit
+            slot = (
+                ctx.resource_manager.judge_slot()
+                if ctx.resource_manager
+                else contextlib.nullcontext()
             )
+            with slot:
+                single_start = datetime.now(timezone.utc)
+                actual_judge_dir = judge_dir / f"judge_{judge_num:02d}"
+                actual_judge_dir.mkdir(parents=True, exist_ok=True)
+
+                stdout, stderr, result, judge_result = _call_judge_with_retry(
+                    judge_prompt, model, ctx.workspace, judge_num
+                )
 
             _save_judge_logs(
                 actual_judge_dir,
-                ctx.judge_prompt,
+                judge_prompt,
                 result,
                 judge_result,
                 model,
@@ -180,7 +196,7 @@ def stage_execute_judge(ctx: RunContext) -> None:
                 language=ctx.config.language,
             )
 
-            judge_duration_single = (datetime.now(timezone.utc) - judge_start).total_seconds()
+            judge_duration_single = (datetime.now(timezone.utc) - single_start).total_seconds()
             timing_file = actual_judge_dir / "timing.json"
             with open(timing_file, "w") as f:
                 json.dump(
@@ -192,7 +208,7 @@ def stage_execute_judge(ctx: RunContext) -> None:
                     indent=2,
                 )
 
-            judge_summary = JudgeResultSummary(
+            return JudgeResultSummary(
                 model=model,
                 score=judge_result.score,
                 passed=judge_result.passed,
@@ -202,7 +218,6 @@ def stage_execute_judge(ctx: RunContext) -> None:
                 is_valid=judge_result.is_valid,
                 criteria_scores=judge_result.criteria_scores,
             )
-            judges.append(judge_summary)
 
         except RateLimitError:
             raise
@@ -214,7 +229,7 @@ def stage_execute_judge(ctx: RunContext) -> None:
             )
             _save_judge_failure(judge_dir, judge_num, e)
 
-            failed_summary = JudgeResultSummary(
+            return JudgeResultSummary(
                 model=model,
                 score=0.0,
                 passed=False,
@@ -224,7 +239,14 @@ def stage_execute_judge(ctx: RunContext) -> None:
                 is_valid=False,
                 criteria_scores={},
             )
-            judges.append(failed_summary)
+
+    judges = _run_judges_concurrently(
+        ctx.config.judge_models,
+        _judge_one,
+        max_concurrent=ctx.config.max_concurrent_judges_per_run,
+        quorum=ctx.config.judge_quorum,
+        judge_dir=judge_dir,
+    )
 
     ctx.judge_duration = (datetime.now(timezone.utc) - judge_start).total_seconds()
 
@@ -447,6 +469,9 @@ def stage_finalize_run(ctx: RunContext) -> None:
 
     ctx.run_result = run_result
 
+    if ctx.experiment_dir is not None:
+        index_runs(ctx.experiment_dir, [ctx.run_dir])
+
 
 def stage_write_report(ctx: RunContext) -> None:
     """RUN_FINALIZED -> REPORT_WRITTEN: Generate per-run reports.
@@ -575,6 +600,8 @@ def stage_cleanup_worktree(ctx: RunContext) -> None:
                 f"{ctx.tier_id.value}/{ctx.subtest.id}/run_{ctx.run_number:02d}: {e}"
             )
     elif not should_cleanup:
+        # The kept worktree no longer counts towards the worktree pool
+        ctx.workspace_manager.forget_pooled_worktree(ctx.workspace)
         logger.debug(
             f"Preserving workspace for failed run (--keep-failed-workspaces) "
             f"{ctx.tier_id.value}/{ctx.subtest.id}/run_{ctx.run_number:02d}"
@@ -33,6 +33,7 @@
 
 from __future__ import annotations
 
+import contextlib
 import json
 import logging
 import os
@@ -95,8 +96,10 @@
 )
 
 if TYPE_CHECKING:
-    from scylla.adapters.base import AdapterConfig, AdapterResult
+    from scylla.adapters.base import AdapterConfig, AdapterResult, AdapterTokenStats
     from scylla.adapters.claude_code import ClaudeCodeAdapter
+    from scylla.e2e.agent_stream import AgentOutputStream
+    from scylla.e2e.build_pipeline import PipelineSlot
     from scylla.e2e.checkpoint import E2ECheckpoint
     from scylla.e2e.llm_judge_models import BuildPipelineResult
     from scylla.e2e.models import JudgeResultSummary
@@ -111,6 +114,9 @@
 # Prefer ctx.resource_manager.pipeline_slot() when available.
 _pipeline_lock = threading.Lock()
 
+# Seconds to wait for the agent's output readers to reach EOF after it exits
+_READER_JOIN_TIMEOUT = 10.0
+
 
 @dataclass
 class RunContext:
@@ -271,6 +277,7 @@ def stage_create_worktree(ctx: RunContext) -> None:
         base_repo=ctx.workspace_manager.base_repo,
         task_commit=ctx.config.task_commit,
         experiment_id=ctx.config.experiment_id,
+        workspace_manager=ctx.workspace_manager,
     )
 
 
@@ -326,6 +333,27 @@ def stage_commit_config(ctx: RunContext) -> None:
     _commit_test_config(ctx.workspace)
 
 
+def _pipeline_budget(
+    ctx: RunContext,
+) -> tuple[contextlib.AbstractContextManager[Any], PipelineSlot | None]:
+    """Return the (outer lock, per-step slot) pair for running the build pipeline.
+
+    With a ResourceManager each pipeline step holds its own share of the
+    weighted pipeline budget and no outer lock is needed; otherwise the whole
+    pipeline is serialized on the module fallback lock.
+
+    Args:
+        ctx: Run context
+
+    Returns:
+        Tuple of (context manager to hold around the pipeline, pipeline_slot)
+
+    """
+    if ctx.resource_manager is not None:
+        return contextlib.nullcontext(), ctx.resource_manager.pipeline_slot
+    return _pipeline_lock, None
+
+
 def stage_capture_baseline(ctx: RunContext) -> None:
     """CONFIG_COMMITTED -> BASELINE_CAPTURED: Capture pipeline baseline.
 
@@ -358,11 +386,13 @@ def stage_capture_baseline(ctx: RunContext) -> None:
         from scylla.e2e.build_pipeline import _run_build_pipeline
 
         logger.info("Capturing pipeline baseline inline (experiment-level baseline unavailable)")
-        _lock = ctx.resource_manager.pipeline_slot() if ctx.resource_manager else _pipeline_lock
+        _lock, pipeline_slot = _pipeline_budget(ctx)
         with _lock:
             ctx.pipeline_baseline = _run_build_pipeline(
                 workspace=ctx.workspace,
                 language=ctx.config.language,
+                use_cache=ctx.config.pipeline_cache,
+                pipeline_slot=pipeline_slot,
             )
         # Save at subtest level for this run's use
         _save_pipeline_baseline(ctx.run_dir.parent, ctx.pipeline_baseline)
@@ -553,6 +583,205 @@ def _communicate_with_shutdown_check(
                 ) from None
 
 
+def _stream_with_shutdown_check(
+    proc: subprocess.Popen[str],
+    timeout: float,
+    ctx: RunContext,
+    stream: AgentOutputStream,
+) -> None:
+    """Feed a subprocess's output to ``stream`` as it arrives, with shutdown checks.
+
+    One reader thread per pipe passes each line to the stream, so the output is
+    never buffered in full. The process is polled like in
+    :func:`_communicate_with_shutdown_check`.
+
+    Args:
+        proc: Running subprocess with stdout and stderr pipes.
+        timeout: Overall timeout in seconds.
+        ctx: Run context for error messages.
+        stream: Receives every stdout and stderr line.
+
+    Raises:
+        ShutdownInterruptedError: If shutdown is requested during execution.
+        subprocess.TimeoutExpired: If the overall timeout expires.
+
+    """
+    assert proc.stdout is not None and proc.stderr is not None  # noqa: S101 — piped by caller
+
+    def pump(pipe: Any, feed: Callable[[str], None]) -> None:
+        for line in pipe:
+            feed(line)
+
+    readers = [
+        threading.Thread(target=pump, args=(proc.stdout, stream.feed_stdout), daemon=True),
+        threading.Thread(target=pump, args=(proc.stderr, stream.feed_stderr), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+    try:
+        poll_interval = 2.0
+        remaining = float(timeout)
+        while True:
+            try:
+                proc.wait(timeout=poll_interval)
+                break
+            except subprocess.TimeoutExpired:
+                remaining -= poll_interval
+                if remaining <= 0:
+                    _kill_process_group(proc)
+                    raise
+                from scylla.e2e.shutdown import ShutdownInterruptedError, is_shutdown_requested
+
+                if is_shutdown_requested():
+                    _kill_process_group(proc)
+                    raise ShutdownInterruptedError(
+                        f"Shutdown requested during agent execution for run "
+                        f"{ctx.run_number} ({ctx.tier_id.value}/{ctx.subtest.id})"
+                    ) from None
+    finally:
+        _join_readers(proc, readers)
+        stream.close()
+
+
+def _join_readers(proc: subprocess.Popen[str], readers: list[threading.Thread]) -> None:
+    """Wait for the pipe reader threads of an exited agent, then close its pipes.
+
+    A background process left behind by the agent keeps the write ends of the
+    pipes open, so the readers would never see EOF. After a bounded wait the
+    agent's process group is killed, which closes them. A reader still blocked
+    after that is abandoned (it is a daemon thread) and its pipe left open:
+    closing a pipe under a blocked reader would block as well.
+
+    Args:
+        proc: Agent subprocess, started with ``start_new_session=True``.
+        readers: The stdout and stderr reader threads, in that order.
+
+    """
+    for reader in readers:
+        reader.join(timeout=_READER_JOIN_TIMEOUT)
+    if any(reader.is_alive() for reader in readers):
+        logger.warning(
+            f"Agent process {proc.pid} left processes holding its output pipes; "
+            "killing its process group"
+        )
+        # The session leader has been reaped, but its pid still names the group
+        with contextlib.suppress(OSError):
+            os.killpg(proc.pid, signal.SIGKILL)
+        for reader in readers:
+            reader.join(timeout=_READER_JOIN_TIMEOUT)
+    for pipe, reader in zip((proc.stdout, proc.stderr), readers, strict=True):
+        if reader.is_alive():
+            logger.warning(f"Output reader for agent process {proc.pid} did not finish")
+        elif pipe is not None:
+            pipe.close()
+
+
+def _capture_agent_output(
+    proc: subprocess.Popen[str],
+    timeout: float,
+    ctx: RunContext,
+    stream: AgentOutputStream | None,
+) -> tuple[str, str]:
+    """Wait for the agent and return its (stdout, stderr).
+
+    With a ``stream`` the output is teed to stdout.log/stderr.log as it arrives
+    and only the stream's retained output (result event or bounded tail) is
+    returned; otherwise the full output is buffered by communicate().
+
+    Args:
+        proc: Running agent subprocess.
+        timeout: Overall timeout in seconds.
+        ctx: Run context for error messages.
+        stream: Streaming capture, or None to buffer the output.
+
+    Returns:
+        Tuple of (stdout, stderr).
+
+    Raises:
+        subprocess.TimeoutExpired: If the overall timeout expires (process killed).
+
+    """
+    if stream is not None:
+        _stream_with_shutdown_check(proc, timeout, ctx, stream)
+        return stream.stdout_summary(), stream.stderr_summary()
+    try:
+        # Poll subprocess with periodic shutdown checks so Ctrl+C can interrupt
+        # a long-running agent (timeout can be up to 3600s).
+        # communicate(timeout=N) does NOT consume partial output on TimeoutExpired,
+        # so calling it in a loop is safe — the successful call returns all output.
+        return _communicate_with_shutdown_check(proc, timeout, ctx)
+    except subprocess.TimeoutExpired:
+        _kill_process_group(proc)
+        raise
+
+
+def _agent_metrics(
+    ctx: RunContext,
+    stdout: str,
+    stderr: str,
+    stream: AgentOutputStream | None,
+) -> tuple[AdapterTokenStats, int, float]:
+    """Return token stats, API calls and cost of an agent run.
+
+    Uses the totals accumulated by ``stream`` when it saw usage events, otherwise
+    parses the (possibly retained-only) output with the adapter.
+
+    Args:
+        ctx: Run context (provides the adapter).
+        stdout: Agent stdout, or the stream's retained stdout.
+        stderr: Agent stderr, or the stream's retained stderr.
+        stream: Streaming capture of the run, if one was used.
+
+    Returns:
+        Tuple of (token_stats, api_calls, cost_usd).
+
+    """
+    if stream is not None and stream.has_metrics:
+        return stream.token_stats, stream.api_calls, stream.cost_usd
+    from scylla.e2e.transcript import parse_transcript
+
+    transcript = parse_transcript(stdout)
+    return (
+        ctx.adapter._parse_token_stats(stdout, stderr, transcript),
+        ctx.adapter._parse_api_calls(stdout, stderr, transcript),
+        ctx.adapter._parse_cost(stdout, transcript),
+    )
+
+
+def _update_agent_command_log(
+    agent_dir: Path,
+    agent_result: AdapterResult,
+    duration: float,
+    stream: AgentOutputStream | None,
+) -> None:
+    """Update the agent's command log with the actual results.
+
+    Args:
+        agent_dir: Agent directory holding command_log.json.
+        agent_result: Result of the agent run.
+        duration: Agent duration in seconds.
+        stream: Streaming capture of the run; its log files hold the full output.
+
+    """
+    from scylla.e2e.command_logger import CommandLogger
+
+    command_log_path = agent_dir / "command_log.json"
+    if command_log_path.exists():
+        command_logger = CommandLogger.load(agent_dir)
+    else:
+        command_logger = CommandLogger(log_dir=agent_dir)
+    if command_logger.commands:
+        command_logger.update_last_command(
+            stdout=agent_result.stdout,
+            stderr=agent_result.stderr,
+            exit_code=agent_result.exit_code,
+            duration=duration,
+            stdout_path=stream.stdout_path if stream is not None else None,
+            stderr_path=stream.stderr_path if stream is not None else None,
+        )
+        command_logger.save()
+
+
 def stage_execute_agent(ctx: RunContext) -> None:
     """REPLAY_GENERATED -> AGENT_COMPLETE: Execute agent and save outputs.
 
@@ -573,7 +802,7 @@ def stage_execute_agent(ctx: RunContext) -> None:
         _create_agent_model_md,
         _save_agent_result,
     )
-    from scylla.e2e.command_logger import CommandLogger
+    from scylla.e2e.agent_stream import AgentOutputStream
 
     agent_dir = get_agent_dir(ctx.run_dir)
     adapter_config = ctx.adapter_config
@@ -599,8 +828,11 @@ def stage_execute_agent(ctx: RunContext) -> None:
 
     logger.info(f"[AGENT] Running agent with model[{ctx.config.models[0]}]")
 
+    stream: AgentOutputStream | None = None
     agent_start = datetime.now(timezone.utc)
     try:
+        if ctx.config.stream_agent_output:
+            stream = AgentOutputStream(agent_dir / "stdout.log", agent_dir / "stderr.log")
         # Use Popen with start_new_session so the agent subprocess gets its own
         # process group. This lets us kill it (and its children) cleanly on shutdown.
         proc = subprocess.Popen(
@@ -612,15 +844,7 @@ def stage_execute_agent(ctx: RunContext) -> None:
             cwd=ctx.workspace.resolve(),
             start_new_session=True,
         )
-        try:
-            # Poll subprocess with periodic shutdown checks so Ctrl+C can interrupt
-            # a long-running agent (timeout can be up to 3600s).
-            # communicate(timeout=N) does NOT consume partial output on TimeoutExpired,
-            # so calling it in a loop is safe — the successful call returns all output.
-            stdout, stderr = _communicate_with_shutdown_check(proc, adapter_config.timeout, ctx)
-        except subprocess.TimeoutExpired:
-            _kill_process_group(proc)
-            raise
+        stdout, stderr = _capture_agent_output(proc, adapter_config.timeout, ctx, stream)
 
         # If the agent was killed by a shutdown signal (Ctrl+C), do NOT advance the
         # run state — leave it at REPLAY_GENERATED so the next invocation can retry
@@ -635,9 +859,7 @@ def stage_execute_agent(ctx: RunContext) -> None:
                 f"({ctx.tier_id.value}/{ctx.subtest.id})"
             )
 
-        token_stats = ctx.adapter._parse_token_stats(stdout, stderr)
-        api_calls = ctx.adapter._parse_api_calls(stdout, stderr)
-        cost = ctx.adapter._parse_cost(stdout)
+        token_stats, api_calls, cost = _agent_metrics(ctx, stdout, stderr, stream)
 
         if cost == 0.0 and (token_stats.input_tokens > 0 or token_stats.output_tokens > 0):
             total_input = token_stats.input_tokens + token_stats.cache_read_tokens
@@ -645,7 +867,8 @@ def stage_execute_agent(ctx: RunContext) -> None:
                 total_input, token_stats.output_tokens, adapter_config.model
             )
 
-        ctx.adapter.write_logs(agent_dir, stdout, stderr)
+        if stream is None:
+            ctx.adapter.write_logs(agent_dir, stdout, stderr)
 
         agent_result = AdapterResult(
             exit_code=proc.returncode,
@@ -670,24 +893,15 @@ def stage_execute_agent(ctx: RunContext) -> None:
             cost_usd=0.0,
             api_calls=0,
         )
+    finally:
+        # Also closes the log files when Popen itself fails
+        if stream is not None:
+            stream.close()
     ctx.agent_duration = (datetime.now(timezone.utc) - agent_start).total_seconds()
     ctx.agent_result = agent_result
     ctx.agent_ran = True
 
-    # Update command logger with actual results
-    command_log_path = agent_dir / "command_log.json"
-    if command_log_path.exists():
-        command_logger = CommandLogger.load(agent_dir)
-    else:
-        command_logger = CommandLogger(log_dir=agent_dir)
-    if command_logger.commands:
-        command_logger.update_last_command(
-            stdout=agent_result.stdout,
-            stderr=agent_result.stderr,
-            exit_code=agent_result.exit_code,
-            duration=ctx.agent_duration,
-        )
-        command_logger.save()
+    _update_agent_command_log(agent_dir, agent_result, ctx.agent_duration, stream)
 
     # Persist timing for resume capability
     agent_timing_file = agent_dir / "timing.json"
@@ -792,6 +1006,7 @@ def stage_promote_to_completed(ctx: RunContext) -> None:
 
     """
     from scylla.e2e.paths import get_experiment_dir_from_run, promote_run_to_completed
+    from scylla.e2e.run_index import index_runs
 
     experiment_dir = get_experiment_dir_from_run(ctx.run_dir)
     new_run_dir = promote_run_to_completed(
@@ -799,10 +1014,14 @@ def stage_promote_to_completed(ctx: RunContext) -> None:
     )
 
     # Update ctx paths to point to new location
+    old_run_dir = ctx.run_dir
     old_workspace_name = ctx.workspace.name
     ctx.run_dir = new_run_dir
     ctx.workspace = new_run_dir / old_workspace_name
 
+    if ctx.experiment_dir is not None:
+        index_runs(ctx.experiment_dir, [old_run_dir, new_run_dir])
+
     logger.info(f"[PROMOTE] Run moved to completed: {new_run_dir}")
 
 
@@ -885,11 +1104,13 @@ def stage_run_judge_pipeline(ctx: RunContext) -> None:
     from scylla.e2e.pipeline_scripts import _save_pipeline_commands
 
     logger.info(f"Running {ctx.config.language} build pipeline for judge evaluation")
-    _lock = ctx.resource_manager.pipeline_slot() if ctx.resource_manager else _pipeline_lock
+    _lock, pipeline_slot = _pipeline_budget(ctx)
     with _lock:
         ctx.judge_pipeline_result = _run_build_pipeline(
             workspace=ctx.workspace,
             language=ctx.config.language,
+            use_cache=ctx.config.pipeline_cache,
+            pipeline_slot=pipeline_slot,
         )
 
     # Save pipeline commands for debugging
@@ -922,6 +1143,8 @@ def stage_build_judge_prompt(ctx: RunContext) -> None:
         return
 
     # Find rubric path (symlinked at experiment root)
+    from scylla.e2e.llm_judge import save_judge_context
+    from scylla.e2e.llm_judge_models import JudgeContext
     from scylla.e2e.paths import get_experiment_dir_from_run
     from scylla.judge.prompts import build_task_prompt
 
@@ -964,16 +1187,42 @@ def stage_build_judge_prompt(ctx: RunContext) -> None:
         baseline_pipeline_str=baseline_pipeline_str,
     )
 
-    # Save assembled judge prompt to disk for debugging and resume
+    # Save assembled judge prompt to disk for debugging and resume, with the
+    # gathered context beside it for reruns (see llm_judge.load_judge_context)
     judge_prompt_path = ctx.run_dir / "judge_prompt.md"
     if not judge_prompt_path.exists():
         judge_prompt_path.write_text(ctx.judge_prompt)
+        save_judge_context(
+            ctx.run_dir,
+            JudgeContext(
+                workspace_state=diff_data.get("workspace_state", ""),
+                patchfile=diff_data.get("patchfile"),
+                deleted_files=diff_data.get("deleted_files"),
+                rubric_content=rubric_content,
+                pipeline_result=ctx.judge_pipeline_result,
+                judge_prompt=ctx.judge_prompt,
+            ),
+        )
 
 
 # ---------------------------------------------------------------------------
 # Stage map builder
 # ---------------------------------------------------------------------------
 
+# Resource class whose ResourceManager slot a run holds while executing the
+# transition starting at each state. Unlisted stages only touch the run's own
+# directory; in the baseline and judge-pipeline stages each build pipeline step
+# takes its own weighted pipeline_slot() internally, and stage_execute_judge()
+# takes one judge_slot() per judge so a run's judges can execute concurrently.
+STAGE_RESOURCES: dict[RunState, str] = {
+    RunState.DIR_STRUCTURE_CREATED: "git",  # git worktree add
+    RunState.SYMLINKS_APPLIED: "git",  # commit test config
+    RunState.REPLAY_GENERATED: "agent",
+    RunState.AGENT_COMPLETE: "git",  # commit agent changes
+    RunState.AGENT_CHANGES_COMMITTED: "git",  # capture diff
+    RunState.CHECKPOINTED: "git",  # git worktree remove
+}
+
 
 def build_actions_dict(
     ctx: RunContext,
@@ -981,7 +1230,10 @@ def build_actions_dict(
     """Build the {RunState -> Callable} map for StateMachine.advance_to_completion().
 
     Each entry maps from_state -> callable that performs the work for the
-    transition starting at that state.
+    transition starting at that state. With a ResourceManager, the stages in
+    STAGE_RESOURCES hold a slot of their resource class while they run, so
+    concurrent runs overlap: one run's judge executes while another run's agent
+    holds an agent slot.
 
     Args:
         ctx: Run context holding all state for this run
@@ -990,24 +1242,7 @@ def build_actions_dict(
         Dict mapping RunState to callable stage function
 
     """
-
-    def _agent_with_slot() -> None:
-        """Execute agent within agent_slot context manager (RAM protection)."""
-        if ctx.resource_manager:
-            with ctx.resource_manager.agent_slot():
-                stage_execute_agent(ctx)
-        else:
-            stage_execute_agent(ctx)
-
-    def _judge_with_slot() -> None:
-        """Execute judge within agent_slot context manager (RAM protection)."""
-        if ctx.resource_manager:
-            with ctx.resource_manager.agent_slot():
-                stage_execute_judge(ctx)
-        else:
-            stage_execute_judge(ctx)
-
-    return {
+    actions: dict[RunState, Callable[..., Any]] = {
         RunState.PENDING: lambda: stage_create_dir_structure(ctx),
         RunState.DIR_STRUCTURE_CREATED: lambda: stage_create_worktree(ctx),
         RunState.WORKTREE_CREATED: lambda: stage_apply_symlinks(ctx),
@@ -1015,14 +1250,29 @@ def _judge_with_slot() -> None:
         RunState.CONFIG_COMMITTED: lambda: stage_capture_baseline(ctx),
         RunState.BASELINE_CAPTURED: lambda: stage_write_prompt(ctx),
         RunState.PROMPT_WRITTEN: lambda: stage_generate_replay(ctx),
-        RunState.REPLAY_GENERATED: _agent_with_slot,
+        RunState.REPLAY_GENERATED: lambda: stage_execute_agent(ctx),
         RunState.AGENT_COMPLETE: lambda: stage_commit_agent_changes(ctx),
         RunState.AGENT_CHANGES_COMMITTED: lambda: stage_capture_diff(ctx),
         RunState.DIFF_CAPTURED: lambda: stage_promote_to_completed(ctx),
         RunState.PROMOTED_TO_COMPLETED: lambda: stage_run_judge_pipeline(ctx),
         RunState.JUDGE_PIPELINE_RUN: lambda: stage_build_judge_prompt(ctx),
-        RunState.JUDGE_PROMPT_BUILT: _judge_with_slot,
+        RunState.JUDGE_PROMPT_BUILT: lambda: stage_execute_judge(ctx),
         RunState.JUDGE_COMPLETE: lambda: stage_finalize_run(ctx),
         RunState.RUN_FINALIZED: lambda: stage_write_report(ctx),
         RunState.CHECKPOINTED: lambda: stage_cleanup_worktree(ctx),
     }
+    resource_manager = ctx.resource_manager
+    if resource_manager is None:
+        return actions
+
+    def _with_slot(resource: str, action: Callable[..., Any]) -> Callable[..., Any]:
+        def run_in_slot() -> None:
+            with resource_manager.slot(resource):
+                action()
+
+        return run_in_slot
+
+    return {
+        state: _with_slot(STAGE_RESOURCES[state], action) if state in STAGE_RESOURCES else action
+        for state, action in actions.items()
+    }
@@ -368,8 +368,8 @@ def advance(
         # Update state in checkpoint
         self.checkpoint.set_run_state(tier_id, subtest_id, run_num, transition.to_state.value)
 
-        # Save checkpoint atomically
-        save_checkpoint(self.checkpoint, self.checkpoint_path)
+        # Append the transition to the checkpoint journal
+        save_checkpoint(self.checkpoint, self.checkpoint_path, incremental=True)
 
         return transition.to_state
 
@@ -429,7 +429,7 @@ def advance_to_completion(
                     break
         except RateLimitError:
             self.checkpoint.set_run_state(tier_id, subtest_id, run_num, RunState.RATE_LIMITED.value)
-            save_checkpoint(self.checkpoint, self.checkpoint_path)
+            save_checkpoint(self.checkpoint, self.checkpoint_path, incremental=True)
             raise
         except ShutdownInterruptedError:
             # Ctrl+C interrupted this run mid-stage — leave it at its last successfully
@@ -446,7 +446,7 @@ def advance_to_completion(
                 f"{self.get_state(tier_id, subtest_id, run_num).value}: {e}"
             )
             self.checkpoint.set_run_state(tier_id, subtest_id, run_num, RunState.FAILED.value)
-            save_checkpoint(self.checkpoint, self.checkpoint_path)
+            save_checkpoint(self.checkpoint, self.checkpoint_path, incremental=True)
             raise
 
         return self.get_state(tier_id, subtest_id, run_num)
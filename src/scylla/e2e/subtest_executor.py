@@ -18,6 +18,9 @@
 import json
 import logging
 import statistics
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -379,6 +382,9 @@ def run_subtest(  # noqa: C901  # orchestration with many retry/outcome paths
 
         Supports checkpoint/resume: skips completed runs and saves after each run.
 
+        Runs execute one after another unless ``config.max_concurrent_runs`` is
+        greater than 1 (see :meth:`_run_concurrently`).
+
         Args:
             tier_id: The tier being executed
             tier_config: Tier configuration
@@ -405,8 +411,9 @@ def run_subtest(  # noqa: C901  # orchestration with many retry/outcome paths
         # Load task prompt once
         task_prompt = self.config.task_prompt_file.read_text()
 
-        # Track last workspace for resource manifest
-        last_workspace = None
+        # Workspace of each run that was executed or skipped as complete; the
+        # highest-numbered one is recorded in the resource manifest
+        workspaces: dict[int, Path] = {}
 
         # Pipeline baseline is shared across runs; stored in RunContext and
         # propagated back to subsequent RunContext instances below.
@@ -422,10 +429,10 @@ def run_subtest(  # noqa: C901  # orchestration with many retry/outcome paths
             else None
         )
 
-        def _run_loop() -> None:  # noqa: C901  # run loop with many retry/skip/state paths
-            nonlocal last_workspace, pipeline_baseline
+        def _run_loop(run_numbers: Iterable[int]) -> None:  # noqa: C901  # many retry/skip paths
+            nonlocal pipeline_baseline
 
-            for run_num in range(1, self.config.runs_per_subtest + 1):
+            for run_num in run_numbers:
                 # Check for shutdown before starting run
                 if coordinator and coordinator.is_shutdown_requested():
                     logger.warning(
@@ -535,7 +542,7 @@ def _run_loop() -> None:  # noqa: C901  # run loop with many retry/skip/state pa
                                 ),
                             )
                             runs.append(run_result)
-                            last_workspace = workspace
+                            workspaces[run_num] = workspace
                             continue
 
                 # If the run was previously promoted to completed/ (and possibly
@@ -564,7 +571,7 @@ def _run_loop() -> None:  # noqa: C901  # run loop with many retry/skip/state pa
 
                 run_dir.mkdir(parents=True, exist_ok=True)
                 workspace.mkdir(parents=True, exist_ok=True)
-                last_workspace = workspace
+                workspaces[run_num] = workspace
 
                 # Build RunContext for this run
                 ctx = RunContext(
@@ -652,7 +659,7 @@ def _run_loop() -> None:  # noqa: C901  # run loop with many retry/skip/state pa
                     raise
 
         def _save_resource_manifest() -> None:
-            nonlocal last_workspace
+            last_workspace = workspaces[max(workspaces)] if workspaces else None
 
             # Save resource manifest for inheritance (no file copying)
             # Use last workspace if available, otherwise use the final run's workspace path
@@ -676,8 +683,29 @@ def _aggregate() -> None:
             nonlocal result
             result = self._aggregate_results(tier_id, subtest.id, runs)
 
+        def _run_all() -> None:
+            nonlocal pipeline_baseline
+
+            run_numbers = list(range(1, self.config.runs_per_subtest + 1))
+            if self.config.max_concurrent_runs <= 1 or len(run_numbers) <= 1:
+                _run_loop(run_numbers)
+                return
+
+            # Resolve the shared pipeline baseline before fanning out, so it is
+            # captured at most once: from disk if available, otherwise by running
+            # runs one at a time until one of them has captured it.
+            if experiment_dir is not None:
+                pipeline_baseline = _load_pipeline_baseline(experiment_dir)
+            if pipeline_baseline is None:
+                pipeline_baseline = _load_pipeline_baseline(results_dir)
+            while run_numbers and pipeline_baseline is None:
+                _run_loop([run_numbers.pop(0)])
+
+            self._run_concurrently(run_numbers, lambda run_num: _run_loop([run_num]))
+            runs.sort(key=lambda run: run.run_number)
+
         def _run_loop_and_save_manifest() -> None:
-            _run_loop()
+            _run_all()
             _save_resource_manifest()
             # If --until stopped every run before reaching a terminal state, signal
             # SubtestSM to stay in RUNS_IN_PROGRESS (not advance to RUNS_COMPLETE).
@@ -728,6 +756,41 @@ def _run_loop_and_save_manifest() -> None:
 
         return self._aggregate_results(tier_id, subtest.id, runs)
 
+    def _run_concurrently(self, run_numbers: list[int], run_one: Callable[[int], None]) -> None:
+        """Execute runs of one sub-test on a pool of worker threads.
+
+        Runs are independent (separate ``run_NN/`` worktrees), and the
+        ``workspace_slot()``/``agent_slot()`` limits of the resource manager still
+        apply inside each run. After the first failure no further runs are
+        started; runs already in flight finish and are checkpointed, and the
+        first exception is re-raised so the caller's retry logic sees it.
+
+        Args:
+            run_numbers: Run numbers to execute
+            run_one: Executes a single run
+
+        """
+        if not run_numbers:
+            return
+        stop = threading.Event()
+        errors: list[BaseException] = []
+
+        def work(run_num: int) -> None:
+            if stop.is_set():
+                return
+            try:
+                run_one(run_num)
+            except BaseException as e:
+                stop.set()
+                errors.append(e)
+
+        workers = min(self.config.max_concurrent_runs, len(run_numbers))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="run") as pool:
+            for future in [pool.submit(work, run_num) for run_num in run_numbers]:
+                future.result()
+        if errors:
+            raise errors[0]
+
     def _compute_judge_consensus(
         self, judges: list[Any]
     ) -> tuple[float | None, bool | None, str | None]:
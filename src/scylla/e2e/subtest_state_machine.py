@@ -261,8 +261,8 @@ def advance(
             saved_state = transition.to_state
         self.checkpoint.set_subtest_state(tier_id, subtest_id, saved_state.value)
 
-        # Save checkpoint atomically
-        save_checkpoint(self.checkpoint, self.checkpoint_path)
+        # Append the transition to the checkpoint journal
+        save_checkpoint(self.checkpoint, self.checkpoint_path, incremental=True)
 
         if halt_error is not None:
             raise halt_error
@@ -325,7 +325,7 @@ def advance_to_completion(
             raise
         except Exception:
             self.checkpoint.set_subtest_state(tier_id, subtest_id, SubtestState.FAILED.value)
-            save_checkpoint(self.checkpoint, self.checkpoint_path)
+            save_checkpoint(self.checkpoint, self.checkpoint_path, incremental=True)
             raise
 
         return self.get_state(tier_id, subtest_id)
@@ -26,6 +26,7 @@
 
 if TYPE_CHECKING:
     from scylla.e2e.checkpoint import E2ECheckpoint
+    from scylla.e2e.parallel_executor import RateLimitCoordinator
     from scylla.e2e.resource_manager import ResourceManager
     from scylla.e2e.runner import TierContext
     from scylla.e2e.tier_manager import TierManager
@@ -57,6 +58,7 @@ def __init__(
         experiment_dir: Path | None,
         save_tier_result_fn: Callable[[TierID, TierResult], None],
         resource_manager: ResourceManager | None = None,
+        coordinator: RateLimitCoordinator | None = None,
     ) -> None:
         """Initialize TierActionBuilder with all required collaborators.
 
@@ -71,6 +73,7 @@ def __init__(
             experiment_dir: Root directory for this experiment's outputs (may be None).
             save_tier_result_fn: Callable injected from the runner to save tier results.
             resource_manager: Optional resource limiter for concurrency control.
+            coordinator: Rate limit coordinator shared with concurrently running tiers.
 
         """
         self.tier_id = tier_id
@@ -83,6 +86,7 @@ def __init__(
         self.experiment_dir = experiment_dir
         self.save_tier_result_fn = save_tier_result_fn
         self.resource_manager = resource_manager
+        self.coordinator = coordinator
 
     def build(self) -> dict[TierState, Callable[[], None]]:  # noqa: C901  # action map with many tier state branches
         """Build and return the TierState -> Callable action map.
@@ -149,6 +153,7 @@ def action_config_loaded() -> None:
                 checkpoint_path=checkpoint_path,
                 experiment_dir=experiment_dir,
                 resource_manager=self.resource_manager,
+                coordinator=self.coordinator,
             )
             tier_ctx.subtest_results = subtest_results
 
@@ -249,8 +249,8 @@ def advance(
         # Update state in checkpoint
         self.checkpoint.set_tier_state(tier_id, transition.to_state.value)
 
-        # Save checkpoint atomically
-        save_checkpoint(self.checkpoint, self.checkpoint_path)
+        # Append the transition to the checkpoint journal
+        save_checkpoint(self.checkpoint, self.checkpoint_path, incremental=True)
 
         return transition.to_state
 
@@ -304,7 +304,7 @@ def advance_to_completion(
                     "— tier left at config_loaded (not FAILED)"
                 )
                 self.checkpoint.set_tier_state(tier_id, TierState.CONFIG_LOADED.value)
-                save_checkpoint(self.checkpoint, self.checkpoint_path)
+                save_checkpoint(self.checkpoint, self.checkpoint_path, incremental=True)
                 raise
 
             if isinstance(e, RateLimitError):
@@ -315,7 +315,7 @@ def advance_to_completion(
                     "Marking tier as FAILED — rate limit handling occurs at experiment level."
                 )
             self.checkpoint.set_tier_state(tier_id, TierState.FAILED.value)
-            save_checkpoint(self.checkpoint, self.checkpoint_path)
+            save_checkpoint(self.checkpoint, self.checkpoint_path, incremental=True)
             raise
 
         return self.get_state(tier_id)
@@ -0,0 +1,348 @@
+"""Single-pass parser for agent CLI transcripts.
+
+Agent and judge CLIs print either one JSON object (``--output-format json``),
+newline-delimited events (``--output-format stream-json``), OpenAI-style JSON
+with a ``usage`` object, or plain text. :class:`TranscriptParser` tokenizes
+such output once, line by line, into :class:`TranscriptEvent` objects and folds
+them into a :class:`Transcript` summary (usage, cost, turns, tool calls, errors,
+rate-limit markers and, optionally, the response text).
+
+The adapters' token/API-call/cost parsers, :func:`scylla.e2e.rate_limit.detect_rate_limit`,
+the judge and the streaming agent capture all consume this summary, so an
+agent's stdout is parsed once instead of once per metric. Plain-text
+fallbacks (regexes over the raw output) stay with the individual adapters.
+
+This module only depends on the standard library so that it can be imported
+from both ``scylla.adapters`` and ``scylla.e2e.rate_limit``.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from typing import Any
+
+# Rate-limit keywords for is_error result fields of json/stream-json output
+RATE_LIMIT_KEYWORDS: tuple[str, ...] = (
+    "rate limit",
+    "rate_limit",
+    "ratelimit",
+    "overloaded",
+    "429",
+    "hit your limit",
+    "resets",
+    "weekly usage limit",
+    "upgrade to continue",
+    "failed to configure provider",
+)
+
+# Top-level keys that mark an untyped object as a final result (json output)
+_RESULT_KEYS = ("usage", "total_cost_usd", "num_turns")
+
+
+@dataclass(frozen=True)
+class Usage:
+    """Token usage reported by an agent CLI.
+
+    Attributes:
+        input_tokens: Fresh input tokens (``input_tokens``/``prompt_tokens``)
+        output_tokens: Generated tokens (``output_tokens``/``completion_tokens``)
+        cache_creation_tokens: Tokens written to the prompt cache
+        cache_read_tokens: Tokens read from the prompt cache
+
+    """
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_creation_tokens: int = 0
+    cache_read_tokens: int = 0
+
+    @classmethod
+    def from_dict(cls, usage: dict[str, Any]) -> Usage:
+        """Build from an Anthropic- or OpenAI-style ``usage`` object."""
+
+        def count(*keys: str) -> int:
+            for key in keys:
+                value = usage.get(key)
+                if isinstance(value, int | float):
+                    return int(value)
+            return 0
+
+        return cls(
+            input_tokens=count("input_tokens", "prompt_tokens"),
+            output_tokens=count("output_tokens", "completion_tokens"),
+            cache_creation_tokens=count("cache_creation_input_tokens"),
+            cache_read_tokens=count("cache_read_input_tokens"),
+        )
+
+    def __add__(self, other: Usage) -> Usage:
+        """Return the element-wise sum of two usages."""
+        return Usage(
+            input_tokens=self.input_tokens + other.input_tokens,
+            output_tokens=self.output_tokens + other.output_tokens,
+            cache_creation_tokens=self.cache_creation_tokens + other.cache_creation_tokens,
+            cache_read_tokens=self.cache_read_tokens + other.cache_read_tokens,
+        )
+
+
+@dataclass(frozen=True)
+class TranscriptEvent:
+    """One JSON event of a transcript.
+
+    Attributes:
+        type: Event ``type`` ("system", "assistant", "user", "result", ...), or
+            "result" for an untyped object carrying usage/cost (json output)
+        usage: Usage of the event (assistant message usage or final usage)
+        cost_usd: ``total_cost_usd`` of a result event
+        num_turns: ``num_turns`` of a result event
+        message_id: Assistant message id (one message spans several events)
+        tool_calls: Number of ``tool_use`` content blocks
+        text: Text content blocks of an assistant message
+        result_text: ``result`` field of a result event
+        error: Error text of an ``is_error`` event
+        rate_limited: Whether ``error`` carries a rate-limit keyword
+
+    """
+
+    type: str
+    usage: Usage | None = None
+    cost_usd: float | None = None
+    num_turns: int | None = None
+    message_id: str | None = None
+    tool_calls: int = 0
+    text: tuple[str, ...] = ()
+    result_text: str | None = None
+    error: str | None = None
+    rate_limited: bool = False
+
+    @property
+    def is_result(self) -> bool:
+        """Whether this is the final result event."""
+        return self.type == "result"
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> TranscriptEvent:
+        """Build an event from one parsed JSON object."""
+        event_type = data.get("type")
+        if event_type is None and any(key in data for key in _RESULT_KEYS):
+            event_type = "result"
+        event_type = str(event_type) if event_type is not None else "unknown"
+
+        error = None
+        rate_limited = False
+        if data.get("is_error"):
+            error = str(data.get("result", data.get("error", "")))
+            error_lower = error.lower()
+            rate_limited = any(keyword in error_lower for keyword in RATE_LIMIT_KEYWORDS)
+
+        if event_type == "assistant":
+            message = data.get("message")
+            if not isinstance(message, dict):
+                message = {}
+            content = message.get("content")
+            if not isinstance(content, list):
+                content = []
+            blocks = [b for b in content if isinstance(b, dict)]
+            usage = message.get("usage")
+            return cls(
+                type=event_type,
+                usage=Usage.from_dict(usage) if isinstance(usage, dict) else None,
+                message_id=message.get("id"),
+                tool_calls=sum(1 for b in blocks if b.get("type") == "tool_use"),
+                text=tuple(str(b.get("text", "")) for b in blocks if b.get("type") == "text"),
+                error=error,
+                rate_limited=rate_limited,
+            )
+
+        if event_type == "result":
+            usage = data.get("usage")
+            cost = data.get("total_cost_usd")
+            turns = data.get("num_turns")
+            result = data.get("result")
+            return cls(
+                type=event_type,
+                usage=Usage.from_dict(usage if isinstance(usage, dict) else {}),
+                cost_usd=float(cost) if isinstance(cost, int | float) else None,
+                num_turns=int(turns) if isinstance(turns, int | float) else None,
+                result_text=result if isinstance(result, str) else None,
+                error=error,
+                rate_limited=rate_limited,
+            )
+
+        return cls(type=event_type, error=error, rate_limited=rate_limited)
+
+
+@dataclass(frozen=True)
+class Transcript:
+    """Summary of a parsed transcript.
+
+    Attributes:
+        usage: Usage of the final result event if there was one, else the sum
+            over assistant messages, else None (no structured usage at all)
+        cost_usd: ``total_cost_usd`` of the final result event (0.0 if absent)
+        api_calls: ``num_turns`` of the result event if positive, else the
+            number of assistant messages
+        tool_calls: Number of ``tool_use`` blocks across assistant messages
+        errors: Error texts of ``is_error`` events, in order
+        rate_limit_errors: The subset of ``errors`` that signal a rate limit
+        json_events: Number of JSON events parsed
+        text_lines: Number of non-empty lines that were not JSON objects
+        response_text: Result text, or the concatenated assistant text blocks
+            when the result is empty (only collected with ``collect_text``)
+
+    """
+
+    usage: Usage | None = None
+    cost_usd: float = 0.0
+    api_calls: int = 0
+    tool_calls: int = 0
+    errors: tuple[str, ...] = ()
+    rate_limit_errors: tuple[str, ...] = ()
+    json_events: int = 0
+    text_lines: int = 0
+    response_text: str = ""
+
+    @property
+    def has_usage(self) -> bool:
+        """Whether structured usage (result event or assistant messages) was seen."""
+        return self.usage is not None
+
+
+@dataclass
+class TranscriptParser:
+    """Incremental transcript parser: feed lines, then read :meth:`result`.
+
+    Only running totals are kept (plus the assistant text when
+    ``collect_text`` is set), so arbitrarily long transcripts can be streamed
+    through it.
+    """
+
+    collect_text: bool = False
+    _final: TranscriptEvent | None = None
+    _message_usage: Usage = field(default_factory=Usage)
+    _message_count: int = 0
+    _current_message_id: str | None = None
+    _current_usage: Usage | None = None
+    _tool_calls: int = 0
+    _errors: list[str] = field(default_factory=list)
+    _rate_limit_errors: list[str] = field(default_factory=list)
+    _json_events: int = 0
+    _text_lines: int = 0
+    _text_parts: list[str] = field(default_factory=list)
+
+    def feed_line(self, line: str) -> TranscriptEvent | None:
+        """Parse one line of output.
+
+        Args:
+            line: One line of stdout, with or without its newline
+
+        Returns:
+            The line's event, or None if it is not a JSON object
+
+        """
+        stripped = line.strip()
+        if not stripped:
+            return None
+        if stripped.startswith("{"):
+            try:
+                data = json.loads(stripped)
+            except ValueError:
+                data = None
+            if isinstance(data, dict):
+                return self.feed_json(data)
+        self._text_lines += 1
+        return None
+
+    def feed_json(self, data: dict[str, Any]) -> TranscriptEvent:
+        """Fold one parsed JSON object into the totals.
+
+        Args:
+            data: Parsed JSON object
+
+        Returns:
+            The object's event
+
+        """
+        event = TranscriptEvent.from_json(data)
+        self._json_events += 1
+        if event.error is not None:
+            self._errors.append(event.error)
+            if event.rate_limited:
+                self._rate_limit_errors.append(event.error)
+        if event.is_result:
+            self._final = event
+        elif event.type == "assistant":
+            # stream-json emits one assistant event per content block of a message
+            if event.message_id is None or event.message_id != self._current_message_id:
+                self._close_message()
+                self._current_message_id = event.message_id
+                self._message_count += 1
+            if event.usage is not None:
+                self._current_usage = event.usage
+            self._tool_calls += event.tool_calls
+            if self.collect_text:
+                self._text_parts.extend(event.text)
+        return event
+
+    def _close_message(self) -> None:
+        if self._current_usage is not None:
+            self._message_usage = self._message_usage + self._current_usage
+        self._current_usage = None
+
+    @property
+    def json_events(self) -> int:
+        """Number of JSON events fed so far."""
+        return self._json_events
+
+    def result(self) -> Transcript:
+        """Return the summary of everything fed so far."""
+        self._close_message()
+        final = self._final
+        usage = final.usage if final is not None else None
+        if usage is None and self._message_count:
+            usage = self._message_usage
+        result_text = final.result_text if final is not None else None
+        response_text = ""
+        if self.collect_text:
+            if result_text and result_text.strip():
+                response_text = result_text
+            else:
+                response_text = "".join(self._text_parts)
+        return Transcript(
+            usage=usage,
+            cost_usd=(final.cost_usd or 0.0) if final is not None else 0.0,
+            api_calls=(final.num_turns if final is not None else None) or self._message_count,
+            tool_calls=self._tool_calls,
+            errors=tuple(self._errors),
+            rate_limit_errors=tuple(self._rate_limit_errors),
+            json_events=self._json_events,
+            text_lines=self._text_lines,
+            response_text=response_text,
+        )
+
+
+def parse_transcript(output: str, *, collect_text: bool = False) -> Transcript:
+    """Parse a complete transcript in one pass.
+
+    Output that is a single pretty-printed JSON object (no JSON on any one
+    line) is parsed as a whole.
+
+    Args:
+        output: Agent or judge stdout
+        collect_text: Also assemble ``Transcript.response_text``
+
+    Returns:
+        Transcript summary
+
+    """
+    parser = TranscriptParser(collect_text=collect_text)
+    for line in output.splitlines():
+        parser.feed_line(line)
+    if parser.json_events == 0 and output.lstrip().startswith("{"):
+        try:
+            data = json.loads(output)
+        except ValueError:
+            data = None
+        if isinstance(data, dict):
+            parser.feed_json(data)
+    return parser.result()
@@ -2,20 +2,63 @@
 
 This module provides efficient workspace management by cloning a repository once
 and using git worktrees for each test run, reducing storage and network overhead.
+
+With a worktree pool (``start_worktree_pool()``), worktrees are created once in
+the background and recycled between runs: a run's workspace is a pooled
+worktree moved into place, and on cleanup it is reset and moved back instead of
+being removed.
+
+With the ``reflink`` workspace backend, run worktrees are registered with
+``git worktree add --no-checkout`` and their files are reflink copies of one
+read-only base checkout, so runs share disk blocks until they write.
 """
 
 from __future__ import annotations
 
+import contextlib
 import fcntl
 import hashlib
 import logging
 import subprocess
+import threading
 from pathlib import Path
 
 from scylla.core.resilience import TRANSIENT_ERROR_PATTERNS
 
 logger = logging.getLogger(__name__)
 
+# Workspace materialization backends (ExperimentConfig.workspace_backend)
+WORKSPACE_BACKENDS = ("worktree", "reflink")
+
+# Copy command for the reflink backend. --reflink=always fails instead of
+# silently copying data on filesystems without copy-on-write support.
+_REFLINK_COPY = ["cp", "-a", "--reflink=always"]
+
+
+def reflink_supported(directory: Path) -> bool:
+    """Return True if files in ``directory`` can be copied with reflinks.
+
+    Args:
+        directory: Existing directory on the filesystem to probe
+
+    Returns:
+        True if a probe file could be reflink-copied
+
+    """
+    probe = directory / f".reflink_probe.{threading.get_ident()}"
+    copy = probe.with_suffix(".copy")
+    try:
+        probe.write_bytes(b"reflink probe\n")
+        result = subprocess.run(
+            [*_REFLINK_COPY, str(probe), str(copy)], capture_output=True, text=True
+        )
+        return result.returncode == 0
+    except OSError:
+        return False
+    finally:
+        probe.unlink(missing_ok=True)
+        copy.unlink(missing_ok=True)
+
 
 class WorkspaceManager:
     """Manages git worktrees for experiment runs.
@@ -34,6 +77,7 @@ def __init__(
         repo_url: str,
         commit: str | None = None,
         repos_dir: Path | None = None,
+        workspace_backend: str = "worktree",
     ) -> None:
         """Initialize workspace manager.
 
@@ -44,14 +88,43 @@ def __init__(
             repos_dir: Optional directory for centralized repo clones.
                       If provided, clones are shared across experiments.
                       If None, uses legacy per-experiment layout.
+            workspace_backend: How run workspaces are materialized, one of
+                      WORKSPACE_BACKENDS ("worktree" = git worktree add).
+
+        Raises:
+            ValueError: If workspace_backend is unknown
 
         """
+        if workspace_backend not in WORKSPACE_BACKENDS:
+            raise ValueError(
+                f"Unknown workspace backend {workspace_backend!r}, "
+                f"expected one of {WORKSPACE_BACKENDS}"
+            )
         self.experiment_dir = experiment_dir
         self.repo_url = repo_url
         self.commit = commit
         self.repos_dir = repos_dir
         self._is_setup = False
         self._worktree_count = 0
+        # Serializes worktree/branch metadata updates from concurrent sub-tests
+        self._git_lock = threading.Lock()
+
+        # Worktree pool (disabled until start_worktree_pool()). _pool_members
+        # counts idle, leased and in-transit pooled worktrees.
+        self._pool_lock = threading.Lock()
+        self._pool_size = 0
+        self._pool_commit = ""
+        self._pool_idle: list[Path] = []
+        self._pool_leased: set[Path] = set()
+        self._pool_members = 0
+        self._pool_slot_count = 0
+        self._pool_stop = threading.Event()
+        self._pool_thread: threading.Thread | None = None
+
+        # Reflink backend: base checkout prepared by prepare_reflink_base()
+        self.workspace_backend = workspace_backend
+        self._reflink_lock = threading.Lock()
+        self._reflink_ready = False
 
         # Calculate base_repo path based on repos_dir
         if repos_dir is not None:
@@ -269,8 +342,9 @@ def create_worktree(
             else:
                 branch_name = f"{tier_id}_{subtest_id}"
         else:
-            self._worktree_count += 1
-            branch_name = f"worktree-{self._worktree_count}"
+            with self._git_lock:
+                self._worktree_count += 1
+                branch_name = f"worktree-{self._worktree_count}"
 
         # Create worktree with named branch and commit in a single step
         worktree_cmd = [
@@ -286,11 +360,12 @@ def create_worktree(
         if self.commit:
             worktree_cmd.append(self.commit)
 
-        result = subprocess.run(
-            worktree_cmd,
-            capture_output=True,
-            text=True,
-        )
+        with self._git_lock:
+            result = subprocess.run(
+                worktree_cmd,
+                capture_output=True,
+                text=True,
+            )
 
         if result.returncode != 0:
             raise RuntimeError(f"Failed to create worktree at {workspace_path}: {result.stderr}")
@@ -302,6 +377,9 @@ def create_worktree(
     def cleanup_worktree(self, workspace_path: Path, branch_name: str | None = None) -> None:
         """Remove a worktree after run completion and delete its branch.
 
+        When the worktree pool has room, the worktree is reset and returned to
+        the pool instead of being removed.
+
         Args:
             workspace_path: Path to the worktree to remove
             branch_name: Optional branch name to delete after removing worktree
@@ -310,7 +388,25 @@ def cleanup_worktree(self, workspace_path: Path, branch_name: str | None = None)
         if not workspace_path.exists():
             return
 
-        # Remove the worktree
+        if self.release_pooled_worktree(workspace_path):
+            if branch_name:
+                self._delete_branch(branch_name)
+            return
+
+        # Delete the branch if specified
+        if self._remove_worktree(workspace_path) and branch_name:
+            self._delete_branch(branch_name)
+
+    def _remove_worktree(self, workspace_path: Path) -> bool:
+        """Run ``git worktree remove --force``, logging failures.
+
+        Args:
+            workspace_path: Path to the worktree to remove
+
+        Returns:
+            True if the worktree was removed
+
+        """
         remove_cmd = [
             "git",
             "-C",
@@ -321,35 +417,43 @@ def cleanup_worktree(self, workspace_path: Path, branch_name: str | None = None)
             str(workspace_path),
         ]
 
-        result = subprocess.run(
-            remove_cmd,
-            capture_output=True,
-            text=True,
-        )
+        with self._git_lock:
+            result = subprocess.run(
+                remove_cmd,
+                capture_output=True,
+                text=True,
+            )
 
         if result.returncode != 0:
             logger.warning(f"Failed to remove worktree: {result.stderr}")
-            return
+            return False
+        return True
 
-        # Delete the branch if specified
-        if branch_name:
-            delete_branch_cmd = [
-                "git",
-                "-C",
-                str(self.base_repo),
-                "branch",
-                "-D",
-                branch_name,
-            ]
+    def _delete_branch(self, branch_name: str) -> None:
+        """Delete a run branch from the base repo, logging failures.
 
+        Args:
+            branch_name: Branch to delete
+
+        """
+        delete_branch_cmd = [
+            "git",
+            "-C",
+            str(self.base_repo),
+            "branch",
+            "-D",
+            branch_name,
+        ]
+
+        with self._git_lock:
             result = subprocess.run(
                 delete_branch_cmd,
                 capture_output=True,
                 text=True,
             )
 
-            if result.returncode != 0:
-                logger.warning(f"Failed to delete branch {branch_name}: {result.stderr}")
+        if result.returncode != 0:
+            logger.warning(f"Failed to delete branch {branch_name}: {result.stderr}")
 
     def cleanup_all(self) -> None:
         """Cleanup all worktrees and prune stale entries."""
@@ -368,6 +472,386 @@ def cleanup_all(self) -> None:
         subprocess.run(prune_cmd, capture_output=True, text=True)
         logger.debug("Pruned stale worktrees")
 
+    # -------------------------------------------------------------------------
+    # Worktree pool
+    # -------------------------------------------------------------------------
+
+    @property
+    def pool_dir(self) -> Path:
+        """Directory holding idle pooled worktrees for this experiment."""
+        return self.experiment_dir / ".worktree_pool"
+
+    def start_worktree_pool(self, size: int) -> None:
+        """Enable the worktree pool and pre-create ``size`` worktrees in the background.
+
+        Pooled worktrees are detached at the pinned commit (or the base repo's
+        HEAD when no commit is pinned). Runs that find no idle worktree fall
+        back to ``git worktree add``; their worktrees join the pool on cleanup
+        while it is below ``size``.
+
+        Args:
+            size: Maximum number of pooled worktrees, normally the number of
+                ResourceManager workspace slots.
+
+        Raises:
+            RuntimeError: If base repo not set up
+
+        """
+        if not self._is_setup:
+            raise RuntimeError("Base repo not set up. Call setup_base_repo() first.")
+        if size < 1 or self._pool_size:
+            return
+
+        commit = self.commit
+        if not commit:
+            result = subprocess.run(
+                ["git", "-C", str(self.base_repo), "rev-parse", "HEAD"],
+                capture_output=True,
+                text=True,
+            )
+            if result.returncode != 0:
+                logger.warning(f"Worktree pool disabled, cannot resolve HEAD: {result.stderr}")
+                return
+            commit = result.stdout.strip()
+
+        self._pool_commit = commit
+        self._pool_size = size
+        self._pool_stop.clear()
+        self.pool_dir.mkdir(parents=True, exist_ok=True)
+        with self._pool_lock:
+            self._start_pool_warmer()
+        logger.info(f"Worktree pool enabled: size={size}, commit={commit[:12]}")
+
+    def _start_pool_warmer(self) -> None:
+        """Start the background warmer unless it is running. Caller holds _pool_lock."""
+        if self._pool_stop.is_set() or (self._pool_thread and self._pool_thread.is_alive()):
+            return
+        self._pool_thread = threading.Thread(
+            target=self._warm_worktree_pool, daemon=True, name="WorktreePoolWarmer"
+        )
+        self._pool_thread.start()
+
+    def _next_pool_slot(self) -> Path:
+        """Return an unused slot path inside pool_dir. Caller holds _pool_lock."""
+        self._pool_slot_count += 1
+        return self.pool_dir / f"slot_{self._pool_slot_count:03d}"
+
+    def _warm_worktree_pool(self) -> None:
+        """Create detached worktrees until the pool is full or stopped."""
+        while not self._pool_stop.is_set():
+            with self._pool_lock:
+                if self._pool_members >= self._pool_size:
+                    return
+                self._pool_members += 1
+                slot = self._next_pool_slot()
+
+            add_cmd = [
+                "git",
+                "-C",
+                str(self.base_repo),
+                "worktree",
+                "add",
+                "--detach",
+                str(slot),
+                self._pool_commit,
+            ]
+            with self._git_lock:
+                result = subprocess.run(add_cmd, capture_output=True, text=True)
+
+            with self._pool_lock:
+                if result.returncode != 0:
+                    self._pool_members -= 1
+                    logger.warning(f"Failed to pre-create pooled worktree {slot}: {result.stderr}")
+                    return
+                self._pool_idle.append(slot)
+            logger.debug(f"Pre-created pooled worktree {slot}")
+
+    def acquire_pooled_worktree(
+        self, workspace_path: Path, branch_name: str, commit: str | None = None
+    ) -> bool:
+        """Move an idle pooled worktree to ``workspace_path`` on a new branch.
+
+        Args:
+            workspace_path: Path where the run's worktree should live
+            branch_name: Branch to create (or reset) at the pooled commit
+            commit: Commit the run expects; the pool is bypassed when it differs
+                from the pinned commit
+
+        Returns:
+            True if a pooled worktree now lives at ``workspace_path``, False if
+            the caller should create a worktree itself.
+
+        """
+        workspace_abs = workspace_path.resolve()
+        if workspace_abs.exists() and any(workspace_abs.iterdir()):
+            return False
+        with self._pool_lock:
+            if not self._pool_idle or (commit or None) != (self.commit or None):
+                return False
+            slot = self._pool_idle.pop()
+
+        if workspace_abs.exists():
+            workspace_abs.rmdir()
+        workspace_abs.parent.mkdir(parents=True, exist_ok=True)
+
+        move_cmd = ["git", "-C", str(self.base_repo), "worktree", "move", str(slot)]
+        move_cmd.append(str(workspace_abs))
+        branch_cmd = ["git", "-C", str(workspace_abs), "checkout", "-B", branch_name]
+        remove_cmd = ["git", "-C", str(self.base_repo), "worktree", "remove", "--force"]
+        remove_cmd.append(str(workspace_abs))
+        with self._git_lock:
+            result = subprocess.run(move_cmd, capture_output=True, text=True)
+            if result.returncode == 0:
+                result = subprocess.run(branch_cmd, capture_output=True, text=True)
+                if result.returncode != 0:
+                    # Free workspace_path for the caller's `git worktree add` fallback
+                    removed = subprocess.run(remove_cmd, capture_output=True, text=True)
+                    if removed.returncode != 0:
+                        logger.warning(
+                            f"Failed to remove half-leased worktree {workspace_abs}: "
+                            f"{removed.stderr}"
+                        )
+
+        if result.returncode != 0:
+            logger.warning(f"Failed to lease pooled worktree {slot}: {result.stderr}")
+            with self._pool_lock:
+                self._pool_members -= 1
+                self._start_pool_warmer()
+            return False
+
+        with self._pool_lock:
+            self._pool_leased.add(workspace_abs)
+        logger.debug(f"Leased pooled worktree {slot} -> {workspace_abs} on {branch_name}")
+        return True
+
+    def release_pooled_worktree(self, workspace_path: Path) -> bool:
+        """Reset a run's worktree and return it to the pool instead of removing it.
+
+        The run's branch is left in place (as ``git worktree remove`` would);
+        the worktree is detached at the pooled commit, hard-reset and cleaned of
+        untracked and ignored files, then moved back under ``pool_dir``.
+
+        Args:
+            workspace_path: Path to the run's worktree
+
+        Returns:
+            True if the worktree was returned to the pool, False if the caller
+            should remove it.
+
+        """
+        workspace_abs = workspace_path.resolve()
+        with self._pool_lock:
+            if not self._pool_size or self._pool_stop.is_set():
+                return False
+            if workspace_abs in self._pool_leased:
+                self._pool_leased.discard(workspace_abs)
+            elif self._pool_members < self._pool_size:
+                self._pool_members += 1
+            else:
+                return False
+            slot = self._next_pool_slot()
+
+        reset_cmds = [
+            ["git", "-C", str(workspace_abs), "checkout", "--force", "--detach", self._pool_commit],
+            ["git", "-C", str(workspace_abs), "reset", "--hard", self._pool_commit],
+            ["git", "-C", str(workspace_abs), "clean", "-ffdx"],
+        ]
+        for cmd in reset_cmds:
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            if result.returncode != 0:
+                break
+        else:
+            move_cmd = ["git", "-C", str(self.base_repo), "worktree", "move", str(workspace_abs)]
+            move_cmd.append(str(slot))
+            with self._git_lock:
+                result = subprocess.run(move_cmd, capture_output=True, text=True)
+
+        with self._pool_lock:
+            if result.returncode != 0:
+                self._pool_members -= 1
+                logger.warning(f"Failed to recycle worktree {workspace_abs}: {result.stderr}")
+                return False
+            self._pool_idle.append(slot)
+        logger.debug(f"Recycled worktree {workspace_abs} -> {slot}")
+        return True
+
+    def forget_pooled_worktree(self, workspace_path: Path) -> None:
+        """Drop a leased worktree that is being kept from the pool accounting.
+
+        Used when a run's workspace is preserved instead of cleaned up (e.g.
+        ``--keep-failed-workspaces``). The worktree stays where it is and stops
+        counting towards the pool size, so a replacement is warmed.
+
+        Args:
+            workspace_path: Path to the run's worktree
+
+        """
+        workspace_abs = workspace_path.resolve()
+        with self._pool_lock:
+            if workspace_abs not in self._pool_leased:
+                return
+            self._pool_leased.discard(workspace_abs)
+            self._pool_members -= 1
+            self._start_pool_warmer()
+        logger.debug(f"Kept leased worktree {workspace_abs} outside the pool")
+
+    def drain_worktree_pool(self) -> None:
+        """Disable the pool and remove its idle worktrees.
+
+        Leased worktrees are removed normally when their runs clean up.
+        """
+        if self._pool_thread is None:
+            return
+        self._pool_stop.set()
+        self._pool_thread.join()
+        self._pool_thread = None
+
+        with self._pool_lock:
+            idle, self._pool_idle = self._pool_idle, []
+            self._pool_members -= len(idle)
+            self._pool_size = 0
+
+        for slot in idle:
+            self.cleanup_worktree(slot)
+        with contextlib.suppress(OSError):
+            self.pool_dir.rmdir()
+        logger.debug(f"Drained worktree pool ({len(idle)} idle worktrees removed)")
+
+    # -------------------------------------------------------------------------
+    # Reflink workspace backend
+    # -------------------------------------------------------------------------
+
+    @property
+    def reflink_base(self) -> Path:
+        """Read-only base checkout that reflink workspaces are copied from."""
+        return self.experiment_dir / ".workspace_base"
+
+    def prepare_reflink_base(self) -> bool:
+        """Create the base checkout for the reflink backend if needed.
+
+        Falls back to the worktree backend (returns False) when the
+        experiment directory's filesystem cannot make reflink copies.
+
+        Returns:
+            True if reflink workspaces can be materialized
+
+        Raises:
+            RuntimeError: If base repo not set up
+
+        """
+        if not self._is_setup:
+            raise RuntimeError("Base repo not set up. Call setup_base_repo() first.")
+        if self.workspace_backend != "reflink":
+            return False
+
+        with self._reflink_lock:
+            if self._reflink_ready:
+                return True
+
+            self.experiment_dir.mkdir(parents=True, exist_ok=True)
+            if not reflink_supported(self.experiment_dir):
+                logger.warning(
+                    f"Filesystem of {self.experiment_dir} does not support reflinks; "
+                    "using git worktree add for run workspaces"
+                )
+                self.workspace_backend = "worktree"
+                return False
+
+            if not self.reflink_base.exists():
+                add_cmd = [
+                    "git",
+                    "-C",
+                    str(self.base_repo),
+                    "worktree",
+                    "add",
+                    "--detach",
+                    str(self.reflink_base),
+                ]
+                if self.commit:
+                    add_cmd.append(self.commit)
+                with self._git_lock:
+                    result = subprocess.run(add_cmd, capture_output=True, text=True)
+                if result.returncode != 0:
+                    raise RuntimeError(
+                        f"Failed to create reflink base checkout at {self.reflink_base}: "
+                        f"{result.stderr}"
+                    )
+
+            self._reflink_ready = True
+            logger.info(f"Reflink workspace backend ready (base: {self.reflink_base})")
+            return True
+
+    def materialize_reflink_workspace(
+        self, workspace_path: Path, branch_name: str, commit: str | None = None
+    ) -> list[list[str]] | None:
+        """Materialize a run worktree as reflink copies of the base checkout.
+
+        The worktree is registered with ``git worktree add --no-checkout`` on
+        ``branch_name``, the base checkout's files are reflink-copied into it,
+        and ``git reset`` builds its index.
+
+        Args:
+            workspace_path: Path where the run's worktree should live
+            branch_name: Branch to create for the run
+            commit: Commit the run expects; the backend is bypassed when it
+                differs from the pinned commit
+
+        Returns:
+            The commands that were run, or None if the caller should create
+            the worktree itself.
+
+        """
+        if not self._reflink_ready or (commit or None) != (self.commit or None):
+            return None
+        workspace_abs = workspace_path.resolve()
+        if workspace_abs.exists() and any(workspace_abs.iterdir()):
+            return None
+        workspace_abs.parent.mkdir(parents=True, exist_ok=True)
+
+        add_cmd = [
+            "git",
+            "-C",
+            str(self.base_repo),
+            "worktree",
+            "add",
+            "--no-checkout",
+            "-b",
+            branch_name,
+            str(workspace_abs),
+        ]
+        if self.commit:
+            add_cmd.append(self.commit)
+        with self._git_lock:
+            result = subprocess.run(add_cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            logger.warning(f"Reflink backend could not register {workspace_abs}: {result.stderr}")
+            return None
+
+        entries = [str(p) for p in self.reflink_base.iterdir() if p.name != ".git"]
+        copy_cmd = [*_REFLINK_COPY, *entries, str(workspace_abs)]
+        index_cmd = ["git", "-C", str(workspace_abs), "reset", "-q"]
+        for cmd in ([copy_cmd] if entries else []) + [index_cmd]:
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            if result.returncode != 0:
+                logger.warning(
+                    f"Failed to materialize reflink workspace {workspace_abs}: {result.stderr}"
+                )
+                self._remove_worktree(workspace_abs)
+                self._delete_branch(branch_name)
+                workspace_abs.mkdir(parents=True, exist_ok=True)
+                return None
+
+        logger.debug(f"Materialized reflink workspace {workspace_abs} on {branch_name}")
+        return [add_cmd, copy_cmd, index_cmd]
+
+    def remove_reflink_base(self) -> None:
+        """Remove the reflink base checkout at the end of an experiment."""
+        with self._reflink_lock:
+            if not self._reflink_ready:
+                return
+            self._reflink_ready = False
+        self._remove_worktree(self.reflink_base)
+
     def get_shared_pixi_dir(self, subpath: str = "") -> Path:
         """Return the path to the shared .pixi directory for worktrees.
 
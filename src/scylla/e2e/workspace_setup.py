@@ -19,6 +19,7 @@
 if TYPE_CHECKING:
     from scylla.e2e.command_logger import CommandLogger
     from scylla.e2e.models import TierID
+    from scylla.e2e.workspace_manager import WorkspaceManager
 
 logger = logging.getLogger(__name__)
 
@@ -107,6 +108,44 @@ def _commit_test_config(workspace: Path) -> None:
         )
 
 
+def _setup_managed_workspace(
+    workspace_manager: WorkspaceManager,
+    workspace_abs: Path,
+    branch_name: str,
+    task_commit: str | None,
+    command_logger: CommandLogger,
+    start_time: datetime,
+) -> bool:
+    """Materialize the workspace from the worktree pool or the reflink base.
+
+    Args:
+        workspace_manager: Manager owning the pool and reflink base
+        workspace_abs: Absolute workspace path
+        branch_name: Branch to create for the run
+        task_commit: Optional commit hash to checkout
+        command_logger: Logger for commands
+        start_time: When workspace setup started
+
+    Returns:
+        True if the workspace was set up, False to fall back to ``git worktree add``
+
+    """
+    if workspace_manager.acquire_pooled_worktree(workspace_abs, branch_name, task_commit):
+        _phase_log("WORKTREE", f"Leased pooled worktree [{branch_name}] @ [{workspace_abs}]")
+        return True
+
+    reflink_cmds = workspace_manager.materialize_reflink_workspace(
+        workspace_abs, branch_name, task_commit
+    )
+    if reflink_cmds is None:
+        return False
+    duration = (datetime.now(timezone.utc) - start_time).total_seconds()
+    for cmd in reflink_cmds:
+        command_logger.log_command(cmd=cmd, stdout="", stderr="", exit_code=0, duration=duration)
+    _phase_log("WORKTREE", f"Materialized reflink worktree [{branch_name}]")
+    return True
+
+
 def _setup_workspace(
     workspace: Path,
     command_logger: CommandLogger,
@@ -116,9 +155,14 @@ def _setup_workspace(
     base_repo: Path,
     task_commit: str | None = None,
     experiment_id: str = "",
+    workspace_manager: WorkspaceManager | None = None,
 ) -> None:
     """Set up workspace using git worktree from base repo with named branch.
 
+    When ``workspace_manager`` has an idle pooled worktree, that worktree is
+    moved into place instead of running ``git worktree add``; otherwise, with
+    the reflink backend, the worktree is materialized from its base checkout.
+
     Args:
         workspace: Target workspace directory
         command_logger: Logger for commands
@@ -128,6 +172,8 @@ def _setup_workspace(
         base_repo: Base repository path
         task_commit: Optional commit hash to checkout
         experiment_id: Experiment identifier for unique branch naming
+        workspace_manager: Optional manager whose worktree pool and reflink
+            backend are tried before ``git worktree add``
 
     """
     start_time = datetime.now(timezone.utc)
@@ -176,6 +222,12 @@ def _setup_workspace(
     if task_commit:
         worktree_cmd.append(task_commit)
 
+    if workspace_manager is not None and _setup_managed_workspace(
+        workspace_manager, workspace_abs, branch_name, task_commit, command_logger, start_time
+    ):
+        _write_worktree_script(workspace, workspace_abs, branch_name, worktree_cmd, task_commit)
+        return
+
     result = subprocess.run(
         worktree_cmd,
         capture_output=True,
@@ -247,7 +299,26 @@ def _setup_workspace(
     elif result.returncode != 0:
         raise RuntimeError(f"Failed to create worktree: {result.stderr}")
 
-    # Save worktree creation command (create only, no cleanup)
+    _write_worktree_script(workspace, workspace_abs, branch_name, worktree_cmd, task_commit)
+
+
+def _write_worktree_script(
+    workspace: Path,
+    workspace_abs: Path,
+    branch_name: str,
+    worktree_cmd: list[str],
+    task_commit: str | None,
+) -> None:
+    """Save the worktree creation command (create only, no cleanup) as a script.
+
+    Args:
+        workspace: Workspace directory as passed by the caller
+        workspace_abs: Resolved workspace directory
+        branch_name: Branch the worktree is on
+        worktree_cmd: ``git worktree add`` command that recreates the worktree
+        task_commit: Optional commit hash checked out in the worktree
+
+    """
     subtest_dir = workspace.parent
     worktree_script = subtest_dir / "worktree_create.sh"
     script_lines = [
@@ -1,5 +1,6 @@
 """Tests for BaseCliAdapter class."""
 
+import json
 import subprocess
 from pathlib import Path
 from typing import Any
@@ -227,6 +228,36 @@ def test_parse_api_calls_zero_for_short_output(self) -> None:
         count = adapter._parse_api_calls(stdout, stderr)
         assert count == 0
 
+    def test_parse_api_calls_from_stream_json(self) -> None:
+        """Assistant messages of JSON output are counted before the text patterns."""
+        adapter = TestCliAdapter()
+        stdout = "\n".join(
+            json.dumps({"type": "assistant", "message": {"id": f"m{n}"}}) for n in range(4)
+        )
+
+        assert adapter._parse_api_calls(stdout, "") == 4
+
+
+class TestParseTokenStats:
+    """Tests for _parse_token_stats() method."""
+
+    def test_prefers_json_usage(self) -> None:
+        """Structured usage in stdout takes precedence over _parse_token_counts()."""
+        adapter = TestCliAdapter()
+        stdout = '{"usage": {"prompt_tokens": 12, "completion_tokens": 3}}'
+
+        stats = adapter._parse_token_stats(stdout, "")
+
+        assert (stats.input_tokens, stats.output_tokens) == (12, 3)
+
+    def test_falls_back_to_token_counts(self) -> None:
+        """Text output is handed to the subclass's _parse_token_counts()."""
+        adapter = TestCliAdapter()
+
+        stats = adapter._parse_token_stats("Tokens: 1 input", "")
+
+        assert (stats.input_tokens, stats.output_tokens) == (100, 200)
+
 
 class TestAbstractMethods:
     """Tests for abstract method requirements."""
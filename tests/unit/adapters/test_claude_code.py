@@ -214,6 +214,40 @@ def test_parse_json_with_cache_tokens(self) -> None:
         assert stats.cache_creation_tokens == 27655
         assert stats.cache_read_tokens == 82278
 
+    def test_parse_stream_json(self) -> None:
+        """Stream-json output is read from its final result event."""
+        adapter = ClaudeCodeAdapter()
+        import json
+
+        stdout = "\n".join(
+            json.dumps(event)
+            for event in (
+                {"type": "system", "subtype": "init"},
+                {"type": "assistant", "message": {"id": "m1", "usage": {"output_tokens": 3}}},
+                {"type": "result", "usage": {"input_tokens": 40, "output_tokens": 9}},
+            )
+        )
+
+        stats = adapter._parse_token_stats(stdout, "")
+
+        assert stats.input_tokens == 40
+        assert stats.output_tokens == 9
+
+    def test_shared_transcript_is_not_reparsed(self) -> None:
+        """A transcript passed in is used instead of parsing stdout again."""
+        from scylla.e2e.transcript import parse_transcript
+
+        adapter = ClaudeCodeAdapter()
+        transcript = parse_transcript('{"usage": {"input_tokens": 7}, "total_cost_usd": 0.1}')
+
+        with patch("scylla.adapters.claude_code.parse_transcript") as parse:
+            stats = adapter._parse_token_stats("ignored", "", transcript)
+            cost = adapter._parse_cost("ignored", transcript)
+
+        parse.assert_not_called()
+        assert stats.input_tokens == 7
+        assert cost == 0.1
+
 
 class TestParseApiCalls:
     """Tests for API call count parsing."""
@@ -6,7 +6,13 @@
 import pandas as pd
 import pytest
 
-from scylla.analysis.dataframes import build_criteria_df, build_judges_df, build_runs_df
+from scylla.analysis.dataframes import (
+    build_criteria_df,
+    build_judges_df,
+    build_runs_df,
+    build_subtests_df,
+    update_frames,
+)
 from scylla.analysis.loader import CriterionScore, ItemScore, JudgeEvaluation, RunData
 from scylla.e2e.models import TokenStats
 
@@ -541,3 +547,80 @@ def test_build_judges_df_invalid_judge() -> None:
     # Assert - invalid judge should be marked as invalid
     assert len(df) == 1
     assert not df.iloc[0]["judge_is_valid"]
+
+
+def _run(experiment: str, subtest: str, run_number: int, score: float, judge: Any) -> RunData:
+    """Build a minimal RunData for update tests."""
+    return RunData(
+        experiment=experiment,
+        agent_model="Test Model",
+        tier="T0",
+        subtest=subtest,
+        run_number=run_number,
+        score=score,
+        passed=score >= 0.5,
+        grade="A" if score >= 0.5 else "F",
+        cost_usd=0.1 * run_number,
+        duration_seconds=10.0,
+        agent_duration_seconds=8.0,
+        judge_duration_seconds=2.0,
+        token_stats=TokenStats(input_tokens=100, output_tokens=50),
+        exit_code=0,
+        judges=[judge],
+    )
+
+
+def test_update_frames_matches_full_rebuild(mock_judges: Any) -> None:
+    """Applying a delta gives the same frames as rebuilding from scratch."""
+    judge = mock_judges[0]
+    before = {
+        "exp-a": [_run("exp-a", "00", 1, 0.9, judge), _run("exp-a", "00", 2, 0.4, judge)],
+        "exp-b": [_run("exp-b", "00", 1, 0.7, judge)],
+        "exp-c": [_run("exp-c", "01", 1, 0.2, judge)],
+    }
+    runs_df = build_runs_df(before)
+    frames = (
+        runs_df,
+        build_judges_df(before),
+        build_criteria_df(before),
+        build_subtests_df(runs_df),
+    )
+
+    # exp-b changed, exp-c was deleted, exp-d is new
+    delta = {
+        "exp-b": [_run("exp-b", "00", 1, 0.3, judge), _run("exp-b", "01", 1, 0.8, judge)],
+        "exp-d": [_run("exp-d", "00", 1, 0.6, judge)],
+    }
+    updated = update_frames(*frames, delta=delta, removed=["exp-c"])
+
+    after = {"exp-a": before["exp-a"], **delta}
+    expected_runs = build_runs_df(after)
+    expected = (
+        expected_runs,
+        build_judges_df(after),
+        build_criteria_df(after),
+        build_subtests_df(expected_runs),
+    )
+    for actual_df, expected_df in zip(updated, expected, strict=True):
+        columns = [c for c in ("experiment", "subtest", "run_number") if c in actual_df]
+        pd.testing.assert_frame_equal(
+            actual_df.sort_values(columns, kind="stable").reset_index(drop=True),
+            expected_df.sort_values(columns, kind="stable").reset_index(drop=True),
+        )
+
+
+def test_update_frames_empty_delta_keeps_frames(mock_run_data: Any) -> None:
+    """An empty delta with nothing removed leaves the frames unchanged."""
+    experiments = {"test-experiment-001": [mock_run_data]}
+    runs_df = build_runs_df(experiments)
+    frames = (
+        runs_df,
+        build_judges_df(experiments),
+        build_criteria_df(experiments),
+        build_subtests_df(runs_df),
+    )
+
+    updated = update_frames(*frames, delta={})
+
+    for actual_df, expected_df in zip(updated, frames, strict=True):
+        pd.testing.assert_frame_equal(actual_df, expected_df)
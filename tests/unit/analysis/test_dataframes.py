@@ -495,3 +495,56 @@ def test_criteria_summary_empty_dataframe() -> None:
     # Should return empty result, not crash
     summary = criteria_summary(empty_df)
     assert len(summary) == 0
+
+
+def test_build_subtests_df_matches_per_group_reference(
+    sample_runs_df: pd.DataFrame, sample_subtests_df: pd.DataFrame
+) -> None:
+    """Vectorized subtest aggregation matches the per-group reference values."""
+    from scylla.analysis.dataframes import build_subtests_df
+
+    keys = ["experiment", "agent_model", "tier", "subtest"]
+    actual = build_subtests_df(sample_runs_df).sort_values(keys).reset_index(drop=True)
+    expected = sample_subtests_df.sort_values(keys).reset_index(drop=True)
+
+    assert len(actual) == len(expected)
+    for col in expected.columns:
+        if col in keys or col == "modal_grade":
+            assert actual[col].tolist() == expected[col].tolist(), col
+        elif col.startswith("grade_"):
+            assert actual[col].tolist() == expected[col].astype(int).tolist(), col
+        else:
+            np.testing.assert_allclose(
+                actual[col].astype(float), expected[col].astype(float), rtol=1e-12, err_msg=col
+            )
+
+
+def test_build_subtests_df_modal_grade_ties_and_missing() -> None:
+    """Modal grade breaks ties alphabetically and falls back to F without grades."""
+    from scylla.analysis.dataframes import build_subtests_df
+
+    runs_df = pd.DataFrame(
+        {
+            "experiment": ["exp"] * 5,
+            "agent_model": ["m"] * 5,
+            "tier": ["T0"] * 5,
+            "subtest": ["00", "00", "00", "00", "01"],
+            "passed": [True, True, False, False, True],
+            "score": [0.9, 0.8, 0.3, 0.2, 0.5],
+            "impl_rate": [0.9, 0.8, 0.3, 0.2, 0.5],
+            "cost_usd": [1.0, 1.0, 1.0, 1.0, 1.0],
+            "duration_seconds": [10.0] * 5,
+            "grade": ["C", "B", "B", "C", None],
+            "r_prog": [None] * 5,
+            "cfp": [None] * 5,
+            "pr_revert_rate": [None] * 5,
+            "strategic_drift": [None] * 5,
+        }
+    )
+
+    result = build_subtests_df(runs_df).set_index("subtest")
+
+    assert result.loc["00", "modal_grade"] == "B"
+    assert result.loc["00", ["grade_B", "grade_C", "grade_S"]].tolist() == [2, 2, 0]
+    assert result.loc["01", "modal_grade"] == "F"
+    assert result.loc["01", "grade_F"] == 0
@@ -0,0 +1,149 @@
+"""Unit tests for the columnar analysis dataset."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from scylla.analysis.dataset import (
+    MANIFEST_FILENAME,
+    compute_source_hashes,
+    dataset_is_current,
+    read_dataset,
+    write_dataset,
+)
+
+
+def _make_fullruns(tmp_path: Path) -> Path:
+    """Create a fullruns/ tree with one experiment and two runs."""
+    data_dir = tmp_path / "fullruns"
+    exp_dir = data_dir / "exp1" / "2026-01-31T10-00-00-run"
+    (exp_dir / "config").mkdir(parents=True)
+    (exp_dir / "config" / "experiment.json").write_text(
+        json.dumps({"models": ["claude-sonnet-4-6"]})
+    )
+    for run_num in (1, 2):
+        run_dir = exp_dir / "T0" / "00" / f"run_{run_num:02d}"
+        run_dir.mkdir(parents=True)
+        (run_dir / "run_result.json").write_text(json.dumps({"judge_score": 0.5}))
+    return data_dir
+
+
+@pytest.fixture
+def written_dataset(
+    tmp_path: Path,
+    sample_runs_df: pd.DataFrame,
+    sample_judges_df: pd.DataFrame,
+    sample_criteria_df: pd.DataFrame,
+    sample_subtests_df: pd.DataFrame,
+) -> tuple[Path, Path]:
+    """Write the sample frames as a dataset; return (dataset_dir, data_dir)."""
+    data_dir = _make_fullruns(tmp_path)
+    dataset_dir = tmp_path / "dataset"
+    write_dataset(
+        dataset_dir,
+        sample_runs_df,
+        sample_judges_df,
+        sample_criteria_df,
+        sample_subtests_df,
+        compute_source_hashes(data_dir),
+    )
+    return dataset_dir, data_dir
+
+
+class TestRoundTrip:
+    """Tests for write_dataset() / read_dataset()."""
+
+    def test_frames_round_trip(
+        self, written_dataset: tuple[Path, Path], sample_runs_df: pd.DataFrame
+    ) -> None:
+        """Read frames equal the written ones with identifier columns decoded."""
+        dataset = read_dataset(written_dataset[0])
+
+        pd.testing.assert_frame_equal(dataset.runs_df, sample_runs_df, check_dtype=False)
+        assert dataset.runs_df["tier"].dtype == object
+
+    def test_categorical_option_keeps_category_dtype(
+        self, written_dataset: tuple[Path, Path]
+    ) -> None:
+        """categorical=True keeps dictionary-encoded identifier columns."""
+        dataset = read_dataset(written_dataset[0], categorical=True)
+
+        assert isinstance(dataset.runs_df["tier"].dtype, pd.CategoricalDtype)
+        assert isinstance(dataset.judges_df["judge_model"].dtype, pd.CategoricalDtype)
+
+    def test_manifest_records_tables_and_sources(
+        self, written_dataset: tuple[Path, Path], sample_runs_df: pd.DataFrame
+    ) -> None:
+        """Manifest lists row counts, dtypes and per-experiment source hashes."""
+        manifest = json.loads((written_dataset[0] / MANIFEST_FILENAME).read_text())
+
+        assert manifest["tables"]["runs"]["rows"] == len(sample_runs_df)
+        assert manifest["tables"]["runs"]["dtypes"]["tier"] == "category"
+        assert set(manifest["sources"]) == {"exp1"}
+
+    def test_mixed_criterion_values_are_coerced(self, tmp_path: Path) -> None:
+        """'N/A' strings in numeric criterion columns become NaN instead of failing."""
+        criteria_df = pd.DataFrame(
+            {"criterion": ["functional", "quality"], "criterion_achieved": [1.0, "N/A"]}
+        )
+        empty = pd.DataFrame()
+        write_dataset(tmp_path / "ds", empty, empty, criteria_df, empty, {})
+
+        criteria = read_dataset(tmp_path / "ds").criteria_df
+
+        assert criteria["criterion_achieved"].iloc[0] == pytest.approx(1.0)
+        assert pd.isna(criteria["criterion_achieved"].iloc[1])
+
+    def test_read_without_manifest_raises(self, tmp_path: Path) -> None:
+        """read_dataset() raises FileNotFoundError for a non-dataset directory."""
+        with pytest.raises(FileNotFoundError):
+            read_dataset(tmp_path)
+
+
+class TestDatasetIsCurrent:
+    """Tests for dataset_is_current()."""
+
+    def test_current_after_write(self, written_dataset: tuple[Path, Path]) -> None:
+        """A freshly written dataset is current."""
+        dataset_dir, data_dir = written_dataset
+
+        assert dataset_is_current(dataset_dir, data_dir)
+
+    def test_stale_after_source_change(self, written_dataset: tuple[Path, Path]) -> None:
+        """Modifying a run_result.json makes the dataset stale."""
+        dataset_dir, data_dir = written_dataset
+        result = next(data_dir.rglob("run_result.json"))
+        st = result.stat()
+        os.utime(result, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        assert not dataset_is_current(dataset_dir, data_dir)
+
+    def test_stale_after_new_run(self, written_dataset: tuple[Path, Path]) -> None:
+        """Adding a run makes the dataset stale."""
+        dataset_dir, data_dir = written_dataset
+        run_dir = next(data_dir.rglob("run_01")).parent / "run_03"
+        run_dir.mkdir()
+        (run_dir / "run_result.json").write_text("{}")
+
+        assert not dataset_is_current(dataset_dir, data_dir)
+
+    def test_stale_after_pipeline_change(self, written_dataset: tuple[Path, Path]) -> None:
+        """A dataset written by another pipeline version is stale."""
+        dataset_dir, data_dir = written_dataset
+        manifest_path = dataset_dir / MANIFEST_FILENAME
+        manifest = json.loads(manifest_path.read_text())
+        manifest["pipeline_version"] = "0.0.0"
+        manifest_path.write_text(json.dumps(manifest))
+
+        assert not dataset_is_current(dataset_dir, data_dir)
+
+    def test_missing_dataset_is_not_current(self, tmp_path: Path) -> None:
+        """A directory without a manifest is never current."""
+        assert not dataset_is_current(tmp_path / "nope", _make_fullruns(tmp_path))
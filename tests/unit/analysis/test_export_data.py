@@ -663,6 +663,28 @@ def test_compute_power_analysis_includes_omnibus(sample_runs_df: pd.DataFrame) -
     assert len(omnibus_entries) == len(models)
 
 
+def test_run_power_tasks_deduplicates() -> None:
+    """Identical power tasks are simulated once and shared."""
+    import export_data
+
+    tasks = [("mw", (10, 10, 0.3)), ("mw", (10, 10, 0.3)), ("kw", ((10, 10, 10), 0.06))]
+
+    powers = export_data._run_power_tasks(tasks)
+
+    assert export_data.mann_whitney_power.call_count == 1
+    assert export_data.kruskal_wallis_power.call_count == 1
+    assert powers == {tasks[0]: 0.8, tasks[2]: 0.75}
+
+
+def test_run_power_tasks_process_pool_matches_serial() -> None:
+    """A process pool returns the same mapping as in-process simulation."""
+    from export_data import _run_power_tasks
+
+    tasks = [("mw", (6, 7, 0.4)), ("mw", (6, 7, 0.3)), ("kw", ((5, 6, 5), 0.06))]
+
+    assert _run_power_tasks(tasks, jobs=2) == _run_power_tasks(tasks, jobs=1)
+
+
 def test_compute_correlations_structure(sample_runs_df: pd.DataFrame) -> None:
     """_compute_correlations returns Spearman rho entries with required fields."""
     from export_data import _compute_correlations
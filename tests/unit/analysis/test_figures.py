@@ -4,6 +4,7 @@
 from typing import Any
 
 import pandas as pd
+import pytest
 
 
 def test_fig01_score_variance_by_tier(sample_runs_df: pd.DataFrame, tmp_path: Path) -> None:
@@ -957,3 +958,81 @@ def test_task_analysis_module_structure() -> None:
     assert hasattr(task_analysis, "fig36_tier_rank_stability")
     assert hasattr(task_analysis, "fig37_complexity_vs_differentiation")
     assert hasattr(task_analysis, "fig38_full_ablation_comparison")
+
+
+def test_defer_rendering_queues_jobs(tmp_path: Path) -> None:
+    """Inside defer_rendering() save_figure writes the spec and queues the render."""
+    import altair as alt
+
+    from scylla.analysis.figures.spec_builder import defer_rendering, save_figure
+
+    chart = alt.Chart(pd.DataFrame({"x": [1, 2], "y": [3, 4]})).mark_bar().encode(x="x", y="y")
+
+    with defer_rendering() as queue:
+        save_figure(chart, "deferred", tmp_path, render=True, formats=["png"])
+
+    assert (tmp_path / "deferred.vl.json").exists()
+    assert not (tmp_path / "deferred.png").exists()
+    assert [job.name for job in queue] == ["deferred"]
+    assert queue[0].outputs == (("png", str(tmp_path / "deferred.png")),)
+
+
+def test_render_job_matches_synchronous_render(tmp_path: Path) -> None:
+    """render_job() produces the same PNG as synchronous save_figure()."""
+    import altair as alt
+
+    from scylla.analysis.figures.spec_builder import defer_rendering, render_job, save_figure
+
+    chart = alt.Chart(pd.DataFrame({"x": [1, 2], "y": [3, 4]})).mark_bar().encode(x="x", y="y")
+    sync_dir = tmp_path / "sync"
+    deferred_dir = tmp_path / "deferred"
+
+    save_figure(chart, "fig", sync_dir, render=True, formats=["png"])
+    with defer_rendering() as queue:
+        save_figure(chart, "fig", deferred_dir, render=True, formats=["png"])
+    result = render_job(queue[0])
+
+    assert result.errors == ()
+    assert result.rendered == (str(deferred_dir / "fig.png"),)
+    assert (deferred_dir / "fig.png").read_bytes() == (sync_dir / "fig.png").read_bytes()
+
+
+def test_run_figures_parallel_rendering(sample_runs_df: pd.DataFrame, tmp_path: Path) -> None:
+    """run_figures(jobs=2) builds specs in-process and renders them in a pool."""
+    from scripts.generate_figures import run_figures
+
+    success, failed = run_figures(
+        sample_runs_df,
+        pd.DataFrame(),
+        pd.DataFrame(),
+        tmp_path,
+        ["fig04_pass_rate_by_tier", "fig06_cop_by_tier"],
+        render=True,
+        jobs=2,
+    )
+
+    assert (success, failed) == (2, [])
+    for name in ("fig04_pass_rate_by_tier", "fig06_cop_by_tier"):
+        assert (tmp_path / f"{name}.vl.json").exists()
+        assert (tmp_path / f"{name}.png").exists()
+
+
+def test_run_figures_skips_unchanged_figures(
+    sample_runs_df: pd.DataFrame, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """A second run on identical data skips the figure; changed data rebuilds it."""
+    from scripts.generate_figures import run_figures
+
+    args = (pd.DataFrame(), pd.DataFrame(), tmp_path, ["fig04_pass_rate_by_tier"])
+    run_figures(sample_runs_df, *args, render=False)
+    spec = tmp_path / "fig04_pass_rate_by_tier.vl.json"
+    mtime = spec.stat().st_mtime_ns
+    capsys.readouterr()
+
+    assert run_figures(sample_runs_df, *args, render=False) == (1, [])
+    assert "skipped (cached)" in capsys.readouterr().out
+    assert spec.stat().st_mtime_ns == mtime
+
+    run_figures(sample_runs_df.iloc[:-1], *args, render=False)
+    assert "generated successfully" in capsys.readouterr().out
+    assert spec.stat().st_mtime_ns != mtime
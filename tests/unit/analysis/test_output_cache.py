@@ -0,0 +1,144 @@
+"""Unit tests for the figure/table output cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from scylla.analysis.output_cache import (
+    MANIFEST_FILENAME,
+    SHARED_SOURCES,
+    OutputCache,
+    frame_digest,
+)
+
+
+def _table(df: pd.DataFrame) -> tuple[str, str]:
+    """Stand-in table generator."""
+    return df.to_string(), ""
+
+
+def _other_table(df: pd.DataFrame) -> tuple[str, str]:
+    """Second generator defined in the same module."""
+    return "", df.to_string()
+
+
+@pytest.fixture
+def frame() -> pd.DataFrame:
+    """Small frame with numeric, string and list columns."""
+    return pd.DataFrame({"tier": ["T0", "T1"], "score": [0.5, 0.75], "tags": [["a"], ["b", "c"]]})
+
+
+def _build(cache: OutputCache, name: str, key: str | None) -> Path:
+    """Write one output file and record it."""
+    out = cache.output_dir / f"{name}.md"
+    cache.output_dir.mkdir(parents=True, exist_ok=True)
+    out.write_text(name)
+    cache.record(name, key, [out])
+    return out
+
+
+class TestFrameDigest:
+    """Tests for frame_digest()."""
+
+    def test_equal_frames_hash_equal(self, frame: pd.DataFrame) -> None:
+        """Digest depends on content, not object identity."""
+        assert frame_digest(frame) == frame_digest(frame.copy())
+
+    def test_value_change_changes_digest(self, frame: pd.DataFrame) -> None:
+        """Changing one value, including inside a list column, changes the digest."""
+        changed = frame.copy()
+        changed.loc[1, "score"] = 0.8
+        tags_changed = frame.copy()
+        tags_changed.at[0, "tags"] = ["z"]
+
+        assert frame_digest(changed) != frame_digest(frame)
+        assert frame_digest(tags_changed) != frame_digest(frame)
+
+    def test_added_rows_change_digest(self, frame: pd.DataFrame) -> None:
+        """Appending a row (e.g. a new experiment's runs) changes the digest."""
+        extended = pd.concat([frame, frame.iloc[:1]], ignore_index=True)
+        assert frame_digest(extended) != frame_digest(frame)
+
+
+def test_shared_sources_cover_frame_modules() -> None:
+    """The loader and DataFrame builders that generators import are fingerprinted."""
+    names = {path.name for path in SHARED_SOURCES}
+
+    assert {"loader.py", "dataframes.py"} <= names
+    assert all(path.exists() for path in SHARED_SOURCES)
+
+
+class TestOutputCache:
+    """Tests for OutputCache."""
+
+    def test_round_trip_across_instances(self, frame: pd.DataFrame, tmp_path: Path) -> None:
+        """A recorded output is current for a new cache instance with the same key."""
+        cache = OutputCache(tmp_path)
+        key = cache.key(_table, [frame])
+        _build(cache, "tab", key)
+        cache.save()
+
+        reloaded = OutputCache(tmp_path)
+        assert (tmp_path / MANIFEST_FILENAME).exists()
+        assert reloaded.is_current("tab", reloaded.key(_table, [frame.copy()]))
+
+    def test_key_depends_on_inputs_generator_and_params(
+        self, frame: pd.DataFrame, tmp_path: Path
+    ) -> None:
+        """Different data, generator or parameters give different keys."""
+        cache = OutputCache(tmp_path)
+        key = cache.key(_table, [frame], render=True)
+
+        assert cache.key(_table, [frame.iloc[:1]], render=True) != key
+        assert cache.key(_other_table, [frame], render=True) != key
+        assert cache.key(_table, [frame], render=False) != key
+        assert cache.key(_table, [frame], render=True) == key
+
+    def test_missing_output_is_not_current(self, frame: pd.DataFrame, tmp_path: Path) -> None:
+        """Deleting a recorded output forces a rebuild."""
+        cache = OutputCache(tmp_path)
+        key = cache.key(_table, [frame])
+        out = _build(cache, "tab", key)
+
+        assert cache.is_current("tab", key)
+        out.unlink()
+        assert not cache.is_current("tab", key)
+
+    def test_disabled_cache_still_records(self, frame: pd.DataFrame, tmp_path: Path) -> None:
+        """With caching disabled nothing is current, but the manifest stays accurate."""
+        disabled = OutputCache(tmp_path, enabled=False)
+        key = disabled.key(_table, [frame])
+        _build(disabled, "tab", key)
+        disabled.save()
+
+        assert not disabled.is_current("tab", key)
+        assert OutputCache(tmp_path).is_current("tab", key)
+
+    def test_unhashable_generator_is_never_cached(self, tmp_path: Path) -> None:
+        """Inputs that cannot be hashed yield no key and are always rebuilt."""
+        cache = OutputCache(tmp_path)
+        key = cache.key(lambda df: ("", ""), [object()])
+
+        assert key is None
+        _build(cache, "tab", key)
+        assert not cache.is_current("tab", key)
+
+    def test_written_since_detects_new_and_modified_files(self, tmp_path: Path) -> None:
+        """Only files created or rewritten after the snapshot are reported."""
+        (tmp_path / "old.csv").write_text("old")
+        (tmp_path / "changed.csv").write_text("v1")
+        cache = OutputCache(tmp_path)
+        before = cache.snapshot()
+
+        (tmp_path / "new.csv").write_text("new")
+        (tmp_path / "changed.csv").write_text("v2 longer")
+
+        assert sorted(p.name for p in cache.written_since(before)) == ["changed.csv", "new.csv"]
+
+    def test_corrupt_manifest_is_ignored(self, tmp_path: Path) -> None:
+        """An unreadable manifest starts an empty cache instead of failing."""
+        (tmp_path / MANIFEST_FILENAME).write_text("{not json")
+        assert not OutputCache(tmp_path).is_current("tab", "key")
@@ -0,0 +1,119 @@
+"""Unit tests for multi-factor rank tests."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from scylla.analysis.rank_tests import scheirer_ray_hare_factorial
+from scylla.analysis.stats import scheirer_ray_hare
+
+
+def _masked_srh(data: pd.DataFrame, value_col: str, a: str, b: str) -> dict[str, dict[str, float]]:
+    """Two-factor SRH with one boolean mask per level and cell (reference)."""
+    from scipy import stats
+
+    ranks = data[value_col].rank()
+    mean_rank = ranks.mean()
+    ms_total = ((ranks - mean_rank) ** 2).sum() / (len(data) - 1)
+
+    def ss(masks: list[pd.Series]) -> float:
+        return float(
+            sum(m.sum() * (ranks[m].mean() - mean_rank) ** 2 for m in masks if m.sum() > 0)
+        )
+
+    levels_a, levels_b = data[a].unique(), data[b].unique()
+    ss_a = ss([data[a] == la for la in levels_a])
+    ss_b = ss([data[b] == lb for lb in levels_b])
+    ss_ab = ss([(data[a] == la) & (data[b] == lb) for la in levels_a for lb in levels_b])
+    ss_ab -= ss_a + ss_b
+    dfs = (len(levels_a) - 1, len(levels_b) - 1, (len(levels_a) - 1) * (len(levels_b) - 1))
+
+    return {
+        name: {
+            "h_statistic": s / ms_total,
+            "df": df,
+            "p_value": 1 - stats.chi2.cdf(s / ms_total, df),
+        }
+        for name, s, df in zip((a, b, "interaction"), (ss_a, ss_b, ss_ab), dfs, strict=True)
+    }
+
+
+@pytest.fixture
+def factorial_df() -> pd.DataFrame:
+    """Unbalanced three-factor data with a strong main effect of ``tier``."""
+    rng = np.random.default_rng(7)
+    n = 300
+    tier = rng.choice(["T0", "T1", "T2", "T3"], n)
+    return pd.DataFrame(
+        {
+            "score": rng.random(n) + (tier == "T3") * 0.8,
+            "cost_usd": rng.random(n).round(1),
+            "agent_model": rng.choice(["haiku", "sonnet"], n),
+            "tier": tier,
+            "experiment": rng.choice(["exp1", "exp2", "exp3"], n),
+        }
+    )
+
+
+class TestScheirerRayHareFactorial:
+    """Tests for scheirer_ray_hare_factorial()."""
+
+    def test_two_factors_match_masked_reference(self, factorial_df: pd.DataFrame) -> None:
+        """Bincount statistics equal the per-level boolean-mask computation."""
+        expected = _masked_srh(factorial_df, "score", "agent_model", "tier")
+
+        result = scheirer_ray_hare(factorial_df, "score", "agent_model", "tier")
+
+        assert list(result) == ["agent_model", "tier", "interaction"]
+        for effect, values in expected.items():
+            assert result[effect]["df"] == values["df"]
+            assert result[effect]["h_statistic"] == pytest.approx(values["h_statistic"], rel=1e-12)
+            assert result[effect]["p_value"] == pytest.approx(values["p_value"], rel=1e-9)
+
+    def test_three_factors_report_all_effects(self, factorial_df: pd.DataFrame) -> None:
+        """Three factors give three main effects, three 2-way and one 3-way interaction."""
+        result = scheirer_ray_hare_factorial(
+            factorial_df, "score", ["agent_model", "tier", "experiment"]
+        )["score"]
+
+        assert list(result) == [
+            "agent_model",
+            "tier",
+            "experiment",
+            "agent_model:tier",
+            "agent_model:experiment",
+            "tier:experiment",
+            "agent_model:tier:experiment",
+        ]
+        assert result["agent_model:tier:experiment"]["df"] == 1 * 3 * 2
+        assert result["tier"]["p_value"] < 0.001
+        assert result["agent_model"]["p_value"] > 0.01
+
+    def test_main_effects_independent_of_other_factors(self, factorial_df: pd.DataFrame) -> None:
+        """Adding a factor leaves the main-effect statistics unchanged."""
+        two = scheirer_ray_hare_factorial(factorial_df, "score", ["agent_model", "tier"])
+        three = scheirer_ray_hare_factorial(
+            factorial_df, "score", ["agent_model", "tier", "experiment"]
+        )
+
+        assert three["score"]["tier"] == two["score"]["tier"]
+
+    def test_multiple_columns_drop_missing_per_column(self, factorial_df: pd.DataFrame) -> None:
+        """Each value column matches a separate run on its own non-missing rows."""
+        df = factorial_df.copy()
+        df.loc[df.index[::7], "cost_usd"] = np.nan
+
+        result = scheirer_ray_hare_factorial(df, ["score", "cost_usd"], ["agent_model", "tier"])
+
+        for col in ("score", "cost_usd"):
+            alone = scheirer_ray_hare_factorial(
+                df.dropna(subset=[col]), col, ["agent_model", "tier"]
+            )
+            assert result[col] == alone[col]
+
+    def test_requires_a_factor(self, factorial_df: pd.DataFrame) -> None:
+        """An empty factor list raises ValueError."""
+        with pytest.raises(ValueError, match="at least one factor"):
+            scheirer_ray_hare_factorial(factorial_df, "score", [])
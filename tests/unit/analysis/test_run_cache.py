@@ -0,0 +1,176 @@
+"""Unit tests for the parsed-run cache and cached/parallel experiment loading."""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from scylla.analysis.loader import load_all_experiments, load_experiment
+from scylla.analysis.run_cache import CACHE_FILENAME, RunCache, run_fingerprint
+
+
+def _write_run(run_dir: Path, score: float, judges: int = 0) -> None:
+    """Create a minimal run directory with optional judge outputs."""
+    run_dir.mkdir(parents=True, exist_ok=True)
+    (run_dir / "run_result.json").write_text(
+        json.dumps(
+            {
+                "judge_score": score,
+                "judge_passed": score >= 0.5,
+                "judge_grade": "A",
+                "cost_usd": 0.05,
+                "duration_seconds": 10.0,
+                "token_stats": {},
+                "exit_code": 0,
+            }
+        )
+    )
+    for n in range(1, judges + 1):
+        judge_dir = run_dir / "judge" / f"judge_{n:02d}"
+        judge_dir.mkdir(parents=True, exist_ok=True)
+        (judge_dir / "judgment.json").write_text(json.dumps({"score": score, "passed": True}))
+        (judge_dir / "MODEL.md").write_text("**Model**: claude-opus-4-6\n")
+
+
+def _make_experiment(tmp_path: Path, n_runs: int = 3) -> Path:
+    """Create a fullruns/ tree with one experiment and ``n_runs`` runs in T0/00."""
+    exp_dir = tmp_path / "fullruns" / "exp1" / "2026-01-31T10-00-00-run"
+    (exp_dir / "config").mkdir(parents=True)
+    (exp_dir / "config" / "experiment.json").write_text(
+        json.dumps({"models": ["claude-sonnet-4-6"]})
+    )
+    for run_num in range(1, n_runs + 1):
+        _write_run(exp_dir / "T0" / "00" / f"run_{run_num:02d}", 0.1 * run_num, judges=2)
+    return exp_dir
+
+
+def _touch_later(path: Path) -> None:
+    """Bump a file's mtime so its fingerprint changes even on coarse clocks."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class TestRunFingerprint:
+    """Tests for run_fingerprint()."""
+
+    def test_covers_run_and_judge_files(self, tmp_path: Path) -> None:
+        """Fingerprint lists run_result.json and each judge's files."""
+        run_dir = tmp_path / "run_01"
+        _write_run(run_dir, 0.5, judges=2)
+
+        fingerprint = run_fingerprint(run_dir, "exp", "T0", "00", "model")
+
+        names = [entry[0] for entry in fingerprint[4]]
+        assert "run_result.json" in names
+        assert str(Path("judge/judge_01/judgment.json")) in names
+        assert str(Path("judge/judge_02/MODEL.md")) in names
+        assert fingerprint[:4] == ("exp", "T0", "00", "model")
+
+    def test_changes_when_file_modified(self, tmp_path: Path) -> None:
+        """Touching a judgment changes the fingerprint."""
+        run_dir = tmp_path / "run_01"
+        _write_run(run_dir, 0.5, judges=1)
+        before = run_fingerprint(run_dir, "exp", "T0", "00", "model")
+
+        _touch_later(run_dir / "judge" / "judge_01" / "judgment.json")
+
+        assert run_fingerprint(run_dir, "exp", "T0", "00", "model") != before
+
+
+class TestRunCache:
+    """Tests for RunCache persistence."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Runs stored and saved are served from a fresh cache instance."""
+        exp_dir = _make_experiment(tmp_path)
+        cache_dir = tmp_path / "cache"
+
+        cache = RunCache(cache_dir)
+        runs = load_experiment(exp_dir, "claude-sonnet-4-6", cache=cache)
+        cache.save()
+
+        assert (cache_dir / CACHE_FILENAME).exists()
+        reopened = RunCache(cache_dir)
+        assert len(reopened) == 3
+        with patch("scylla.analysis.loader.load_run") as mock_load:
+            cached = load_experiment(exp_dir, "claude-sonnet-4-6", cache=reopened)
+        mock_load.assert_not_called()
+        assert reopened.hits == 3
+        assert [r.score for r in cached] == [r.score for r in runs]
+        assert [len(r.judges) for r in cached] == [2, 2, 2]
+
+    def test_only_changed_runs_are_reparsed(self, tmp_path: Path) -> None:
+        """A modified run_result.json invalidates only that run."""
+        exp_dir = _make_experiment(tmp_path)
+        cache_dir = tmp_path / "cache"
+        cache = RunCache(cache_dir)
+        load_experiment(exp_dir, "claude-sonnet-4-6", cache=cache)
+        cache.save()
+
+        _write_run(exp_dir / "T0" / "00" / "run_02", 0.9)
+        _touch_later(exp_dir / "T0" / "00" / "run_02" / "run_result.json")
+
+        reopened = RunCache(cache_dir)
+        runs = load_experiment(exp_dir, "claude-sonnet-4-6", cache=reopened)
+
+        assert reopened.hits == 2
+        assert reopened.misses == 1
+        assert runs[1].score == pytest.approx(0.9)
+
+    def test_corrupt_cache_file_is_ignored(self, tmp_path: Path) -> None:
+        """An unreadable cache file starts an empty cache instead of raising."""
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        (cache_dir / CACHE_FILENAME).write_bytes(b"not a pickle")
+
+        assert len(RunCache(cache_dir)) == 0
+
+    def test_save_drops_deleted_runs(self, tmp_path: Path) -> None:
+        """Entries whose run directory was removed are pruned on save."""
+        exp_dir = _make_experiment(tmp_path)
+        cache_dir = tmp_path / "cache"
+        cache = RunCache(cache_dir)
+        load_experiment(exp_dir, "claude-sonnet-4-6", cache=cache)
+
+        shutil.rmtree(exp_dir / "T0" / "00" / "run_03")
+        cache.save()
+
+        assert len(RunCache(cache_dir)) == 2
+
+
+class TestParallelLoading:
+    """Tests for process-pool loading."""
+
+    def test_parallel_matches_serial(self, tmp_path: Path) -> None:
+        """jobs>1 returns the same runs in the same order as serial loading."""
+        exp_dir = _make_experiment(tmp_path, n_runs=4)
+
+        serial = load_experiment(exp_dir, "claude-sonnet-4-6")
+        parallel = load_experiment(exp_dir, "claude-sonnet-4-6", jobs=2)
+
+        assert [r.run_number for r in parallel] == [r.run_number for r in serial]
+        assert [r.score for r in parallel] == [r.score for r in serial]
+
+    def test_parallel_skips_corrupted_runs(self, tmp_path: Path) -> None:
+        """Worker failures are logged and skipped, not raised."""
+        exp_dir = _make_experiment(tmp_path, n_runs=3)
+        (exp_dir / "T0" / "00" / "run_02" / "run_result.json").write_text("{bad json")
+
+        runs = load_experiment(exp_dir, "claude-sonnet-4-6", jobs=2)
+
+        assert [r.run_number for r in runs] == [1, 3]
+
+    def test_load_all_experiments_with_cache_dir(self, tmp_path: Path) -> None:
+        """load_all_experiments() persists the cache when cache_dir is given."""
+        _make_experiment(tmp_path)
+        cache_dir = tmp_path / "cache"
+
+        experiments = load_all_experiments(tmp_path / "fullruns", cache_dir=cache_dir, jobs=2)
+
+        assert len(experiments["exp1"]) == 3
+        assert len(RunCache(cache_dir)) == 3
@@ -0,0 +1,52 @@
+"""Unit tests for start-up profiling and lazy package imports."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+from scylla.analysis.startup import StartupProfiler
+
+
+class TestStartupProfiler:
+    """Tests for StartupProfiler."""
+
+    def test_report_lists_steps_and_budget(self) -> None:
+        """Every marked step appears in the report along with the budget verdict."""
+        profiler = StartupProfiler()
+        profiler.mark("script imports")
+        profiler.mark("load data", startup=False)
+
+        report = profiler.report(budget=1000.0)
+
+        assert "script imports" in report
+        assert "load data" in report and "(not startup)" in report
+        assert "within budget of 1000.00s" in report
+
+    def test_non_startup_steps_excluded_from_budget(self) -> None:
+        """Work steps do not count towards the startup total."""
+        profiler = StartupProfiler()
+        profiler.mark("imports")
+        before = profiler.startup_seconds()
+        profiler.mark("load data", startup=False)
+
+        assert profiler.startup_seconds() == before
+
+    def test_over_budget_is_flagged(self) -> None:
+        """A zero budget is always exceeded."""
+        profiler = StartupProfiler()
+        profiler.mark("imports")
+
+        assert "OVER budget of 0.00s" in profiler.report(budget=0.0)
+
+
+def test_analysis_package_import_is_lazy() -> None:
+    """Importing scylla.analysis does not load pandas until a re-export is used."""
+    code = (
+        "import sys, scylla.analysis as a; before = 'pandas' in sys.modules; "
+        "a.build_runs_df; print(before, 'pandas' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False True"
@@ -5,6 +5,81 @@
 import pytest
 
 
+class TestPowerSimulations:
+    """Tests for the vectorized Monte Carlo power functions."""
+
+    @pytest.fixture(autouse=True)
+    def mock_power_simulations(self) -> None:
+        """Override the conftest mock so the real simulations run."""
+
+    @staticmethod
+    def _reference_mw_power(n1: int, n2: int, effect_size: float, n_sim: int) -> float:
+        """Per-iteration simulation loop the vectorized version replaces."""
+        from scipy.stats import norm
+
+        from scylla.analysis.config import config
+        from scylla.analysis.stats import mann_whitney_u
+
+        shift = np.sqrt(2) * norm.ppf((effect_size + 1) / 2)
+        rng = np.random.RandomState(config.power_random_state)
+        hits = 0
+        for _ in range(n_sim):
+            g1 = rng.normal(0, 1, n1)
+            g2 = rng.normal(shift, 1, n2)
+            hits += mann_whitney_u(g1, g2)[1] < config.alpha
+        return hits / n_sim
+
+    @staticmethod
+    def _reference_kw_power(sizes: list[int], effect_size: float, n_sim: int) -> float:
+        """Per-iteration simulation loop the vectorized version replaces."""
+        from scylla.analysis.config import config
+        from scylla.analysis.stats import kruskal_wallis
+
+        shifts = np.linspace(-1, 1, len(sizes)) * np.sqrt(effect_size) * 2
+        rng = np.random.RandomState(config.power_random_state)
+        hits = 0
+        for _ in range(n_sim):
+            groups = [rng.normal(s, 1, n) for s, n in zip(shifts, sizes, strict=True)]
+            hits += kruskal_wallis(*groups)[1] < config.alpha
+        return hits / n_sim
+
+    @pytest.mark.parametrize(("n1", "n2", "effect"), [(5, 5, 0.3), (3, 9, 0.7), (20, 15, 0.2)])
+    def test_mann_whitney_power_matches_loop(self, n1: int, n2: int, effect: float) -> None:
+        """Vectorized power equals the per-simulation loop with the same seed."""
+        from scylla.analysis.stats import mann_whitney_power
+
+        expected = self._reference_mw_power(n1, n2, effect, 300)
+
+        assert mann_whitney_power(n1, n2, effect, n_simulations=300) == expected
+
+    @pytest.mark.parametrize("sizes", [[5, 5, 5], [10, 4, 7, 10]])
+    def test_kruskal_wallis_power_matches_loop(self, sizes: list[int]) -> None:
+        """Vectorized power equals the per-simulation loop with the same seed."""
+        from scylla.analysis.stats import kruskal_wallis_power
+
+        expected = self._reference_kw_power(sizes, 0.06, 300)
+
+        assert kruskal_wallis_power(sizes, 0.06, n_simulations=300) == expected
+
+    def test_chunking_does_not_change_result(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Small simulation chunks consume the random stream identically."""
+        from scylla.analysis import stats
+
+        unchunked = stats.mann_whitney_power(8, 8, 0.4, n_simulations=500)
+        monkeypatch.setattr(stats, "_POWER_CHUNK_ELEMENTS", 50)
+
+        assert stats.mann_whitney_power(8, 8, 0.4, n_simulations=500) == unchunked
+
+    def test_edge_cases(self) -> None:
+        """Small samples give NaN and zero effect gives alpha."""
+        from scylla.analysis.config import config
+        from scylla.analysis.stats import kruskal_wallis_power, mann_whitney_power
+
+        assert np.isnan(mann_whitney_power(1, 5, 0.5))
+        assert mann_whitney_power(5, 5, 0.0) == config.alpha
+        assert np.isnan(kruskal_wallis_power([5], 0.06))
+
+
 def test_cliffs_delta_basic() -> None:
     """Test Cliff's delta with known values."""
     # Group 1 has higher values than Group 2
@@ -148,6 +223,54 @@ def test_bootstrap_ci_empty_array() -> None:
     assert np.isnan(upper)
 
 
+def _scipy_bca(samples: tuple[np.ndarray, ...], statistic: object) -> tuple[float, float]:
+    """Compute the reference BCa interval via scipy.stats.bootstrap with the configured seed."""
+    from scipy import stats
+
+    from scylla.analysis.config import config
+
+    res = stats.bootstrap(
+        samples,
+        statistic,
+        n_resamples=2000,
+        confidence_level=0.95,
+        method="BCa",
+        random_state=config.bootstrap_random_state,
+    )
+    return float(res.confidence_interval.low), float(res.confidence_interval.high)
+
+
+def test_bootstrap_ci_batch_matches_scipy() -> None:
+    """Batched intervals are bit-identical to one scipy bootstrap per group."""
+    from scylla.analysis.stats import bootstrap_ci_batch
+
+    rng = np.random.default_rng(0)
+    groups = [
+        rng.integers(0, 2, 20).astype(float),
+        rng.random(20),
+        rng.random(13),
+        rng.integers(0, 5, 31) / 4,
+    ]
+
+    results = bootstrap_ci_batch(groups, n_resamples=2000)
+
+    for group, (mean, low, high) in zip(groups, results, strict=True):
+        assert mean == np.mean(group)
+        assert (low, high) == _scipy_bca((group,), np.mean)
+
+
+def test_bootstrap_ci_batch_degenerate_groups() -> None:
+    """Short and zero-variance groups return point estimates within a batch."""
+    from scylla.analysis.stats import bootstrap_ci, bootstrap_ci_batch
+
+    data = np.array([0.0, 1.0, 1.0, 0.0, 1.0])
+    results = bootstrap_ci_batch([np.array([5.0]), np.ones(4), data], n_resamples=1000)
+
+    assert results[0] == (5.0, 5.0, 5.0)
+    assert results[1] == (1.0, 1.0, 1.0)
+    assert results[2] == bootstrap_ci(data, n_resamples=1000)
+
+
 def test_mann_whitney_u_basic() -> None:
     """Test Mann-Whitney U returns reasonable values."""
     from scylla.analysis.stats import mann_whitney_u
@@ -604,6 +727,27 @@ def test_cliffs_delta_ci_small_sample() -> None:
     assert delta == ci_low == ci_high
 
 
+def test_cliffs_delta_ci_batch_matches_scipy() -> None:
+    """Rank-based batched intervals equal scipy's pairwise-matrix bootstrap."""
+    from scylla.analysis.stats import cliffs_delta, cliffs_delta_ci_batch
+
+    def pairwise_delta(g1: np.ndarray, g2: np.ndarray) -> float:
+        return float(np.sign(g1[:, None] - g2[None, :]).sum() / (len(g1) * len(g2)))
+
+    rng = np.random.default_rng(1)
+    pairs = [
+        (rng.integers(0, 2, 12).astype(float), rng.integers(0, 2, 9).astype(float)),
+        (rng.random(12).round(1), rng.random(9).round(1)),
+        (rng.random(7), rng.random(15)),
+    ]
+
+    results = cliffs_delta_ci_batch(pairs, n_resamples=2000)
+
+    for (g1, g2), (delta, low, high) in zip(pairs, results, strict=True):
+        assert delta == cliffs_delta(g1, g2)
+        assert (low, high) == _scipy_bca((g1, g2), pairwise_delta)
+
+
 def test_ols_regression_perfect_line() -> None:
     """Test OLS regression with perfect linear relationship."""
     from scylla.analysis.stats import ols_regression
@@ -0,0 +1,129 @@
+"""Unit tests for scylla/e2e/agent_stream.py."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from scylla.e2e.agent_stream import AgentOutputStream
+from scylla.e2e.rate_limit import detect_rate_limit
+
+
+def _line(event: dict[str, Any]) -> str:
+    return json.dumps(event) + "\n"
+
+
+def _assistant(message_id: str, output_tokens: int) -> str:
+    return _line(
+        {
+            "type": "assistant",
+            "message": {
+                "id": message_id,
+                "usage": {"input_tokens": 10, "output_tokens": output_tokens},
+            },
+        }
+    )
+
+
+RESULT_EVENT = {
+    "type": "result",
+    "is_error": False,
+    "result": "Done",
+    "num_turns": 3,
+    "total_cost_usd": 0.25,
+    "usage": {
+        "input_tokens": 100,
+        "output_tokens": 50,
+        "cache_creation_input_tokens": 7,
+        "cache_read_input_tokens": 900,
+    },
+}
+
+
+@pytest.fixture()
+def stream(tmp_path: Path) -> AgentOutputStream:
+    """AgentOutputStream writing to a temporary agent directory."""
+    return AgentOutputStream(tmp_path / "agent" / "stdout.log", tmp_path / "agent" / "stderr.log")
+
+
+class TestAgentOutputStream:
+    """Tests for AgentOutputStream."""
+
+    def test_tees_every_line_to_log_files(self, stream: AgentOutputStream) -> None:
+        """Both streams are written to their log files unchanged."""
+        lines = [_line({"type": "system"}), "plain text\n", _line(RESULT_EVENT)]
+        for line in lines:
+            stream.feed_stdout(line)
+        stream.feed_stderr("warning: something\n")
+        stream.close()
+
+        assert stream.stdout_path.read_text() == "".join(lines)
+        assert stream.stderr_path.read_text() == "warning: something\n"
+
+    def test_metrics_from_result_event(self, stream: AgentOutputStream) -> None:
+        """The result event provides tokens, turns and cost; only it is retained."""
+        stream.feed_stdout(_assistant("msg_1", 20))
+        stream.feed_stdout(_line(RESULT_EVENT))
+        stream.close()
+
+        assert stream.has_metrics
+        assert stream.token_stats.input_tokens == 100
+        assert stream.token_stats.output_tokens == 50
+        assert stream.token_stats.cache_creation_tokens == 7
+        assert stream.token_stats.cache_read_tokens == 900
+        assert stream.api_calls == 3
+        assert stream.cost_usd == 0.25
+        assert json.loads(stream.stdout_summary()) == RESULT_EVENT
+
+    def test_metrics_from_assistant_events_without_result(self, stream: AgentOutputStream) -> None:
+        """Without a result event, usage is summed once per assistant message."""
+        stream.feed_stdout(_assistant("msg_1", 5))
+        stream.feed_stdout(_assistant("msg_1", 8))  # second content block of msg_1
+        stream.feed_stdout(_line({"type": "user"}))
+        stream.feed_stdout(_assistant("msg_2", 4))
+        stream.close()
+
+        assert stream.api_calls == 2
+        assert stream.token_stats.input_tokens == 20
+        assert stream.token_stats.output_tokens == 12
+        assert stream.cost_usd == 0.0
+
+    def test_text_output_keeps_bounded_tail(self, tmp_path: Path) -> None:
+        """Non-JSON output yields no metrics and only the trailing bytes are kept."""
+        stream = AgentOutputStream(tmp_path / "stdout.log", tmp_path / "stderr.log", tail_bytes=20)
+        for n in range(100):
+            stream.feed_stdout(f"line {n:03d}\n")
+        stream.close()
+
+        assert not stream.has_metrics
+        assert stream.stdout_summary() == "line 098\nline 099\n"
+        assert stream.stdout_path.read_text().count("\n") == 100
+
+    def test_rate_limit_event_is_retained(self, stream: AgentOutputStream) -> None:
+        """A rate-limited result event is recorded and survives in the summary."""
+        for n in range(50):
+            stream.feed_stdout(_assistant(f"msg_{n}", 1))
+        stream.feed_stdout(
+            _line({"type": "result", "is_error": True, "result": "Rate limit exceeded"})
+        )
+        stream.close()
+
+        assert stream.rate_limit_info is not None
+        assert detect_rate_limit(stream.stdout_summary(), "") is not None
+
+    def test_stderr_rate_limit_survives_tail(self, tmp_path: Path) -> None:
+        """The first stderr rate-limit line is kept even after it leaves the tail."""
+        stream = AgentOutputStream(tmp_path / "stdout.log", tmp_path / "stderr.log", tail_bytes=32)
+        stream.feed_stderr("Error: 429 Too Many Requests\n")
+        for n in range(20):
+            stream.feed_stderr(f"retrying {n}\n")
+        stream.close()
+
+        assert stream.rate_limit_info is not None
+        assert stream.rate_limit_info.error_message == "HTTP 429: Rate limit exceeded"
+        summary = stream.stderr_summary()
+        assert summary.startswith("Error: 429")
+        assert detect_rate_limit("", summary) is not None
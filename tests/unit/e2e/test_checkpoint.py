@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+import json
 import os
 import threading
 from datetime import datetime, timezone
@@ -17,8 +18,11 @@
     CheckpointError,
     ConfigMismatchError,
     E2ECheckpoint,
+    append_checkpoint_fields,
+    compact_checkpoint,
     compute_config_hash,
     get_experiment_status,
+    get_journal_path,
     load_checkpoint,
     save_checkpoint,
 )
@@ -834,3 +838,171 @@ def test_sequential_saves_still_work(self, tmp_path: Path) -> None:
         assert checkpoint_path.exists()
         loaded = load_checkpoint(checkpoint_path)
         assert loaded.experiment_id == "thread-test"
+
+
+class TestCheckpointJournal:
+    """Tests for incremental saves through checkpoint.journal."""
+
+    def _saved_checkpoint(self, tmp_path: Path) -> tuple[E2ECheckpoint, Path]:
+        """Return a checkpoint with a full snapshot on disk."""
+        checkpoint = E2ECheckpoint(
+            experiment_id="journal-test",
+            experiment_dir=str(tmp_path),
+            config_hash="abc",
+        )
+        path = tmp_path / "checkpoint.json"
+        save_checkpoint(checkpoint, path)
+        return checkpoint, path
+
+    def test_incremental_save_appends_without_rewriting_snapshot(self, tmp_path: Path) -> None:
+        """Transitions go to the journal; the snapshot bytes stay unchanged."""
+        checkpoint, path = self._saved_checkpoint(tmp_path)
+        snapshot = path.read_bytes()
+
+        checkpoint.set_run_state("T0", "00", 1, "agent_complete")
+        save_checkpoint(checkpoint, path, incremental=True)
+        checkpoint.set_subtest_state("T0", "00", "runs_in_progress")
+        checkpoint.set_tier_state("T0", "subtests_running")
+        save_checkpoint(checkpoint, path, incremental=True)
+
+        assert path.read_bytes() == snapshot
+        lines = get_journal_path(path).read_text().splitlines()
+        assert "snapshot" in json.loads(lines[0])
+        assert [json.loads(line)["op"] for line in lines[1:]] == [
+            "run",
+            "done",
+            "set",
+            "subtest",
+            "tier",
+            "set",
+        ]
+
+    def test_load_replays_journal(self, tmp_path: Path) -> None:
+        """load_checkpoint() returns snapshot plus journaled changes."""
+        checkpoint, path = self._saved_checkpoint(tmp_path)
+        checkpoint.set_run_state("T0", "00", 1, "failed")
+        checkpoint.set_run_state("T0", "00", 2, "worktree_cleaned")
+        checkpoint.unmark_run_completed("T0", "00", 1)
+        checkpoint.status = "paused_rate_limit"
+        save_checkpoint(checkpoint, path, incremental=True)
+
+        loaded = load_checkpoint(path)
+
+        assert loaded.run_states == {"T0": {"00": {"1": "failed", "2": "worktree_cleaned"}}}
+        assert loaded.completed_runs == {"T0": {"00": {2: "passed"}}}
+        assert loaded.status == "paused_rate_limit"
+        assert loaded.last_updated_at == checkpoint.last_updated_at
+
+    def test_incremental_save_of_unsynced_checkpoint_writes_snapshot(self, tmp_path: Path) -> None:
+        """A checkpoint never saved to or loaded from the path is written in full."""
+        checkpoint = E2ECheckpoint(experiment_id="fresh", config_hash="abc")
+        checkpoint.set_tier_state("T0", "pending")
+        path = tmp_path / "checkpoint.json"
+
+        save_checkpoint(checkpoint, path, incremental=True)
+
+        assert not get_journal_path(path).exists()
+        assert json.loads(path.read_text())["tier_states"] == {"T0": "pending"}
+
+    def test_full_save_compacts_journal(self, tmp_path: Path) -> None:
+        """A full save folds the journal into the snapshot and removes it."""
+        checkpoint, path = self._saved_checkpoint(tmp_path)
+        checkpoint.set_tier_state("T0", "complete")
+        save_checkpoint(checkpoint, path, incremental=True)
+        assert get_journal_path(path).exists()
+
+        save_checkpoint(checkpoint, path)
+
+        assert not get_journal_path(path).exists()
+        assert json.loads(path.read_text())["tier_states"] == {"T0": "complete"}
+
+    def test_incremental_save_compacts_at_record_limit(self, tmp_path: Path) -> None:
+        """Reaching CHECKPOINT_JOURNAL_MAX_RECORDS triggers a full snapshot."""
+        checkpoint, path = self._saved_checkpoint(tmp_path)
+
+        with patch("scylla.e2e.checkpoint.CHECKPOINT_JOURNAL_MAX_RECORDS", 2):
+            for run_num in range(1, 4):
+                checkpoint.set_run_state("T0", "00", run_num, "worktree_created")
+                save_checkpoint(checkpoint, path, incremental=True)
+
+        snapshot = json.loads(path.read_text())
+        assert snapshot["run_states"]["T0"]["00"].keys() == {"1", "2"}
+        assert load_checkpoint(path).run_states["T0"]["00"].keys() == {"1", "2", "3"}
+
+    def test_stale_journal_is_ignored(self, tmp_path: Path) -> None:
+        """A journal written against an older snapshot is not replayed."""
+        checkpoint, path = self._saved_checkpoint(tmp_path)
+        checkpoint.set_tier_state("T0", "complete")
+        save_checkpoint(checkpoint, path, incremental=True)
+
+        data = json.loads(path.read_text())
+        data["tier_states"] = {"T1": "pending"}
+        path.write_text(json.dumps(data))
+
+        assert load_checkpoint(path).tier_states == {"T1": "pending"}
+
+    def test_torn_last_record_is_dropped(self, tmp_path: Path) -> None:
+        """A partially written final line from a crash is skipped on load."""
+        checkpoint, path = self._saved_checkpoint(tmp_path)
+        checkpoint.set_tier_state("T0", "complete")
+        save_checkpoint(checkpoint, path, incremental=True)
+        with open(get_journal_path(path), "a") as f:
+            f.write('{"op":"tier","t":"T1"')
+
+        assert load_checkpoint(path).tier_states == {"T0": "complete"}
+
+    def test_loaded_checkpoint_keeps_journaling(self, tmp_path: Path) -> None:
+        """A checkpoint returned by load_checkpoint() can save incrementally."""
+        checkpoint, path = self._saved_checkpoint(tmp_path)
+        checkpoint.set_tier_state("T0", "config_loaded")
+        save_checkpoint(checkpoint, path, incremental=True)
+
+        resumed = load_checkpoint(path)
+        resumed.set_tier_state("T0", "subtests_running")
+        save_checkpoint(resumed, path, incremental=True)
+
+        assert load_checkpoint(path).tier_states == {"T0": "subtests_running"}
+        assert len(get_journal_path(path).read_text().splitlines()) > 2
+
+    def test_append_checkpoint_fields(self, tmp_path: Path) -> None:
+        """Scalar fields can be journaled without the in-memory checkpoint."""
+        path = tmp_path / "checkpoint.json"
+        assert append_checkpoint_fields(path, last_heartbeat="x") is False
+
+        _, path = self._saved_checkpoint(tmp_path)
+        assert append_checkpoint_fields(path, last_heartbeat="2026-01-01T00:00:00") is True
+
+        assert load_checkpoint(path).last_heartbeat == "2026-01-01T00:00:00"
+
+    def test_compact_checkpoint(self, tmp_path: Path) -> None:
+        """compact_checkpoint() leaves a self-contained checkpoint.json."""
+        checkpoint, path = self._saved_checkpoint(tmp_path)
+        checkpoint.set_run_state("T0", "00", 1, "replay_generated")
+        save_checkpoint(checkpoint, path, incremental=True)
+
+        compacted = compact_checkpoint(path)
+
+        assert compacted.get_run_state("T0", "00", 1) == "replay_generated"
+        assert not get_journal_path(path).exists()
+        assert json.loads(path.read_text())["run_states"] == {
+            "T0": {"00": {"1": "replay_generated"}}
+        }
+
+    def test_concurrent_incremental_saves_lose_no_transitions(self, tmp_path: Path) -> None:
+        """Threads journaling different runs all land in the replayed state."""
+        checkpoint, path = self._saved_checkpoint(tmp_path)
+
+        def worker(run_num: int) -> None:
+            for state in ("worktree_created", "agent_complete", "worktree_cleaned"):
+                checkpoint.set_run_state("T0", "00", run_num, state)
+                save_checkpoint(checkpoint, path, incremental=True)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(1, 9)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        loaded = load_checkpoint(path)
+        assert loaded.run_states["T0"]["00"] == {str(n): "worktree_cleaned" for n in range(1, 9)}
+        assert loaded.completed_runs["T0"]["00"] == dict.fromkeys(range(1, 9), "passed")
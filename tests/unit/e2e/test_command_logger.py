@@ -75,6 +75,26 @@ def test_log_command(self) -> None:
             assert stdout_file.exists()
             assert stdout_file.read_text() == "hello\n"
 
+    def test_update_last_command_copies_streamed_logs(self) -> None:
+        """update_last_command copies log files from streamed output paths."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_dir = Path(tmpdir)
+            logger = CommandLogger(log_dir=log_dir)
+            log = logger.log_command(cmd=["agent"], stdout="", stderr="", exit_code=0, duration=0)
+            (log_dir / "stdout.log").write_text("full transcript\n")
+
+            logger.update_last_command(
+                stdout="summary",
+                stderr="err",
+                exit_code=1,
+                duration=2.0,
+                stdout_path=log_dir / "stdout.log",
+            )
+
+            assert (log_dir / log.stdout_file).read_text() == "full transcript\n"
+            assert (log_dir / log.stderr_file).read_text() == "err"
+            assert logger.commands[-1].exit_code == 1
+
     def test_save(self) -> None:
         """Test saving command log to JSON."""
         with tempfile.TemporaryDirectory() as tmpdir:
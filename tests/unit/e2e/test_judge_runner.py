@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import threading
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -14,10 +15,11 @@
     _has_valid_judge_result,
     _load_judge_result,
     _run_judge,
+    _run_judges_concurrently,
     _save_judge_result,
 )
 from scylla.e2e.models import JudgeResultSummary
-from scylla.e2e.paths import JUDGE_DIR, RESULT_FILE
+from scylla.e2e.paths import JUDGE_DIR, JUDGE_SKIPPED_FILE, RESULT_FILE
 from scylla.e2e.rate_limit import RateLimitError, RateLimitInfo
 
 
@@ -281,6 +283,117 @@ def test_judges_with_none_score_excluded(self) -> None:
         assert score == pytest.approx(0.6)
 
 
+def _summary(judge_num: int, model: str, is_valid: bool = True) -> JudgeResultSummary:
+    """Create a JudgeResultSummary for fan-out tests."""
+    return JudgeResultSummary(
+        model=model,
+        score=0.8,
+        passed=True,
+        grade="B",
+        reasoning="ok",
+        judge_number=judge_num,
+        is_valid=is_valid,
+    )
+
+
+class TestRunJudgesConcurrently:
+    """Tests for _run_judges_concurrently()."""
+
+    def test_judges_overlap_and_results_are_ordered(self) -> None:
+        """All judges run at once by default; results come back in judge order."""
+        models = ["model-a", "model-b", "model-c"]
+        barrier = threading.Barrier(len(models), timeout=5)
+
+        def run_one(judge_num: int, model: str) -> JudgeResultSummary:
+            barrier.wait()  # Deadlocks (BrokenBarrierError) unless all run concurrently
+            return _summary(judge_num, model)
+
+        judges = _run_judges_concurrently(models, run_one)
+
+        assert [j.judge_number for j in judges] == [1, 2, 3]
+        assert [j.model for j in judges] == models
+
+    def test_max_concurrent_bounds_parallelism(self) -> None:
+        """No more than max_concurrent judges run at the same time."""
+        lock = threading.Lock()
+        active = peak = 0
+
+        def run_one(judge_num: int, model: str) -> JudgeResultSummary:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            threading.Event().wait(0.02)
+            with lock:
+                active -= 1
+            return _summary(judge_num, model)
+
+        judges = _run_judges_concurrently(["a", "b", "c", "d"], run_one, max_concurrent=2)
+
+        assert len(judges) == 4
+        assert peak <= 2
+
+    def test_quorum_stops_starting_judges(self) -> None:
+        """With a quorum of 1 and one worker, only the first judge runs."""
+        calls: list[int] = []
+
+        def run_one(judge_num: int, model: str) -> JudgeResultSummary:
+            calls.append(judge_num)
+            return _summary(judge_num, model)
+
+        judges = _run_judges_concurrently(["a", "b", "c"], run_one, max_concurrent=1, quorum=1)
+
+        assert calls == [1]
+        assert [j.judge_number for j in judges] == [1]
+
+    def test_quorum_marks_skipped_judge_slots(self, tmp_path: Path) -> None:
+        """Judges never started because of the quorum get a skipped.json marker."""
+
+        def run_one(judge_num: int, model: str) -> JudgeResultSummary:
+            return _summary(judge_num, model)
+
+        _run_judges_concurrently(
+            ["a", "b", "c"], run_one, max_concurrent=1, quorum=1, judge_dir=tmp_path
+        )
+
+        assert not (tmp_path / "judge_01").exists()
+        for judge_num, model in ((2, "b"), (3, "c")):
+            marker = json.loads(
+                (tmp_path / f"judge_{judge_num:02d}" / JUDGE_SKIPPED_FILE).read_text()
+            )
+            assert marker["skipped"] is True
+            assert marker["model"] == model
+
+    def test_invalid_results_do_not_count_towards_quorum(self) -> None:
+        """Judges keep starting until enough valid results are in."""
+
+        def run_one(judge_num: int, model: str) -> JudgeResultSummary:
+            return _summary(judge_num, model, is_valid=judge_num != 1)
+
+        judges = _run_judges_concurrently(["a", "b", "c"], run_one, max_concurrent=1, quorum=1)
+
+        assert [j.judge_number for j in judges] == [1, 2]
+
+    def test_rate_limit_error_propagates_and_stops_new_judges(self) -> None:
+        """A RateLimitError is re-raised and no further judges are started."""
+        info = RateLimitInfo(
+            source="judge",
+            retry_after_seconds=60,
+            error_message="rate limited",
+            detected_at="2026-01-01T00:00:00Z",
+        )
+        calls: list[int] = []
+
+        def run_one(judge_num: int, model: str) -> JudgeResultSummary:
+            calls.append(judge_num)
+            raise RateLimitError(info)
+
+        with pytest.raises(RateLimitError):
+            _run_judges_concurrently(["a", "b", "c"], run_one, max_concurrent=1)
+
+        assert calls == [1]
+
+
 class TestRunJudge:
     """Tests for _run_judge()."""
 
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import contextlib
+import gc
 import json
 import os
 import subprocess
 import tempfile
+import threading
+from collections import Counter
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any, ClassVar
 from unittest.mock import MagicMock, patch
@@ -13,6 +18,7 @@
 import pytest
 
 from scylla.e2e.build_pipeline import (
+    PIPELINE_STEP_COSTS,
     _execute_python_scripts,
     _get_pipeline_env,
     _run_build_pipeline,
@@ -25,18 +31,25 @@
     _run_python_format_step,
     _run_python_pipeline,
     _run_python_test_step,
+    _workspace_lock,
+    _workspace_locks,
 )
 from scylla.e2e.llm_judge import (
     _call_claude_judge,
+    _context_lock,
+    _context_locks,
     _gather_judge_context,
     _get_deleted_files,
     _get_patchfile,
     _get_workspace_state,
     _load_reference_patch,
     _parse_judge_response,
+    load_judge_context,
+    load_saved_judge_prompt,
     run_llm_judge,
+    save_judge_context,
 )
-from scylla.e2e.llm_judge_models import BuildPipelineResult, JudgeResult
+from scylla.e2e.llm_judge_models import BuildPipelineResult, JudgeContext, JudgeResult
 from scylla.e2e.pipeline_scripts import (
     _create_mojo_build_script,
     _create_mojo_format_script,
@@ -270,6 +283,22 @@ def test_inherits_os_environ(self) -> None:
         assert env is not os.environ
 
 
+def _by_command(results: dict[str, Any], default: Any) -> Any:
+    """Return a subprocess.run side effect keyed on the command's first word.
+
+    Format and test steps run concurrently, so results cannot be given in call order.
+    """
+
+    def run(cmd: list[str], **kwargs: Any) -> Any:
+        key = cmd[2] if cmd[:2] == ["python", "-m"] else cmd[0]
+        result = results.get(key, default)
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    return run
+
+
 class TestRunPythonPipeline:
     """Tests for _run_python_pipeline."""
 
@@ -305,7 +334,7 @@ def test_python_syntax_check_failure(self, tmp_path: Path) -> None:
 
         with patch(
             "subprocess.run",
-            side_effect=[fail_result, success_result, success_result, success_result],
+            side_effect=_by_command({"compileall": fail_result}, success_result),
         ):
             result = _run_python_pipeline(tmp_path)
 
@@ -327,7 +356,7 @@ def test_python_pytest_no_tests(self, tmp_path: Path) -> None:
 
         with patch(
             "subprocess.run",
-            side_effect=[success_result, success_result, no_tests_result, success_result],
+            side_effect=_by_command({"pytest": no_tests_result}, success_result),
         ):
             result = _run_python_pipeline(tmp_path)
 
@@ -343,7 +372,7 @@ def test_python_ruff_not_found(self, tmp_path: Path) -> None:
 
         with patch(
             "subprocess.run",
-            side_effect=[success_result, FileNotFoundError(), success_result, success_result],
+            side_effect=_by_command({"ruff": FileNotFoundError()}, success_result),
         ):
             result = _run_python_pipeline(tmp_path)
 
@@ -360,13 +389,57 @@ def test_python_precommit_not_found(self, tmp_path: Path) -> None:
 
         with patch(
             "subprocess.run",
-            side_effect=[success_result, success_result, success_result, FileNotFoundError()],
+            side_effect=_by_command({"pre-commit": FileNotFoundError()}, success_result),
         ):
             result = _run_python_pipeline(tmp_path)
 
         assert result.precommit_passed is True
         assert result.precommit_na is True
 
+    def test_steps_hold_their_pipeline_cost(self, tmp_path: Path) -> None:
+        """Each step acquires its PIPELINE_STEP_COSTS weight; precommit runs last."""
+        success_result = MagicMock(returncode=0, stdout="OK", stderr="")
+        acquired: list[int | None] = []
+        order: list[str] = []
+
+        @contextlib.contextmanager
+        def slot(weight: int | None) -> Iterator[None]:
+            acquired.append(weight)
+            yield
+
+        def run(cmd: list[str], **kwargs: Any) -> Any:
+            order.append(cmd[0])
+            return success_result
+
+        with patch("subprocess.run", side_effect=run):
+            result = _run_python_pipeline(tmp_path, pipeline_slot=slot)
+
+        assert result.all_passed is True
+        # Format and test acquire concurrently, so compare without ordering
+        assert Counter(acquired) == Counter(
+            PIPELINE_STEP_COSTS[step]
+            for step in ("python_build", "python_format", "python_test", "precommit")
+        )
+        assert order[0] == "python"
+        assert order[-1] == "pre-commit"
+
+    def test_format_overlaps_tests(self, tmp_path: Path) -> None:
+        """The ruff format check runs while pytest is still running."""
+        success_result = MagicMock(returncode=0, stdout="OK", stderr="")
+        ruff_started = threading.Event()
+
+        def run(cmd: list[str], **kwargs: Any) -> Any:
+            if cmd[0] == "ruff":
+                ruff_started.set()
+            elif cmd[0] == "pytest":
+                assert ruff_started.wait(5), "ruff did not start while pytest ran"
+            return success_result
+
+        with patch("subprocess.run", side_effect=run):
+            result = _run_python_pipeline(tmp_path)
+
+        assert result.all_passed is True
+
 
 class TestRunMojoPipeline:
     """Tests for _run_mojo_pipeline."""
@@ -1831,7 +1904,7 @@ class TestGatherJudgeContext:
     def test_no_pipeline_when_disabled(self, tmp_path: Path) -> None:
         """Returns None pipeline_result when run_build_pipeline=False."""
         with patch("scylla.e2e.llm_judge._get_workspace_state", return_value="state"):
-            judge_prompt, pipeline_result = _gather_judge_context(
+            context = _gather_judge_context(
                 workspace=tmp_path,
                 task_prompt="do task",
                 agent_output="done",
@@ -1844,9 +1917,10 @@ def test_no_pipeline_when_disabled(self, tmp_path: Path) -> None:
                 judge_dir=None,
             )
 
-        assert pipeline_result is None
-        assert isinstance(judge_prompt, str)
-        assert len(judge_prompt) > 0
+        assert context.pipeline_result is None
+        assert context.workspace_state == "state"
+        assert isinstance(context.judge_prompt, str)
+        assert len(context.judge_prompt) > 0
 
     def test_includes_baseline_in_prompt(self, tmp_path: Path) -> None:
         """Baseline pipeline result is formatted and included in the prompt."""
@@ -1862,7 +1936,7 @@ def test_includes_baseline_in_prompt(self, tmp_path: Path) -> None:
             patch("scylla.e2e.llm_judge._get_patchfile", return_value="diff"),
             patch("scylla.e2e.llm_judge._get_deleted_files", return_value=[]),
         ):
-            judge_prompt, _pipeline_result = _gather_judge_context(
+            context = _gather_judge_context(
                 workspace=tmp_path,
                 task_prompt="do task",
                 agent_output="done",
@@ -1875,7 +1949,8 @@ def test_includes_baseline_in_prompt(self, tmp_path: Path) -> None:
                 judge_dir=None,
             )
 
-        assert "ALL PASSED" in judge_prompt
+        assert "ALL PASSED" in context.judge_prompt
+        assert context.patchfile == "diff"
 
     def test_rubric_loaded_from_path(self, tmp_path: Path) -> None:
         """Rubric content is loaded from file and included in context."""
@@ -1883,7 +1958,7 @@ def test_rubric_loaded_from_path(self, tmp_path: Path) -> None:
         rubric_file.write_text("- check correctness")
 
         with patch("scylla.e2e.llm_judge._get_workspace_state", return_value="state"):
-            judge_prompt, _ = _gather_judge_context(
+            context = _gather_judge_context(
                 workspace=tmp_path,
                 task_prompt="do task",
                 agent_output="done",
@@ -1896,4 +1971,115 @@ def test_rubric_loaded_from_path(self, tmp_path: Path) -> None:
                 judge_dir=None,
             )
 
-        assert "check correctness" in judge_prompt
+        assert "check correctness" in context.judge_prompt
+        assert context.rubric_content == "- check correctness"
+
+
+class TestPathLocks:
+    """Tests for the per-path locks of judge context gathering and pipeline runs."""
+
+    @pytest.mark.parametrize(
+        ("get_lock", "registry"),
+        [(_context_lock, _context_locks), (_workspace_lock, _workspace_locks)],
+    )
+    def test_lock_is_shared_while_held_and_then_dropped(
+        self, tmp_path: Path, get_lock: Any, registry: Any
+    ) -> None:
+        """Callers for one path share a lock; the entry goes away once unreferenced."""
+        lock = get_lock(tmp_path)
+        assert get_lock(tmp_path) is lock
+
+        del lock
+        gc.collect()
+        assert tmp_path.resolve() not in registry
+
+
+class TestJudgeContextCache:
+    """Tests for sharing one judge context across the judges of a run."""
+
+    _RESPONSE = '{"score": 0.8, "passed": true, "reasoning": "Good"}'
+
+    def _run_judges(self, run_dir: Path, models: list[str], agent_output: str = "Output") -> None:
+        workspace = run_dir / "workspace"
+        workspace.mkdir(parents=True, exist_ok=True)
+        for judge_num, model in enumerate(models, start=1):
+            run_llm_judge(
+                workspace=workspace,
+                task_prompt="Task",
+                agent_output=agent_output,
+                model=model,
+                judge_dir=run_dir / "judge",
+                judge_run_number=judge_num,
+            )
+
+    def test_context_gathered_once_per_run(self, tmp_path: Path) -> None:
+        """Git helpers and the build pipeline run once for all judges of a run."""
+        run_dir = tmp_path / "run_01"
+        pipeline = BuildPipelineResult(language="python", build_passed=True, all_passed=True)
+
+        with (
+            patch("scylla.e2e.llm_judge._get_workspace_state", return_value="state") as state,
+            patch("scylla.e2e.llm_judge._get_patchfile", return_value="diff") as patchfile,
+            patch("scylla.e2e.llm_judge._get_deleted_files", return_value=[]),
+            patch(
+                "scylla.e2e.build_pipeline._run_build_pipeline", return_value=pipeline
+            ) as run_pipeline,
+            patch(
+                "scylla.e2e.llm_judge._call_claude_judge",
+                return_value=(self._RESPONSE, "", self._RESPONSE),
+            ) as call_judge,
+        ):
+            self._run_judges(run_dir, ["model-a", "model-b", "model-c"])
+
+        assert state.call_count == 1
+        assert patchfile.call_count == 1
+        assert run_pipeline.call_count == 1
+        assert call_judge.call_count == 3
+        prompts = {call.args[0] for call in call_judge.call_args_list}
+        assert len(prompts) == 1
+
+        context = load_judge_context(run_dir)
+        assert context is not None
+        assert context.patchfile == "diff"
+        assert context.pipeline_result == pipeline
+        assert context.judge_prompt == prompts.pop()
+
+    def test_context_regathered_when_inputs_change(self, tmp_path: Path) -> None:
+        """A cached context is not reused for different agent output."""
+        run_dir = tmp_path / "run_01"
+
+        with (
+            patch("scylla.e2e.llm_judge._get_workspace_state", return_value="state") as state,
+            patch("scylla.e2e.llm_judge._get_patchfile", return_value="diff"),
+            patch("scylla.e2e.llm_judge._get_deleted_files", return_value=[]),
+            patch(
+                "scylla.e2e.build_pipeline._run_build_pipeline",
+                return_value=BuildPipelineResult(language="python", build_passed=True),
+            ),
+            patch(
+                "scylla.e2e.llm_judge._call_claude_judge",
+                return_value=(self._RESPONSE, "", self._RESPONSE),
+            ),
+        ):
+            self._run_judges(run_dir, ["model-a"], agent_output="first")
+            self._run_judges(run_dir, ["model-a"], agent_output="second")
+
+        assert state.call_count == 2
+        context = load_judge_context(run_dir)
+        assert context is not None
+        assert "second" in context.judge_prompt
+
+    def test_load_saved_judge_prompt_prefers_prompt_file(self, tmp_path: Path) -> None:
+        """judge_prompt.md wins; judge_context.json is the fallback."""
+        assert load_saved_judge_prompt(tmp_path) is None
+
+        save_judge_context(tmp_path, JudgeContext(judge_prompt="from context"))
+        assert load_saved_judge_prompt(tmp_path) == "from context"
+
+        (tmp_path / "judge_prompt.md").write_text("from file")
+        assert load_saved_judge_prompt(tmp_path) == "from file"
+
+    def test_unreadable_context_is_ignored(self, tmp_path: Path) -> None:
+        """A corrupt judge_context.json loads as None."""
+        (tmp_path / "judge_context.json").write_text("{not json")
+        assert load_judge_context(tmp_path) is None
@@ -0,0 +1,35 @@
+"""cmd_reindex tests for scripts/manage_experiment.py."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from manage_experiment import build_parser, cmd_reindex
+
+from scylla.e2e.run_index import RunIndex
+
+
+class TestCmdReindex:
+    """Tests for cmd_reindex() — run index rebuild."""
+
+    def test_reindex_missing_directory_returns_1(self, tmp_path: Path) -> None:
+        """cmd_reindex returns 1 when the experiment directory does not exist."""
+        args = build_parser().parse_args(["reindex", str(tmp_path / "missing")])
+
+        assert cmd_reindex(args) == 1
+
+    def test_reindex_picks_up_manual_changes(self, tmp_path: Path) -> None:
+        """cmd_reindex rebuilds the index from the run directories on disk."""
+        index = RunIndex(tmp_path)
+        index.rebuild()
+        run_dir = tmp_path / "completed" / "T0" / "00" / "run_01"
+        (run_dir / "judge" / "judge_01").mkdir(parents=True)
+        (run_dir / "judge" / "judge_01" / "judgment.json").write_text(json.dumps({"score": 1.0}))
+        assert index.runs() == []
+
+        args = build_parser().parse_args(["reindex", str(tmp_path)])
+
+        assert cmd_reindex(args) == 0
+        assert [r.run_key for r in index.runs()] == ["completed/T0/00/run_01"]
+        assert list(index.judges()) == ["completed/T0/00/run_01"]
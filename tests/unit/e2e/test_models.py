@@ -4,9 +4,10 @@
 
 import tempfile
 from pathlib import Path
-from typing import ClassVar
+from typing import Any, ClassVar
 
 import pytest
+from pydantic import ValidationError
 
 from scylla.e2e.models import (
     E2ERunResult,
@@ -436,6 +437,49 @@ def test_save_and_load(self) -> None:
             assert loaded.tiers_to_run == [TierID.T0, TierID.T1, TierID.T2]
 
 
+class TestExperimentConfigWorkspaceBackend:
+    """Tests for ExperimentConfig.workspace_backend validation."""
+
+    def test_unknown_backend_is_rejected(self) -> None:
+        """A misspelled backend fails when the config is built, not during setup."""
+        with pytest.raises(ValidationError, match="workspace_backend"):
+            ExperimentConfig(
+                experiment_id="test-backend",
+                task_repo="https://github.com/test/repo",
+                task_commit="abc123",
+                task_prompt_file=Path("prompt.md"),
+                language="python",
+                workspace_backend="reflnk",  # type: ignore[arg-type]
+            )
+
+
+class TestExperimentConfigJudgeQuorum:
+    """Tests for the judge_quorum / max_concurrent_judges_per_run check."""
+
+    def _config(self, **kwargs: Any) -> ExperimentConfig:
+        return ExperimentConfig(
+            experiment_id="test-quorum",
+            task_repo="https://github.com/test/repo",
+            task_commit="abc123",
+            task_prompt_file=Path("prompt.md"),
+            language="python",
+            judge_models=["claude-opus-4-6", "claude-sonnet-4-6", "claude-haiku-4-5"],
+            **kwargs,
+        )
+
+    def test_quorum_with_cap_below_judge_count(self) -> None:
+        """A quorum is accepted when fewer judges than configured run at once."""
+        config = self._config(judge_quorum=2, max_concurrent_judges_per_run=2)
+
+        assert config.judge_quorum == 2
+
+    @pytest.mark.parametrize("cap", [None, 3])
+    def test_quorum_without_effective_cap_is_rejected(self, cap: int | None) -> None:
+        """A quorum that could never skip a judge is rejected at load time."""
+        with pytest.raises(ValidationError, match="max_concurrent_judges_per_run"):
+            self._config(judge_quorum=2, max_concurrent_judges_per_run=cap)
+
+
 class TestExperimentConfigDefaults:
     """Tests verifying ExperimentConfig defaults use the published constants."""
 
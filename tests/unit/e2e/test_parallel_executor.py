@@ -5,6 +5,7 @@
 - Race condition regression: _resume_event not cleared by worker
 - Manager() cleanup via finally block
 - run_tier_subtests_parallel: single-subtest path (no coordinator)
+- run_tier_subtests_parallel: worker-pool path (max_concurrent_subtests > 1)
 """
 
 from __future__ import annotations
@@ -15,8 +16,10 @@
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from scylla.e2e.parallel_executor import RateLimitCoordinator
-from scylla.e2e.rate_limit import RateLimitInfo
+from scylla.e2e.rate_limit import RateLimitError, RateLimitInfo
 
 # ---------------------------------------------------------------------------
 # RateLimitCoordinator tests
@@ -134,6 +137,21 @@ def test_after_resume_get_rate_limit_info_returns_none(self) -> None:
         assert coordinator.get_rate_limit_info() is None
 
 
+class TestRateLimitCoordinatorRepeatedPause:
+    """A second rate limit after a resume must pause workers again."""
+
+    def test_signal_after_resume_rearms_resume_event(self) -> None:
+        """signal_rate_limit() clears the resume event left set by the previous resume."""
+        coordinator = _make_coordinator()
+        coordinator.signal_rate_limit(_make_info())
+        coordinator.resume_all_workers()
+
+        coordinator.signal_rate_limit(_make_info(source="judge"))
+
+        assert coordinator._pause_event.is_set()
+        assert not coordinator._resume_event.is_set()
+
+
 class TestRateLimitCoordinatorResumeEventRaceCondition:
     """Regression test: _resume_event must NOT be cleared by check_if_paused().
 
@@ -424,6 +442,148 @@ def test_stops_early_on_shutdown(self, tmp_path: Any) -> None:
         assert results == {}
 
 
+# ---------------------------------------------------------------------------
+# Worker-pool path (max_concurrent_subtests > 1)
+# ---------------------------------------------------------------------------
+
+
+class TestRunTierSubtestsConcurrent:
+    """Tests for run_tier_subtests_parallel with a worker pool."""
+
+    def _make_config(self, workers: int) -> Any:
+        """Create an ExperimentConfig with the given sub-test concurrency."""
+        from scylla.e2e.models import ExperimentConfig, TierID
+
+        return ExperimentConfig(
+            experiment_id="test",
+            task_repo="https://example.com/repo",
+            task_commit="abc123",
+            task_prompt_file=Path("prompt.md"),
+            language="python",
+            tiers_to_run=[TierID.T0],
+            max_concurrent_subtests=workers,
+        )
+
+    def _run(self, config: Any, subtest_ids: list[str], tmp_path: Path, **kwargs: Any) -> Any:
+        """Call run_tier_subtests_parallel for sub-tests with the given IDs."""
+        from scylla.e2e.models import SubTestConfig, TierID
+        from scylla.e2e.parallel_executor import run_tier_subtests_parallel
+
+        tier_config = MagicMock()
+        tier_config.subtests = [
+            SubTestConfig(id=sid, name=sid, description=sid) for sid in subtest_ids
+        ]
+        return run_tier_subtests_parallel(
+            config=config,
+            tier_id=TierID.T0,
+            tier_config=tier_config,
+            tier_manager=MagicMock(),
+            workspace_manager=MagicMock(),
+            baseline=None,
+            results_dir=tmp_path,
+            **kwargs,
+        )
+
+    @staticmethod
+    def _result(subtest_id: str) -> Any:
+        from scylla.e2e.models import SubTestResult, TierID
+
+        return SubTestResult(subtest_id=subtest_id, tier_id=TierID.T0, runs=[], pass_rate=0.0)
+
+    def test_subtests_run_concurrently(self, tmp_path: Path) -> None:
+        """Sub-tests overlap in time and results keep the configured order."""
+        barrier = threading.Barrier(3, timeout=10)
+        coordinators: list[Any] = []
+
+        def run_subtest(**kwargs: Any) -> Any:
+            coordinators.append(kwargs["coordinator"])
+            barrier.wait()  # Only passes if three sub-tests run at once
+            return self._result(kwargs["subtest"].id)
+
+        executor = MagicMock()
+        executor.run_subtest.side_effect = run_subtest
+        with patch("scylla.e2e.subtest_executor.SubTestExecutor", return_value=executor):
+            results = self._run(self._make_config(3), ["02", "00", "01"], tmp_path)
+
+        assert list(results) == ["02", "00", "01"]
+        assert all(isinstance(c, RateLimitCoordinator) for c in coordinators)
+        assert len({id(c) for c in coordinators}) == 1
+
+    def test_rate_limited_subtest_is_retried_after_wait(self, tmp_path: Path) -> None:
+        """A rate-limited sub-test is waited out once and resubmitted."""
+        attempts: dict[str, int] = {}
+        lock = threading.Lock()
+
+        def run_subtest(**kwargs: Any) -> Any:
+            subtest_id = kwargs["subtest"].id
+            with lock:
+                attempts[subtest_id] = attempts.get(subtest_id, 0) + 1
+                first = attempts[subtest_id] == 1
+            if subtest_id == "00" and first:
+                info = _make_info(retry_after_seconds=5.0)
+                kwargs["coordinator"].signal_rate_limit(info)
+                raise RateLimitError(info)
+            return self._result(subtest_id)
+
+        executor = MagicMock()
+        executor.run_subtest.side_effect = run_subtest
+        checkpoint = MagicMock()
+        checkpoint_path = tmp_path / "checkpoint.json"
+        with (
+            patch("scylla.e2e.subtest_executor.SubTestExecutor", return_value=executor),
+            patch("scylla.e2e.parallel_executor.wait_for_rate_limit") as mock_wait,
+        ):
+            results = self._run(
+                self._make_config(2),
+                ["00", "01"],
+                tmp_path,
+                checkpoint=checkpoint,
+                checkpoint_path=checkpoint_path,
+            )
+
+        assert list(results) == ["00", "01"]
+        assert attempts == {"00": 2, "01": 1}
+        mock_wait.assert_called_once_with(5.0, checkpoint, checkpoint_path)
+
+    def test_rate_limit_without_checkpoint_raises(self, tmp_path: Path) -> None:
+        """Without a checkpoint the rate limit propagates, as in sequential mode."""
+
+        def run_subtest(**kwargs: Any) -> Any:
+            raise RateLimitError(_make_info())
+
+        executor = MagicMock()
+        executor.run_subtest.side_effect = run_subtest
+        with (
+            patch("scylla.e2e.subtest_executor.SubTestExecutor", return_value=executor),
+            pytest.raises(RateLimitError),
+        ):
+            self._run(self._make_config(2), ["00", "01"], tmp_path)
+
+    def test_shared_coordinator_is_used(self, tmp_path: Path) -> None:
+        """A coordinator passed in by a concurrent tier runner reaches every sub-test."""
+        shared = RateLimitCoordinator()
+        coordinators: list[Any] = []
+
+        def run_subtest(**kwargs: Any) -> Any:
+            coordinators.append(kwargs["coordinator"])
+            return self._result(kwargs["subtest"].id)
+
+        executor = MagicMock()
+        executor.run_subtest.side_effect = run_subtest
+        for workers in (1, 2):
+            with patch("scylla.e2e.subtest_executor.SubTestExecutor", return_value=executor):
+                self._run(self._make_config(workers), ["00", "01"], tmp_path, coordinator=shared)
+
+        assert coordinators == [shared] * 4
+
+    def test_max_concurrent_subtests_must_be_positive(self) -> None:
+        """ExperimentConfig rejects a non-positive sub-test concurrency."""
+        from pydantic import ValidationError
+
+        with pytest.raises(ValidationError):
+            self._make_config(0)
+
+
 # ---------------------------------------------------------------------------
 # _run_async helper
 # ---------------------------------------------------------------------------
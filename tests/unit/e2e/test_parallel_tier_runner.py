@@ -7,6 +7,7 @@
 
 from __future__ import annotations
 
+import threading
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any
@@ -22,6 +23,7 @@
     TierResult,
     TokenStats,
 )
+from scylla.e2e.parallel_executor import RateLimitCoordinator
 from scylla.e2e.parallel_tier_runner import ParallelTierRunner
 
 # ---------------------------------------------------------------------------
@@ -231,6 +233,118 @@ def run_tier(tier_id: TierID, *args: Any) -> TierResult:
         assert TierID.T2 in results
 
 
+def _concurrent_config(tiers: list[TierID], max_concurrent_tiers: int = 4) -> ExperimentConfig:
+    """Create an ExperimentConfig that runs tier groups concurrently."""
+    return ExperimentConfig(
+        experiment_id="test-exp",
+        task_repo="https://github.com/test/repo",
+        task_commit="abc123",
+        task_prompt_file=Path("/tmp/prompt.md"),
+        language="python",
+        tiers_to_run=tiers,
+        max_concurrent_tiers=max_concurrent_tiers,
+    )
+
+
+class TestConcurrentTierGroups:
+    """Tests for execute_tier_groups() with max_concurrent_tiers > 1."""
+
+    def test_tiers_of_a_group_overlap(self, tmp_path: Path) -> None:
+        """All tiers of a group are running at the same time."""
+        tiers = [TierID.T0, TierID.T1, TierID.T2]
+        barrier = threading.Barrier(len(tiers), timeout=5)
+
+        def run_tier(tier_id: TierID, *args: Any) -> TierResult:
+            barrier.wait()  # BrokenBarrierError if the tiers ran one at a time
+            return _make_tier_result(tier_id)
+
+        runner = _make_runner(
+            config=_concurrent_config(tiers),
+            run_tier_fn=run_tier,
+            experiment_dir=tmp_path,
+        )
+
+        results = runner.execute_tier_groups([tiers])
+
+        assert list(results) == tiers
+
+    def test_tiers_share_one_coordinator(self, tmp_path: Path) -> None:
+        """Every tier receives the same RateLimitCoordinator."""
+        run_tier_fn = MagicMock(side_effect=lambda tier_id, *args: _make_tier_result(tier_id))
+        save_tier_result_fn = MagicMock()
+        runner = _make_runner(
+            config=_concurrent_config([TierID.T0, TierID.T1]),
+            run_tier_fn=run_tier_fn,
+            save_tier_result_fn=save_tier_result_fn,
+            experiment_dir=tmp_path,
+        )
+
+        runner.execute_tier_groups([[TierID.T0, TierID.T1]])
+
+        coordinators = {c.args[2] for c in run_tier_fn.call_args_list}
+        assert len(coordinators) == 1
+        assert isinstance(coordinators.pop(), RateLimitCoordinator)
+        assert save_tier_result_fn.call_count == 2
+
+    def test_tiers_inherit_from_declared_dependencies(self, tmp_path: Path) -> None:
+        """T5 builds on its cheapest dependency and T6 on T5, not on the previous tier."""
+        costs = {TierID.T0: 3.0, TierID.T1: 1.0, TierID.T5: 2.0, TierID.T6: 2.0}
+        baselines: dict[TierID, TierBaseline | None] = {}
+
+        def run_tier(tier_id: TierID, baseline: TierBaseline | None, *args: Any) -> TierResult:
+            baselines[tier_id] = baseline
+            return _make_tier_result(tier_id, cost_of_pass=costs[tier_id])
+
+        mock_tier_manager = MagicMock()
+        mock_tier_manager.get_baseline_for_subtest.side_effect = lambda tier_id, **kw: tier_id
+        runner = _make_runner(
+            config=_concurrent_config(list(costs)),
+            tier_manager=mock_tier_manager,
+            run_tier_fn=run_tier,
+            experiment_dir=tmp_path,
+        )
+
+        runner.execute_tier_groups([[TierID.T0, TierID.T1], [TierID.T5], [TierID.T6]])
+
+        assert baselines == {
+            TierID.T0: None,
+            TierID.T1: None,
+            TierID.T5: TierID.T1,
+            TierID.T6: TierID.T5,
+        }
+
+    def test_first_error_stops_other_tiers(self, tmp_path: Path) -> None:
+        """A failing tier signals shutdown to the others and its error is re-raised."""
+        coordinators: list[RateLimitCoordinator] = []
+
+        def run_tier(tier_id: TierID, baseline: Any, coordinator: Any) -> TierResult:
+            coordinators.append(coordinator)
+            if tier_id == TierID.T0:
+                raise ValueError("tier failed")
+            return _make_tier_result(tier_id)
+
+        runner = _make_runner(
+            config=_concurrent_config([TierID.T0, TierID.T1]),
+            run_tier_fn=run_tier,
+            experiment_dir=tmp_path,
+        )
+
+        with pytest.raises(ValueError, match="tier failed"):
+            runner.execute_tier_groups([[TierID.T0, TierID.T1], [TierID.T5]])
+
+        assert coordinators
+        assert coordinators[0].is_shutdown_requested()
+
+    def test_default_runs_sequentially(self, tmp_path: Path) -> None:
+        """With the default max_concurrent_tiers, tiers are called without a coordinator."""
+        run_tier_fn = MagicMock(return_value=_make_tier_result())
+        runner = _make_runner(run_tier_fn=run_tier_fn, experiment_dir=tmp_path)
+
+        runner.execute_tier_groups([[TierID.T0, TierID.T1]])
+
+        assert [len(c.args) for c in run_tier_fn.call_args_list] == [2, 2]
+
+
 # ---------------------------------------------------------------------------
 # TestSelectBestBaselineFromGroup
 # ---------------------------------------------------------------------------
@@ -0,0 +1,225 @@
+"""Tests for the build pipeline result cache."""
+
+from __future__ import annotations
+
+import gc
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from scylla.e2e.build_pipeline import (
+    _run_build_pipeline,
+    _run_python_format_step,
+    _transient,
+    _transient_failures,
+)
+from scylla.e2e.llm_judge_models import BuildPipelineResult
+from scylla.e2e.pipeline_cache import (
+    PIPELINE_CACHE_ENV,
+    _key_locks,
+    cache_key_lock,
+    get_pipeline_cache_dir,
+    load_cached_result,
+    pipeline_cache_key,
+    save_cached_result,
+    workspace_tree_hash,
+)
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """Create a committed git repo with a .gitignore."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "main.py").write_text("print('hi')\n")
+    (repo / ".gitignore").write_text("build/\n")
+    _git(repo, "init", "-q")
+    _git(repo, "add", ".")
+    _git(repo, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "-m", "init")
+    return repo
+
+
+class TestWorkspaceTreeHash:
+    """Tests for workspace_tree_hash()."""
+
+    def test_clean_tree_matches_head(self, repo: Path) -> None:
+        """A clean checkout hashes to HEAD's tree."""
+        assert workspace_tree_hash(repo) == _git(repo, "rev-parse", "HEAD^{tree}")
+
+    def test_untracked_and_modified_files_change_hash(self, repo: Path) -> None:
+        """Modified and untracked files are part of the hash."""
+        clean = workspace_tree_hash(repo)
+        (repo / "new.py").write_text("x = 1\n")
+        untracked = workspace_tree_hash(repo)
+        (repo / "main.py").write_text("print('bye')\n")
+        modified = workspace_tree_hash(repo)
+        assert len({clean, untracked, modified}) == 3
+
+    def test_ignored_files_do_not_change_hash(self, repo: Path) -> None:
+        """Files matched by .gitignore are excluded."""
+        clean = workspace_tree_hash(repo)
+        (repo / "build").mkdir()
+        (repo / "build" / "out.o").write_text("binary")
+        assert workspace_tree_hash(repo) == clean
+
+    def test_real_index_untouched(self, repo: Path) -> None:
+        """Hashing does not stage anything in the workspace's index."""
+        (repo / "new.py").write_text("x = 1\n")
+        workspace_tree_hash(repo)
+        assert _git(repo, "status", "--porcelain") == "?? new.py"
+
+    def test_not_a_repo(self, tmp_path: Path) -> None:
+        """Non-git directories have no tree hash or cache dir."""
+        assert workspace_tree_hash(tmp_path) is None
+        assert get_pipeline_cache_dir(tmp_path) is None
+
+    def test_worktrees_share_cache_dir(self, repo: Path, tmp_path: Path) -> None:
+        """All worktrees of a repo use the cache under the common git dir."""
+        worktree = tmp_path / "wt"
+        _git(repo, "worktree", "add", "-q", "--detach", str(worktree))
+        assert get_pipeline_cache_dir(worktree) == get_pipeline_cache_dir(repo)
+        assert get_pipeline_cache_dir(repo) == (repo / ".git" / "scylla" / "pipeline_cache")
+        assert workspace_tree_hash(worktree) == workspace_tree_hash(repo)
+
+
+class TestCacheEntries:
+    """Tests for the cache key and entry storage."""
+
+    def test_key_depends_on_all_parts(self) -> None:
+        """Tree hash, language, pipeline and toolchain version all change the key."""
+        keys = {
+            pipeline_cache_key("t1", "python", "v1", "tools1"),
+            pipeline_cache_key("t2", "python", "v1", "tools1"),
+            pipeline_cache_key("t1", "mojo", "v1", "tools1"),
+            pipeline_cache_key("t1", "python", "v2", "tools1"),
+            pipeline_cache_key("t1", "python", "v1", "tools2"),
+        }
+        assert len(keys) == 5
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Saved results load back unchanged."""
+        result = BuildPipelineResult(build_passed=True, test_output="3 passed")
+        save_cached_result(tmp_path / "cache", "abc", result)
+        assert load_cached_result(tmp_path / "cache", "abc") == result
+
+    def test_key_lock_is_shared_while_held_and_then_dropped(self) -> None:
+        """Callers of one key share a lock; the entry goes away once unreferenced."""
+        lock = cache_key_lock("lock-test")
+        assert cache_key_lock("lock-test") is lock
+
+        del lock
+        gc.collect()
+        assert "lock-test" not in _key_locks
+
+    def test_missing_and_corrupt_entries(self, tmp_path: Path) -> None:
+        """Missing or unreadable entries are cache misses."""
+        assert load_cached_result(tmp_path, "missing") is None
+        (tmp_path / "bad.json").write_text("{not json")
+        assert load_cached_result(tmp_path, "bad") is None
+
+
+class TestCachedBuildPipeline:
+    """Tests for _run_build_pipeline() caching."""
+
+    def test_identical_tree_reuses_result(self, repo: Path, tmp_path: Path) -> None:
+        """A second workspace with the same contents does not rerun the pipeline."""
+        worktree = tmp_path / "wt"
+        _git(repo, "worktree", "add", "-q", "--detach", str(worktree))
+        result = BuildPipelineResult(build_passed=True, all_passed=True)
+        with patch(
+            "scylla.e2e.build_pipeline._run_python_pipeline", return_value=result
+        ) as mock_python:
+            first = _run_build_pipeline(repo, language="python")
+            second = _run_build_pipeline(worktree, language="python")
+        mock_python.assert_called_once_with(repo)
+        assert first == second == result
+
+    def test_changed_tree_reruns(self, repo: Path) -> None:
+        """Editing the workspace invalidates the cached result."""
+        with patch(
+            "scylla.e2e.build_pipeline._run_python_pipeline",
+            return_value=BuildPipelineResult(),
+        ) as mock_python:
+            _run_build_pipeline(repo, language="python")
+            (repo / "main.py").write_text("print('changed')\n")
+            _run_build_pipeline(repo, language="python")
+        assert mock_python.call_count == 2
+
+    def test_use_cache_false(self, repo: Path) -> None:
+        """use_cache=False always runs the pipeline and stores nothing."""
+        with patch(
+            "scylla.e2e.build_pipeline._run_python_pipeline",
+            return_value=BuildPipelineResult(),
+        ) as mock_python:
+            _run_build_pipeline(repo, language="python", use_cache=False)
+            _run_build_pipeline(repo, language="python", use_cache=False)
+        assert mock_python.call_count == 2
+        assert not (repo / ".git" / "scylla").exists()
+
+    def test_transient_failures_are_not_cached(self, repo: Path) -> None:
+        """A result with a timed-out step is returned but not stored."""
+
+        def timed_out(workspace: Path) -> BuildPipelineResult:
+            return BuildPipelineResult(test_output=_transient("Error: pytest timed out"))
+
+        with patch(
+            "scylla.e2e.build_pipeline._run_python_pipeline", side_effect=timed_out
+        ) as mock_python:
+            first = _run_build_pipeline(repo, language="python")
+            _run_build_pipeline(repo, language="python")
+        assert mock_python.call_count == 2
+        assert first.test_output == "Error: pytest timed out"
+
+    def test_toolchain_change_reruns(self, repo: Path) -> None:
+        """Upgrading a pipeline tool invalidates the cached result."""
+        with (
+            patch(
+                "scylla.e2e.build_pipeline._run_python_pipeline",
+                return_value=BuildPipelineResult(),
+            ) as mock_python,
+            patch("scylla.e2e.build_pipeline._toolchain_version", side_effect=["a", "a", "b"]),
+        ):
+            _run_build_pipeline(repo, language="python")
+            _run_build_pipeline(repo, language="python")
+            _run_build_pipeline(repo, language="python")
+        assert mock_python.call_count == 2
+
+    def test_environment_disables_cache(self, repo: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """SCYLLA_PIPELINE_CACHE=0 bypasses the cache for every caller."""
+        monkeypatch.setenv(PIPELINE_CACHE_ENV, "0")
+        with patch(
+            "scylla.e2e.build_pipeline._run_python_pipeline",
+            return_value=BuildPipelineResult(),
+        ) as mock_python:
+            _run_build_pipeline(repo, language="python")
+            _run_build_pipeline(repo, language="python")
+        assert mock_python.call_count == 2
+        assert not (repo / ".git" / "scylla").exists()
+
+
+class TestTransientStepFailures:
+    """Pipeline steps flag timeouts and missing tools as transient."""
+
+    def test_missing_tool_is_flagged(self, tmp_path: Path) -> None:
+        """A step whose tool is missing records its output as transient."""
+        failures: list[str] = []
+        token = _transient_failures.set(failures)
+        try:
+            with patch("subprocess.run", side_effect=FileNotFoundError("ruff")):
+                passed, na, output = _run_python_format_step(tmp_path, {})
+        finally:
+            _transient_failures.reset(token)
+        assert (passed, na) == (True, True)
+        assert failures == [output]
+
+    def test_flags_are_ignored_outside_cached_runs(self) -> None:
+        """Without an active collector _transient() only passes the output through."""
+        assert _transient("Error: timed out") == "Error: timed out"
@@ -1,8 +1,10 @@
 """Tests for experiment regeneration functionality."""
 
 import json
+import threading
+import time
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from scylla.e2e.agent_runner import _has_valid_agent_result
 from scylla.e2e.judge_runner import _has_valid_judge_result
@@ -11,6 +13,7 @@
     RegenerateStats,
     _find_frontier,
     rebuild_tier_results,
+    rejudge_missing_runs,
     scan_run_results,
 )
 from scylla.e2e.subtest_executor import aggregate_run_results as _aggregate_results
@@ -281,3 +284,77 @@ def test_rebuild_tier_results_empty() -> None:
     assert tier_results == {}
     assert stats.tiers_processed == 0
     assert stats.subtests_processed == 0
+
+
+def _run_result(run_number: int) -> E2ERunResult:
+    return E2ERunResult(
+        run_number=run_number,
+        exit_code=0,
+        token_stats=TokenStats(input_tokens=100, output_tokens=50),
+        cost_usd=0.01,
+        duration_seconds=10.0,
+        agent_duration_seconds=8.0,
+        judge_duration_seconds=2.0,
+        judge_score=0.85,
+        judge_passed=True,
+        judge_grade="A",
+        judge_reasoning="Good",
+        workspace_path=Path("/tmp/workspace"),
+        logs_path=Path("/tmp/logs"),
+    )
+
+
+def test_rejudge_missing_runs_parallel(tmp_path: Path) -> None:
+    """Parallel re-judging judges every run and records results in run order."""
+    run_results = {
+        "T1": {"00": [_run_result(1), _run_result(2)]},
+        "T0": {"01": [_run_result(1)], "00": [_run_result(1), _run_result(2)]},
+    }
+    threads: set[str] = set()
+
+    def fake_rejudge(
+        experiment_dir: Path,
+        config: ExperimentConfig,
+        tier_id: str,
+        subtest_id: str,
+        run: E2ERunResult,
+        judge_model: str,
+        dry_run: bool,
+    ) -> Path | None:
+        threads.add(threading.current_thread().name)
+        time.sleep(0.05 if run.run_number == 1 else 0.0)  # later runs finish first
+        if run.run_number != 1:
+            return None
+        return experiment_dir / "completed" / tier_id / subtest_id / "run_01"
+
+    stats = RegenerateStats()
+    with (
+        patch("scylla.e2e.regenerate._rejudge_run", side_effect=fake_rejudge) as mock_rejudge,
+        patch("scylla.e2e.regenerate.index_runs") as mock_index,
+    ):
+        rejudge_missing_runs(tmp_path, MagicMock(), run_results, "judge", False, stats, parallel=4)
+
+    assert mock_rejudge.call_count == 5
+    assert len(threads) > 1
+    assert stats.runs_rejudged == 3
+    mock_index.assert_called_once_with(
+        tmp_path,
+        [
+            tmp_path / "completed" / "T0" / "00" / "run_01",
+            tmp_path / "completed" / "T0" / "01" / "run_01",
+            tmp_path / "completed" / "T1" / "00" / "run_01",
+        ],
+    )
+
+
+def test_scan_run_results_orders_runs_by_number(tmp_path: Path) -> None:
+    """Runs of a subtest are returned sorted by run number."""
+    for run_number in (3, 1, 2):
+        run_dir = tmp_path / "completed" / "T0" / "00" / f"run_{run_number:02d}"
+        run_dir.mkdir(parents=True)
+        data = _run_result(run_number).model_dump(mode="json")
+        (run_dir / "run_result.json").write_text(json.dumps(data))
+
+    results = scan_run_results(tmp_path, RegenerateStats())
+
+    assert [r.run_number for r in results["T0"]["00"]] == [1, 2, 3]
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import threading
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -13,6 +15,7 @@
     RunStatus,
     RunToRerun,
     _classify_run_status,
+    _map_runs,
     scan_runs_needing_rerun,
 )
 
@@ -96,6 +99,46 @@ def test_run_to_rerun_creation(self, tmp_path: Path) -> None:
         assert run.reason == "Run never started"
 
 
+class TestMapRuns:
+    """Tests for _map_runs() — bounded parallel execution of per-run work."""
+
+    @staticmethod
+    def _runs(tmp_path: Path, count: int) -> list[RunToRerun]:
+        return [
+            RunToRerun(
+                tier_id="T0",
+                subtest_id="00",
+                run_number=n,
+                run_dir=tmp_path / f"run_{n:02d}",
+                status=RunStatus.FAILED,
+                reason="Agent ran but failed",
+            )
+            for n in range(1, count + 1)
+        ]
+
+    def test_parallel_results_keep_input_order(self, tmp_path: Path) -> None:
+        """Results are yielded in run order even when later runs finish first."""
+        runs = self._runs(tmp_path, 4)
+        threads: set[str] = set()
+
+        def work(run: RunToRerun) -> int:
+            threads.add(threading.current_thread().name)
+            time.sleep(0.02 * (5 - run.run_number))
+            return run.run_number
+
+        assert list(_map_runs(work, runs, parallel=4)) == [1, 2, 3, 4]
+        assert len(threads) > 1
+
+    def test_sequential_runs_inline(self, tmp_path: Path) -> None:
+        """parallel=1 runs on the calling thread."""
+        runs = self._runs(tmp_path, 3)
+
+        def work(run: RunToRerun) -> str:
+            return threading.current_thread().name
+
+        assert set(_map_runs(work, runs, parallel=1)) == {threading.current_thread().name}
+
+
 class TestClassifyRunStatus:
     """Tests for _classify_run_status function."""
 
@@ -20,6 +20,7 @@
     _regenerate_consensus,
     scan_judges_needing_rerun,
 )
+from scylla.e2e.run_index import open_run_index
 from scylla.e2e.tier_manager import TierManager
 
 
@@ -442,6 +443,28 @@ def test_all_complete(self, tmp_path: Path) -> None:
         assert len(results) == 2
         assert all(status == JudgeSlotStatus.COMPLETE for _, _, status in results)
 
+    def test_quorum_skipped_judge_slots(self, tmp_path: Path) -> None:
+        """A slot holding only skipped.json is SKIPPED, not MISSING or FAILED."""
+        run_dir = tmp_path / "run_01"
+        agent_dir = run_dir / "agent"
+        agent_dir.mkdir(parents=True)
+        (agent_dir / "output.txt").write_text("Agent output")
+        (agent_dir / "result.json").write_text(
+            '{"exit_code": 0, "token_stats": {"input_tokens": 100}, "cost_usd": 0.01}'
+        )
+        judge_dir = run_dir / "judge"
+        (judge_dir / "judge_01").mkdir(parents=True)
+        (judge_dir / "judge_01" / "judgment.json").write_text('{"score": 0.8}')
+        (judge_dir / "judge_02").mkdir()
+        (judge_dir / "judge_02" / "skipped.json").write_text('{"skipped": true}')
+
+        results = _classify_judge_slots(run_dir, ["claude-opus-4-6", "claude-sonnet-4-6"])
+
+        assert [status for _, _, status in results] == [
+            JudgeSlotStatus.COMPLETE,
+            JudgeSlotStatus.SKIPPED,
+        ]
+
     def test_missing_judge_slots(self, tmp_path: Path) -> None:
         """Test classification when judge slots are missing."""
         run_dir = tmp_path / "run_01"
@@ -675,6 +698,40 @@ def test_scan_with_run_filter(
             assert stats.total_expected_slots == 0
             assert stats.runs_skipped_by_filter == 1
 
+    def test_scan_with_index_matches_file_scan(
+        self, experiment_setup: tuple[Path, ExperimentConfig, TierManager]
+    ) -> None:
+        """Judge slots classified from the run index match the file-based classification."""
+        experiment_dir, config, tier_manager = experiment_setup
+        judge_dir = experiment_dir / "T0" / "00" / "run_01" / "judge"
+        (judge_dir / "judge_01").mkdir(parents=True)
+        (judge_dir / "judge_01" / "judgment.json").write_text('{"score": 0.9}')
+        (judge_dir / "judge_02").mkdir()
+        (judge_dir / "judge_02" / "judgment.json").write_text('{"score": 0.1, "is_valid": false}')
+        config = config.model_copy(update={"judge_models": [*config.judge_models, "quorum-skip"]})
+        (judge_dir / "judge_03").mkdir()
+        (judge_dir / "judge_03" / "skipped.json").write_text('{"skipped": true}')
+
+        with patch.object(tier_manager, "load_tier_config") as mock_load:
+            mock_load.return_value = TierConfig(
+                tier_id=TierID.T0,
+                subtests=[SubTestConfig(id="00", name="Test", description="Test", resources={})],
+            )
+            from_files = scan_judges_needing_rerun(experiment_dir, config, tier_manager)
+
+            index = open_run_index(experiment_dir)
+            assert index is not None
+            with patch("scylla.e2e.rerun_judges._classify_judge_slots") as mock_classify:
+                from_index = scan_judges_needing_rerun(
+                    experiment_dir, config, tier_manager, index=index
+                )
+
+        mock_classify.assert_not_called()
+        assert from_index == from_files
+        assert [s.judge_number for s in from_index[JudgeSlotStatus.COMPLETE]] == [1]
+        assert [s.judge_number for s in from_index[JudgeSlotStatus.FAILED]] == [2]
+        assert [s.judge_number for s in from_index[JudgeSlotStatus.SKIPPED]] == [3]
+
 
 class TestRerunJudgeStats:
     """Tests for RerunJudgeStats dataclass."""
@@ -0,0 +1,202 @@
+"""Unit tests for scylla/e2e/resource_manager.py.
+
+Tests cover:
+- Per-class limits and timeouts
+- Judge slots shared with agents by default, or drawn from their own queue
+- Weighted pipeline budget
+- Queue depth and utilization statistics
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from scylla.e2e.resource_manager import ResourceManager
+
+
+class TestSlots:
+    """Tests for slot acquisition and limits."""
+
+    def test_agent_slot_times_out_when_exhausted(self) -> None:
+        """A second agent slot times out when the limit is 1."""
+        rm = ResourceManager(max_agents=1)
+        with (
+            rm.agent_slot(),
+            pytest.raises(TimeoutError, match=r"No agent slot available.*limit: 1"),
+            rm.agent_slot(timeout=0.01),
+        ):
+            pass
+
+    def test_judge_slot_independent_of_agent_slot(self) -> None:
+        """A judge can run while every agent slot is held."""
+        rm = ResourceManager(max_agents=1, max_judges=1)
+        with rm.agent_slot(), rm.judge_slot(timeout=0.01):
+            stats = rm.stats()
+            assert stats["agent"].in_use == 1
+            assert stats["judge"].in_use == 1
+
+    def test_judges_share_agent_slots_by_default(self) -> None:
+        """Without max_judges a judge waits for an agent slot."""
+        rm = ResourceManager(max_agents=1)
+        with (
+            rm.agent_slot(),
+            pytest.raises(TimeoutError, match=r"No agent slot available.*limit: 1"),
+            rm.judge_slot(timeout=0.01),
+        ):
+            pass
+        assert "judge" not in rm.stats()
+
+    def test_slot_released_on_exception(self) -> None:
+        """Slots are released when the body raises."""
+        rm = ResourceManager(max_git_ops=1)
+        with pytest.raises(RuntimeError), rm.git_slot():
+            raise RuntimeError("boom")
+        with rm.git_slot(timeout=0.01):
+            assert rm.stats()["git"].in_use == 1
+        assert rm.stats()["git"].in_use == 0
+
+    def test_slot_by_name(self) -> None:
+        """slot() dispatches on the resource class name."""
+        rm = ResourceManager()
+        with rm.slot("pipeline"):
+            assert rm.stats()["pipeline"].in_use == 1
+        with pytest.raises(KeyError):
+            rm.slot("gpu")
+
+
+class TestPipelineBudget:
+    """Tests for the weighted build pipeline budget."""
+
+    def test_light_steps_share_budget(self) -> None:
+        """Steps whose weights fit the budget hold it at the same time."""
+        rm = ResourceManager(pipeline_budget=4)
+        with rm.pipeline_slot(1), rm.pipeline_slot(2):
+            assert rm.stats()["pipeline"].in_use == 3
+        assert rm.stats()["pipeline"].in_use == 0
+
+    def test_none_weight_takes_whole_budget(self) -> None:
+        """weight=None is exclusive; weights above the budget are capped to it."""
+        rm = ResourceManager(pipeline_budget=3)
+        with rm.pipeline_slot(None):
+            assert rm.stats()["pipeline"].in_use == 3
+        with rm.pipeline_slot(10):
+            assert rm.stats()["pipeline"].in_use == 3
+        assert rm.pipeline_budget == 3
+
+    def test_heavy_step_waits_for_light_steps(self) -> None:
+        """A whole-budget step starts only after the running light steps finish."""
+        rm = ResourceManager(pipeline_budget=2)
+        release = threading.Event()
+        events: list[str] = []
+
+        def light() -> None:
+            with rm.pipeline_slot(1):
+                events.append("light start")
+                release.wait(5)
+                events.append("light end")
+
+        def heavy() -> None:
+            with rm.pipeline_slot(None):
+                events.append("heavy")
+
+        light_thread = threading.Thread(target=light)
+        light_thread.start()
+        while not events:
+            time.sleep(0.01)
+        heavy_thread = threading.Thread(target=heavy)
+        heavy_thread.start()
+        while rm.stats()["pipeline"].waiting < 1:
+            time.sleep(0.01)
+        assert events == ["light start"]
+        release.set()
+        for t in (light_thread, heavy_thread):
+            t.join(5)
+        assert events == ["light start", "light end", "heavy"]
+
+    def test_waiters_served_in_arrival_order(self) -> None:
+        """A light step queued behind a waiting heavy step does not overtake it."""
+        rm = ResourceManager(pipeline_budget=2)
+        release = threading.Event()
+        order: list[str] = []
+
+        def hold() -> None:
+            with rm.pipeline_slot(1):
+                release.wait(5)
+
+        def step(name: str, weight: int | None) -> None:
+            with rm.pipeline_slot(weight):
+                order.append(name)
+
+        threads = [threading.Thread(target=hold)]
+        threads[0].start()
+        while rm.stats()["pipeline"].in_use < 1:
+            time.sleep(0.01)
+        for name, weight in (("heavy", None), ("light", 1)):
+            threads.append(threading.Thread(target=step, args=(name, weight)))
+            threads[-1].start()
+            while rm.stats()["pipeline"].waiting < len(threads) - 1:
+                time.sleep(0.01)
+        # One unit is free, but the light step must queue behind the heavy one
+        assert order == []
+        release.set()
+        for t in threads:
+            t.join(5)
+        assert order == ["heavy", "light"]
+
+
+class TestStats:
+    """Tests for queue depth and utilization reporting."""
+
+    def test_waiting_and_peak_depth(self) -> None:
+        """Threads blocked on a full queue are counted as waiting."""
+        rm = ResourceManager(max_agents=1)
+        release = threading.Event()
+        holding = threading.Event()
+
+        def holder() -> None:
+            with rm.agent_slot():
+                holding.set()
+                release.wait(5)
+
+        def waiter() -> None:
+            with rm.agent_slot(timeout=5):
+                pass
+
+        threads = [threading.Thread(target=holder)]
+        threads[0].start()
+        holding.wait(5)
+        threads += [threading.Thread(target=waiter) for _ in range(2)]
+        for t in threads[1:]:
+            t.start()
+        deadline = time.monotonic() + 5
+        while rm.stats()["agent"].waiting < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert rm.stats()["agent"].waiting == 2
+        release.set()
+        for t in threads:
+            t.join(5)
+
+        usage = rm.stats()["agent"]
+        assert usage.waiting == 0
+        assert usage.peak_waiting == 2
+        assert usage.acquisitions == 3
+        assert usage.mean_wait_seconds > 0
+
+    def test_utilization_reflects_time_held(self) -> None:
+        """Holding the only slot for most of the lifetime gives high utilization."""
+        rm = ResourceManager(max_judges=2)
+        with rm.judge_slot():
+            time.sleep(0.05)
+        usage = rm.stats()["judge"]
+        # One of two slots held for nearly the whole lifetime
+        assert 0.2 < usage.utilization <= 0.5
+
+    def test_format_stats_lists_every_queue(self) -> None:
+        """format_stats() has one line per resource class."""
+        text = ResourceManager(max_judges=2).format_stats()
+        for name in ("workspace", "agent", "judge", "pipeline", "git"):
+            assert name in text
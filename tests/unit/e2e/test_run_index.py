@@ -0,0 +1,206 @@
+"""Unit tests for scylla/e2e/run_index.py."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from scylla.e2e.models import TierID
+from scylla.e2e.regenerate import RegenerateStats, scan_run_results
+from scylla.e2e.rehydrate import load_subtest_run_results, load_tier_subtest_results
+from scylla.e2e.run_index import (
+    INDEX_FILENAME,
+    RunIndex,
+    find_run_index,
+    index_runs,
+    open_run_index,
+)
+
+RUN_RESULT = {
+    "run_number": 1,
+    "exit_code": 0,
+    "token_stats": {"input_tokens": 100, "output_tokens": 50},
+    "cost_usd": 0.5,
+    "duration_seconds": 12.0,
+    "agent_duration_seconds": 10.0,
+    "judge_duration_seconds": 2.0,
+    "judge_score": 0.8,
+    "judge_passed": True,
+    "judge_grade": "B",
+    "judge_reasoning": "Good",
+    "workspace_path": "/tmp/workspace",
+    "logs_path": "/tmp/logs",
+    "process_metrics": {"r_prog": 1.0},
+}
+
+
+def _make_run(
+    experiment_dir: Path,
+    key: str,
+    run_result: dict[str, Any] | None = None,
+    judgments: dict[int, dict[str, Any]] | None = None,
+) -> Path:
+    """Create a run directory with a valid agent result and optional results."""
+    run_dir = experiment_dir / key
+    agent_dir = run_dir / "agent"
+    agent_dir.mkdir(parents=True)
+    (agent_dir / "output.txt").write_text("done")
+    (agent_dir / "result.json").write_text(
+        json.dumps({"exit_code": 0, "token_stats": {"input_tokens": 1}, "cost_usd": 0.5})
+    )
+    for judge_number, judgment in (judgments or {}).items():
+        slot_dir = run_dir / "judge" / f"judge_{judge_number:02d}"
+        slot_dir.mkdir(parents=True)
+        (slot_dir / "judgment.json").write_text(json.dumps(judgment))
+    if run_result is not None:
+        (run_dir / "run_result.json").write_text(json.dumps(run_result))
+    return run_dir
+
+
+@pytest.fixture()
+def experiment_dir(tmp_path: Path) -> Path:
+    """Experiment with two completed runs, one in-progress run and a .failed archive."""
+    exp = tmp_path / "experiment"
+    _make_run(exp, "completed/T0/00/run_01", RUN_RESULT, {1: {"score": 0.8}})
+    _make_run(
+        exp,
+        "completed/T0/00/run_02",
+        {**RUN_RESULT, "run_number": 2, "judge_passed": False},
+        {1: {"score": 0.2, "is_valid": False}},
+    )
+    _make_run(exp, "in_progress/T1/00/run_01")
+    _make_run(exp, "completed/T0/00/.failed/run_03_attempt_01", RUN_RESULT)
+    return exp
+
+
+class TestRunIndex:
+    """Tests for RunIndex."""
+
+    def test_rebuild_indexes_runs_and_judges(self, experiment_dir: Path) -> None:
+        """Rebuild records every run directory and judge slot, skipping .failed/."""
+        index = RunIndex(experiment_dir)
+
+        assert index.rebuild() == 3
+        assert index.is_built()
+        assert (experiment_dir / INDEX_FILENAME).exists()
+
+        runs = {run.run_key: run for run in index.runs()}
+        assert sorted(runs) == [
+            "completed/T0/00/run_01",
+            "completed/T0/00/run_02",
+            "in_progress/T1/00/run_01",
+        ]
+        first = runs["completed/T0/00/run_01"]
+        assert (first.phase, first.tier_id, first.subtest_id, first.run_number) == (
+            "completed",
+            "T0",
+            "00",
+            1,
+        )
+        assert first.agent_valid
+        assert first.judge_score == 0.8
+        assert first.judge_passed is True
+        assert first.cost_usd == 0.5
+        assert first.run_result is not None
+        assert "process_metrics" not in first.run_result
+        assert not runs["in_progress/T1/00/run_01"].has_run_result
+
+        judges = index.judges()
+        assert [(j.judge_number, j.is_valid) for j in judges["completed/T0/00/run_01"]] == [
+            (1, True)
+        ]
+        assert [(j.judge_number, j.is_valid) for j in judges["completed/T0/00/run_02"]] == [
+            (1, False)
+        ]
+
+    def test_prefix_query_matches_path_components(self, experiment_dir: Path) -> None:
+        """Prefix queries select a subtree; underscores are not wildcards."""
+        index = open_run_index(experiment_dir)
+        assert index is not None
+
+        assert [r.run_number for r in index.runs(prefix="completed/T0/00/")] == [1, 2]
+        assert [r.run_key for r in index.runs(prefix="in_progress/")] == [
+            "in_progress/T1/00/run_01"
+        ]
+        assert index.runs(prefix="in-progress/") == []
+        assert list(index.judges(prefix="in_progress/")) == []
+
+    def test_record_runs_refreshes_and_forgets(self, experiment_dir: Path) -> None:
+        """record_runs() picks up new results and drops directories that moved away."""
+        index = open_run_index(experiment_dir)
+        assert index is not None
+
+        in_progress = experiment_dir / "in_progress" / "T1" / "00" / "run_01"
+        completed = experiment_dir / "completed" / "T1" / "00" / "run_01"
+        completed.parent.mkdir(parents=True)
+        in_progress.rename(completed)
+        (completed / "run_result.json").write_text(json.dumps(RUN_RESULT))
+
+        index.record_runs([in_progress, completed])
+
+        keys = [r.run_key for r in index.runs()]
+        assert "in_progress/T1/00/run_01" not in keys
+        promoted = index.runs(prefix="completed/T1/")
+        assert [r.has_run_result for r in promoted] == [True]
+
+    def test_outdated_version_is_rebuilt(self, experiment_dir: Path) -> None:
+        """An index written by another index version is rebuilt on open."""
+        index = open_run_index(experiment_dir)
+        assert index is not None
+        with sqlite3.connect(index.path) as conn:
+            conn.execute("UPDATE meta SET value = '0' WHERE key = 'version'")
+            conn.execute("DELETE FROM runs")
+
+        assert not index.is_built()
+        reopened = open_run_index(experiment_dir)
+        assert reopened is not None
+        assert len(reopened.runs()) == 3
+
+    def test_find_run_index_never_creates(self, experiment_dir: Path) -> None:
+        """find_run_index() only returns an index that was already built."""
+        subtest_dir = experiment_dir / "completed" / "T0" / "00"
+        assert find_run_index(subtest_dir) is None
+        assert not (experiment_dir / INDEX_FILENAME).exists()
+
+        open_run_index(experiment_dir)
+        found = find_run_index(subtest_dir / "run_01")
+        assert found is not None
+        assert found.experiment_dir == experiment_dir
+
+    def test_index_runs_is_best_effort(self, tmp_path: Path) -> None:
+        """index_runs() logs instead of raising when the index cannot be written."""
+        (tmp_path / INDEX_FILENAME).mkdir()  # a directory cannot be opened as a database
+
+        index_runs(tmp_path, [tmp_path / "completed" / "T0" / "00" / "run_01"])
+
+
+class TestIndexedScanners:
+    """The scanners return the same results from the index as from the files."""
+
+    def test_scan_run_results(self, experiment_dir: Path) -> None:
+        """scan_run_results() reads completed run results from the index."""
+        file_stats = RegenerateStats()
+        from_files = scan_run_results(experiment_dir, file_stats)
+        index_stats = RegenerateStats()
+        from_index = scan_run_results(experiment_dir, index_stats, open_run_index(experiment_dir))
+
+        from_files["T0"]["00"].sort(key=lambda r: r.run_number)
+        assert from_index == from_files
+        assert [r.run_number for r in from_index["T0"]["00"]] == [1, 2]
+        assert index_stats.runs_valid == file_stats.runs_valid == 2
+
+    def test_rehydrate_uses_built_index(self, experiment_dir: Path) -> None:
+        """Rehydration reads the index once one exists."""
+        subtest_dir = experiment_dir / "completed" / "T0" / "00"
+        from_files = load_subtest_run_results(subtest_dir)
+
+        open_run_index(experiment_dir)
+        (subtest_dir / "run_02" / "run_result.json").write_text("not json")
+
+        assert load_subtest_run_results(subtest_dir) == from_files
+        tier_results = load_tier_subtest_results(subtest_dir.parent, TierID.T0)
+        assert tier_results["00"].runs == from_files
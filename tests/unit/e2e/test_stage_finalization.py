@@ -2,6 +2,7 @@
 
 Tests cover:
 - stage_execute_judge: no-op when ctx.judgment already set (resume path)
+- stage_execute_judge: judges of a run execute concurrently, one judge slot each
 - stage_finalize_run: error handling when prerequisites are missing
 - stage_finalize_run: baseline_summary construction from pipeline_baseline
 - stage_finalize_run: checkpoint.mark_run_completed called with correct status
@@ -18,6 +19,7 @@
 from __future__ import annotations
 
 import json
+import threading
 from pathlib import Path
 from typing import Any, cast
 from unittest.mock import MagicMock, patch
@@ -239,6 +241,38 @@ def mock_call_judge(prompt: str, model: str, workspace: object) -> tuple[str, st
         assert ctx.judgment is not None
         assert ctx.judgment["score"] == pytest.approx(0.9)
 
+    def test_judges_run_concurrently_with_one_slot_each(
+        self, minimal_run_context: RunContext
+    ) -> None:
+        """Each judge holds its own judge slot and all judges of the run overlap."""
+        from scylla.e2e.resource_manager import ResourceManager
+
+        ctx = minimal_run_context
+        ctx.judgment = None
+        ctx.judge_prompt = "evaluate this"
+        ctx.config = ctx.config.model_copy(update={"judge_models": ["model-a", "model-b"]})
+        rm = ResourceManager(max_judges=2)
+        ctx.resource_manager = rm
+        barrier = threading.Barrier(2, timeout=5)
+        slots_in_use: list[int] = []
+
+        def mock_call_judge(prompt: str, model: str, workspace: object) -> tuple[str, str, str]:
+            barrier.wait()  # Fails unless both judges are in flight together
+            slots_in_use.append(rm.stats()["judge"].in_use)
+            barrier.wait()  # Neither judge releases its slot before both have recorded
+            score = 0.6 if model == "model-a" else 1.0
+            return ("", "", json.dumps({"score": score, "passed": True, "reasoning": model}))
+
+        with patch("scylla.e2e.llm_judge._call_claude_judge", side_effect=mock_call_judge):
+            stage_execute_judge(ctx)
+
+        assert slots_in_use == [2, 2]
+        assert [j.model for j in ctx.judges] == ["model-a", "model-b"]
+        assert ctx.judgment is not None
+        assert ctx.judgment["score"] == pytest.approx(0.8)
+        for judge_num in (1, 2):
+            assert (ctx.run_dir / "judge" / f"judge_{judge_num:02d}" / "timing.json").exists()
+
 
 # ---------------------------------------------------------------------------
 # TestStageFinalizeRun
@@ -671,6 +705,7 @@ def test_cleanup_not_called_for_failed_run_with_keep_flag(
         stage_cleanup_worktree(ctx)
 
         wm.cleanup_worktree.assert_not_called()
+        wm.forget_pooled_worktree.assert_called_once_with(ctx.workspace)
 
     def test_cleanup_not_called_when_workspace_absent(
         self, minimal_run_context: RunContext
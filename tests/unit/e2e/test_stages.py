@@ -218,6 +218,31 @@ def test_action_count_matches_transition_registry(self, run_context: RunContext)
         actions = build_actions_dict(run_context)
         assert len(actions) == len(TRANSITION_REGISTRY) - 1
 
+    def test_stages_hold_their_resource_slot(self, run_context: RunContext) -> None:
+        """With a ResourceManager, agent and git stages run inside their slot."""
+        from scylla.e2e.resource_manager import ResourceManager
+        from scylla.e2e.stages import STAGE_RESOURCES
+
+        rm = ResourceManager()
+        run_context.resource_manager = rm
+        held: dict[str, int] = {}
+
+        def record(resource: str) -> None:
+            held[resource] = rm.stats()[resource].in_use
+
+        with (
+            patch("scylla.e2e.stages.stage_execute_agent", lambda ctx: record("agent")),
+            patch("scylla.e2e.stages.stage_capture_diff", lambda ctx: record("git")),
+        ):
+            actions = build_actions_dict(run_context)
+            actions[RunState.REPLAY_GENERATED]()
+            actions[RunState.AGENT_CHANGES_COMMITTED]()
+
+        assert held == {"agent": 1, "git": 1}
+        # Judges take their own slot per judge inside stage_execute_judge
+        assert RunState.JUDGE_PROMPT_BUILT not in STAGE_RESOURCES
+        assert all(usage.in_use == 0 for usage in rm.stats().values())
+
 
 class TestStageCleanupWorktree:
     """Tests for stage_cleanup_worktree() — cleans up passed runs."""
@@ -672,6 +697,80 @@ def test_runs_subprocess_and_saves_result(self, stage_context: RunContext) -> No
         assert (agent_dir / "output.txt").exists()
         assert (agent_dir / "timing.json").exists()
 
+    def test_streams_output_to_disk(self, stage_context: RunContext) -> None:
+        """With stream_agent_output, logs are teed to disk and metrics come from events."""
+        stage_context.config = stage_context.config.model_copy(update={"stream_agent_output": True})
+        stage_create_dir_structure(stage_context)
+        stage_write_prompt(stage_context)
+        stage_generate_replay(stage_context)
+
+        result_event = {
+            "type": "result",
+            "result": "Done",
+            "num_turns": 2,
+            "total_cost_usd": 0.5,
+            "usage": {"input_tokens": 30, "output_tokens": 20},
+        }
+        events = [{"type": "system"}, {"type": "assistant", "message": {"id": "m1"}}, result_event]
+        agent_dir = stage_context.run_dir / "agent"
+        (agent_dir / "replay.sh").write_text(
+            "\n".join(f"echo '{json.dumps(e)}'" for e in events) + "\necho 'note' >&2\n"
+        )
+
+        stage_execute_agent(stage_context)
+
+        result = stage_context.agent_result
+        assert result is not None
+        assert result.exit_code == 0
+        assert json.loads(result.stdout) == result_event
+        assert result.token_stats.input_tokens == 30
+        assert result.api_calls == 2
+        assert result.cost_usd == 0.5
+        assert (agent_dir / "stdout.log").read_text().count("\n") == 3
+        assert (agent_dir / "stderr.log").read_text() == "note\n"
+        stage_context.adapter._parse_token_stats.assert_not_called()  # type: ignore[attr-defined]
+        stage_context.adapter.write_logs.assert_not_called()  # type: ignore[attr-defined]
+
+    def test_streaming_survives_leftover_background_process(
+        self, stage_context: RunContext
+    ) -> None:
+        """A background process holding the pipes is killed instead of hanging the run."""
+        stage_context.config = stage_context.config.model_copy(update={"stream_agent_output": True})
+        stage_create_dir_structure(stage_context)
+        stage_write_prompt(stage_context)
+        stage_generate_replay(stage_context)
+        agent_dir = stage_context.run_dir / "agent"
+        result_event = {"type": "result", "usage": {"input_tokens": 1, "output_tokens": 1}}
+        (agent_dir / "replay.sh").write_text(f"sleep 60 &\necho '{json.dumps(result_event)}'\n")
+
+        with patch("scylla.e2e.stages._READER_JOIN_TIMEOUT", 0.2):
+            stage_execute_agent(stage_context)
+
+        assert stage_context.agent_result is not None
+        assert stage_context.agent_result.exit_code == 0
+        assert json.loads(stage_context.agent_result.stdout) == result_event
+
+    def test_stream_closed_when_popen_fails(self, stage_context: RunContext) -> None:
+        """The stream's log files are closed even if the agent cannot be started."""
+        from scylla.e2e.agent_stream import AgentOutputStream
+
+        stage_context.config = stage_context.config.model_copy(update={"stream_agent_output": True})
+        stage_create_dir_structure(stage_context)
+        stage_write_prompt(stage_context)
+        stage_generate_replay(stage_context)
+
+        with (
+            patch("scylla.e2e.stages.subprocess.Popen", side_effect=OSError("no bash")),
+            patch.object(
+                AgentOutputStream, "close", autospec=True, side_effect=AgentOutputStream.close
+            ) as mock_close,
+        ):
+            stage_execute_agent(stage_context)
+
+        assert stage_context.agent_result is not None
+        assert stage_context.agent_result.exit_code == -1
+        mock_close.assert_called_once()
+
 
 class TestStageCaptureDiff:
     """Tests for stage_capture_diff()."""
@@ -777,6 +876,13 @@ def test_builds_prompt_and_saves(self, stage_context: RunContext) -> None:
         assert stage_context.judge_prompt == "JUDGE PROMPT"
         assert (stage_context.run_dir / "judge_prompt.md").exists()
 
+        from scylla.e2e.llm_judge import load_judge_context
+
+        context = load_judge_context(stage_context.run_dir)
+        assert context is not None
+        assert context.judge_prompt == "JUDGE PROMPT"
+        assert context.patchfile == "some diff"
+
 
 class TestStageExecuteJudge:
     """Tests for stage_execute_judge()."""
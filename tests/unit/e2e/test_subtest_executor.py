@@ -899,3 +899,111 @@ def test_rehydrates_from_disk_when_runs_empty(self, tmp_path: Path) -> None:
         assert result.total_cost == pytest.approx(0.10)
         assert len(result.runs) == 2
         assert result.pass_rate == pytest.approx(1.0)
+
+
+class TestRunSubtestConcurrentRuns:
+    """Tests for run_subtest with max_concurrent_runs > 1."""
+
+    def _make_executor(self, tmp_path: Path, runs: int, workers: int) -> SubTestExecutor:
+        """Create a SubTestExecutor whose config runs ``runs`` runs on ``workers`` threads."""
+        prompt = tmp_path / "prompt.md"
+        prompt.write_text("Do the task")
+        config = ExperimentConfig(
+            experiment_id="test",
+            task_repo="https://example.com/repo",
+            task_commit="abc123",
+            task_prompt_file=prompt,
+            language="python",
+            runs_per_subtest=runs,
+            max_concurrent_runs=workers,
+        )
+        return SubTestExecutor(config, MagicMock(), MagicMock(), adapter=MagicMock())
+
+    def _run_subtest(self, executor: SubTestExecutor, tmp_path: Path, build_actions: Any) -> Any:
+        """Run sub-test "00" of T0 with build_actions_dict patched."""
+        from unittest.mock import patch
+
+        from scylla.e2e.models import SubTestConfig
+
+        with patch("scylla.e2e.stages.build_actions_dict", side_effect=build_actions):
+            return executor.run_subtest(
+                tier_id=TierID.T0,
+                tier_config=MagicMock(),
+                subtest=SubTestConfig(id="00", name="Empty", description="empty"),
+                baseline=None,
+                results_dir=tmp_path / "T0" / "00",
+                experiment_dir=tmp_path,
+            )
+
+    def test_runs_execute_concurrently_and_aggregate_in_order(self, tmp_path: Path) -> None:
+        """Runs overlap in time and are aggregated in run-number order."""
+        import threading
+
+        from scylla.e2e.llm_judge_models import BuildPipelineResult
+        from scylla.e2e.subtest_executor import _save_pipeline_baseline
+
+        _save_pipeline_baseline(tmp_path, BuildPipelineResult(all_passed=True))
+        barrier = threading.Barrier(3, timeout=10)
+        baselines: list[Any] = []
+
+        def build_actions(ctx: Any) -> dict[str, Any]:
+            def run() -> None:
+                baselines.append(ctx.pipeline_baseline)
+                barrier.wait()  # Only passes if all three runs are in flight
+                ctx.run_result = _make_run_result(run_number=ctx.run_number)
+
+            return {"run": run}
+
+        executor = self._make_executor(tmp_path, runs=3, workers=3)
+        result = self._run_subtest(executor, tmp_path, build_actions)
+
+        assert [run.run_number for run in result.runs] == [1, 2, 3]
+        assert all(b is not None and b.all_passed for b in baselines)
+
+    def test_first_run_captures_baseline_before_fan_out(self, tmp_path: Path) -> None:
+        """Without a stored baseline, run 1 captures it alone and the rest share it."""
+        from scylla.e2e.llm_judge_models import BuildPipelineResult
+
+        captured = BuildPipelineResult(all_passed=False)
+        events: list[tuple[str, int]] = []
+
+        def build_actions(ctx: Any) -> dict[str, Any]:
+            def run() -> None:
+                events.append(("start", ctx.run_number))
+                if ctx.pipeline_baseline is None:
+                    ctx.pipeline_baseline = captured
+                else:
+                    assert ctx.pipeline_baseline is captured
+                ctx.run_result = _make_run_result(run_number=ctx.run_number)
+                events.append(("end", ctx.run_number))
+
+            return {"run": run}
+
+        executor = self._make_executor(tmp_path, runs=3, workers=2)
+        result = self._run_subtest(executor, tmp_path, build_actions)
+
+        assert events[:2] == [("start", 1), ("end", 1)]
+        assert [run.run_number for run in result.runs] == [1, 2, 3]
+
+    def test_failure_stops_new_runs_and_is_reraised(self, tmp_path: Path) -> None:
+        """The first failing run's exception propagates and queued runs are not started."""
+        from scylla.e2e.llm_judge_models import BuildPipelineResult
+        from scylla.e2e.subtest_executor import _save_pipeline_baseline
+
+        _save_pipeline_baseline(tmp_path, BuildPipelineResult(all_passed=True))
+        started: list[int] = []
+
+        def build_actions(ctx: Any) -> dict[str, Any]:
+            def run() -> None:
+                started.append(ctx.run_number)
+                raise RuntimeError(f"run {ctx.run_number} failed")
+
+            return {"run": run}
+
+        executor = self._make_executor(tmp_path, runs=4, workers=2)
+        with pytest.raises(RuntimeError, match="failed"):
+            self._run_subtest(executor, tmp_path, build_actions)
+
+        # Runs 3 and 4 are only picked up after a worker's run has already failed
+        assert 1 in started
+        assert set(started) <= {1, 2}
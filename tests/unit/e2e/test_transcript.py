@@ -0,0 +1,149 @@
+"""Unit tests for scylla/e2e/transcript.py."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from scylla.e2e.transcript import TranscriptParser, Usage, parse_transcript
+
+
+def _stream(*events: dict[str, Any]) -> str:
+    return "\n".join(json.dumps(event) for event in events) + "\n"
+
+
+def _assistant(
+    message_id: str, output_tokens: int, content: list[dict[str, Any]] | None = None
+) -> dict[str, Any]:
+    return {
+        "type": "assistant",
+        "message": {
+            "id": message_id,
+            "content": content or [],
+            "usage": {"input_tokens": 10, "output_tokens": output_tokens},
+        },
+    }
+
+
+RESULT = {
+    "type": "result",
+    "is_error": False,
+    "result": "Done",
+    "num_turns": 4,
+    "total_cost_usd": 0.5,
+    "usage": {
+        "input_tokens": 100,
+        "output_tokens": 50,
+        "cache_creation_input_tokens": 7,
+        "cache_read_input_tokens": 900,
+    },
+}
+
+
+class TestUsage:
+    """Tests for Usage."""
+
+    def test_from_openai_usage(self) -> None:
+        """prompt_tokens/completion_tokens map to input/output tokens."""
+        usage = Usage.from_dict({"prompt_tokens": 12, "completion_tokens": 3})
+        assert usage == Usage(input_tokens=12, output_tokens=3)
+
+    def test_add(self) -> None:
+        """Usages add element-wise."""
+        total = Usage(1, 2, 3, 4) + Usage(10, 20, 30, 40)
+        assert total == Usage(11, 22, 33, 44)
+
+
+class TestParseTranscript:
+    """Tests for parse_transcript()."""
+
+    def test_result_event_wins(self) -> None:
+        """Usage, cost and turns come from the result event of a stream."""
+        transcript = parse_transcript(_stream({"type": "system"}, _assistant("m1", 5), RESULT))
+
+        assert transcript.usage == Usage(100, 50, 7, 900)
+        assert transcript.cost_usd == 0.5
+        assert transcript.api_calls == 4
+        assert transcript.json_events == 3
+
+    def test_single_json_object(self) -> None:
+        """``--output-format json`` output (no type field) is a result event."""
+        transcript = parse_transcript(json.dumps({k: v for k, v in RESULT.items() if k != "type"}))
+
+        assert transcript.usage == Usage(100, 50, 7, 900)
+        assert transcript.api_calls == 4
+
+    def test_pretty_printed_json(self) -> None:
+        """A multi-line JSON document is parsed as a whole."""
+        transcript = parse_transcript(json.dumps(RESULT, indent=2))
+
+        assert transcript.cost_usd == 0.5
+        assert transcript.json_events == 1
+
+    def test_assistant_messages_deduplicated(self) -> None:
+        """Without a result, usage is summed once per assistant message id."""
+        output = _stream(
+            _assistant("m1", 5, [{"type": "text", "text": "a"}]),
+            _assistant("m1", 8, [{"type": "tool_use", "name": "Bash"}]),
+            {"type": "user"},
+            _assistant("m2", 4, [{"type": "tool_use", "name": "Read"}]),
+        )
+        transcript = parse_transcript(output)
+
+        assert transcript.usage == Usage(input_tokens=20, output_tokens=12)
+        assert transcript.api_calls == 2
+        assert transcript.tool_calls == 2
+        assert transcript.cost_usd == 0.0
+
+    def test_plain_text(self) -> None:
+        """Text output has no structured usage."""
+        transcript = parse_transcript("Input tokens: 10\nOutput tokens: 5\n")
+
+        assert transcript.usage is None
+        assert not transcript.has_usage
+        assert transcript.text_lines == 2
+
+    def test_rate_limit_error(self) -> None:
+        """An is_error result with a rate-limit keyword is flagged."""
+        transcript = parse_transcript(
+            _stream({"type": "result", "is_error": True, "result": "Rate limit exceeded"})
+        )
+
+        assert transcript.errors == ("Rate limit exceeded",)
+        assert transcript.rate_limit_errors == ("Rate limit exceeded",)
+
+    def test_other_errors_not_rate_limits(self) -> None:
+        """Non rate-limit errors are recorded but not flagged."""
+        transcript = parse_transcript(
+            _stream({"type": "result", "is_error": True, "result": "Invalid API key"})
+        )
+
+        assert transcript.errors == ("Invalid API key",)
+        assert transcript.rate_limit_errors == ()
+
+    def test_response_text_prefers_result(self) -> None:
+        """The result field is the response when it is populated."""
+        output = _stream(_assistant("m1", 1, [{"type": "text", "text": "draft"}]), RESULT)
+
+        assert parse_transcript(output, collect_text=True).response_text == "Done"
+        assert parse_transcript(output).response_text == ""
+
+    def test_response_text_from_assistant_blocks(self) -> None:
+        """An empty result falls back to the concatenated assistant text."""
+        output = _stream(
+            _assistant("m1", 1, [{"type": "text", "text": "Hello "}]),
+            _assistant("m2", 1, [{"type": "text", "text": "world"}]),
+            {"type": "result", "result": ""},
+        )
+
+        assert parse_transcript(output, collect_text=True).response_text == "Hello world"
+
+
+def test_parser_is_incremental() -> None:
+    """Feeding lines one at a time yields the same summary as parsing the whole output."""
+    output = _stream(_assistant("m1", 5), _assistant("m2", 6), RESULT)
+    parser = TranscriptParser()
+    events = [parser.feed_line(line) for line in output.splitlines(keepends=True)]
+
+    assert [e.type for e in events if e is not None] == ["assistant", "assistant", "result"]
+    assert parser.result() == parse_transcript(output)
@@ -1,8 +1,10 @@
-"""Unit tests for WorkspaceManager retry logic."""
+"""Unit tests for WorkspaceManager retry logic and worktree pool."""
 
 from __future__ import annotations
 
 import hashlib
+import subprocess
+from collections.abc import Iterator
 from pathlib import Path
 from unittest.mock import MagicMock, call, patch
 
@@ -687,3 +689,247 @@ def test_ensure_commit_available_depth_one(self, tmp_path: Path) -> None:
         fetch_cmd = mock_run.call_args_list[1][0][0]
         assert "--depth=1" in fetch_cmd
         assert "fetch" in fetch_cmd
+
+
+def _git(*args: str, cwd: Path) -> str:
+    """Run a git command in cwd and return stdout."""
+    result = subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+def _make_local_repo(tmp_path: Path) -> tuple[Path, str]:
+    """Create a one-commit local repo; return (path, commit)."""
+    base_repo = tmp_path / "repo"
+    base_repo.mkdir()
+    _git("init", "-q", "-b", "main", cwd=base_repo)
+    (base_repo / "README.md").write_text("hello\n")
+    (base_repo / ".gitignore").write_text("build/\n")
+    (base_repo / "src").mkdir()
+    (base_repo / "src" / "main.py").write_text("print('hi')\n")
+    _git("add", ".", cwd=base_repo)
+    _git("-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "-m", "init", cwd=base_repo)
+    return base_repo, _git("rev-parse", "HEAD", cwd=base_repo)
+
+
+def _local_manager(tmp_path: Path, workspace_backend: str = "worktree") -> WorkspaceManager:
+    """WorkspaceManager over a real local repo, marked as set up."""
+    base_repo, commit = _make_local_repo(tmp_path)
+    manager = WorkspaceManager(
+        experiment_dir=tmp_path / "experiment",
+        repo_url="file://unused",
+        commit=commit,
+        workspace_backend=workspace_backend,
+    )
+    manager.base_repo = base_repo
+    manager._is_setup = True
+    return manager
+
+
+@pytest.fixture
+def pooled_manager(tmp_path: Path) -> Iterator[WorkspaceManager]:
+    """WorkspaceManager over a real one-commit local repo, pool of 2."""
+    manager = _local_manager(tmp_path)
+    manager.start_worktree_pool(2)
+    assert manager._pool_thread is not None
+    manager._pool_thread.join(timeout=30)
+    yield manager
+    manager.drain_worktree_pool()
+
+
+class TestWorktreePool:
+    """Tests for the pre-warmed worktree pool (real git, local repo)."""
+
+    def test_pool_prewarms_up_to_size(self, pooled_manager: WorkspaceManager) -> None:
+        """start_worktree_pool() pre-creates one detached worktree per slot."""
+        assert len(pooled_manager._pool_idle) == 2
+        assert all((slot / "README.md").exists() for slot in pooled_manager._pool_idle)
+
+    def test_acquire_moves_worktree_onto_run_branch(
+        self, pooled_manager: WorkspaceManager, tmp_path: Path
+    ) -> None:
+        """A leased worktree lives at the run path on the requested branch."""
+        workspace = tmp_path / "T0" / "00" / "run_01" / "workspace"
+        workspace.mkdir(parents=True)
+
+        assert pooled_manager.acquire_pooled_worktree(
+            workspace, "T0_00_run_01", pooled_manager.commit
+        )
+
+        assert (workspace / "README.md").exists()
+        assert _git("branch", "--show-current", cwd=workspace) == "T0_00_run_01"
+        assert len(pooled_manager._pool_idle) == 1
+
+    def test_acquire_bypasses_pool_for_other_commit(
+        self, pooled_manager: WorkspaceManager, tmp_path: Path
+    ) -> None:
+        """Runs pinned to a different commit fall back to git worktree add."""
+        workspace = tmp_path / "workspace"
+
+        assert not pooled_manager.acquire_pooled_worktree(workspace, "b", "0" * 40)
+        assert len(pooled_manager._pool_idle) == 2
+
+    def test_cleanup_resets_and_recycles(
+        self, pooled_manager: WorkspaceManager, tmp_path: Path
+    ) -> None:
+        """cleanup_worktree() resets a leased worktree and returns it to the pool."""
+        workspace = tmp_path / "workspace"
+        pooled_manager.acquire_pooled_worktree(workspace, "run_branch", pooled_manager.commit)
+        (workspace / "README.md").write_text("changed\n")
+        (workspace / "new.txt").write_text("untracked\n")
+        (workspace / "build").mkdir()
+        (workspace / "build" / "out.o").write_text("ignored\n")
+
+        pooled_manager.cleanup_worktree(workspace)
+
+        assert not workspace.exists()
+        assert len(pooled_manager._pool_idle) == 2
+        slot = pooled_manager._pool_idle[-1]
+        assert (slot / "README.md").read_text() == "hello\n"
+        assert not (slot / "new.txt").exists()
+        assert not (slot / "build").exists()
+        # The run branch survives, as with git worktree remove
+        assert "run_branch" in _git("branch", "--list", "run_branch", cwd=pooled_manager.base_repo)
+
+    def test_cleanup_removes_worktree_when_pool_full(
+        self, pooled_manager: WorkspaceManager, tmp_path: Path
+    ) -> None:
+        """Worktrees beyond the pool size are removed as before."""
+        workspace = tmp_path / "extra"
+        _git(
+            "worktree",
+            "add",
+            "-q",
+            "-b",
+            "extra",
+            str(workspace),
+            cwd=pooled_manager.base_repo,
+        )
+
+        pooled_manager.cleanup_worktree(workspace, "extra")
+
+        assert not workspace.exists()
+        assert len(pooled_manager._pool_idle) == 2
+        assert _git("branch", "--list", "extra", cwd=pooled_manager.base_repo) == ""
+
+    def test_failed_branch_checkout_frees_workspace_path(
+        self, pooled_manager: WorkspaceManager, tmp_path: Path
+    ) -> None:
+        """A lease that fails after the move leaves the run path free for worktree add."""
+        workspace = tmp_path / "workspace"
+
+        assert not pooled_manager.acquire_pooled_worktree(
+            workspace, "bad..branch", pooled_manager.commit
+        )
+
+        assert not workspace.exists()
+        _git(
+            "worktree", "add", "-q", "-b", "fallback", str(workspace), cwd=pooled_manager.base_repo
+        )
+        assert pooled_manager._pool_thread is not None
+        pooled_manager._pool_thread.join(timeout=30)
+        assert len(pooled_manager._pool_idle) == 2
+
+    def test_forget_kept_lease_warms_replacement(
+        self, pooled_manager: WorkspaceManager, tmp_path: Path
+    ) -> None:
+        """A kept leased worktree leaves the pool and a replacement is pre-created."""
+        workspace = tmp_path / "kept"
+        pooled_manager.acquire_pooled_worktree(workspace, "kept", pooled_manager.commit)
+
+        pooled_manager.forget_pooled_worktree(workspace)
+
+        assert pooled_manager._pool_thread is not None
+        pooled_manager._pool_thread.join(timeout=30)
+        assert len(pooled_manager._pool_idle) == 2
+        assert not pooled_manager._pool_leased
+        assert pooled_manager._pool_members == 2
+        assert (workspace / "README.md").exists()
+
+    def test_drain_removes_idle_worktrees(self, pooled_manager: WorkspaceManager) -> None:
+        """drain_worktree_pool() removes idle worktrees and disables the pool."""
+        slots = list(pooled_manager._pool_idle)
+
+        pooled_manager.drain_worktree_pool()
+
+        assert not any(slot.exists() for slot in slots)
+        assert not pooled_manager.pool_dir.exists()
+        assert pooled_manager._pool_size == 0
+
+
+class TestReflinkBackend:
+    """Tests for the reflink workspace backend (real git, local repo).
+
+    The copy command is patched to a plain ``cp -a`` so the tests run on
+    filesystems without reflink support.
+    """
+
+    @pytest.fixture
+    def reflink_manager(self, tmp_path: Path) -> Iterator[WorkspaceManager]:
+        """Yield a manager with a prepared reflink base checkout."""
+        manager = _local_manager(tmp_path, workspace_backend="reflink")
+        with patch("scylla.e2e.workspace_manager._REFLINK_COPY", ["cp", "-a"]):
+            assert manager.prepare_reflink_base()
+            yield manager
+        manager.remove_reflink_base()
+
+    def test_unknown_backend_rejected(self, tmp_path: Path) -> None:
+        """An unknown backend name raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown workspace backend"):
+            WorkspaceManager(tmp_path, "file://unused", workspace_backend="overlay")
+
+    def test_falls_back_without_reflink_support(self, tmp_path: Path) -> None:
+        """prepare_reflink_base() switches to the worktree backend when unsupported."""
+        manager = _local_manager(tmp_path, workspace_backend="reflink")
+
+        with patch("scylla.e2e.workspace_manager.reflink_supported", return_value=False):
+            assert not manager.prepare_reflink_base()
+
+        assert manager.workspace_backend == "worktree"
+        assert manager.materialize_reflink_workspace(tmp_path / "ws", "b", manager.commit) is None
+
+    def test_materialized_workspace_is_clean_worktree(
+        self, reflink_manager: WorkspaceManager, tmp_path: Path
+    ) -> None:
+        """The run workspace is a registered worktree on its branch with a clean index."""
+        workspace = tmp_path / "T0" / "00" / "run_01" / "workspace"
+        workspace.mkdir(parents=True)
+
+        cmds = reflink_manager.materialize_reflink_workspace(
+            workspace, "T0_00_run_01", reflink_manager.commit
+        )
+
+        assert cmds is not None
+        assert "--no-checkout" in cmds[0]
+        assert (workspace / "src" / "main.py").read_text() == "print('hi')\n"
+        assert _git("branch", "--show-current", cwd=workspace) == "T0_00_run_01"
+        assert _git("status", "--porcelain", cwd=workspace) == ""
+        assert str(workspace.resolve()) in _git("worktree", "list", cwd=reflink_manager.base_repo)
+
+    def test_workspace_writes_do_not_touch_base(
+        self, reflink_manager: WorkspaceManager, tmp_path: Path
+    ) -> None:
+        """Edits in a run workspace leave the base checkout unchanged."""
+        workspace = tmp_path / "workspace"
+        reflink_manager.materialize_reflink_workspace(
+            workspace, "run_branch", reflink_manager.commit
+        )
+
+        (workspace / "README.md").write_text("changed\n")
+
+        assert (reflink_manager.reflink_base / "README.md").read_text() == "hello\n"
+        assert _git("status", "--porcelain", cwd=workspace) == "M README.md"
+
+    def test_failed_copy_unregisters_worktree(
+        self, reflink_manager: WorkspaceManager, tmp_path: Path
+    ) -> None:
+        """A failed copy removes the half-made worktree so worktree add can retry."""
+        workspace = tmp_path / "workspace"
+
+        with patch("scylla.e2e.workspace_manager._REFLINK_COPY", ["false"]):
+            result = reflink_manager.materialize_reflink_workspace(
+                workspace, "run_branch", reflink_manager.commit
+            )
+
+        assert result is None
+        assert workspace.is_dir() and not any(workspace.iterdir())
+        assert _git("branch", "--list", "run_branch", cwd=reflink_manager.base_repo) == ""
@@ -205,6 +205,85 @@ def test_recovery_retry_failure_raises(self, tmp_path: Path) -> None:
                 )
 
 
+class TestSetupWorkspacePooled:
+    """A pooled worktree replaces git worktree add when one is available."""
+
+    def test_pooled_worktree_skips_worktree_add(self, tmp_path: Path) -> None:
+        """When the pool leases a worktree, no worktree add is issued."""
+        workspace = tmp_path / "workspace"
+        base_repo = tmp_path / "repo"
+        base_repo.mkdir()
+        manager = MagicMock()
+        manager.acquire_pooled_worktree.return_value = True
+
+        with patch("subprocess.run", return_value=_ok()) as mock_run:
+            _setup_workspace(
+                workspace=workspace,
+                command_logger=MagicMock(),
+                tier_id=TierID.T0,
+                subtest_id="00",
+                run_number=1,
+                base_repo=base_repo,
+                task_commit="abc123",
+                workspace_manager=manager,
+            )
+
+        manager.acquire_pooled_worktree.assert_called_once_with(
+            workspace.resolve(), "T0_00_run_01", "abc123"
+        )
+        cmds = [c[0][0] for c in mock_run.call_args_list]
+        assert not any("add" in c for c in cmds)
+        assert "worktree add" in (tmp_path / "worktree_create.sh").read_text()
+
+    def test_empty_pool_falls_back_to_worktree_add(self, tmp_path: Path) -> None:
+        """Without a pooled or reflink worktree, git worktree add runs as before."""
+        workspace = tmp_path / "workspace"
+        base_repo = tmp_path / "repo"
+        base_repo.mkdir()
+        manager = MagicMock()
+        manager.acquire_pooled_worktree.return_value = False
+        manager.materialize_reflink_workspace.return_value = None
+
+        with patch("subprocess.run", return_value=_ok()) as mock_run:
+            _setup_workspace(
+                workspace=workspace,
+                command_logger=MagicMock(),
+                tier_id=TierID.T0,
+                subtest_id="00",
+                run_number=1,
+                base_repo=base_repo,
+                workspace_manager=manager,
+            )
+
+        cmds = [c[0][0] for c in mock_run.call_args_list]
+        assert any("worktree" in c and "add" in c for c in cmds)
+
+    def test_reflink_workspace_skips_worktree_add(self, tmp_path: Path) -> None:
+        """A reflink-materialized worktree is logged and no worktree add runs."""
+        workspace = tmp_path / "workspace"
+        base_repo = tmp_path / "repo"
+        base_repo.mkdir()
+        manager = MagicMock()
+        manager.acquire_pooled_worktree.return_value = False
+        manager.materialize_reflink_workspace.return_value = [["git", "worktree"], ["cp"]]
+        command_logger = MagicMock()
+
+        with patch("subprocess.run", return_value=_ok()) as mock_run:
+            _setup_workspace(
+                workspace=workspace,
+                command_logger=command_logger,
+                tier_id=TierID.T0,
+                subtest_id="00",
+                run_number=1,
+                base_repo=base_repo,
+                workspace_manager=manager,
+            )
+
+        cmds = [c[0][0] for c in mock_run.call_args_list]
+        assert not any("add" in c for c in cmds)
+        assert command_logger.log_command.call_count == 2
+
+
 class TestMoveToFailed:
     """Tests for _move_to_failed function."""
 
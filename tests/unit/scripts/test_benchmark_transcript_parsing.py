@@ -0,0 +1,49 @@
+"""Tests for scripts/benchmark_transcript_parsing.py."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from benchmark_transcript_parsing import (
+    ModeResult,
+    benchmark,
+    format_results,
+    generate_transcript,
+    main,
+)
+
+from scylla.e2e.transcript import parse_transcript
+
+
+def test_generate_transcript_size_and_result() -> None:
+    """The transcript reaches the requested size and ends with a result event."""
+    stdout = generate_transcript(20_000)
+    transcript = parse_transcript(stdout)
+
+    assert len(stdout) >= 20_000
+    assert json.loads(stdout.splitlines()[-1])["type"] == "result"
+    assert transcript.api_calls > 0
+    assert transcript.tool_calls == transcript.api_calls
+
+
+def test_modes_extract_identical_metrics() -> None:
+    """Per-metric and shared parsing report the same metrics."""
+    results = benchmark(generate_transcript(10_000), repeat=2)
+
+    assert [r.mode for r in results] == ["per-metric", "shared"]
+    assert all(len(r.seconds) == 2 for r in results)
+    assert results[0].metrics == results[1].metrics
+    assert results[0].metrics[2] > 0
+
+
+def test_format_results() -> None:
+    """The table has one row per mode."""
+    table = format_results([ModeResult("shared", [0.5], (10, 5, 2, 0.1))], 2**20)
+    assert table.splitlines()[1].split() == ["shared", "0.500", "2.0", "10/5", "2"]
+
+
+def test_main_json(capsys: pytest.CaptureFixture[str]) -> None:
+    """--json prints one entry per mode."""
+    assert main(["--size-mb", "0.01", "--repeat", "1", "--json"]) == 0
+    assert len(json.loads(capsys.readouterr().out)) == 2
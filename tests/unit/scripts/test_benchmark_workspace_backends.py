@@ -0,0 +1,109 @@
+"""Tests for scripts/benchmark_workspace_backends.py."""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from benchmark_workspace_backends import (
+    BackendResult,
+    benchmark_backend,
+    format_results,
+    resolve_source,
+)
+
+
+@pytest.fixture
+def local_repo(tmp_path: Path) -> tuple[str, str]:
+    """Create a small committed repo; return (path, commit)."""
+    repo = tmp_path / "source"
+    repo.mkdir()
+    (repo / "a.txt").write_text("a" * 4096)
+    (repo / "pkg").mkdir()
+    (repo / "pkg" / "b.txt").write_text("b" * 4096)
+    for cmd in (
+        ["git", "init", "-q"],
+        ["git", "add", "."],
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "-m", "init"],
+    ):
+        subprocess.run(cmd, cwd=repo, check=True, capture_output=True)
+    commit = subprocess.run(
+        ["git", "rev-parse", "HEAD"], cwd=repo, check=True, capture_output=True, text=True
+    ).stdout.strip()
+    return str(repo), commit
+
+
+class TestResolveSource:
+    """Tests for resolve_source()."""
+
+    def test_reads_fixture_test_yaml(self) -> None:
+        """The repo and hash come from the fixture's source block."""
+        repo, commit = resolve_source(Path("tests/fixtures/tests/test-001"), None, None)
+        assert repo.startswith("https://")
+        assert len(commit) == 40
+
+    def test_explicit_repo_and_commit(self) -> None:
+        """Explicit --repo/--commit are returned unchanged."""
+        assert resolve_source(None, "/r", "abc") == ("/r", "abc")
+
+    def test_missing_source_raises(self) -> None:
+        """Without a test dir or repo+commit, a ValueError is raised."""
+        with pytest.raises(ValueError, match="--test"):
+            resolve_source(None, "/r", None)
+
+
+class TestBenchmarkBackend:
+    """Tests for benchmark_backend() against a local repo."""
+
+    def test_worktree_backend(self, local_repo: tuple[str, str], tmp_path: Path) -> None:
+        """Every workspace is timed and cleaned up afterwards."""
+        repo, commit = local_repo
+        work_dir = tmp_path / "work"
+        work_dir.mkdir()
+
+        result = benchmark_backend("worktree", repo, commit, 2, work_dir)
+
+        assert result.supported
+        assert len(result.setup_seconds) == 2
+        assert result.apparent_bytes == 2 * 8192
+        assert not any((work_dir / "experiment-worktree" / "runs").rglob("a.txt"))
+
+    def test_reflink_backend(self, local_repo: tuple[str, str], tmp_path: Path) -> None:
+        """With a working copy command, the reflink backend materializes workspaces."""
+        repo, commit = local_repo
+        work_dir = tmp_path / "work"
+        work_dir.mkdir()
+
+        with patch("scylla.e2e.workspace_manager._REFLINK_COPY", ["cp", "-a"]):
+            result = benchmark_backend("reflink", repo, commit, 2, work_dir)
+
+        assert result.supported
+        assert len(result.setup_seconds) == 2
+        assert result.apparent_bytes == 2 * 8192
+
+    def test_reflink_unsupported(self, local_repo: tuple[str, str], tmp_path: Path) -> None:
+        """On filesystems without reflinks the backend is reported unsupported."""
+        repo, commit = local_repo
+        work_dir = tmp_path / "work"
+        work_dir.mkdir()
+
+        with patch("scylla.e2e.workspace_manager.reflink_supported", return_value=False):
+            result = benchmark_backend("reflink", repo, commit, 2, work_dir)
+
+        assert not result.supported
+        assert result.setup_seconds == []
+
+
+def test_format_results() -> None:
+    """The table has one row per backend."""
+    table = format_results(
+        [
+            BackendResult("worktree", setup_seconds=[0.5, 1.5], disk_bytes=2**20),
+            BackendResult("reflink", supported=False),
+        ]
+    )
+    lines = table.splitlines()
+    assert lines[1].split()[:3] == ["worktree", "0.000", "1.000"]
+    assert "unsupported" in lines[2]
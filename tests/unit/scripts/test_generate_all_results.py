@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import argparse
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
 from generate_all_results import run_script
 
 
@@ -187,3 +190,102 @@ def test_skip_all_flags_runs_no_scripts(self) -> None:
                     main()
 
         assert mock_run.call_count == 0
+
+    def test_in_process_flag_skips_subprocesses(self) -> None:
+        """--in-process delegates to run_in_process() instead of run_script()."""
+        with (
+            patch("generate_all_results.run_script", return_value=True) as mock_run,
+            patch("generate_all_results.run_in_process", return_value=True) as mock_inproc,
+            patch("generate_all_results.terminal_guard"),
+            patch("sys.argv", ["generate_all_results.py", "--in-process"]),
+        ):
+            from generate_all_results import main
+
+            main()
+
+        assert mock_run.call_count == 0
+        mock_inproc.assert_called_once()
+
+
+class TestRunInProcess:
+    """Tests for run_in_process() shared-DataFrame orchestration."""
+
+    @staticmethod
+    def _args(tmp_path: Path, *extra: str) -> argparse.Namespace:
+        """Build a Namespace mirroring main()'s defaults."""
+        return argparse.Namespace(
+            data_dir=tmp_path / "fullruns",
+            output_dir=tmp_path / "docs",
+            no_render=True,
+            skip_data="--skip-data" in extra,
+            skip_figures="--skip-figures" in extra,
+            skip_tables="--skip-tables" in extra,
+            exclude=[],
+            cache_dir=None,
+            load_jobs=1,
+            power_jobs=1,
+            figure_jobs=1,
+            no_output_cache=False,
+            in_process=True,
+        )
+
+    def test_loads_once_and_shares_frames(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Experiments load once and every stage receives the same DataFrames."""
+        runs_df = MagicMock(name="runs_df")
+        with (
+            patch("scylla.analysis.load_all_experiments", return_value={"exp": []}) as mock_load,
+            patch("scylla.analysis.build_runs_df", return_value=runs_df),
+            patch("scylla.analysis.build_judges_df"),
+            patch("scylla.analysis.build_criteria_df"),
+            patch("scylla.analysis.build_subtests_df"),
+            patch("scylla.analysis.load_rubric_weights", return_value={}),
+            patch("scylla.analysis.dataset.compute_source_hashes", return_value={}),
+            patch("scylla.analysis.figures.spec_builder.apply_publication_theme"),
+            patch("export_data.export_frames") as mock_export,
+            patch("generate_figures.run_figures", return_value=(1, [])) as mock_figs,
+            patch("generate_tables.run_tables", return_value=(1, [], 1)) as mock_tables,
+        ):
+            from generate_all_results import run_in_process
+
+            assert run_in_process(self._args(tmp_path)) is True
+
+        mock_load.assert_called_once()
+        assert mock_export.call_args.args[0] is runs_df
+        assert mock_figs.call_args.args[0] is runs_df
+        assert mock_tables.call_args.args[0] is runs_df
+        out = capsys.readouterr().out
+        assert "Stage timings:" in out
+        for stage in ("load", "dataframes", "export", "figures", "tables", "total"):
+            assert stage in out
+
+    def test_stage_exception_stops_later_stages(self, tmp_path: Path) -> None:
+        """A raising stage returns False and later stages do not run."""
+        with (
+            patch("scylla.analysis.load_all_experiments", return_value={"exp": []}),
+            patch("scylla.analysis.build_runs_df"),
+            patch("scylla.analysis.build_judges_df"),
+            patch("scylla.analysis.build_criteria_df"),
+            patch("scylla.analysis.build_subtests_df"),
+            patch("scylla.analysis.dataset.compute_source_hashes", return_value={}),
+            patch("export_data.export_frames", side_effect=ValueError("boom")),
+            patch("generate_figures.run_figures") as mock_figs,
+        ):
+            from generate_all_results import run_in_process
+
+            assert run_in_process(self._args(tmp_path)) is False
+
+        mock_figs.assert_not_called()
+
+    def test_no_experiments_returns_false(self, tmp_path: Path) -> None:
+        """An empty data directory fails without running any stage."""
+        with (
+            patch("scylla.analysis.load_all_experiments", return_value={}),
+            patch("export_data.export_frames") as mock_export,
+        ):
+            from generate_all_results import run_in_process
+
+            assert run_in_process(self._args(tmp_path)) is False
+
+        mock_export.assert_not_called()
@@ -2,7 +2,13 @@
 
 from __future__ import annotations
 
-from generate_figures import FIGURES
+import subprocess
+import sys
+from pathlib import Path
+
+from generate_figures import FIGURE_MODULES, FIGURES
+
+SCRIPTS_DIR = Path(__file__).parents[3] / "scripts"
 
 # ---------------------------------------------------------------------------
 # TestFiguresRegistry
@@ -62,3 +68,50 @@ def test_expected_figure_count(self) -> None:
         """Registry contains at least 30 figures, consistent with the documented ~34."""
         # 34 figures as documented in README and audit
         assert len(FIGURES) >= 30, f"Expected ~34 figures, got {len(FIGURES)}"
+
+    def test_category_matches_lookup(self) -> None:
+        """category() agrees with the resolved registry entry."""
+        for name in FIGURES:
+            assert FIGURES.category(name) == FIGURES[name][0]
+
+    def test_generator_names_match_figure_names(self) -> None:
+        """Each figure resolves to the generator function of the same name."""
+        for name in FIGURE_MODULES:
+            assert FIGURES[name][1].__name__ == name
+
+
+class TestLazyImports:
+    """Start-up must not pay for the full figure import tree."""
+
+    def test_import_and_list_do_not_load_heavy_dependencies(self) -> None:
+        """Importing the script and listing figures leaves pandas/altair/scipy unloaded."""
+        code = (
+            "import sys; sys.path.insert(0, sys.argv[1]); import generate_figures as g; "
+            "[g.FIGURES.category(n) for n in g.FIGURES]; "
+            "print(sorted(m for m in ('pandas', 'altair', 'scipy', 'statsmodels') "
+            "if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code, str(SCRIPTS_DIR)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_lookup_imports_only_that_module(self) -> None:
+        """Resolving one figure imports its own module, not every figure module."""
+        code = (
+            "import sys; sys.path.insert(0, sys.argv[1]); import generate_figures as g; "
+            "g.FIGURES['fig04_pass_rate_by_tier']; "
+            "print(sorted(m.rsplit('.', 1)[1] for m in sys.modules "
+            "if m.startswith('scylla.analysis.figures.') and m != "
+            "'scylla.analysis.figures.spec_builder'))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code, str(SCRIPTS_DIR)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == "['tier_performance']"